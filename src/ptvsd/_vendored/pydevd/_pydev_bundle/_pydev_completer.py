@@ -43,7 +43,7 @@ class _StartsWithFilter:
 #=======================================================================================================================
 class Completer:
 
-    def __init__(self, namespace=None, global_namespace=None):
+    def __init__(self, namespace=None, global_namespace=None, get_complete_info=True):
         """Create a new completer for the command line.
 
         Completer([namespace,global_namespace]) -> completer instance.
@@ -77,6 +77,9 @@ class Completer:
         else:
             self.global_namespace = global_namespace
 
+        # If False, only the name and type of the completions are computed (no docs nor args).
+        self.get_complete_info = get_complete_info
+
     def complete(self, text):
         """Return the next possible completion for 'text'.
 
@@ -112,7 +115,7 @@ class Completer:
 
         filter = _StartsWithFilter(text)
 
-        return dir2(a, a.keys(), get_item, filter)
+        return dir2(a, a.keys(), get_item, filter, get_complete_info=self.get_complete_info)
 
     def attr_matches(self, text):
         """Compute matches when text contains a dot.
@@ -146,13 +149,16 @@ class Completer:
 
         filter = _StartsWithFilter(attr)
 
-        words = dir2(obj, filter=filter)
+        words = dir2(obj, filter=filter, get_complete_info=self.get_complete_info)
 
         return words
 
 
-def generate_completions(frame, act_tok):
+def generate_completions(frame, act_tok, get_complete_info=True):
     '''
+    :param bool get_complete_info:
+        If False the docstring and parameters aren't computed (they're returned as '').
+
     :return list(tuple(method_name, docstring, parameters, completion_type))
 
     method_name: str
@@ -174,13 +180,63 @@ def generate_completions(frame, act_tok):
     if pydevconsole.IPYTHON:
         completions = pydevconsole.get_completions(act_tok, act_tok, updated_globals, frame.f_locals)
     else:
-        completer = Completer(updated_globals, None)
+        completer = Completer(updated_globals, None, get_complete_info)
         # list(tuple(name, descr, parameters, type))
         completions = completer.complete(act_tok)
 
     return completions
 
 
+class CompletionsCache(object):
+    '''
+    Keeps the completions of the last request.
+
+    While typing, the IDE requests the completions on each keystroke for the same activation token
+    (only changing the qualifier), so, the completions are computed only once and are then just
+    narrowed by the qualifier (based on the previous results if the new qualifier starts with the
+    previous one).
+
+    Note: the cache must be discarded when the program is resumed or when the state of the frames
+    may have changed (i.e.: when an expression is evaluated).
+    '''
+
+    def __init__(self):
+        # (key, completions, qualifier, completions matching the qualifier)
+        self._last = None
+
+    def get_completions(self, key, qualifier, compute_completions):
+        '''
+        :param tuple key:
+            Identifies the frame, activation token and kind of completions requested.
+
+        :param str qualifier:
+            Only the completions starting with the qualifier (case-insensitive) are returned.
+
+        :param callable compute_completions:
+            Called to compute the completions on a cache miss.
+
+        :return list(tuple(method_name, docstring, parameters, completion_type))
+        '''
+        qualifier = qualifier.lower()
+        last = self._last
+        if last is not None and last[0] == key:
+            completions = last[1]
+            if qualifier.startswith(last[2]):
+                matching = last[3]
+            else:
+                matching = completions
+        else:
+            completions = matching = compute_completions()
+
+        if qualifier:
+            matching = [completion for completion in matching if completion[0].lower().startswith(qualifier)]
+        else:
+            matching = completions
+
+        self._last = (key, completions, qualifier, matching)
+        return matching
+
+
 def generate_completions_as_xml(frame, act_tok):
     completions = generate_completions(frame, act_tok)
     return completions_to_xml(completions)
@@ -158,12 +158,13 @@ def check_char(c):
 
 _SENTINEL = object()
 
-def generate_imports_tip_for_module(obj_to_complete, dir_comps=None, getattr=getattr, filter=lambda name:True):
+def generate_imports_tip_for_module(obj_to_complete, dir_comps=None, getattr=getattr, filter=lambda name:True, get_complete_info=True):
     '''
         @param obj_to_complete: the object from where we should get the completions
         @param dir_comps: if passed, we should not 'dir' the object and should just iterate those passed as kwonly_arg parameter
         @param getattr: the way to get kwonly_arg given object from the obj_to_complete (used for the completer)
         @param filter: kwonly_arg callable that receives the name and decides if it should be appended or not to the results
+        @param get_complete_info: if False, the docs and args aren't computed (only the name and type)
         @return: list of tuples, so that each tuple represents kwonly_arg completion with:
             name, doc, args, type (from the TYPE_* constants)
     '''
@@ -176,9 +177,7 @@ def generate_imports_tip_for_module(obj_to_complete, dir_comps=None, getattr=get
         if hasattr(obj_to_complete, '__class__'):
             dir_comps.append('__class__')
 
-    get_complete_info = True
-
-    if len(dir_comps) > 1000:
+    if get_complete_info and len(dir_comps) > 1000:
         #ok, we don't want to let our users wait forever...
         #no complete info for you...
 
@@ -406,12 +406,13 @@ def search_definition(data):
         return do_find(f, parent), foundAs
 
 
-def generate_imports_tip_for_module(obj_to_complete, dir_comps=None, getattr=getattr, filter=lambda name:True):
+def generate_imports_tip_for_module(obj_to_complete, dir_comps=None, getattr=getattr, filter=lambda name:True, get_complete_info=True):
     '''
         @param obj_to_complete: the object from where we should get the completions
         @param dir_comps: if passed, we should not 'dir' the object and should just iterate those passed as a parameter
         @param getattr: the way to get a given object from the obj_to_complete (used for the completer)
         @param filter: a callable that receives the name and decides if it should be appended or not to the results
+        @param get_complete_info: unused in jython (the docs and args are a by-product of getting the type)
         @return: list of tuples, so that each tuple represents a completion with:
             name, doc, args, type (from the TYPE_* constants)
     '''
@@ -86,6 +86,76 @@ def _get_host_port():
     return host, port
 
 
+def _get_inherited_config_env_var():
+    '''
+    :return tuple(str, str)|None:
+        The name and value of the environment variable with the configuration to be inherited
+        by a subprocess (or None if there's nothing to be inherited).
+    '''
+    py_db = get_global_debugger()
+    if py_db is None:
+        return None
+
+    from _pydevd_bundle import pydevd_inherited_config
+    value = pydevd_inherited_config.get_env_var_value(py_db)
+    if value is None:
+        return None
+    return pydevd_inherited_config.INHERITED_CONFIG_ENV_VAR, value
+
+
+def _patch_args_and_env(args, env):
+    '''
+    :param dict|None env:
+        The environment for the subprocess (None to use the environment of the current process).
+
+    :return tuple(list, dict|None):
+        The patched args and the environment for the subprocess (a copy with the configuration
+        to be inherited if the args were patched to start the debugger).
+    '''
+    new_args = patch_args(args)
+    if new_args is not args:
+        env_var = _get_inherited_config_env_var()
+        if env_var is not None:
+            env = dict(os.environ if env is None else env)
+            env[env_var[0]] = env_var[1]
+    return new_args, env
+
+
+def _patch_fork_exec_args_and_env(args, env_list):
+    '''
+    Same as `_patch_args_and_env` for the env as used in `_posixsubprocess.fork_exec`
+    (a list of b'name=value' or None to use the environment of the current process).
+    '''
+    new_args = patch_args(args)
+    if new_args is not args:
+        env_var = _get_inherited_config_env_var()
+        if env_var is not None:
+            prefix = env_var[0].encode('ascii') + b'='
+            if env_list is None:
+                env_list = [name + b'=' + value for name, value in os.environb.items()]
+            env_list = [entry for entry in env_list if not entry.startswith(prefix)]
+            env_list.append(prefix + env_var[1].encode('utf-8'))
+    return new_args, env_list
+
+
+@contextmanager
+def _inherited_config_in_environ(patched):
+    '''
+    For the functions which create the subprocess with the environment of the current process
+    the configuration is only set in `os.environ` while the subprocess is created.
+    '''
+    env_var = _get_inherited_config_env_var() if patched else None
+    if env_var is None:
+        yield
+        return
+
+    os.environ[env_var[0]] = env_var[1]
+    try:
+        yield
+    finally:
+        os.environ.pop(env_var[0], None)
+
+
 def _is_managed_arg(arg):
     pydevd_py = _get_str_type_compatible(arg, 'pydevd.py')
     if arg.endswith(pydevd_py):
@@ -458,11 +528,15 @@ def create_execl(original_name):
         os.execlp(file, arg0, arg1, ...)
         os.execlpe(file, arg0, arg1, ..., env)
         """
+        patched = False
         if _get_apply_arg_patching():
-            args = patch_args(args)
+            new_args = patch_args(args)
+            patched = new_args is not args
+            args = new_args
             send_process_created_message()
 
-        return getattr(os, original_name)(path, *args)
+        with _inherited_config_in_environ(patched):
+            return getattr(os, original_name)(path, *args)
 
     return new_execl
 
@@ -474,11 +548,15 @@ def create_execv(original_name):
         os.execv(path, args)
         os.execvp(file, args)
         """
+        patched = False
         if _get_apply_arg_patching():
-            args = patch_args(args)
+            new_args = patch_args(args)
+            patched = new_args is not args
+            args = new_args
             send_process_created_message()
 
-        return getattr(os, original_name)(path, args)
+        with _inherited_config_in_environ(patched):
+            return getattr(os, original_name)(path, args)
 
     return new_execv
 
@@ -491,7 +569,7 @@ def create_execve(original_name):
 
     def new_execve(path, args, env):
         if _get_apply_arg_patching():
-            args = patch_args(args)
+            args, env = _patch_args_and_env(args, env)
             send_process_created_message()
 
         return getattr(os, original_name)(path, args, env)
@@ -506,11 +584,15 @@ def create_spawnl(original_name):
         os.spawnl(mode, path, arg0, arg1, ...)
         os.spawnlp(mode, file, arg0, arg1, ...)
         """
+        patched = False
         if _get_apply_arg_patching():
-            args = patch_args(args)
+            new_args = patch_args(args)
+            patched = new_args is not args
+            args = new_args
             send_process_created_message()
 
-        return getattr(os, original_name)(mode, path, *args)
+        with _inherited_config_in_environ(patched):
+            return getattr(os, original_name)(mode, path, *args)
 
     return new_spawnl
 
@@ -522,11 +604,15 @@ def create_spawnv(original_name):
         os.spawnv(mode, path, args)
         os.spawnvp(mode, file, args)
         """
+        patched = False
         if _get_apply_arg_patching():
-            args = patch_args(args)
+            new_args = patch_args(args)
+            patched = new_args is not args
+            args = new_args
             send_process_created_message()
 
-        return getattr(os, original_name)(mode, path, args)
+        with _inherited_config_in_environ(patched):
+            return getattr(os, original_name)(mode, path, args)
 
     return new_spawnv
 
@@ -539,7 +625,7 @@ def create_spawnve(original_name):
 
     def new_spawnve(mode, path, args, env):
         if _get_apply_arg_patching():
-            args = patch_args(args)
+            args, env = _patch_args_and_env(args, env)
             send_process_created_message()
 
         return getattr(os, original_name)(mode, path, args, env)
@@ -554,7 +640,7 @@ def create_posix_spawn(original_name):
 
     def new_posix_spawn(executable, args, env, **kwargs):
         if _get_apply_arg_patching():
-            args = patch_args(args)
+            args, env = _patch_args_and_env(args, env)
             send_process_created_message()
 
         return getattr(os, original_name)(executable, args, env, **kwargs)
@@ -570,7 +656,7 @@ def create_fork_exec(original_name):
     def new_fork_exec(args, *other_args):
         import _posixsubprocess  # @UnresolvedImport
         if _get_apply_arg_patching():
-            args = patch_args(args)
+            args, other_args = _patch_fork_exec_args(args, other_args)
             send_process_created_message()
 
         return getattr(_posixsubprocess, original_name)(args, *other_args)
@@ -578,6 +664,31 @@ def create_fork_exec(original_name):
     return new_fork_exec
 
 
+def create_subprocess_fork_exec(original_name):
+    """
+    subprocess._fork_exec(args, executable_list, close_fds, ... (13 more))
+
+    Note: on Python 3.11 onwards subprocess keeps its own reference to `_posixsubprocess.fork_exec`.
+    """
+
+    def new_fork_exec(args, *other_args):
+        import subprocess
+        if _get_apply_arg_patching():
+            args, other_args = _patch_fork_exec_args(args, other_args)
+            send_process_created_message()
+
+        return getattr(subprocess, original_name)(args, *other_args)
+
+    return new_fork_exec
+
+
+def _patch_fork_exec_args(args, other_args):
+    # Note: the env_list is the 6th argument (fork_exec(args, executable_list, close_fds, pass_fds, cwd, env_list, ...)).
+    other_args = list(other_args)
+    args, other_args[4] = _patch_fork_exec_args_and_env(args, other_args[4])
+    return args, other_args
+
+
 def create_warn_fork_exec(original_name):
     """
     _posixsubprocess.fork_exec(args, executable_list, close_fds, ... (13 more))
@@ -606,7 +717,16 @@ def create_CreateProcess(original_name):
             import _winapi as _subprocess
 
         if _get_apply_arg_patching():
-            cmd_line = patch_arg_str_win(cmd_line)
+            new_cmd_line = patch_arg_str_win(cmd_line)
+            if new_cmd_line != cmd_line:
+                # CreateProcess(app_name, cmd_line, proc_attrs, thread_attrs, inherit_handles, creation_flags, env_mapping, ...)
+                env_var = _get_inherited_config_env_var()
+                if env_var is not None and len(args) > 4:
+                    args = list(args)
+                    env = dict(os.environ if args[4] is None else args[4])
+                    env[env_var[0]] = env_var[1]
+                    args[4] = env
+            cmd_line = new_cmd_line
             send_process_created_message()
 
         return getattr(_subprocess, original_name)(app_name, cmd_line, *args)
@@ -717,6 +837,10 @@ def patch_new_process_functions():
             try:
                 import _posixsubprocess
                 monkey_patch_module(_posixsubprocess, 'fork_exec', create_fork_exec)
+
+                import subprocess
+                if getattr(subprocess, '_fork_exec', None) is getattr(_posixsubprocess, 'original_fork_exec', None):
+                    monkey_patch_module(subprocess, '_fork_exec', create_subprocess_fork_exec)
             except ImportError:
                 pass
         else:
@@ -30,6 +30,8 @@ class Configuration:
         exclude_tests=None,
         include_files=None,
         django=False,
+        timings_file=None,
+        discovery_index_file=None,
         ):
         self.files_or_dirs = files_or_dirs
         self.verbosity = verbosity
@@ -40,6 +42,8 @@ class Configuration:
         self.jobs = jobs
         self.split_jobs = split_jobs
         self.django = django
+        self.timings_file = timings_file
+        self.discovery_index_file = discovery_index_file
 
         if include_tests:
             assert isinstance(include_tests, (list, tuple))
@@ -67,6 +71,8 @@ class Configuration:
  - files_to_tests: %s
  - jobs: %s
  - split_jobs: %s
+ - timings_file: %s
+ - discovery_index_file: %s
 
  - include_files: %s
  - include_tests: %s
@@ -87,6 +93,8 @@ class Configuration:
         self.files_to_tests,
         self.jobs,
         self.split_jobs,
+        self.timings_file,
+        self.discovery_index_file,
 
         self.include_files,
         self.include_tests,
@@ -117,6 +125,11 @@ def parse_cmdline(argv=None):
     split_jobs='module'|'tests'
         if == module, a given job will always receive all the tests from a module
         if == tests, the tests will be split independently of their originating module (default)
+    timings_file=path (file with the time each test took in previous runs -- the tests expected
+        to take longer are run first and it's updated after each parallel run -- if not given,
+        no timings are kept)
+    discovery_index_file=path (file with the tests found in each module -- when running in parallel, modules which
+        didn't change are not imported to collect the tests to be distributed among the jobs)
 
     --exclude_files  = comma-separated list of patterns with files to exclude (fnmatch style)
     --include_files = comma-separated list of patterns with files to include (fnmatch style)
@@ -140,6 +153,8 @@ def parse_cmdline(argv=None):
     exclude_tests = None
     include_files = None
     django = False
+    timings_file = None
+    discovery_index_file = None
 
     from _pydev_bundle._pydev_getopt import gnu_getopt
     optlist, dirs = gnu_getopt(
@@ -153,6 +168,8 @@ def parse_cmdline(argv=None):
 
             "jobs=",
             "split_jobs=",
+            "timings_file=",
+            "discovery_index_file=",
 
             "include_tests=",
             "include_files=",
@@ -182,6 +199,12 @@ def parse_cmdline(argv=None):
             if split_jobs not in ('module', 'tests'):
                 raise AssertionError('Expected split to be either "module" or "tests". Was :%s' % (split_jobs,))
 
+        elif opt in ("--timings_file",):
+            timings_file = value.strip()
+
+        elif opt in ("--discovery_index_file",):
+            discovery_index_file = value.strip()
+
         elif opt in ("-d", "--coverage_output_dir",):
             coverage_output_dir = value.strip()
 
@@ -264,6 +287,8 @@ def parse_cmdline(argv=None):
         exclude_tests=exclude_tests,
         include_files=include_files,
         django=django,
+        timings_file=timings_file,
+        discovery_index_file=discovery_index_file,
     )
 
     if verbosity > 5:
@@ -669,37 +694,88 @@ class PydevTestRunner(object):
                     #changed in python 2.5
                     testMethodName = test_obj._testMethodName
 
-                add = True
-                if self.configuration.exclude_tests:
-                    for pat in self.configuration.exclude_tests:
-                        if fnmatch.fnmatchcase(testMethodName, pat):
-                            if self.verbosity > 3:
-                                sys.stdout.write('Skipped test: %s (matched exclude_tests pattern: %s)\n' % (testMethodName, pat))
-
-                            elif self.verbosity > 2:
-                                sys.stdout.write('Skipped test: %s\n' % (testMethodName,))
-
-                            add = False
-                            break
-
-                if add:
+                if not self.__is_excluded_test(testMethodName):
                     if self.__match_tests(self.tests, test_obj, testMethodName):
-                        include = True
-                        if self.configuration.include_tests:
-                            include = False
-                            for pat in self.configuration.include_tests:
-                                if fnmatch.fnmatchcase(testMethodName, pat):
-                                    include = True
-                                    break
-                        if include:
+                        if self.__is_included_test(testMethodName):
                             test_suite.append(test_obj)
-                        else:
-                            if self.verbosity > 3:
-                                sys.stdout.write('Skipped test: %s (did not match any include_tests pattern %s)\n' % (
-                                    testMethodName, self.configuration.include_tests,))
         return test_suite
 
 
+    def __is_excluded_test(self, test_method_name):
+        if self.configuration.exclude_tests:
+            for pat in self.configuration.exclude_tests:
+                if fnmatch.fnmatchcase(test_method_name, pat):
+                    if self.verbosity > 3:
+                        sys.stdout.write('Skipped test: %s (matched exclude_tests pattern: %s)\n' % (test_method_name, pat))
+
+                    elif self.verbosity > 2:
+                        sys.stdout.write('Skipped test: %s\n' % (test_method_name,))
+
+                    return True
+        return False
+
+
+    def __is_included_test(self, test_method_name):
+        if self.configuration.include_tests:
+            for pat in self.configuration.include_tests:
+                if fnmatch.fnmatchcase(test_method_name, pat):
+                    return True
+
+            if self.verbosity > 3:
+                sys.stdout.write('Skipped test: %s (did not match any include_tests pattern %s)\n' % (
+                    test_method_name, self.configuration.include_tests,))
+            return False
+        return True
+
+
+    def get_discovery_index(self):
+        """ returns the DiscoveryIndex to be used (or None if the tests from all the modules must be imported) """
+        if self.jobs < 2 or not self.configuration.discovery_index_file:
+            return None
+
+        if self.files_to_tests or self.tests:
+            #The index has all the tests from a module (and these filters are applied when loading the tests).
+            return None
+
+        from _pydev_runfiles.pydev_runfiles_discovery_index import DiscoveryIndex
+        return DiscoveryIndex(self.configuration.discovery_index_file)
+
+
+    def find_indexed_tests(self, discovery_index, pyfiles):
+        """ returns the files which must still be imported and the (pyfile, module_name, test_name) of the tests
+            which were found in the index (the include/exclude patterns are already applied) """
+        files_to_import = []
+        indexed_tests = []
+        for pyfile in pyfiles:
+            indexed = discovery_index.get(pyfile)
+            if indexed is None:
+                files_to_import.append(pyfile)
+                continue
+
+            module_name, test_names = indexed
+            if self.verbosity > 3:
+                sys.stdout.write('Tests from: %s found in the discovery index.\n' % (pyfile,))
+
+            for test_name in test_names:
+                test_method_name = test_name.split('.')[-1]
+                if not self.__is_excluded_test(test_method_name) and self.__is_included_test(test_method_name):
+                    indexed_tests.append((pyfile, module_name, test_name))
+
+        return files_to_import, indexed_tests
+
+
+    def update_discovery_index(self, discovery_index, file_and_modules_and_module_name, test_objs):
+        """ adds the tests found in the given modules (before filtering) to the index """
+        from _pydev_runfiles.pydev_runfiles_discovery_index import get_test_name
+        pyfile_to_test_names = {}
+        for test_case in self.iter_tests(test_objs):
+            pyfile_to_test_names.setdefault(test_case.__pydev_pyfile__, []).append(get_test_name(test_case))
+
+        for pyfile, _m, module_name in file_and_modules_and_module_name:
+            discovery_index.set(pyfile, module_name, pyfile_to_test_names.get(pyfile, []))
+        discovery_index.save()
+
+
     def iter_tests(self, test_objs):
         #Note: not using yield because of Jython 2.1.
         import unittest
@@ -767,16 +843,23 @@ class PydevTestRunner(object):
         if handle_coverage:
             coverage_files, coverage = start_coverage_support(self.configuration)
 
+        indexed_tests = []
+        discovery_index = self.get_discovery_index()
+        if discovery_index is not None:
+            files, indexed_tests = self.find_indexed_tests(discovery_index, files)
+
         file_and_modules_and_module_name = self.find_modules_from_files(files)
         sys.stdout.write("done.\n")
 
         all_tests = self.find_tests_from_modules(file_and_modules_and_module_name)
+        if discovery_index is not None:
+            self.update_discovery_index(discovery_index, file_and_modules_and_module_name, all_tests)
         all_tests = self.filter_tests(all_tests)
 
         from _pydev_runfiles import pydev_runfiles_unittest
         test_suite = pydev_runfiles_unittest.PydevTestSuite(all_tests)
         from _pydev_runfiles import pydev_runfiles_xml_rpc
-        pydev_runfiles_xml_rpc.notifyTestsCollected(test_suite.countTestCases())
+        pydev_runfiles_xml_rpc.notifyTestsCollected(test_suite.countTestCases() + len(indexed_tests))
 
         start_time = time.time()
 
@@ -789,9 +872,16 @@ class PydevTestRunner(object):
                 #(e.g.: 2 jobs were requested for running 1 test) -- in which case execute_tests_in_parallel will
                 #return False and won't run any tests.
                 executed_in_parallel = pydev_runfiles_parallel.execute_tests_in_parallel(
-                    all_tests, self.jobs, self.split_jobs, self.verbosity, coverage_files, self.configuration.coverage_include)
+                    all_tests, self.jobs, self.split_jobs, self.verbosity, coverage_files, self.configuration.coverage_include,
+                    self.configuration.timings_file, indexed_tests)
 
             if not executed_in_parallel:
+                if indexed_tests:
+                    #The tests will be run in this process after all, so, the modules from the index must be imported.
+                    indexed_files = self.remove_duplicates_keeping_order([pyfile for pyfile, _, _ in indexed_tests])
+                    test_suite.addTests(self.filter_tests(
+                        self.find_tests_from_modules(self.find_modules_from_files(indexed_files))))
+
                 #If in coverage, we don't need to pass anything here (coverage is already enabled for this execution).
                 runner = pydev_runfiles_unittest.PydevTextTestRunner(stream=sys.stdout, descriptions=1, verbosity=self.verbosity)
                 sys.stdout.write('\n')
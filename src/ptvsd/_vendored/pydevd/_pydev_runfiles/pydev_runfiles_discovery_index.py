@@ -0,0 +1,99 @@
+'''
+On-disk index with the tests each module contributes (keyed by the file path and validated by its mtime and size).
+
+When running tests in parallel the process which distributes the tests only needs the test names (the jobs import
+the modules they run), so, modules which didn't change since the last run are served from the index without being
+imported.
+
+Note: only the module file itself is checked, so, if a test module gets tests from another module (i.e.: a base class
+defined elsewhere), changing only that other module won't invalidate its entry.
+'''
+import json
+import os
+import sys
+
+
+#=======================================================================================================================
+# get_test_name
+#=======================================================================================================================
+def get_test_name(test_case):
+    '''
+    @return: str
+        The name of the test in the format: TestCase.testName
+    '''
+    try:
+        return test_case.__class__.__name__ + "." + test_case._testMethodName
+    except AttributeError:
+        #Support for jython 2.1 (__testMethodName is pseudo-private in the test case)
+        return test_case.__class__.__name__ + "." + test_case._TestCase__testMethodName
+
+
+#=======================================================================================================================
+# DiscoveryIndex
+#=======================================================================================================================
+class DiscoveryIndex(object):
+
+    def __init__(self, index_file):
+        self.index_file = index_file
+        self._changed = False
+
+        # pyfile -> {'mtime': float, 'size': int, 'module_name': str, 'tests': list(str)}
+        self._pyfile_to_entry = {}
+
+        try:
+            if os.path.exists(index_file):
+                with open(index_file, 'r') as stream:
+                    self._pyfile_to_entry = json.load(stream)
+        except:
+            sys.stderr.write('Unable to load test discovery index from: %s\n' % (index_file,))
+
+    def _get_stat(self, pyfile):
+        try:
+            stat = os.stat(pyfile)
+        except OSError:
+            return None
+        return stat.st_mtime, stat.st_size
+
+    def get(self, pyfile):
+        '''
+        @return: tuple(str, list(str))|None
+            The module name and the tests (in the format TestCase.testName) of the given file or None if the file
+            is not in the index (or changed since it was indexed).
+        '''
+        entry = self._pyfile_to_entry.get(pyfile)
+        if entry is None:
+            return None
+
+        stat = self._get_stat(pyfile)
+        if stat is None or stat != (entry['mtime'], entry['size']):
+            return None
+
+        return entry['module_name'], entry['tests']
+
+    def set(self, pyfile, module_name, tests):
+        '''
+        @param tests: list(str)
+            The tests (in the format TestCase.testName) found in the given file.
+        '''
+        stat = self._get_stat(pyfile)
+        if stat is None:
+            return
+
+        self._pyfile_to_entry[pyfile] = {
+            'mtime': stat[0],
+            'size': stat[1],
+            'module_name': module_name,
+            'tests': tests,
+        }
+        self._changed = True
+
+    def save(self):
+        if not self._changed:
+            return
+
+        try:
+            with open(self.index_file, 'w') as stream:
+                json.dump(self._pyfile_to_entry, stream)
+            self._changed = False
+        except:
+            sys.stderr.write('Unable to save test discovery index to: %s\n' % (self.index_file,))
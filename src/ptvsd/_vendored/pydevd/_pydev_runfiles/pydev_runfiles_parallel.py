@@ -5,10 +5,26 @@ try:
 except:
     import queue as Queue #@UnresolvedImport
 from _pydev_runfiles import pydev_runfiles_xml_rpc
+from _pydev_runfiles.pydev_runfiles_discovery_index import get_test_name
 import time
 import os
 import threading
 import sys
+import json
+import tempfile
+
+try:
+    _replace = os.replace
+except AttributeError:  # Python 2
+
+    def _replace(src, dst):
+        if sys.platform == 'win32' and os.path.exists(dst):
+            os.remove(dst)  # os.rename() doesn't overwrite on Windows.
+        os.rename(src, dst)
+
+# Time (in seconds) expected for a test without any timing information (when no test has timing
+# information, all the tests are considered to take the same time).
+_DEFAULT_EXPECTED_TIME = 0.1
 
 #=======================================================================================================================
 # flatten_test_suite
@@ -22,10 +38,169 @@ def flatten_test_suite(test_suite, ret):
         ret.append(test_suite)
 
 
+#=======================================================================================================================
+# TestsTimings
+#=======================================================================================================================
+class TestsTimings(object):
+    '''
+    History with the time that each test took in previous runs (kept in a json file), used to
+    schedule the tests which are expected to take longer first.
+
+    Tests are identified as: filename|Test.testName
+
+    If no timings file is given, the times are only used for the report of the current run.
+    '''
+
+    def __init__(self, timings_file=None):
+        self.timings_file = timings_file
+        self._lock = threading.Lock()
+        self._test_to_time = {}
+        self._job_to_time = {}
+        self._batch_times = []
+
+        if not timings_file:
+            return
+
+        try:
+            if os.path.exists(timings_file):
+                with open(timings_file, 'r') as stream:
+                    self._test_to_time = json.load(stream)
+        except:
+            sys.stderr.write('Unable to load test timings from: %s\n' % (timings_file,))
+
+    def get_expected_time(self, test_ids):
+        '''
+        @param test_ids: list(str)
+        @return: float
+            The time the given tests are expected to take.
+        '''
+        test_to_time = self._test_to_time
+        if test_to_time:
+            default = sum(test_to_time.values()) / len(test_to_time)
+        else:
+            default = _DEFAULT_EXPECTED_TIME
+
+        return sum(test_to_time.get(test_id, default) for test_id in test_ids)
+
+    def on_test_finished(self, job_id, test_id, elapsed):
+        try:
+            elapsed = float(elapsed)
+        except (TypeError, ValueError):
+            return  # i.e.: no time available (import error).
+
+        with self._lock:
+            self._test_to_time[test_id] = elapsed
+            self._job_to_time[job_id] = self._job_to_time.get(job_id, 0) + elapsed
+
+    def on_batch_finished(self, elapsed):
+        with self._lock:
+            self._batch_times.append(elapsed)
+
+    def save(self):
+        if not self.timings_file:
+            return
+
+        try:
+            with self._lock:
+                contents = json.dumps(self._test_to_time)
+
+            # Written to a temporary file which is then renamed so that a concurrent run (or a
+            # run which is interrupted) never sees a partially written file.
+            fd, tmp_file = tempfile.mkstemp(
+                prefix='.pydev_runfiles_timings', dir=os.path.dirname(os.path.abspath(self.timings_file)))
+            try:
+                with os.fdopen(fd, 'w') as stream:
+                    stream.write(contents)
+                _replace(tmp_file, self.timings_file)
+            except:
+                os.remove(tmp_file)
+                raise
+        except:
+            sys.stderr.write('Unable to save test timings to: %s\n' % (self.timings_file,))
+
+    def get_report(self, jobs, wall_time):
+        '''
+        @return: str
+            A report on how the time was distributed among the jobs (the critical path of the run is
+            the biggest batch or the total time divided by the jobs, whichever is bigger).
+        '''
+        with self._lock:
+            total_time = sum(self._job_to_time.values())
+            busiest_job_time = max(self._job_to_time.values()) if self._job_to_time else 0
+            biggest_batch_time = max(self._batch_times) if self._batch_times else 0
+
+        ideal_time = total_time / jobs
+        return (
+            'Tests time: %.2f secs (ideal with %s jobs: %.2f secs, busiest job: %.2f secs, '
+            'biggest batch: %.2f secs, wall time: %.2f secs).\n' % (
+                total_time, jobs, ideal_time, busiest_job_time, biggest_batch_time, wall_time))
+
+
+#=======================================================================================================================
+# schedule_batches
+#=======================================================================================================================
+def schedule_batches(batches, jobs, timings, split_by_class=False):
+    '''
+    @param batches: list(list(str))
+        The batches of tests to be run (each test is in the format: filename|Test.testName).
+
+    @param split_by_class: bool
+        If True, batches which are expected to take longer than the total time divided by the
+        number of jobs are split in a batch per test class (so that a big module doesn't end up
+        being the critical path of the run).
+
+    @return: list(list(str))
+        The batches sorted so that the ones expected to take longer are run first (as each job
+        asks for a new batch when it finishes the previous one, the shorter ones at the end
+        balance the work among the jobs).
+    '''
+    expected = [(timings.get_expected_time(batch), batch) for batch in batches]
+    if split_by_class and jobs > 1:
+        max_batch_time = sum(t for t, _batch in expected) / jobs
+        new_expected = []
+        for t, batch in expected:
+            if t <= max_batch_time:
+                new_expected.append((t, batch))
+                continue
+
+            class_to_tests = {}
+            classes = []
+            for test_id in batch:
+                class_name = test_id.split('|')[-1].split('.')[0]
+                if class_name not in class_to_tests:
+                    classes.append(class_name)
+                class_to_tests.setdefault(class_name, []).append(test_id)
+
+            for class_name in classes:
+                class_batch = class_to_tests[class_name]
+                new_expected.append((timings.get_expected_time(class_batch), class_batch))
+        expected = new_expected
+
+    # Note: stable sort (so, the discovery order is kept for batches with the same expected time).
+    expected.sort(key=lambda entry: -entry[0])
+    return [batch for _t, batch in expected]
+
+
+#=======================================================================================================================
+# _is_debugging_subprocesses
+#=======================================================================================================================
+def _is_debugging_subprocesses():
+    '''
+    @return: bool
+        True if the debugger patched the functions which create new processes (so, the jobs are also debugged).
+    '''
+    from pydevd import SetupHolder
+    setup = SetupHolder.setup
+    if not setup:
+        return False
+    return bool(setup.get('multiprocess') or setup.get('multiproc'))
+
+
 #=======================================================================================================================
 # execute_tests_in_parallel
 #=======================================================================================================================
-def execute_tests_in_parallel(tests, jobs, split, verbosity, coverage_files, coverage_include):
+def execute_tests_in_parallel(
+        tests, jobs, split, verbosity, coverage_files, coverage_include, timings_file=None, indexed_tests=None):
     '''
     @param tests: list(PydevTestSuite)
         A list with the suites to be run
@@ -40,16 +215,26 @@ def execute_tests_in_parallel(tests, jobs, split, verbosity, coverage_files, cov
     @param coverage_include: str
         The pattern that should be included in the coverage.
 
+    @param timings_file: str
+        The file with the time each test took in previous runs (used to run the tests which are
+        expected to take longer first and which is updated with the times of this run). If not
+        given, the tests are run in the discovery order and no times are kept.
+
+    @param indexed_tests: list(tuple(str, str, str))
+        Tests to be run which weren't imported (they came from the discovery index), where each entry is a tuple with
+        the file, module name and test name (in the format: Test.testName).
+
     @return: bool
         Returns True if the tests were actually executed in parallel. If the tests were not executed because only 1
         should be used (e.g.: 2 jobs were requested for running 1 test), False will be returned and no tests will be
         run.
 
-        It may also return False if in debug mode (in which case, multi-processes are not accepted)
+        It may also return False if in debug mode and the debugger is not tracing subprocesses (when it is,
+        each job is started as a subprocess which is automatically attached to the debugger).
     '''
     try:
         from _pydevd_bundle.pydevd_comm import get_global_debugger
-        if get_global_debugger() is not None:
+        if get_global_debugger() is not None and not _is_debugging_subprocesses():
             return False
     except:
         pass #Ignore any error here.
@@ -59,65 +244,58 @@ def execute_tests_in_parallel(tests, jobs, split, verbosity, coverage_files, cov
     #from a given module.
     tests_queue = []
 
-    queue_elements = []
+    # Each entry is a tuple(file, module name, test name).
+    all_tests = []
+    for test in tests:
+        lst = []
+        flatten_test_suite(test, lst)
+        for test_case in lst:
+            all_tests.append((test_case.__pydev_pyfile__, test_case.__pydev_module_name__, get_test_name(test_case)))
+
+    if indexed_tests:
+        all_tests.extend(indexed_tests)
+
     if split == 'module':
         module_to_tests = {}
-        for test in tests:
-            lst = []
-            flatten_test_suite(test, lst)
-            for test in lst:
-                key = (test.__pydev_pyfile__, test.__pydev_module_name__)
-                module_to_tests.setdefault(key, []).append(test)
-
-        for key, tests in module_to_tests.items():
-            queue_elements.append(tests)
+        modules = []
+        for pyfile, module_name, test_name in all_tests:
+            key = (pyfile, module_name)
+            if key not in module_to_tests:
+                modules.append(key)
+            module_to_tests.setdefault(key, []).append(pyfile+'|'+test_name)
 
-        if len(queue_elements) < jobs:
-            #Don't create jobs we will never use.
-            jobs = len(queue_elements)
+        for key in modules:
+            tests_queue.append(module_to_tests[key])
 
     elif split == 'tests':
-        for test in tests:
-            lst = []
-            flatten_test_suite(test, lst)
-            for test in lst:
-                queue_elements.append([test])
-
-        if len(queue_elements) < jobs:
-            #Don't create jobs we will never use.
-            jobs = len(queue_elements)
+        for pyfile, module_name, test_name in all_tests:
+            tests_queue.append([pyfile+'|'+test_name])
 
     else:
         raise AssertionError('Do not know how to handle: %s' % (split,))
 
-    for test_cases in queue_elements:
-        test_queue_elements = []
-        for test_case in test_cases:
-            try:
-                test_name = test_case.__class__.__name__+"."+test_case._testMethodName
-            except AttributeError:
-                #Support for jython 2.1 (__testMethodName is pseudo-private in the test case)
-                test_name = test_case.__class__.__name__+"."+test_case._TestCase__testMethodName
-
-            test_queue_elements.append(test_case.__pydev_pyfile__+'|'+test_name)
-
-        tests_queue.append(test_queue_elements)
+    if len(tests_queue) < jobs:
+        #Don't create jobs we will never use.
+        jobs = len(tests_queue)
 
     if jobs < 2:
         return False
 
     sys.stdout.write('Running tests in parallel with: %s jobs.\n' %(jobs,))
 
+    timings = TestsTimings(timings_file)
+    tests_queue = schedule_batches(tests_queue, jobs, timings, split_by_class=split == 'module')
 
     queue = Queue.Queue()
     for item in tests_queue:
         queue.put(item, block=False)
 
+    start_time = time.time()
 
     providers = []
     clients = []
     for i in range(jobs):
-        test_cases_provider = CommunicationThread(queue)
+        test_cases_provider = CommunicationThread(queue, timings)
         providers.append(test_cases_provider)
 
         test_cases_provider.start()
@@ -144,6 +322,8 @@ def execute_tests_in_parallel(tests, jobs, split, verbosity, coverage_files, cov
     for provider in providers:
         provider.shutdown()
 
+    timings.save()
+    sys.stdout.write(timings.get_report(jobs, time.time() - start_time))
     return True
 
 
@@ -153,10 +333,12 @@ def execute_tests_in_parallel(tests, jobs, split, verbosity, coverage_files, cov
 #=======================================================================================================================
 class CommunicationThread(threading.Thread):
 
-    def __init__(self, tests_queue):
+    def __init__(self, tests_queue, timings=None):
         threading.Thread.__init__(self)
-        self.setDaemon(True)
+        self.daemon = True
         self.queue = tests_queue
+        self.timings = timings
+        self._batch_start_time = None
         self.finished = False
         from _pydev_bundle.pydev_imports import SimpleXMLRPCServer
 
@@ -196,8 +378,14 @@ class CommunicationThread(threading.Thread):
         @return: list(str)
             Each entry is a string in the format: filename|Test.testName
         '''
+        if self.timings is not None and self._batch_start_time is not None:
+            # Note: a job only asks for a new batch after finishing the previous one.
+            self.timings.on_batch_finished(time.time() - self._batch_start_time)
+            self._batch_start_time = None
+
         try:
             ret = self.queue.get(block=False)
+            self._batch_start_time = time.time()
             return ret
         except: #Any exception getting from the queue (empty or not) means we finished our work on providing the tests.
             self.finished = True
@@ -218,6 +406,9 @@ class CommunicationThread(threading.Thread):
 
     def notifyTest(self, job_id, *args, **kwargs):
         pydev_runfiles_xml_rpc.notifyTest(*args, **kwargs)
+        if self.timings is not None and len(args) == 6:
+            _cond, _captured_output, _error_contents, file, test, elapsed = args
+            self.timings.on_test_finished(job_id, '%s|%s' % (file, test), elapsed)
         return True
 
     def shutdown(self):
@@ -243,7 +434,7 @@ class ClientThread(threading.Thread):
 
     def __init__(self, job_id, port, verbosity, coverage_output_file=None, coverage_include=None):
         threading.Thread.__init__(self)
-        self.setDaemon(True)
+        self.daemon = True
         self.port = port
         self.job_id = job_id
         self.verbosity = verbosity
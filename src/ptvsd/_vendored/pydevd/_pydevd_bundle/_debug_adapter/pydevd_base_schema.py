@@ -53,6 +53,30 @@ _event_to_types = {}
 _all_messages = {}
 
 
+def _load_schema():
+    # The generated `pydevd_schema` registers its classes on import (note: this is a
+    # really big module, so, it's only imported on demand to keep the startup fast).
+    if not _all_messages:
+        from _pydevd_bundle._debug_adapter import pydevd_schema  # @UnusedImport
+
+
+class _LazySchemaModule(object):
+    '''
+    Provides access to the contents of `pydevd_schema` without importing it
+    until the first attribute is actually requested.
+    '''
+
+    def __getattr__(self, name):
+        from _pydevd_bundle._debug_adapter import pydevd_schema
+        ret = getattr(pydevd_schema, name)
+        # Cache it so that __getattr__ is not called again for the same name.
+        setattr(self, name, ret)
+        return ret
+
+
+lazy_schema = _LazySchemaModule()
+
+
 def register(cls):
     _all_messages[cls.__name__] = cls
     return cls
@@ -85,12 +109,69 @@ def register_event(event):
     return do_register
 
 
+# Requests received frequently (i.e.: when stepping) -> name of the class of their arguments (or
+# None if it has no ids). These aren't converted to the full object graph: the arguments are
+# accessed through a `DictView` and only the ids the schema declares are translated.
+_FAST_REQUESTS = {
+    'continue': 'ContinueArguments',
+    'next': 'NextArguments',
+    'stepIn': 'StepInArguments',
+    'stepOut': 'StepOutArguments',
+    'pause': 'PauseArguments',
+    'stackTrace': 'StackTraceArguments',
+    'scopes': 'ScopesArguments',
+    'variables': 'VariablesArguments',
+    'threads': None,
+}
+
+
+class DictView(object):
+    '''
+    Provides read-only attribute access to the contents of a dict (as in the generated schema
+    classes, missing properties are None).
+    '''
+
+    __slots__ = ['_dct']
+
+    def __init__(self, dct):
+        self._dct = dct
+
+    def __getattr__(self, name):
+        try:
+            value = self._dct[name]
+        except KeyError:
+            if name.startswith('__'):
+                raise AttributeError(name)
+            return None
+
+        if value.__class__ == dict:
+            return DictView(value)
+        return value
+
+    def to_dict(self, update_ids_to_dap=False):
+        return self._dct
+
+
+def _fast_request_from_dict(dct, arguments_class_name, update_ids_from_dap):
+    arguments = dct.get('arguments')
+    if update_ids_from_dap and arguments_class_name is not None and arguments:
+        # Note: copied (the received dict isn't changed, as with the generated classes).
+        dct = dct.copy()
+        dct['arguments'] = _all_messages[arguments_class_name].update_dict_ids_from_dap(arguments.copy())
+    return DictView(dct)
+
+
 def from_dict(dct, update_ids_from_dap=False):
+    _load_schema()
     msg_type = dct.get('type')
     if msg_type is None:
         raise ValueError('Unable to make sense of message: %s' % (dct,))
 
     if msg_type == 'request':
+        command = dct['command']
+        if command in _FAST_REQUESTS:
+            return _fast_request_from_dict(dct, _FAST_REQUESTS[command], update_ids_from_dap)
+
         to_type = _requests_to_types
         use = dct['command']
 
@@ -131,17 +212,35 @@ def from_json(json_msg, update_ids_from_dap=False, on_dict_loaded=lambda dct:Non
 
 
 def get_response_class(request):
+    _load_schema()
     if request.__class__ == dict:
         return _responses_to_types[request['command']]
     return _responses_to_types[request.command]
 
 
+def build_response_dict(request_seq, command, body=None):
+    '''
+    Like `build_response`, but the response is created directly as a dict (which is sent as is,
+    so, any ids in the body must already be translated with `update_dict_ids_to_dap`).
+    '''
+    dct = {
+        'type': 'response',
+        'request_seq': request_seq,
+        'success': True,
+        'command': command,
+    }
+    if body is not None:
+        dct['body'] = body
+    return dct
+
+
 def build_response(request, kwargs=None):
     if kwargs is None:
         kwargs = {'success':True}
     else:
         if 'success' not in kwargs:
             kwargs['success'] = True
+    _load_schema()
     response_class = _responses_to_types[request.command]
     kwargs.setdefault('seq', -1)  # To be overwritten before sending
     return response_class(command=request.command, request_seq=request.seq, **kwargs)
@@ -13275,6 +13275,92 @@ class PydevdInputRequestedEvent(BaseSchema):
         return dct
 
 
+@register_event('pydevdVariablesUpdated')
+@register
+class PydevdVariablesUpdatedEvent(BaseSchema):
+    """
+    The event indicates that the values of variables previously sent with a placeholder value (because
+    computing them exceeded the time budget of the 'variables' request) are now available.
+    
+    The variables have the same name and evaluateName previously sent in the 'variables' response.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "event"
+            ]
+        },
+        "event": {
+            "type": "string",
+            "enum": [
+                "pydevdVariablesUpdated"
+            ]
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "variablesReference": {
+                    "type": "integer",
+                    "description": "The variablesReference used in the 'variables' request."
+                },
+                "variables": {
+                    "type": "array",
+                    "items": {
+                        "$ref": "#/definitions/Variable"
+                    },
+                    "description": "The variables with the computed values."
+                }
+            },
+            "required": [
+                "variablesReference",
+                "variables"
+            ]
+        }
+    }
+    __refs__ = set(['body'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param string event: 
+        :param PydevdVariablesUpdatedEventBody body: 
+        :param integer seq: Sequence number.
+        """
+        self.type = 'event'
+        self.event = 'pydevdVariablesUpdated'
+        if body is None:
+            self.body = PydevdVariablesUpdatedEventBody()
+        else:
+            self.body = PydevdVariablesUpdatedEventBody(update_ids_from_dap=update_ids_from_dap, **body) if body.__class__ !=  PydevdVariablesUpdatedEventBody else body
+        self.seq = seq
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        event = self.event
+        body = self.body
+        seq = self.seq
+        dct = {
+            'type': type,
+            'event': event,
+            'body': body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
 @register_request('setPydevdSourceMap')
 @register
 class SetPydevdSourceMapRequest(BaseSchema):
@@ -13642,22 +13728,30 @@ class PydevdSystemInfoArguments(BaseSchema):
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {}
+    __props__ = {
+        "compactEncoding": {
+            "type": "boolean",
+            "description": "If true, the client can read messages in the compact encoding (and the debugger should use it for the messages it sends after this request)."
+        }
+    }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, compactEncoding=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-    
+        :param boolean compactEncoding: If true, the client can read messages in the compact encoding (and the debugger should use it for the messages it sends after this request).
         """
-    
+        self.compactEncoding = compactEncoding
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        compactEncoding = self.compactEncoding
         dct = {
         }
+        if compactEncoding is not None:
+            dct['compactEncoding'] = compactEncoding
         dct.update(self.kwargs)
         return dct
 
@@ -13716,6 +13810,14 @@ class PydevdSystemInfoResponse(BaseSchema):
                 "pydevd": {
                     "$ref": "#/definitions/PydevdInfo",
                     "description": "Information about pydevd."
+                },
+                "compactEncoding": {
+                    "type": "boolean",
+                    "description": "If true, the debugger accepted the compact encoding (so, the client may use it for the messages it sends after this response)."
+                },
+                "inheritedConfig": {
+                    "type": "boolean",
+                    "description": "If true, the debugger applied the configuration inherited from the parent process (so, it may be started with the 'pydevdRunWithInheritedConfig' request)."
                 }
             },
             "required": [
@@ -14221,1208 +14323,3398 @@ class PydevdAuthorizeResponse(BaseSchema):
         return dct
 
 
+@register_request('pydevdRunWithInheritedConfig')
 @register
-class ErrorResponseBody(BaseSchema):
+class PydevdRunWithInheritedConfigRequest(BaseSchema):
     """
-    "body" of ErrorResponse
+    A request to start running the user code in a subprocess which was already configured with the
+    configuration inherited from its parent process (i.e.: without waiting for the 'configurationDone'
+    request).
+    
+    The notifications that a thread was suspended are only sent after the 'configurationDone' request is
+    received.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "error": {
-            "description": "An optional, structured error message.",
-            "type": "Message"
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "request"
+            ]
+        },
+        "command": {
+            "type": "string",
+            "enum": [
+                "pydevdRunWithInheritedConfig"
+            ]
+        },
+        "arguments": {
+            "type": "PydevdRunWithInheritedConfigArguments"
         }
     }
-    __refs__ = set(['error'])
+    __refs__ = set(['arguments'])
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, error=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param Message error: An optional, structured error message.
+        :param string type: 
+        :param string command: 
+        :param integer seq: Sequence number.
+        :param PydevdRunWithInheritedConfigArguments arguments: 
         """
-        if error is None:
-            self.error = Message()
+        self.type = 'request'
+        self.command = 'pydevdRunWithInheritedConfig'
+        self.seq = seq
+        if arguments is None:
+            self.arguments = PydevdRunWithInheritedConfigArguments()
         else:
-            self.error = Message(update_ids_from_dap=update_ids_from_dap, **error) if error.__class__ !=  Message else error
+            self.arguments = PydevdRunWithInheritedConfigArguments(update_ids_from_dap=update_ids_from_dap, **arguments) if arguments.__class__ !=  PydevdRunWithInheritedConfigArguments else arguments
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        error = self.error
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        seq = self.seq
+        arguments = self.arguments
         dct = {
+            'type': type,
+            'command': command,
+            'seq': seq,
         }
-        if error is not None:
-            dct['error'] = error.to_dict(update_ids_to_dap=update_ids_to_dap)
+        if arguments is not None:
+            dct['arguments'] = arguments.to_dict(update_ids_to_dap=update_ids_to_dap)
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class StoppedEventBody(BaseSchema):
+class PydevdRunWithInheritedConfigArguments(BaseSchema):
     """
-    "body" of StoppedEvent
+    Arguments for 'pydevdRunWithInheritedConfig' request.
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {
-        "reason": {
-            "type": "string",
-            "description": "The reason for the event.\nFor backward compatibility this string is shown in the UI if the 'description' attribute is missing (but it must not be translated).",
-            "_enum": [
-                "step",
-                "breakpoint",
-                "exception",
-                "pause",
-                "entry",
-                "goto",
-                "function breakpoint",
-                "data breakpoint"
-            ]
-        },
-        "description": {
-            "type": "string",
-            "description": "The full reason for the event, e.g. 'Paused on exception'. This string is shown in the UI as is and must be translated."
-        },
-        "threadId": {
-            "type": "integer",
-            "description": "The thread which was stopped."
-        },
-        "preserveFocusHint": {
-            "type": "boolean",
-            "description": "A value of true hints to the frontend that this event should not change the focus."
-        },
-        "text": {
-            "type": "string",
-            "description": "Additional information. E.g. if reason is 'exception', text contains the exception name. This string is shown in the UI."
-        },
-        "allThreadsStopped": {
-            "type": "boolean",
-            "description": "If 'allThreadsStopped' is true, a debug adapter can announce that all threads have stopped.\n- The client should use this information to enable that all threads can be expanded to access their stacktraces.\n- If the attribute is missing or false, only the thread with the given threadId can be expanded."
-        }
-    }
+    __props__ = {}
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, reason, description=None, threadId=None, preserveFocusHint=None, text=None, allThreadsStopped=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
-        """
-        :param string reason: The reason for the event.
-        For backward compatibility this string is shown in the UI if the 'description' attribute is missing (but it must not be translated).
-        :param string description: The full reason for the event, e.g. 'Paused on exception'. This string is shown in the UI as is and must be translated.
-        :param integer threadId: The thread which was stopped.
-        :param boolean preserveFocusHint: A value of true hints to the frontend that this event should not change the focus.
-        :param string text: Additional information. E.g. if reason is 'exception', text contains the exception name. This string is shown in the UI.
-        :param boolean allThreadsStopped: If 'allThreadsStopped' is true, a debug adapter can announce that all threads have stopped.
-        - The client should use this information to enable that all threads can be expanded to access their stacktraces.
-        - If the attribute is missing or false, only the thread with the given threadId can be expanded.
+    def __init__(self, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        self.reason = reason
-        self.description = description
-        self.threadId = threadId
-        self.preserveFocusHint = preserveFocusHint
-        self.text = text
-        self.allThreadsStopped = allThreadsStopped
-        if update_ids_from_dap:
-            self.threadId = self._translate_id_from_dap(self.threadId)
-        self.kwargs = kwargs
     
+        """
     
-    @classmethod
-    def update_dict_ids_from_dap(cls, dct):
-        if 'threadId' in dct:
-            dct['threadId'] = cls._translate_id_from_dap(dct['threadId'])
-        return dct
+        self.kwargs = kwargs
+
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        reason = self.reason
-        description = self.description
-        threadId = self.threadId
-        preserveFocusHint = self.preserveFocusHint
-        text = self.text
-        allThreadsStopped = self.allThreadsStopped
-        if update_ids_to_dap:
-            if threadId is not None:
-                threadId = self._translate_id_to_dap(threadId)
         dct = {
-            'reason': reason,
         }
-        if description is not None:
-            dct['description'] = description
-        if threadId is not None:
-            dct['threadId'] = threadId
-        if preserveFocusHint is not None:
-            dct['preserveFocusHint'] = preserveFocusHint
-        if text is not None:
-            dct['text'] = text
-        if allThreadsStopped is not None:
-            dct['allThreadsStopped'] = allThreadsStopped
         dct.update(self.kwargs)
-        return dct    
-    
-    @classmethod
-    def update_dict_ids_to_dap(cls, dct):
-        if 'threadId' in dct:
-            dct['threadId'] = cls._translate_id_to_dap(dct['threadId'])
         return dct
 
 
+@register_response('pydevdRunWithInheritedConfig')
 @register
-class ContinuedEventBody(BaseSchema):
+class PydevdRunWithInheritedConfigResponse(BaseSchema):
     """
-    "body" of ContinuedEvent
+    Response to 'pydevdRunWithInheritedConfig' request.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "threadId": {
+        "seq": {
             "type": "integer",
-            "description": "The thread which was continued."
+            "description": "Sequence number."
         },
-        "allThreadsContinued": {
+        "type": {
+            "type": "string",
+            "enum": [
+                "response"
+            ]
+        },
+        "request_seq": {
+            "type": "integer",
+            "description": "Sequence number of the corresponding request."
+        },
+        "success": {
             "type": "boolean",
-            "description": "If 'allThreadsContinued' is true, a debug adapter can announce that all threads have continued."
-        }
-    }
-    __refs__ = set()
-
-    __slots__ = list(__props__.keys()) + ['kwargs']
-
-    def __init__(self, threadId, allThreadsContinued=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
-        """
-        :param integer threadId: The thread which was continued.
-        :param boolean allThreadsContinued: If 'allThreadsContinued' is true, a debug adapter can announce that all threads have continued.
-        """
-        self.threadId = threadId
-        self.allThreadsContinued = allThreadsContinued
-        if update_ids_from_dap:
-            self.threadId = self._translate_id_from_dap(self.threadId)
-        self.kwargs = kwargs
-    
-    
-    @classmethod
-    def update_dict_ids_from_dap(cls, dct):
-        if 'threadId' in dct:
-            dct['threadId'] = cls._translate_id_from_dap(dct['threadId'])
-        return dct
-
-    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        threadId = self.threadId
-        allThreadsContinued = self.allThreadsContinued
-        if update_ids_to_dap:
-            if threadId is not None:
-                threadId = self._translate_id_to_dap(threadId)
-        dct = {
-            'threadId': threadId,
-        }
-        if allThreadsContinued is not None:
-            dct['allThreadsContinued'] = allThreadsContinued
-        dct.update(self.kwargs)
-        return dct    
-    
-    @classmethod
-    def update_dict_ids_to_dap(cls, dct):
-        if 'threadId' in dct:
-            dct['threadId'] = cls._translate_id_to_dap(dct['threadId'])
-        return dct
-
-
-@register
-class ExitedEventBody(BaseSchema):
-    """
-    "body" of ExitedEvent
-
-    Note: automatically generated code. Do not edit manually.
-    """
-
-    __props__ = {
-        "exitCode": {
-            "type": "integer",
-            "description": "The exit code returned from the debuggee."
+            "description": "Outcome of the request."
+        },
+        "command": {
+            "type": "string",
+            "description": "The command requested."
+        },
+        "message": {
+            "type": "string",
+            "description": "Contains error message if success == false."
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "running": {
+                    "type": "boolean",
+                    "description": "Whether the process started running (false if it has no inherited configuration, in which case it still waits for the 'configurationDone' request)."
+                }
+            },
+            "required": [
+                "running"
+            ]
         }
     }
-    __refs__ = set()
+    __refs__ = set(['body'])
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, exitCode, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param integer exitCode: The exit code returned from the debuggee.
+        :param string type: 
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        :param string command: The command requested.
+        :param PydevdRunWithInheritedConfigResponseBody body: 
+        :param integer seq: Sequence number.
+        :param string message: Contains error message if success == false.
         """
-        self.exitCode = exitCode
+        self.type = 'response'
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        if body is None:
+            self.body = PydevdRunWithInheritedConfigResponseBody()
+        else:
+            self.body = PydevdRunWithInheritedConfigResponseBody(update_ids_from_dap=update_ids_from_dap, **body) if body.__class__ !=  PydevdRunWithInheritedConfigResponseBody else body
+        self.seq = seq
+        self.message = message
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        exitCode = self.exitCode
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        body = self.body
+        seq = self.seq
+        message = self.message
         dct = {
-            'exitCode': exitCode,
+            'type': type,
+            'request_seq': request_seq,
+            'success': success,
+            'command': command,
+            'body': body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
         }
+        if message is not None:
+            dct['message'] = message
         dct.update(self.kwargs)
         return dct
 
 
+@register_request('pydevdArraySlice')
 @register
-class TerminatedEventBody(BaseSchema):
+class PydevdArraySliceRequest(BaseSchema):
     """
-    "body" of TerminatedEvent
+    Retrieves a window of a 2D (or 1D) numpy array or pandas DataFrame in a columnar format.
+    
+    Only the requested window is formatted (and the statistics are computed only for that window).
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "restart": {
-            "type": [
-                "array",
-                "boolean",
-                "integer",
-                "null",
-                "number",
-                "object",
-                "string"
-            ],
-            "description": "A debug adapter may set 'restart' to true (or to an arbitrary object) to request that the front end restarts the session.\nThe value is not interpreted by the client and passed unmodified as an attribute '__restart' to the 'launch' and 'attach' requests."
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "request"
+            ]
+        },
+        "command": {
+            "type": "string",
+            "enum": [
+                "pydevdArraySlice"
+            ]
+        },
+        "arguments": {
+            "type": "PydevdArraySliceArguments"
         }
     }
-    __refs__ = set()
+    __refs__ = set(['arguments'])
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, restart=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param ['array', 'boolean', 'integer', 'null', 'number', 'object', 'string'] restart: A debug adapter may set 'restart' to true (or to an arbitrary object) to request that the front end restarts the session.
-        The value is not interpreted by the client and passed unmodified as an attribute '__restart' to the 'launch' and 'attach' requests.
+        :param string type: 
+        :param string command: 
+        :param PydevdArraySliceArguments arguments: 
+        :param integer seq: Sequence number.
         """
-        self.restart = restart
+        self.type = 'request'
+        self.command = 'pydevdArraySlice'
+        if arguments is None:
+            self.arguments = PydevdArraySliceArguments()
+        else:
+            self.arguments = PydevdArraySliceArguments(update_ids_from_dap=update_ids_from_dap, **arguments) if arguments.__class__ !=  PydevdArraySliceArguments else arguments
+        self.seq = seq
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        restart = self.restart
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        arguments = self.arguments
+        seq = self.seq
         dct = {
+            'type': type,
+            'command': command,
+            'arguments': arguments.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
         }
-        if restart is not None:
-            dct['restart'] = restart
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class ThreadEventBody(BaseSchema):
+class PydevdArraySliceArguments(BaseSchema):
     """
-    "body" of ThreadEvent
+    Arguments for 'pydevdArraySlice' request.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "reason": {
+        "frameId": {
+            "type": "integer",
+            "description": "Evaluate the expression in the scope of this stack frame."
+        },
+        "expression": {
             "type": "string",
-            "description": "The reason for the event.",
-            "_enum": [
-                "started",
-                "exited"
-            ]
+            "description": "The expression which evaluates to the array or DataFrame."
         },
-        "threadId": {
+        "rowOffset": {
             "type": "integer",
-            "description": "The identifier of the thread."
+            "description": "The first row of the window (default: 0)."
+        },
+        "colOffset": {
+            "type": "integer",
+            "description": "The first column of the window (default: 0)."
+        },
+        "rows": {
+            "type": "integer",
+            "description": "The maximum number of rows in the window (default and maximum: 1000)."
+        },
+        "cols": {
+            "type": "integer",
+            "description": "The maximum number of columns in the window (default and maximum: 1000)."
+        },
+        "format": {
+            "type": "string",
+            "description": "printf-style format for the values of float columns (i.e.: '%.3f')."
+        },
+        "binary": {
+            "type": "boolean",
+            "description": "If true, the values of numeric columns are sent as base64-encoded little-endian raw data instead of formatted strings."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, reason, threadId, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, frameId, expression, rowOffset=None, colOffset=None, rows=None, cols=None, format=None, binary=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string reason: The reason for the event.
-        :param integer threadId: The identifier of the thread.
+        :param integer frameId: Evaluate the expression in the scope of this stack frame.
+        :param string expression: The expression which evaluates to the array or DataFrame.
+        :param integer rowOffset: The first row of the window (default: 0).
+        :param integer colOffset: The first column of the window (default: 0).
+        :param integer rows: The maximum number of rows in the window (default and maximum: 1000).
+        :param integer cols: The maximum number of columns in the window (default and maximum: 1000).
+        :param string format: printf-style format for the values of float columns (i.e.: '%.3f').
+        :param boolean binary: If true, the values of numeric columns are sent as base64-encoded little-endian raw data instead of formatted strings.
         """
-        self.reason = reason
-        self.threadId = threadId
+        self.frameId = frameId
+        self.expression = expression
+        self.rowOffset = rowOffset
+        self.colOffset = colOffset
+        self.rows = rows
+        self.cols = cols
+        self.format = format
+        self.binary = binary
         if update_ids_from_dap:
-            self.threadId = self._translate_id_from_dap(self.threadId)
+            self.frameId = self._translate_id_from_dap(self.frameId)
         self.kwargs = kwargs
     
     
     @classmethod
     def update_dict_ids_from_dap(cls, dct):
-        if 'threadId' in dct:
-            dct['threadId'] = cls._translate_id_from_dap(dct['threadId'])
+        if 'frameId' in dct:
+            dct['frameId'] = cls._translate_id_from_dap(dct['frameId'])
         return dct
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        reason = self.reason
-        threadId = self.threadId
+        frameId = self.frameId
+        expression = self.expression
+        rowOffset = self.rowOffset
+        colOffset = self.colOffset
+        rows = self.rows
+        cols = self.cols
+        format = self.format  # noqa (assign to builtin)
+        binary = self.binary
         if update_ids_to_dap:
-            if threadId is not None:
-                threadId = self._translate_id_to_dap(threadId)
+            if frameId is not None:
+                frameId = self._translate_id_to_dap(frameId)
         dct = {
-            'reason': reason,
-            'threadId': threadId,
+            'frameId': frameId,
+            'expression': expression,
         }
+        if rowOffset is not None:
+            dct['rowOffset'] = rowOffset
+        if colOffset is not None:
+            dct['colOffset'] = colOffset
+        if rows is not None:
+            dct['rows'] = rows
+        if cols is not None:
+            dct['cols'] = cols
+        if format is not None:
+            dct['format'] = format
+        if binary is not None:
+            dct['binary'] = binary
         dct.update(self.kwargs)
         return dct    
     
     @classmethod
     def update_dict_ids_to_dap(cls, dct):
-        if 'threadId' in dct:
-            dct['threadId'] = cls._translate_id_to_dap(dct['threadId'])
+        if 'frameId' in dct:
+            dct['frameId'] = cls._translate_id_to_dap(dct['frameId'])
         return dct
 
 
+@register_response('pydevdArraySlice')
 @register
-class OutputEventBody(BaseSchema):
+class PydevdArraySliceResponse(BaseSchema):
     """
-    "body" of OutputEvent
+    Response to 'pydevdArraySlice' request.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "category": {
-            "type": "string",
-            "description": "The output category. If not specified, 'console' is assumed.",
-            "_enum": [
-                "console",
-                "stdout",
-                "stderr",
-                "telemetry"
-            ]
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
         },
-        "output": {
+        "type": {
             "type": "string",
-            "description": "The output to report."
+            "enum": [
+                "response"
+            ]
         },
-        "variablesReference": {
+        "request_seq": {
             "type": "integer",
-            "description": "If an attribute 'variablesReference' exists and its value is > 0, the output contains objects which can be retrieved by passing 'variablesReference' to the 'variables' request. The value should be less than or equal to 2147483647 (2^31 - 1)."
-        },
-        "source": {
-            "description": "An optional source location where the output was produced.",
-            "type": "Source"
+            "description": "Sequence number of the corresponding request."
         },
-        "line": {
-            "type": "integer",
-            "description": "An optional source location line where the output was produced."
+        "success": {
+            "type": "boolean",
+            "description": "Outcome of the request."
         },
-        "column": {
-            "type": "integer",
-            "description": "An optional source location column where the output was produced."
+        "command": {
+            "type": "string",
+            "description": "The command requested."
         },
-        "data": {
-            "type": [
-                "array",
-                "boolean",
-                "integer",
-                "null",
-                "number",
-                "object",
-                "string"
-            ],
-            "description": "Optional data to report. For the 'telemetry' category the data will be sent to telemetry, for the other categories the data is shown in JSON format."
+        "message": {
+            "type": "string",
+            "description": "Contains error message if success == false."
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "shape": {
+                    "type": "array",
+                    "items": {
+                        "type": "integer"
+                    },
+                    "description": "The shape of the whole array or DataFrame."
+                },
+                "rowOffset": {
+                    "type": "integer",
+                    "description": "The first row of the window."
+                },
+                "colOffset": {
+                    "type": "integer",
+                    "description": "The first column of the window."
+                },
+                "rows": {
+                    "type": "integer",
+                    "description": "The number of rows in the window."
+                },
+                "cols": {
+                    "type": "integer",
+                    "description": "The number of columns in the window."
+                },
+                "rowLabels": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
+                    },
+                    "description": "The labels of the rows in the window."
+                },
+                "columns": {
+                    "type": "array",
+                    "items": {
+                        "$ref": "#/definitions/PydevdArraySliceColumn"
+                    },
+                    "description": "The columns in the window."
+                }
+            },
+            "required": [
+                "shape",
+                "rowOffset",
+                "colOffset",
+                "rows",
+                "cols",
+                "rowLabels",
+                "columns"
+            ]
         }
     }
-    __refs__ = set(['source'])
+    __refs__ = set(['body'])
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, output, category=None, variablesReference=None, source=None, line=None, column=None, data=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string output: The output to report.
-        :param string category: The output category. If not specified, 'console' is assumed.
-        :param integer variablesReference: If an attribute 'variablesReference' exists and its value is > 0, the output contains objects which can be retrieved by passing 'variablesReference' to the 'variables' request. The value should be less than or equal to 2147483647 (2^31 - 1).
-        :param Source source: An optional source location where the output was produced.
-        :param integer line: An optional source location line where the output was produced.
-        :param integer column: An optional source location column where the output was produced.
-        :param ['array', 'boolean', 'integer', 'null', 'number', 'object', 'string'] data: Optional data to report. For the 'telemetry' category the data will be sent to telemetry, for the other categories the data is shown in JSON format.
+        :param string type: 
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        :param string command: The command requested.
+        :param PydevdArraySliceResponseBody body: 
+        :param integer seq: Sequence number.
+        :param string message: Contains error message if success == false.
         """
-        self.output = output
-        self.category = category
-        self.variablesReference = variablesReference
-        if source is None:
-            self.source = Source()
+        self.type = 'response'
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        if body is None:
+            self.body = PydevdArraySliceResponseBody()
         else:
-            self.source = Source(update_ids_from_dap=update_ids_from_dap, **source) if source.__class__ !=  Source else source
-        self.line = line
-        self.column = column
-        self.data = data
+            self.body = PydevdArraySliceResponseBody(update_ids_from_dap=update_ids_from_dap, **body) if body.__class__ !=  PydevdArraySliceResponseBody else body
+        self.seq = seq
+        self.message = message
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        body = self.body
+        seq = self.seq
+        message = self.message
+        dct = {
+            'type': type,
+            'request_seq': request_seq,
+            'success': success,
+            'command': command,
+            'body': body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        if message is not None:
+            dct['message'] = message
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdArraySliceColumn(BaseSchema):
+    """
+    A column in the window of a 'pydevdArraySlice' response.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "label": {
+            "type": "string",
+            "description": "The column label."
+        },
+        "dtype": {
+            "type": "string",
+            "description": "The numpy dtype of the column (i.e.: '<f8')."
+        },
+        "kind": {
+            "type": "string",
+            "description": "The numpy dtype kind of the column (i.e.: 'f' for floats)."
+        },
+        "format": {
+            "type": "string",
+            "description": "The format used for the values (only when sent as strings)."
+        },
+        "min": {
+            "type": "string",
+            "description": "The minimum value in the window (only for numeric columns)."
+        },
+        "max": {
+            "type": "string",
+            "description": "The maximum value in the window (only for numeric columns)."
+        },
+        "values": {
+            "type": "array",
+            "items": {
+                "type": "string"
+            },
+            "description": "The formatted values of the column (if not sent in binary)."
+        },
+        "base64": {
+            "type": "string",
+            "description": "The base64-encoded little-endian raw values of the column (if sent in binary)."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, label, dtype, kind, format=None, min=None, max=None, values=None, base64=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string label: The column label.
+        :param string dtype: The numpy dtype of the column (i.e.: '<f8').
+        :param string kind: The numpy dtype kind of the column (i.e.: 'f' for floats).
+        :param string format: The format used for the values (only when sent as strings).
+        :param string min: The minimum value in the window (only for numeric columns).
+        :param string max: The maximum value in the window (only for numeric columns).
+        :param array values: The formatted values of the column (if not sent in binary).
+        :param string base64: The base64-encoded little-endian raw values of the column (if sent in binary).
+        """
+        self.label = label
+        self.dtype = dtype
+        self.kind = kind
+        self.format = format
+        self.min = min
+        self.max = max
+        self.values = values
+        self.base64 = base64
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        label = self.label
+        dtype = self.dtype
+        kind = self.kind
+        format = self.format  # noqa (assign to builtin)
+        min = self.min
+        max = self.max
+        values = self.values
+        if values and hasattr(values[0], "to_dict"):
+            values = [x.to_dict() for x in values]
+        base64 = self.base64
+        dct = {
+            'label': label,
+            'dtype': dtype,
+            'kind': kind,
+        }
+        if format is not None:
+            dct['format'] = format
+        if min is not None:
+            dct['min'] = min
+        if max is not None:
+            dct['max'] = max
+        if values is not None:
+            dct['values'] = values
+        if base64 is not None:
+            dct['base64'] = base64
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_request('pydevdReferrers')
+@register
+class PydevdReferrersRequest(BaseSchema):
+    """
+    Retrieves the objects which refer to the object resulting from the evaluation of an expression.
+    
+    The referrers are found using an index which is reused while the program is suspended.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "request"
+            ]
+        },
+        "command": {
+            "type": "string",
+            "enum": [
+                "pydevdReferrers"
+            ]
+        },
+        "arguments": {
+            "type": "PydevdReferrersArguments"
+        }
+    }
+    __refs__ = set(['arguments'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param string command: 
+        :param PydevdReferrersArguments arguments: 
+        :param integer seq: Sequence number.
+        """
+        self.type = 'request'
+        self.command = 'pydevdReferrers'
+        if arguments is None:
+            self.arguments = PydevdReferrersArguments()
+        else:
+            self.arguments = PydevdReferrersArguments(update_ids_from_dap=update_ids_from_dap, **arguments) if arguments.__class__ !=  PydevdReferrersArguments else arguments
+        self.seq = seq
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        arguments = self.arguments
+        seq = self.seq
+        dct = {
+            'type': type,
+            'command': command,
+            'arguments': arguments.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdReferrersArguments(BaseSchema):
+    """
+    Arguments for 'pydevdReferrers' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "frameId": {
+            "type": "integer",
+            "description": "Evaluate the expression in the scope of this stack frame."
+        },
+        "expression": {
+            "type": "string",
+            "description": "The expression which evaluates to the object whose referrers should be found."
+        },
+        "maxResults": {
+            "type": "integer",
+            "description": "The maximum number of referrers to be returned (default: 100)."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, frameId, expression, maxResults=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param integer frameId: Evaluate the expression in the scope of this stack frame.
+        :param string expression: The expression which evaluates to the object whose referrers should be found.
+        :param integer maxResults: The maximum number of referrers to be returned (default: 100).
+        """
+        self.frameId = frameId
+        self.expression = expression
+        self.maxResults = maxResults
         if update_ids_from_dap:
-            self.variablesReference = self._translate_id_from_dap(self.variablesReference)
+            self.frameId = self._translate_id_from_dap(self.frameId)
         self.kwargs = kwargs
     
     
     @classmethod
     def update_dict_ids_from_dap(cls, dct):
-        if 'variablesReference' in dct:
-            dct['variablesReference'] = cls._translate_id_from_dap(dct['variablesReference'])
+        if 'frameId' in dct:
+            dct['frameId'] = cls._translate_id_from_dap(dct['frameId'])
         return dct
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        output = self.output
-        category = self.category
-        variablesReference = self.variablesReference
-        source = self.source
-        line = self.line
-        column = self.column
-        data = self.data
+        frameId = self.frameId
+        expression = self.expression
+        maxResults = self.maxResults
         if update_ids_to_dap:
-            if variablesReference is not None:
-                variablesReference = self._translate_id_to_dap(variablesReference)
+            if frameId is not None:
+                frameId = self._translate_id_to_dap(frameId)
+        dct = {
+            'frameId': frameId,
+            'expression': expression,
+        }
+        if maxResults is not None:
+            dct['maxResults'] = maxResults
+        dct.update(self.kwargs)
+        return dct    
+    
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if 'frameId' in dct:
+            dct['frameId'] = cls._translate_id_to_dap(dct['frameId'])
+        return dct
+
+
+@register_response('pydevdReferrers')
+@register
+class PydevdReferrersResponse(BaseSchema):
+    """
+    Response to 'pydevdReferrers' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "response"
+            ]
+        },
+        "request_seq": {
+            "type": "integer",
+            "description": "Sequence number of the corresponding request."
+        },
+        "success": {
+            "type": "boolean",
+            "description": "Outcome of the request."
+        },
+        "command": {
+            "type": "string",
+            "description": "The command requested."
+        },
+        "message": {
+            "type": "string",
+            "description": "Contains error message if success == false."
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "referrers": {
+                    "type": "array",
+                    "items": {
+                        "$ref": "#/definitions/PydevdReferrer"
+                    },
+                    "description": "The referrers found."
+                },
+                "truncated": {
+                    "type": "boolean",
+                    "description": "Whether the referrers were truncated (because of the maxResults or because the time budget was exceeded)."
+                }
+            },
+            "required": [
+                "referrers",
+                "truncated"
+            ]
+        }
+    }
+    __refs__ = set(['body'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        :param string command: The command requested.
+        :param PydevdReferrersResponseBody body: 
+        :param integer seq: Sequence number.
+        :param string message: Contains error message if success == false.
+        """
+        self.type = 'response'
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        if body is None:
+            self.body = PydevdReferrersResponseBody()
+        else:
+            self.body = PydevdReferrersResponseBody(update_ids_from_dap=update_ids_from_dap, **body) if body.__class__ !=  PydevdReferrersResponseBody else body
+        self.seq = seq
+        self.message = message
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        body = self.body
+        seq = self.seq
+        message = self.message
+        dct = {
+            'type': type,
+            'request_seq': request_seq,
+            'success': success,
+            'command': command,
+            'body': body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        if message is not None:
+            dct['message'] = message
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdReferrer(BaseSchema):
+    """
+    A referrer in a 'pydevdReferrers' response.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "type": {
+            "type": "string",
+            "description": "The type of the referrer."
+        },
+        "value": {
+            "type": "string",
+            "description": "The value of the referrer."
+        },
+        "foundAs": {
+            "type": "string",
+            "description": "How the referrer refers to the object (i.e.: the name of a local variable or attribute or 'list[1]')."
+        },
+        "variablesReference": {
+            "type": "integer",
+            "description": "If variablesReference is > 0, the referrer is structured and its children can be retrieved by passing variablesReference to the VariablesRequest."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, type, value, variablesReference, foundAs=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: The type of the referrer.
+        :param string value: The value of the referrer.
+        :param integer variablesReference: If variablesReference is > 0, the referrer is structured and its children can be retrieved by passing variablesReference to the VariablesRequest.
+        :param string foundAs: How the referrer refers to the object (i.e.: the name of a local variable or attribute or 'list[1]').
+        """
+        self.type = type
+        self.value = value
+        self.variablesReference = variablesReference
+        self.foundAs = foundAs
+        if update_ids_from_dap:
+            self.variablesReference = self._translate_id_from_dap(self.variablesReference)
+        self.kwargs = kwargs
+    
+    
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if 'variablesReference' in dct:
+            dct['variablesReference'] = cls._translate_id_from_dap(dct['variablesReference'])
+        return dct
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        value = self.value
+        variablesReference = self.variablesReference
+        foundAs = self.foundAs
+        if update_ids_to_dap:
+            if variablesReference is not None:
+                variablesReference = self._translate_id_to_dap(variablesReference)
+        dct = {
+            'type': type,
+            'value': value,
+            'variablesReference': variablesReference,
+        }
+        if foundAs is not None:
+            dct['foundAs'] = foundAs
+        dct.update(self.kwargs)
+        return dct    
+    
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if 'variablesReference' in dct:
+            dct['variablesReference'] = cls._translate_id_to_dap(dct['variablesReference'])
+        return dct
+
+
+@register_request('pydevdStats')
+@register
+class PydevdStatsRequest(BaseSchema):
+    """
+    The request can be used to retrieve a snapshot of the debugger counters (to check the debugger
+    overhead).
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "request"
+            ]
+        },
+        "command": {
+            "type": "string",
+            "enum": [
+                "pydevdStats"
+            ]
+        },
+        "arguments": {
+            "type": "PydevdStatsArguments"
+        }
+    }
+    __refs__ = set(['arguments'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param string command: 
+        :param integer seq: Sequence number.
+        :param PydevdStatsArguments arguments: 
+        """
+        self.type = 'request'
+        self.command = 'pydevdStats'
+        self.seq = seq
+        if arguments is None:
+            self.arguments = PydevdStatsArguments()
+        else:
+            self.arguments = PydevdStatsArguments(update_ids_from_dap=update_ids_from_dap, **arguments) if arguments.__class__ !=  PydevdStatsArguments else arguments
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        seq = self.seq
+        arguments = self.arguments
+        dct = {
+            'type': type,
+            'command': command,
+            'seq': seq,
+        }
+        if arguments is not None:
+            dct['arguments'] = arguments.to_dict(update_ids_to_dap=update_ids_to_dap)
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdStatsArguments(BaseSchema):
+    """
+    Arguments for 'pydevdStats' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {}
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+    
+        """
+    
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        dct = {
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_response('pydevdStats')
+@register
+class PydevdStatsResponse(BaseSchema):
+    """
+    Response to 'pydevdStats' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "response"
+            ]
+        },
+        "request_seq": {
+            "type": "integer",
+            "description": "Sequence number of the corresponding request."
+        },
+        "success": {
+            "type": "boolean",
+            "description": "Outcome of the request."
+        },
+        "command": {
+            "type": "string",
+            "description": "The command requested."
+        },
+        "message": {
+            "type": "string",
+            "description": "Contains error message if success == false."
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "traceDispatch": {
+                    "$ref": "#/definitions/PydevdTraceDispatchStats",
+                    "description": "Counters of the tracing of the threads which are currently alive."
+                },
+                "caches": {
+                    "type": "object",
+                    "description": "Maps the name of each cache to an object with its 'size', number of 'misses' and estimated 'memory' (in bytes; -1 if not available). Caches which are bounded also have a 'maxSize' (number of entries)."
+                },
+                "queues": {
+                    "type": "object",
+                    "description": "The number of commands in the 'writer' queue and in each 'internalCommands' queue (which maps thread ids to the size of their queue)."
+                },
+                "suspends": {
+                    "$ref": "#/definitions/PydevdSuspendStats",
+                    "description": "Information on the time the threads were suspended."
+                }
+            },
+            "required": [
+                "traceDispatch",
+                "caches",
+                "queues",
+                "suspends"
+            ]
+        }
+    }
+    __refs__ = set(['body'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        :param string command: The command requested.
+        :param PydevdStatsResponseBody body: 
+        :param integer seq: Sequence number.
+        :param string message: Contains error message if success == false.
+        """
+        self.type = 'response'
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        if body is None:
+            self.body = PydevdStatsResponseBody()
+        else:
+            self.body = PydevdStatsResponseBody(update_ids_from_dap=update_ids_from_dap, **body) if body.__class__ !=  PydevdStatsResponseBody else body
+        self.seq = seq
+        self.message = message
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        body = self.body
+        seq = self.seq
+        message = self.message
+        dct = {
+            'type': type,
+            'request_seq': request_seq,
+            'success': success,
+            'command': command,
+            'body': body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        if message is not None:
+            dct['message'] = message
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdTraceDispatchStats(BaseSchema):
+    """
+    Counters of the tracing of the threads which are currently alive.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "calls": {
+            "type": "integer",
+            "description": "The number of times the tracing was called for a new frame."
+        },
+        "skipCacheHits": {
+            "type": "integer",
+            "description": "The number of times a new frame was skipped because of the skip cache."
+        },
+        "threads": {
+            "type": "integer",
+            "description": "The number of threads accounted for."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, calls, skipCacheHits, threads, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param integer calls: The number of times the tracing was called for a new frame.
+        :param integer skipCacheHits: The number of times a new frame was skipped because of the skip cache.
+        :param integer threads: The number of threads accounted for.
+        """
+        self.calls = calls
+        self.skipCacheHits = skipCacheHits
+        self.threads = threads
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        calls = self.calls
+        skipCacheHits = self.skipCacheHits
+        threads = self.threads
+        dct = {
+            'calls': calls,
+            'skipCacheHits': skipCacheHits,
+            'threads': threads,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdSuspendStats(BaseSchema):
+    """
+    Information on the time the threads were suspended.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "count": {
+            "type": "integer",
+            "description": "The number of times a thread was suspended."
+        },
+        "totalTime": {
+            "type": "number",
+            "description": "The total time (in seconds) the threads were suspended."
+        },
+        "maxTime": {
+            "type": "number",
+            "description": "The maximum time (in seconds) a thread was suspended."
+        },
+        "lastTime": {
+            "type": "number",
+            "description": "The time (in seconds) of the last suspend."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, count, totalTime, maxTime, lastTime, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param integer count: The number of times a thread was suspended.
+        :param number totalTime: The total time (in seconds) the threads were suspended.
+        :param number maxTime: The maximum time (in seconds) a thread was suspended.
+        :param number lastTime: The time (in seconds) of the last suspend.
+        """
+        self.count = count
+        self.totalTime = totalTime
+        self.maxTime = maxTime
+        self.lastTime = lastTime
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        count = self.count
+        totalTime = self.totalTime
+        maxTime = self.maxTime
+        lastTime = self.lastTime
+        dct = {
+            'count': count,
+            'totalTime': totalTime,
+            'maxTime': maxTime,
+            'lastTime': lastTime,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_request('pydevdStartProfiler')
+@register
+class PydevdStartProfilerRequest(BaseSchema):
+    """
+    Starts sampling the stacks of all the threads (without installing any trace function).
+    
+    The samples are sent periodically in 'pydevdProfilerSamples' events until a 'pydevdStopProfiler'
+    request is received (if the profiler is already running it's restarted with the new arguments).
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "request"
+            ]
+        },
+        "command": {
+            "type": "string",
+            "enum": [
+                "pydevdStartProfiler"
+            ]
+        },
+        "arguments": {
+            "type": "PydevdStartProfilerArguments"
+        }
+    }
+    __refs__ = set(['arguments'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param string command: 
+        :param integer seq: Sequence number.
+        :param PydevdStartProfilerArguments arguments: 
+        """
+        self.type = 'request'
+        self.command = 'pydevdStartProfiler'
+        self.seq = seq
+        if arguments is None:
+            self.arguments = PydevdStartProfilerArguments()
+        else:
+            self.arguments = PydevdStartProfilerArguments(update_ids_from_dap=update_ids_from_dap, **arguments) if arguments.__class__ !=  PydevdStartProfilerArguments else arguments
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        seq = self.seq
+        arguments = self.arguments
+        dct = {
+            'type': type,
+            'command': command,
+            'seq': seq,
+        }
+        if arguments is not None:
+            dct['arguments'] = arguments.to_dict(update_ids_to_dap=update_ids_to_dap)
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdStartProfilerArguments(BaseSchema):
+    """
+    Arguments for 'pydevdStartProfiler' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "interval": {
+            "type": "number",
+            "description": "The time (in seconds) between each sample (default: 0.01)."
+        },
+        "flushInterval": {
+            "type": "number",
+            "description": "The time (in seconds) between each 'pydevdProfilerSamples' event (default: 1)."
+        },
+        "maxDepth": {
+            "type": "integer",
+            "description": "The maximum number of frames in each stack (default: 128)."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, interval=None, flushInterval=None, maxDepth=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param number interval: The time (in seconds) between each sample (default: 0.01).
+        :param number flushInterval: The time (in seconds) between each 'pydevdProfilerSamples' event (default: 1).
+        :param integer maxDepth: The maximum number of frames in each stack (default: 128).
+        """
+        self.interval = interval
+        self.flushInterval = flushInterval
+        self.maxDepth = maxDepth
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        interval = self.interval
+        flushInterval = self.flushInterval
+        maxDepth = self.maxDepth
+        dct = {
+        }
+        if interval is not None:
+            dct['interval'] = interval
+        if flushInterval is not None:
+            dct['flushInterval'] = flushInterval
+        if maxDepth is not None:
+            dct['maxDepth'] = maxDepth
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_response('pydevdStartProfiler')
+@register
+class PydevdStartProfilerResponse(BaseSchema):
+    """
+    Response to 'pydevdStartProfiler' request. This is just an acknowledgement, so no body field is
+    required.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "response"
+            ]
+        },
+        "request_seq": {
+            "type": "integer",
+            "description": "Sequence number of the corresponding request."
+        },
+        "success": {
+            "type": "boolean",
+            "description": "Outcome of the request."
+        },
+        "command": {
+            "type": "string",
+            "description": "The command requested."
+        },
+        "message": {
+            "type": "string",
+            "description": "Contains error message if success == false."
+        },
+        "body": {
+            "type": [
+                "array",
+                "boolean",
+                "integer",
+                "null",
+                "number",
+                "object",
+                "string"
+            ],
+            "description": "Contains request result if success is true and optional error details if success is false."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        :param string command: The command requested.
+        :param integer seq: Sequence number.
+        :param string message: Contains error message if success == false.
+        :param ['array', 'boolean', 'integer', 'null', 'number', 'object', 'string'] body: Contains request result if success is true and optional error details if success is false.
+        """
+        self.type = 'response'
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        self.seq = seq
+        self.message = message
+        self.body = body
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        seq = self.seq
+        message = self.message
+        body = self.body
+        dct = {
+            'type': type,
+            'request_seq': request_seq,
+            'success': success,
+            'command': command,
+            'seq': seq,
+        }
+        if message is not None:
+            dct['message'] = message
+        if body is not None:
+            dct['body'] = body
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_request('pydevdStopProfiler')
+@register
+class PydevdStopProfilerRequest(BaseSchema):
+    """
+    Stops the sampling profiler (the remaining samples are sent in a final 'pydevdProfilerSamples' event
+    before the response).
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "request"
+            ]
+        },
+        "command": {
+            "type": "string",
+            "enum": [
+                "pydevdStopProfiler"
+            ]
+        },
+        "arguments": {
+            "type": "PydevdStopProfilerArguments"
+        }
+    }
+    __refs__ = set(['arguments'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param string command: 
+        :param integer seq: Sequence number.
+        :param PydevdStopProfilerArguments arguments: 
+        """
+        self.type = 'request'
+        self.command = 'pydevdStopProfiler'
+        self.seq = seq
+        if arguments is None:
+            self.arguments = PydevdStopProfilerArguments()
+        else:
+            self.arguments = PydevdStopProfilerArguments(update_ids_from_dap=update_ids_from_dap, **arguments) if arguments.__class__ !=  PydevdStopProfilerArguments else arguments
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        seq = self.seq
+        arguments = self.arguments
+        dct = {
+            'type': type,
+            'command': command,
+            'seq': seq,
+        }
+        if arguments is not None:
+            dct['arguments'] = arguments.to_dict(update_ids_to_dap=update_ids_to_dap)
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdStopProfilerArguments(BaseSchema):
+    """
+    Arguments for 'pydevdStopProfiler' request.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {}
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+    
+        """
+    
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        dct = {
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_response('pydevdStopProfiler')
+@register
+class PydevdStopProfilerResponse(BaseSchema):
+    """
+    Response to 'pydevdStopProfiler' request. This is just an acknowledgement, so no body field is
+    required.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "response"
+            ]
+        },
+        "request_seq": {
+            "type": "integer",
+            "description": "Sequence number of the corresponding request."
+        },
+        "success": {
+            "type": "boolean",
+            "description": "Outcome of the request."
+        },
+        "command": {
+            "type": "string",
+            "description": "The command requested."
+        },
+        "message": {
+            "type": "string",
+            "description": "Contains error message if success == false."
+        },
+        "body": {
+            "type": [
+                "array",
+                "boolean",
+                "integer",
+                "null",
+                "number",
+                "object",
+                "string"
+            ],
+            "description": "Contains request result if success is true and optional error details if success is false."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        :param string command: The command requested.
+        :param integer seq: Sequence number.
+        :param string message: Contains error message if success == false.
+        :param ['array', 'boolean', 'integer', 'null', 'number', 'object', 'string'] body: Contains request result if success is true and optional error details if success is false.
+        """
+        self.type = 'response'
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        self.seq = seq
+        self.message = message
+        self.body = body
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        seq = self.seq
+        message = self.message
+        body = self.body
+        dct = {
+            'type': type,
+            'request_seq': request_seq,
+            'success': success,
+            'command': command,
+            'seq': seq,
+        }
+        if message is not None:
+            dct['message'] = message
+        if body is not None:
+            dct['body'] = body
+        dct.update(self.kwargs)
+        return dct
+
+
+@register_event('pydevdProfilerSamples')
+@register
+class PydevdProfilerSamplesEvent(BaseSchema):
+    """
+    The event provides the stacks sampled by the profiler (started with 'pydevdStartProfiler') since the
+    previous event.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number."
+        },
+        "type": {
+            "type": "string",
+            "enum": [
+                "event"
+            ]
+        },
+        "event": {
+            "type": "string",
+            "enum": [
+                "pydevdProfilerSamples"
+            ]
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "samples": {
+                    "type": "array",
+                    "items": {
+                        "$ref": "#/definitions/PydevdProfilerSample"
+                    },
+                    "description": "The collapsed stacks sampled and the number of times each one was seen."
+                },
+                "sampleCount": {
+                    "type": "integer",
+                    "description": "The number of times the stacks of all the threads were sampled."
+                },
+                "interval": {
+                    "type": "number",
+                    "description": "The time (in seconds) between each sample."
+                },
+                "final": {
+                    "type": "boolean",
+                    "description": "True if this is the last event (the profiler was stopped)."
+                }
+            },
+            "required": [
+                "samples",
+                "sampleCount",
+                "interval",
+                "final"
+            ]
+        }
+    }
+    __refs__ = set(['body'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string type: 
+        :param string event: 
+        :param PydevdProfilerSamplesEventBody body: 
+        :param integer seq: Sequence number.
+        """
+        self.type = 'event'
+        self.event = 'pydevdProfilerSamples'
+        if body is None:
+            self.body = PydevdProfilerSamplesEventBody()
+        else:
+            self.body = PydevdProfilerSamplesEventBody(update_ids_from_dap=update_ids_from_dap, **body) if body.__class__ !=  PydevdProfilerSamplesEventBody else body
+        self.seq = seq
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        type = self.type  # noqa (assign to builtin)
+        event = self.event
+        body = self.body
+        seq = self.seq
+        dct = {
+            'type': type,
+            'event': event,
+            'body': body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'seq': seq,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class PydevdProfilerSample(BaseSchema):
+    """
+    A collapsed stack in a 'pydevdProfilerSamples' event.
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "stack": {
+            "type": "string",
+            "description": "The thread name and the functions from the root to the leaf separated by ';' (each function is shown as 'name (file:first_line)')."
+        },
+        "count": {
+            "type": "integer",
+            "description": "The number of times the stack was seen."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, stack, count, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string stack: The thread name and the functions from the root to the leaf separated by ';' (each function is shown as 'name (file:first_line)').
+        :param integer count: The number of times the stack was seen.
+        """
+        self.stack = stack
+        self.count = count
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        stack = self.stack
+        count = self.count
+        dct = {
+            'stack': stack,
+            'count': count,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class ErrorResponseBody(BaseSchema):
+    """
+    "body" of ErrorResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "error": {
+            "description": "An optional, structured error message.",
+            "type": "Message"
+        }
+    }
+    __refs__ = set(['error'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, error=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param Message error: An optional, structured error message.
+        """
+        if error is None:
+            self.error = Message()
+        else:
+            self.error = Message(update_ids_from_dap=update_ids_from_dap, **error) if error.__class__ !=  Message else error
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        error = self.error
+        dct = {
+        }
+        if error is not None:
+            dct['error'] = error.to_dict(update_ids_to_dap=update_ids_to_dap)
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class StoppedEventBody(BaseSchema):
+    """
+    "body" of StoppedEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "reason": {
+            "type": "string",
+            "description": "The reason for the event.\nFor backward compatibility this string is shown in the UI if the 'description' attribute is missing (but it must not be translated).",
+            "_enum": [
+                "step",
+                "breakpoint",
+                "exception",
+                "pause",
+                "entry",
+                "goto",
+                "function breakpoint",
+                "data breakpoint"
+            ]
+        },
+        "description": {
+            "type": "string",
+            "description": "The full reason for the event, e.g. 'Paused on exception'. This string is shown in the UI as is and must be translated."
+        },
+        "threadId": {
+            "type": "integer",
+            "description": "The thread which was stopped."
+        },
+        "preserveFocusHint": {
+            "type": "boolean",
+            "description": "A value of true hints to the frontend that this event should not change the focus."
+        },
+        "text": {
+            "type": "string",
+            "description": "Additional information. E.g. if reason is 'exception', text contains the exception name. This string is shown in the UI."
+        },
+        "allThreadsStopped": {
+            "type": "boolean",
+            "description": "If 'allThreadsStopped' is true, a debug adapter can announce that all threads have stopped.\n- The client should use this information to enable that all threads can be expanded to access their stacktraces.\n- If the attribute is missing or false, only the thread with the given threadId can be expanded."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, reason, description=None, threadId=None, preserveFocusHint=None, text=None, allThreadsStopped=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string reason: The reason for the event.
+        For backward compatibility this string is shown in the UI if the 'description' attribute is missing (but it must not be translated).
+        :param string description: The full reason for the event, e.g. 'Paused on exception'. This string is shown in the UI as is and must be translated.
+        :param integer threadId: The thread which was stopped.
+        :param boolean preserveFocusHint: A value of true hints to the frontend that this event should not change the focus.
+        :param string text: Additional information. E.g. if reason is 'exception', text contains the exception name. This string is shown in the UI.
+        :param boolean allThreadsStopped: If 'allThreadsStopped' is true, a debug adapter can announce that all threads have stopped.
+        - The client should use this information to enable that all threads can be expanded to access their stacktraces.
+        - If the attribute is missing or false, only the thread with the given threadId can be expanded.
+        """
+        self.reason = reason
+        self.description = description
+        self.threadId = threadId
+        self.preserveFocusHint = preserveFocusHint
+        self.text = text
+        self.allThreadsStopped = allThreadsStopped
+        if update_ids_from_dap:
+            self.threadId = self._translate_id_from_dap(self.threadId)
+        self.kwargs = kwargs
+    
+    
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if 'threadId' in dct:
+            dct['threadId'] = cls._translate_id_from_dap(dct['threadId'])
+        return dct
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        reason = self.reason
+        description = self.description
+        threadId = self.threadId
+        preserveFocusHint = self.preserveFocusHint
+        text = self.text
+        allThreadsStopped = self.allThreadsStopped
+        if update_ids_to_dap:
+            if threadId is not None:
+                threadId = self._translate_id_to_dap(threadId)
+        dct = {
+            'reason': reason,
+        }
+        if description is not None:
+            dct['description'] = description
+        if threadId is not None:
+            dct['threadId'] = threadId
+        if preserveFocusHint is not None:
+            dct['preserveFocusHint'] = preserveFocusHint
+        if text is not None:
+            dct['text'] = text
+        if allThreadsStopped is not None:
+            dct['allThreadsStopped'] = allThreadsStopped
+        dct.update(self.kwargs)
+        return dct    
+    
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if 'threadId' in dct:
+            dct['threadId'] = cls._translate_id_to_dap(dct['threadId'])
+        return dct
+
+
+@register
+class ContinuedEventBody(BaseSchema):
+    """
+    "body" of ContinuedEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "threadId": {
+            "type": "integer",
+            "description": "The thread which was continued."
+        },
+        "allThreadsContinued": {
+            "type": "boolean",
+            "description": "If 'allThreadsContinued' is true, a debug adapter can announce that all threads have continued."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, threadId, allThreadsContinued=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param integer threadId: The thread which was continued.
+        :param boolean allThreadsContinued: If 'allThreadsContinued' is true, a debug adapter can announce that all threads have continued.
+        """
+        self.threadId = threadId
+        self.allThreadsContinued = allThreadsContinued
+        if update_ids_from_dap:
+            self.threadId = self._translate_id_from_dap(self.threadId)
+        self.kwargs = kwargs
+    
+    
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if 'threadId' in dct:
+            dct['threadId'] = cls._translate_id_from_dap(dct['threadId'])
+        return dct
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        threadId = self.threadId
+        allThreadsContinued = self.allThreadsContinued
+        if update_ids_to_dap:
+            if threadId is not None:
+                threadId = self._translate_id_to_dap(threadId)
+        dct = {
+            'threadId': threadId,
+        }
+        if allThreadsContinued is not None:
+            dct['allThreadsContinued'] = allThreadsContinued
+        dct.update(self.kwargs)
+        return dct    
+    
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if 'threadId' in dct:
+            dct['threadId'] = cls._translate_id_to_dap(dct['threadId'])
+        return dct
+
+
+@register
+class ExitedEventBody(BaseSchema):
+    """
+    "body" of ExitedEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "exitCode": {
+            "type": "integer",
+            "description": "The exit code returned from the debuggee."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, exitCode, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param integer exitCode: The exit code returned from the debuggee.
+        """
+        self.exitCode = exitCode
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        exitCode = self.exitCode
+        dct = {
+            'exitCode': exitCode,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class TerminatedEventBody(BaseSchema):
+    """
+    "body" of TerminatedEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "restart": {
+            "type": [
+                "array",
+                "boolean",
+                "integer",
+                "null",
+                "number",
+                "object",
+                "string"
+            ],
+            "description": "A debug adapter may set 'restart' to true (or to an arbitrary object) to request that the front end restarts the session.\nThe value is not interpreted by the client and passed unmodified as an attribute '__restart' to the 'launch' and 'attach' requests."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, restart=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param ['array', 'boolean', 'integer', 'null', 'number', 'object', 'string'] restart: A debug adapter may set 'restart' to true (or to an arbitrary object) to request that the front end restarts the session.
+        The value is not interpreted by the client and passed unmodified as an attribute '__restart' to the 'launch' and 'attach' requests.
+        """
+        self.restart = restart
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        restart = self.restart
+        dct = {
+        }
+        if restart is not None:
+            dct['restart'] = restart
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class ThreadEventBody(BaseSchema):
+    """
+    "body" of ThreadEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "reason": {
+            "type": "string",
+            "description": "The reason for the event.",
+            "_enum": [
+                "started",
+                "exited"
+            ]
+        },
+        "threadId": {
+            "type": "integer",
+            "description": "The identifier of the thread."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, reason, threadId, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string reason: The reason for the event.
+        :param integer threadId: The identifier of the thread.
+        """
+        self.reason = reason
+        self.threadId = threadId
+        if update_ids_from_dap:
+            self.threadId = self._translate_id_from_dap(self.threadId)
+        self.kwargs = kwargs
+    
+    
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if 'threadId' in dct:
+            dct['threadId'] = cls._translate_id_from_dap(dct['threadId'])
+        return dct
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        reason = self.reason
+        threadId = self.threadId
+        if update_ids_to_dap:
+            if threadId is not None:
+                threadId = self._translate_id_to_dap(threadId)
+        dct = {
+            'reason': reason,
+            'threadId': threadId,
+        }
+        dct.update(self.kwargs)
+        return dct    
+    
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if 'threadId' in dct:
+            dct['threadId'] = cls._translate_id_to_dap(dct['threadId'])
+        return dct
+
+
+@register
+class OutputEventBody(BaseSchema):
+    """
+    "body" of OutputEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "category": {
+            "type": "string",
+            "description": "The output category. If not specified, 'console' is assumed.",
+            "_enum": [
+                "console",
+                "stdout",
+                "stderr",
+                "telemetry"
+            ]
+        },
+        "output": {
+            "type": "string",
+            "description": "The output to report."
+        },
+        "variablesReference": {
+            "type": "integer",
+            "description": "If an attribute 'variablesReference' exists and its value is > 0, the output contains objects which can be retrieved by passing 'variablesReference' to the 'variables' request. The value should be less than or equal to 2147483647 (2^31 - 1)."
+        },
+        "source": {
+            "description": "An optional source location where the output was produced.",
+            "type": "Source"
+        },
+        "line": {
+            "type": "integer",
+            "description": "An optional source location line where the output was produced."
+        },
+        "column": {
+            "type": "integer",
+            "description": "An optional source location column where the output was produced."
+        },
+        "data": {
+            "type": [
+                "array",
+                "boolean",
+                "integer",
+                "null",
+                "number",
+                "object",
+                "string"
+            ],
+            "description": "Optional data to report. For the 'telemetry' category the data will be sent to telemetry, for the other categories the data is shown in JSON format."
+        }
+    }
+    __refs__ = set(['source'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, output, category=None, variablesReference=None, source=None, line=None, column=None, data=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string output: The output to report.
+        :param string category: The output category. If not specified, 'console' is assumed.
+        :param integer variablesReference: If an attribute 'variablesReference' exists and its value is > 0, the output contains objects which can be retrieved by passing 'variablesReference' to the 'variables' request. The value should be less than or equal to 2147483647 (2^31 - 1).
+        :param Source source: An optional source location where the output was produced.
+        :param integer line: An optional source location line where the output was produced.
+        :param integer column: An optional source location column where the output was produced.
+        :param ['array', 'boolean', 'integer', 'null', 'number', 'object', 'string'] data: Optional data to report. For the 'telemetry' category the data will be sent to telemetry, for the other categories the data is shown in JSON format.
+        """
+        self.output = output
+        self.category = category
+        self.variablesReference = variablesReference
+        if source is None:
+            self.source = Source()
+        else:
+            self.source = Source(update_ids_from_dap=update_ids_from_dap, **source) if source.__class__ !=  Source else source
+        self.line = line
+        self.column = column
+        self.data = data
+        if update_ids_from_dap:
+            self.variablesReference = self._translate_id_from_dap(self.variablesReference)
+        self.kwargs = kwargs
+    
+    
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if 'variablesReference' in dct:
+            dct['variablesReference'] = cls._translate_id_from_dap(dct['variablesReference'])
+        return dct
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        output = self.output
+        category = self.category
+        variablesReference = self.variablesReference
+        source = self.source
+        line = self.line
+        column = self.column
+        data = self.data
+        if update_ids_to_dap:
+            if variablesReference is not None:
+                variablesReference = self._translate_id_to_dap(variablesReference)
+        dct = {
+            'output': output,
+        }
+        if category is not None:
+            dct['category'] = category
+        if variablesReference is not None:
+            dct['variablesReference'] = variablesReference
+        if source is not None:
+            dct['source'] = source.to_dict(update_ids_to_dap=update_ids_to_dap)
+        if line is not None:
+            dct['line'] = line
+        if column is not None:
+            dct['column'] = column
+        if data is not None:
+            dct['data'] = data
+        dct.update(self.kwargs)
+        return dct    
+    
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if 'variablesReference' in dct:
+            dct['variablesReference'] = cls._translate_id_to_dap(dct['variablesReference'])
+        return dct
+
+
+@register
+class BreakpointEventBody(BaseSchema):
+    """
+    "body" of BreakpointEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "reason": {
+            "type": "string",
+            "description": "The reason for the event.",
+            "_enum": [
+                "changed",
+                "new",
+                "removed"
+            ]
+        },
+        "breakpoint": {
+            "description": "The 'id' attribute is used to find the target breakpoint and the other attributes are used as the new values.",
+            "type": "Breakpoint"
+        }
+    }
+    __refs__ = set(['breakpoint'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, reason, breakpoint, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string reason: The reason for the event.
+        :param Breakpoint breakpoint: The 'id' attribute is used to find the target breakpoint and the other attributes are used as the new values.
+        """
+        self.reason = reason
+        if breakpoint is None:
+            self.breakpoint = Breakpoint()
+        else:
+            self.breakpoint = Breakpoint(update_ids_from_dap=update_ids_from_dap, **breakpoint) if breakpoint.__class__ !=  Breakpoint else breakpoint
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        reason = self.reason
+        breakpoint = self.breakpoint  # noqa (assign to builtin)
+        dct = {
+            'reason': reason,
+            'breakpoint': breakpoint.to_dict(update_ids_to_dap=update_ids_to_dap),
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class ModuleEventBody(BaseSchema):
+    """
+    "body" of ModuleEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "reason": {
+            "type": "string",
+            "description": "The reason for the event.",
+            "enum": [
+                "new",
+                "changed",
+                "removed"
+            ]
+        },
+        "module": {
+            "description": "The new, changed, or removed module. In case of 'removed' only the module id is used.",
+            "type": "Module"
+        }
+    }
+    __refs__ = set(['module'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, reason, module, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string reason: The reason for the event.
+        :param Module module: The new, changed, or removed module. In case of 'removed' only the module id is used.
+        """
+        self.reason = reason
+        if module is None:
+            self.module = Module()
+        else:
+            self.module = Module(update_ids_from_dap=update_ids_from_dap, **module) if module.__class__ !=  Module else module
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        reason = self.reason
+        module = self.module
+        dct = {
+            'reason': reason,
+            'module': module.to_dict(update_ids_to_dap=update_ids_to_dap),
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class LoadedSourceEventBody(BaseSchema):
+    """
+    "body" of LoadedSourceEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "reason": {
+            "type": "string",
+            "description": "The reason for the event.",
+            "enum": [
+                "new",
+                "changed",
+                "removed"
+            ]
+        },
+        "source": {
+            "description": "The new, changed, or removed source.",
+            "type": "Source"
+        }
+    }
+    __refs__ = set(['source'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, reason, source, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string reason: The reason for the event.
+        :param Source source: The new, changed, or removed source.
+        """
+        self.reason = reason
+        if source is None:
+            self.source = Source()
+        else:
+            self.source = Source(update_ids_from_dap=update_ids_from_dap, **source) if source.__class__ !=  Source else source
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        reason = self.reason
+        source = self.source
+        dct = {
+            'reason': reason,
+            'source': source.to_dict(update_ids_to_dap=update_ids_to_dap),
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class ProcessEventBody(BaseSchema):
+    """
+    "body" of ProcessEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "name": {
+            "type": "string",
+            "description": "The logical name of the process. This is usually the full path to process's executable file. Example: /home/example/myproj/program.js."
+        },
+        "systemProcessId": {
+            "type": "integer",
+            "description": "The system process id of the debugged process. This property will be missing for non-system processes."
+        },
+        "isLocalProcess": {
+            "type": "boolean",
+            "description": "If true, the process is running on the same computer as the debug adapter."
+        },
+        "startMethod": {
+            "type": "string",
+            "enum": [
+                "launch",
+                "attach",
+                "attachForSuspendedLaunch"
+            ],
+            "description": "Describes how the debug engine started debugging this process.",
+            "enumDescriptions": [
+                "Process was launched under the debugger.",
+                "Debugger attached to an existing process.",
+                "A project launcher component has launched a new process in a suspended state and then asked the debugger to attach."
+            ]
+        },
+        "pointerSize": {
+            "type": "integer",
+            "description": "The size of a pointer or address for this process, in bits. This value may be used by clients when formatting addresses for display."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, name, systemProcessId=None, isLocalProcess=None, startMethod=None, pointerSize=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string name: The logical name of the process. This is usually the full path to process's executable file. Example: /home/example/myproj/program.js.
+        :param integer systemProcessId: The system process id of the debugged process. This property will be missing for non-system processes.
+        :param boolean isLocalProcess: If true, the process is running on the same computer as the debug adapter.
+        :param string startMethod: Describes how the debug engine started debugging this process.
+        :param integer pointerSize: The size of a pointer or address for this process, in bits. This value may be used by clients when formatting addresses for display.
+        """
+        self.name = name
+        self.systemProcessId = systemProcessId
+        self.isLocalProcess = isLocalProcess
+        self.startMethod = startMethod
+        self.pointerSize = pointerSize
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        name = self.name
+        systemProcessId = self.systemProcessId
+        isLocalProcess = self.isLocalProcess
+        startMethod = self.startMethod
+        pointerSize = self.pointerSize
+        dct = {
+            'name': name,
+        }
+        if systemProcessId is not None:
+            dct['systemProcessId'] = systemProcessId
+        if isLocalProcess is not None:
+            dct['isLocalProcess'] = isLocalProcess
+        if startMethod is not None:
+            dct['startMethod'] = startMethod
+        if pointerSize is not None:
+            dct['pointerSize'] = pointerSize
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class CapabilitiesEventBody(BaseSchema):
+    """
+    "body" of CapabilitiesEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "capabilities": {
+            "description": "The set of updated capabilities.",
+            "type": "Capabilities"
+        }
+    }
+    __refs__ = set(['capabilities'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, capabilities, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param Capabilities capabilities: The set of updated capabilities.
+        """
+        if capabilities is None:
+            self.capabilities = Capabilities()
+        else:
+            self.capabilities = Capabilities(update_ids_from_dap=update_ids_from_dap, **capabilities) if capabilities.__class__ !=  Capabilities else capabilities
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        capabilities = self.capabilities
+        dct = {
+            'capabilities': capabilities.to_dict(update_ids_to_dap=update_ids_to_dap),
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class RunInTerminalRequestArgumentsEnv(BaseSchema):
+    """
+    "env" of RunInTerminalRequestArguments
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {}
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+    
+        """
+    
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
         dct = {
-            'output': output,
         }
-        if category is not None:
-            dct['category'] = category
-        if variablesReference is not None:
-            dct['variablesReference'] = variablesReference
-        if source is not None:
-            dct['source'] = source.to_dict(update_ids_to_dap=update_ids_to_dap)
-        if line is not None:
-            dct['line'] = line
-        if column is not None:
-            dct['column'] = column
-        if data is not None:
-            dct['data'] = data
         dct.update(self.kwargs)
-        return dct    
-    
-    @classmethod
-    def update_dict_ids_to_dap(cls, dct):
-        if 'variablesReference' in dct:
-            dct['variablesReference'] = cls._translate_id_to_dap(dct['variablesReference'])
         return dct
 
 
 @register
-class BreakpointEventBody(BaseSchema):
+class RunInTerminalResponseBody(BaseSchema):
     """
-    "body" of BreakpointEvent
+    "body" of RunInTerminalResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "reason": {
-            "type": "string",
-            "description": "The reason for the event.",
-            "_enum": [
-                "changed",
-                "new",
-                "removed"
-            ]
+        "processId": {
+            "type": "integer",
+            "description": "The process ID. The value should be less than or equal to 2147483647 (2^31 - 1)."
         },
-        "breakpoint": {
-            "description": "The 'id' attribute is used to find the target breakpoint and the other attributes are used as the new values.",
-            "type": "Breakpoint"
+        "shellProcessId": {
+            "type": "integer",
+            "description": "The process ID of the terminal shell. The value should be less than or equal to 2147483647 (2^31 - 1)."
         }
     }
-    __refs__ = set(['breakpoint'])
+    __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, reason, breakpoint, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, processId=None, shellProcessId=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string reason: The reason for the event.
-        :param Breakpoint breakpoint: The 'id' attribute is used to find the target breakpoint and the other attributes are used as the new values.
+        :param integer processId: The process ID. The value should be less than or equal to 2147483647 (2^31 - 1).
+        :param integer shellProcessId: The process ID of the terminal shell. The value should be less than or equal to 2147483647 (2^31 - 1).
         """
-        self.reason = reason
-        if breakpoint is None:
-            self.breakpoint = Breakpoint()
-        else:
-            self.breakpoint = Breakpoint(update_ids_from_dap=update_ids_from_dap, **breakpoint) if breakpoint.__class__ !=  Breakpoint else breakpoint
+        self.processId = processId
+        self.shellProcessId = shellProcessId
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        reason = self.reason
-        breakpoint = self.breakpoint  # noqa (assign to builtin)
+        processId = self.processId
+        shellProcessId = self.shellProcessId
         dct = {
-            'reason': reason,
-            'breakpoint': breakpoint.to_dict(update_ids_to_dap=update_ids_to_dap),
         }
+        if processId is not None:
+            dct['processId'] = processId
+        if shellProcessId is not None:
+            dct['shellProcessId'] = shellProcessId
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class ModuleEventBody(BaseSchema):
+class SetBreakpointsResponseBody(BaseSchema):
     """
-    "body" of ModuleEvent
+    "body" of SetBreakpointsResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "reason": {
-            "type": "string",
-            "description": "The reason for the event.",
-            "enum": [
-                "new",
-                "changed",
-                "removed"
-            ]
-        },
-        "module": {
-            "description": "The new, changed, or removed module. In case of 'removed' only the module id is used.",
-            "type": "Module"
+        "breakpoints": {
+            "type": "array",
+            "items": {
+                "$ref": "#/definitions/Breakpoint"
+            },
+            "description": "Information about the breakpoints. The array elements are in the same order as the elements of the 'breakpoints' (or the deprecated 'lines') array in the arguments."
         }
     }
-    __refs__ = set(['module'])
+    __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, reason, module, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string reason: The reason for the event.
-        :param Module module: The new, changed, or removed module. In case of 'removed' only the module id is used.
+        :param array breakpoints: Information about the breakpoints. The array elements are in the same order as the elements of the 'breakpoints' (or the deprecated 'lines') array in the arguments.
         """
-        self.reason = reason
-        if module is None:
-            self.module = Module()
-        else:
-            self.module = Module(update_ids_from_dap=update_ids_from_dap, **module) if module.__class__ !=  Module else module
+        self.breakpoints = breakpoints
+        if update_ids_from_dap and self.breakpoints:
+            for o in self.breakpoints:
+                Breakpoint.update_dict_ids_from_dap(o)
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        reason = self.reason
-        module = self.module
+        breakpoints = self.breakpoints
+        if breakpoints and hasattr(breakpoints[0], "to_dict"):
+            breakpoints = [x.to_dict() for x in breakpoints]
         dct = {
-            'reason': reason,
-            'module': module.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'breakpoints': [Breakpoint.update_dict_ids_to_dap(o) for o in breakpoints] if (update_ids_to_dap and breakpoints) else breakpoints,
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class LoadedSourceEventBody(BaseSchema):
+class SetFunctionBreakpointsResponseBody(BaseSchema):
     """
-    "body" of LoadedSourceEvent
+    "body" of SetFunctionBreakpointsResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "reason": {
-            "type": "string",
-            "description": "The reason for the event.",
-            "enum": [
-                "new",
-                "changed",
-                "removed"
-            ]
-        },
-        "source": {
-            "description": "The new, changed, or removed source.",
-            "type": "Source"
+        "breakpoints": {
+            "type": "array",
+            "items": {
+                "$ref": "#/definitions/Breakpoint"
+            },
+            "description": "Information about the breakpoints. The array elements correspond to the elements of the 'breakpoints' array."
         }
     }
-    __refs__ = set(['source'])
+    __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, reason, source, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string reason: The reason for the event.
-        :param Source source: The new, changed, or removed source.
+        :param array breakpoints: Information about the breakpoints. The array elements correspond to the elements of the 'breakpoints' array.
         """
-        self.reason = reason
-        if source is None:
-            self.source = Source()
-        else:
-            self.source = Source(update_ids_from_dap=update_ids_from_dap, **source) if source.__class__ !=  Source else source
+        self.breakpoints = breakpoints
+        if update_ids_from_dap and self.breakpoints:
+            for o in self.breakpoints:
+                Breakpoint.update_dict_ids_from_dap(o)
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        reason = self.reason
-        source = self.source
+        breakpoints = self.breakpoints
+        if breakpoints and hasattr(breakpoints[0], "to_dict"):
+            breakpoints = [x.to_dict() for x in breakpoints]
         dct = {
-            'reason': reason,
-            'source': source.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'breakpoints': [Breakpoint.update_dict_ids_to_dap(o) for o in breakpoints] if (update_ids_to_dap and breakpoints) else breakpoints,
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class ProcessEventBody(BaseSchema):
+class DataBreakpointInfoResponseBody(BaseSchema):
     """
-    "body" of ProcessEvent
+    "body" of DataBreakpointInfoResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "name": {
+        "dataId": {
+            "type": [
+                "string",
+                "null"
+            ],
+            "description": "An identifier for the data on which a data breakpoint can be registered with the setDataBreakpoints request or null if no data breakpoint is available."
+        },
+        "description": {
             "type": "string",
-            "description": "The logical name of the process. This is usually the full path to process's executable file. Example: /home/example/myproj/program.js."
+            "description": "UI string that describes on what data the breakpoint is set on or why a data breakpoint is not available."
         },
-        "systemProcessId": {
-            "type": "integer",
-            "description": "The system process id of the debugged process. This property will be missing for non-system processes."
+        "accessTypes": {
+            "type": "array",
+            "items": {
+                "$ref": "#/definitions/DataBreakpointAccessType"
+            },
+            "description": "Optional attribute listing the available access types for a potential data breakpoint. A UI frontend could surface this information."
         },
-        "isLocalProcess": {
+        "canPersist": {
             "type": "boolean",
-            "description": "If true, the process is running on the same computer as the debug adapter."
-        },
-        "startMethod": {
-            "type": "string",
-            "enum": [
-                "launch",
-                "attach",
-                "attachForSuspendedLaunch"
-            ],
-            "description": "Describes how the debug engine started debugging this process.",
-            "enumDescriptions": [
-                "Process was launched under the debugger.",
-                "Debugger attached to an existing process.",
-                "A project launcher component has launched a new process in a suspended state and then asked the debugger to attach."
-            ]
-        },
-        "pointerSize": {
-            "type": "integer",
-            "description": "The size of a pointer or address for this process, in bits. This value may be used by clients when formatting addresses for display."
+            "description": "Optional attribute indicating that a potential data breakpoint could be persisted across sessions."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, name, systemProcessId=None, isLocalProcess=None, startMethod=None, pointerSize=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, dataId, description, accessTypes=None, canPersist=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string name: The logical name of the process. This is usually the full path to process's executable file. Example: /home/example/myproj/program.js.
-        :param integer systemProcessId: The system process id of the debugged process. This property will be missing for non-system processes.
-        :param boolean isLocalProcess: If true, the process is running on the same computer as the debug adapter.
-        :param string startMethod: Describes how the debug engine started debugging this process.
-        :param integer pointerSize: The size of a pointer or address for this process, in bits. This value may be used by clients when formatting addresses for display.
+        :param ['string', 'null'] dataId: An identifier for the data on which a data breakpoint can be registered with the setDataBreakpoints request or null if no data breakpoint is available.
+        :param string description: UI string that describes on what data the breakpoint is set on or why a data breakpoint is not available.
+        :param array accessTypes: Optional attribute listing the available access types for a potential data breakpoint. A UI frontend could surface this information.
+        :param boolean canPersist: Optional attribute indicating that a potential data breakpoint could be persisted across sessions.
         """
-        self.name = name
-        self.systemProcessId = systemProcessId
-        self.isLocalProcess = isLocalProcess
-        self.startMethod = startMethod
-        self.pointerSize = pointerSize
+        self.dataId = dataId
+        self.description = description
+        self.accessTypes = accessTypes
+        if update_ids_from_dap and self.accessTypes:
+            for o in self.accessTypes:
+                DataBreakpointAccessType.update_dict_ids_from_dap(o)
+        self.canPersist = canPersist
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        name = self.name
-        systemProcessId = self.systemProcessId
-        isLocalProcess = self.isLocalProcess
-        startMethod = self.startMethod
-        pointerSize = self.pointerSize
+        dataId = self.dataId
+        description = self.description
+        accessTypes = self.accessTypes
+        if accessTypes and hasattr(accessTypes[0], "to_dict"):
+            accessTypes = [x.to_dict() for x in accessTypes]
+        canPersist = self.canPersist
         dct = {
-            'name': name,
+            'dataId': dataId,
+            'description': description,
         }
-        if systemProcessId is not None:
-            dct['systemProcessId'] = systemProcessId
-        if isLocalProcess is not None:
-            dct['isLocalProcess'] = isLocalProcess
-        if startMethod is not None:
-            dct['startMethod'] = startMethod
-        if pointerSize is not None:
-            dct['pointerSize'] = pointerSize
+        if accessTypes is not None:
+            dct['accessTypes'] = [DataBreakpointAccessType.update_dict_ids_to_dap(o) for o in accessTypes] if (update_ids_to_dap and accessTypes) else accessTypes
+        if canPersist is not None:
+            dct['canPersist'] = canPersist
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class CapabilitiesEventBody(BaseSchema):
+class SetDataBreakpointsResponseBody(BaseSchema):
     """
-    "body" of CapabilitiesEvent
+    "body" of SetDataBreakpointsResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "capabilities": {
-            "description": "The set of updated capabilities.",
-            "type": "Capabilities"
+        "breakpoints": {
+            "type": "array",
+            "items": {
+                "$ref": "#/definitions/Breakpoint"
+            },
+            "description": "Information about the data breakpoints. The array elements correspond to the elements of the input argument 'breakpoints' array."
         }
     }
-    __refs__ = set(['capabilities'])
+    __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, capabilities, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param Capabilities capabilities: The set of updated capabilities.
+        :param array breakpoints: Information about the data breakpoints. The array elements correspond to the elements of the input argument 'breakpoints' array.
         """
-        if capabilities is None:
-            self.capabilities = Capabilities()
-        else:
-            self.capabilities = Capabilities(update_ids_from_dap=update_ids_from_dap, **capabilities) if capabilities.__class__ !=  Capabilities else capabilities
+        self.breakpoints = breakpoints
+        if update_ids_from_dap and self.breakpoints:
+            for o in self.breakpoints:
+                Breakpoint.update_dict_ids_from_dap(o)
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        capabilities = self.capabilities
+        breakpoints = self.breakpoints
+        if breakpoints and hasattr(breakpoints[0], "to_dict"):
+            breakpoints = [x.to_dict() for x in breakpoints]
         dct = {
-            'capabilities': capabilities.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'breakpoints': [Breakpoint.update_dict_ids_to_dap(o) for o in breakpoints] if (update_ids_to_dap and breakpoints) else breakpoints,
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class RunInTerminalRequestArgumentsEnv(BaseSchema):
+class ContinueResponseBody(BaseSchema):
     """
-    "env" of RunInTerminalRequestArguments
+    "body" of ContinueResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {}
+    __props__ = {
+        "allThreadsContinued": {
+            "type": "boolean",
+            "description": "If true, the 'continue' request has ignored the specified thread and continued all threads instead. If this attribute is missing a value of 'true' is assumed for backward compatibility."
+        }
+    }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, allThreadsContinued=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-    
+        :param boolean allThreadsContinued: If true, the 'continue' request has ignored the specified thread and continued all threads instead. If this attribute is missing a value of 'true' is assumed for backward compatibility.
         """
-    
+        self.allThreadsContinued = allThreadsContinued
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        allThreadsContinued = self.allThreadsContinued
         dct = {
         }
+        if allThreadsContinued is not None:
+            dct['allThreadsContinued'] = allThreadsContinued
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class RunInTerminalResponseBody(BaseSchema):
+class StackTraceResponseBody(BaseSchema):
     """
-    "body" of RunInTerminalResponse
+    "body" of StackTraceResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "processId": {
-            "type": "integer",
-            "description": "The process ID. The value should be less than or equal to 2147483647 (2^31 - 1)."
+        "stackFrames": {
+            "type": "array",
+            "items": {
+                "$ref": "#/definitions/StackFrame"
+            },
+            "description": "The frames of the stackframe. If the array has length zero, there are no stackframes available.\nThis means that there is no location information available."
         },
-        "shellProcessId": {
+        "totalFrames": {
             "type": "integer",
-            "description": "The process ID of the terminal shell. The value should be less than or equal to 2147483647 (2^31 - 1)."
+            "description": "The total number of frames available."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, processId=None, shellProcessId=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, stackFrames, totalFrames=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param integer processId: The process ID. The value should be less than or equal to 2147483647 (2^31 - 1).
-        :param integer shellProcessId: The process ID of the terminal shell. The value should be less than or equal to 2147483647 (2^31 - 1).
+        :param array stackFrames: The frames of the stackframe. If the array has length zero, there are no stackframes available.
+        This means that there is no location information available.
+        :param integer totalFrames: The total number of frames available.
         """
-        self.processId = processId
-        self.shellProcessId = shellProcessId
+        self.stackFrames = stackFrames
+        if update_ids_from_dap and self.stackFrames:
+            for o in self.stackFrames:
+                StackFrame.update_dict_ids_from_dap(o)
+        self.totalFrames = totalFrames
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        processId = self.processId
-        shellProcessId = self.shellProcessId
+        stackFrames = self.stackFrames
+        if stackFrames and hasattr(stackFrames[0], "to_dict"):
+            stackFrames = [x.to_dict() for x in stackFrames]
+        totalFrames = self.totalFrames
         dct = {
+            'stackFrames': [StackFrame.update_dict_ids_to_dap(o) for o in stackFrames] if (update_ids_to_dap and stackFrames) else stackFrames,
         }
-        if processId is not None:
-            dct['processId'] = processId
-        if shellProcessId is not None:
-            dct['shellProcessId'] = shellProcessId
+        if totalFrames is not None:
+            dct['totalFrames'] = totalFrames
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class SetBreakpointsResponseBody(BaseSchema):
+class ScopesResponseBody(BaseSchema):
     """
-    "body" of SetBreakpointsResponse
+    "body" of ScopesResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "breakpoints": {
+        "scopes": {
             "type": "array",
             "items": {
-                "$ref": "#/definitions/Breakpoint"
+                "$ref": "#/definitions/Scope"
             },
-            "description": "Information about the breakpoints. The array elements are in the same order as the elements of the 'breakpoints' (or the deprecated 'lines') array in the arguments."
+            "description": "The scopes of the stackframe. If the array has length zero, there are no scopes available."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, scopes, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array breakpoints: Information about the breakpoints. The array elements are in the same order as the elements of the 'breakpoints' (or the deprecated 'lines') array in the arguments.
+        :param array scopes: The scopes of the stackframe. If the array has length zero, there are no scopes available.
         """
-        self.breakpoints = breakpoints
-        if update_ids_from_dap and self.breakpoints:
-            for o in self.breakpoints:
-                Breakpoint.update_dict_ids_from_dap(o)
+        self.scopes = scopes
+        if update_ids_from_dap and self.scopes:
+            for o in self.scopes:
+                Scope.update_dict_ids_from_dap(o)
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        breakpoints = self.breakpoints
-        if breakpoints and hasattr(breakpoints[0], "to_dict"):
-            breakpoints = [x.to_dict() for x in breakpoints]
+        scopes = self.scopes
+        if scopes and hasattr(scopes[0], "to_dict"):
+            scopes = [x.to_dict() for x in scopes]
         dct = {
-            'breakpoints': [Breakpoint.update_dict_ids_to_dap(o) for o in breakpoints] if (update_ids_to_dap and breakpoints) else breakpoints,
+            'scopes': [Scope.update_dict_ids_to_dap(o) for o in scopes] if (update_ids_to_dap and scopes) else scopes,
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class SetFunctionBreakpointsResponseBody(BaseSchema):
+class VariablesResponseBody(BaseSchema):
     """
-    "body" of SetFunctionBreakpointsResponse
+    "body" of VariablesResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "breakpoints": {
+        "variables": {
             "type": "array",
             "items": {
-                "$ref": "#/definitions/Breakpoint"
+                "$ref": "#/definitions/Variable"
             },
-            "description": "Information about the breakpoints. The array elements correspond to the elements of the 'breakpoints' array."
+            "description": "All (or a range) of variables for the given variable reference."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, variables, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array breakpoints: Information about the breakpoints. The array elements correspond to the elements of the 'breakpoints' array.
+        :param array variables: All (or a range) of variables for the given variable reference.
         """
-        self.breakpoints = breakpoints
-        if update_ids_from_dap and self.breakpoints:
-            for o in self.breakpoints:
-                Breakpoint.update_dict_ids_from_dap(o)
+        self.variables = variables
+        if update_ids_from_dap and self.variables:
+            for o in self.variables:
+                Variable.update_dict_ids_from_dap(o)
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        breakpoints = self.breakpoints
-        if breakpoints and hasattr(breakpoints[0], "to_dict"):
-            breakpoints = [x.to_dict() for x in breakpoints]
+        variables = self.variables
+        if variables and hasattr(variables[0], "to_dict"):
+            variables = [x.to_dict() for x in variables]
         dct = {
-            'breakpoints': [Breakpoint.update_dict_ids_to_dap(o) for o in breakpoints] if (update_ids_to_dap and breakpoints) else breakpoints,
+            'variables': [Variable.update_dict_ids_to_dap(o) for o in variables] if (update_ids_to_dap and variables) else variables,
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class DataBreakpointInfoResponseBody(BaseSchema):
+class SetVariableResponseBody(BaseSchema):
     """
-    "body" of DataBreakpointInfoResponse
+    "body" of SetVariableResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "dataId": {
-            "type": [
-                "string",
-                "null"
-            ],
-            "description": "An identifier for the data on which a data breakpoint can be registered with the setDataBreakpoints request or null if no data breakpoint is available."
+        "value": {
+            "type": "string",
+            "description": "The new value of the variable."
         },
-        "description": {
+        "type": {
             "type": "string",
-            "description": "UI string that describes on what data the breakpoint is set on or why a data breakpoint is not available."
+            "description": "The type of the new value. Typically shown in the UI when hovering over the value."
         },
-        "accessTypes": {
-            "type": "array",
-            "items": {
-                "$ref": "#/definitions/DataBreakpointAccessType"
-            },
-            "description": "Optional attribute listing the available access types for a potential data breakpoint. A UI frontend could surface this information."
+        "variablesReference": {
+            "type": "integer",
+            "description": "If variablesReference is > 0, the new value is structured and its children can be retrieved by passing variablesReference to the VariablesRequest. The value should be less than or equal to 2147483647 (2^31 - 1)."
         },
-        "canPersist": {
-            "type": "boolean",
-            "description": "Optional attribute indicating that a potential data breakpoint could be persisted across sessions."
+        "namedVariables": {
+            "type": "integer",
+            "description": "The number of named child variables.\nThe client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1)."
+        },
+        "indexedVariables": {
+            "type": "integer",
+            "description": "The number of indexed child variables.\nThe client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1)."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, dataId, description, accessTypes=None, canPersist=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, value, type=None, variablesReference=None, namedVariables=None, indexedVariables=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param ['string', 'null'] dataId: An identifier for the data on which a data breakpoint can be registered with the setDataBreakpoints request or null if no data breakpoint is available.
-        :param string description: UI string that describes on what data the breakpoint is set on or why a data breakpoint is not available.
-        :param array accessTypes: Optional attribute listing the available access types for a potential data breakpoint. A UI frontend could surface this information.
-        :param boolean canPersist: Optional attribute indicating that a potential data breakpoint could be persisted across sessions.
+        :param string value: The new value of the variable.
+        :param string type: The type of the new value. Typically shown in the UI when hovering over the value.
+        :param integer variablesReference: If variablesReference is > 0, the new value is structured and its children can be retrieved by passing variablesReference to the VariablesRequest. The value should be less than or equal to 2147483647 (2^31 - 1).
+        :param integer namedVariables: The number of named child variables.
+        The client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1).
+        :param integer indexedVariables: The number of indexed child variables.
+        The client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1).
         """
-        self.dataId = dataId
-        self.description = description
-        self.accessTypes = accessTypes
-        if update_ids_from_dap and self.accessTypes:
-            for o in self.accessTypes:
-                DataBreakpointAccessType.update_dict_ids_from_dap(o)
-        self.canPersist = canPersist
+        self.value = value
+        self.type = type
+        self.variablesReference = variablesReference
+        self.namedVariables = namedVariables
+        self.indexedVariables = indexedVariables
+        if update_ids_from_dap:
+            self.variablesReference = self._translate_id_from_dap(self.variablesReference)
         self.kwargs = kwargs
-
+    
+    
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if 'variablesReference' in dct:
+            dct['variablesReference'] = cls._translate_id_from_dap(dct['variablesReference'])
+        return dct
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        dataId = self.dataId
-        description = self.description
-        accessTypes = self.accessTypes
-        if accessTypes and hasattr(accessTypes[0], "to_dict"):
-            accessTypes = [x.to_dict() for x in accessTypes]
-        canPersist = self.canPersist
+        value = self.value
+        type = self.type  # noqa (assign to builtin)
+        variablesReference = self.variablesReference
+        namedVariables = self.namedVariables
+        indexedVariables = self.indexedVariables
+        if update_ids_to_dap:
+            if variablesReference is not None:
+                variablesReference = self._translate_id_to_dap(variablesReference)
         dct = {
-            'dataId': dataId,
-            'description': description,
+            'value': value,
         }
-        if accessTypes is not None:
-            dct['accessTypes'] = [DataBreakpointAccessType.update_dict_ids_to_dap(o) for o in accessTypes] if (update_ids_to_dap and accessTypes) else accessTypes
-        if canPersist is not None:
-            dct['canPersist'] = canPersist
+        if type is not None:
+            dct['type'] = type
+        if variablesReference is not None:
+            dct['variablesReference'] = variablesReference
+        if namedVariables is not None:
+            dct['namedVariables'] = namedVariables
+        if indexedVariables is not None:
+            dct['indexedVariables'] = indexedVariables
         dct.update(self.kwargs)
+        return dct    
+    
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if 'variablesReference' in dct:
+            dct['variablesReference'] = cls._translate_id_to_dap(dct['variablesReference'])
         return dct
 
 
 @register
-class SetDataBreakpointsResponseBody(BaseSchema):
+class SourceResponseBody(BaseSchema):
     """
-    "body" of SetDataBreakpointsResponse
+    "body" of SourceResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "breakpoints": {
-            "type": "array",
-            "items": {
-                "$ref": "#/definitions/Breakpoint"
-            },
-            "description": "Information about the data breakpoints. The array elements correspond to the elements of the input argument 'breakpoints' array."
+        "content": {
+            "type": "string",
+            "description": "Content of the source reference."
+        },
+        "mimeType": {
+            "type": "string",
+            "description": "Optional content type (mime type) of the source."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, content, mimeType=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array breakpoints: Information about the data breakpoints. The array elements correspond to the elements of the input argument 'breakpoints' array.
+        :param string content: Content of the source reference.
+        :param string mimeType: Optional content type (mime type) of the source.
         """
-        self.breakpoints = breakpoints
-        if update_ids_from_dap and self.breakpoints:
-            for o in self.breakpoints:
-                Breakpoint.update_dict_ids_from_dap(o)
+        self.content = content
+        self.mimeType = mimeType
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        breakpoints = self.breakpoints
-        if breakpoints and hasattr(breakpoints[0], "to_dict"):
-            breakpoints = [x.to_dict() for x in breakpoints]
+        content = self.content
+        mimeType = self.mimeType
         dct = {
-            'breakpoints': [Breakpoint.update_dict_ids_to_dap(o) for o in breakpoints] if (update_ids_to_dap and breakpoints) else breakpoints,
+            'content': content,
         }
+        if mimeType is not None:
+            dct['mimeType'] = mimeType
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class ContinueResponseBody(BaseSchema):
+class ThreadsResponseBody(BaseSchema):
     """
-    "body" of ContinueResponse
+    "body" of ThreadsResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "allThreadsContinued": {
-            "type": "boolean",
-            "description": "If true, the 'continue' request has ignored the specified thread and continued all threads instead. If this attribute is missing a value of 'true' is assumed for backward compatibility."
+        "threads": {
+            "type": "array",
+            "items": {
+                "$ref": "#/definitions/Thread"
+            },
+            "description": "All threads."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, allThreadsContinued=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, threads, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param boolean allThreadsContinued: If true, the 'continue' request has ignored the specified thread and continued all threads instead. If this attribute is missing a value of 'true' is assumed for backward compatibility.
+        :param array threads: All threads.
         """
-        self.allThreadsContinued = allThreadsContinued
+        self.threads = threads
+        if update_ids_from_dap and self.threads:
+            for o in self.threads:
+                Thread.update_dict_ids_from_dap(o)
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        allThreadsContinued = self.allThreadsContinued
+        threads = self.threads
+        if threads and hasattr(threads[0], "to_dict"):
+            threads = [x.to_dict() for x in threads]
         dct = {
+            'threads': [Thread.update_dict_ids_to_dap(o) for o in threads] if (update_ids_to_dap and threads) else threads,
         }
-        if allThreadsContinued is not None:
-            dct['allThreadsContinued'] = allThreadsContinued
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class StackTraceResponseBody(BaseSchema):
+class ModulesResponseBody(BaseSchema):
     """
-    "body" of StackTraceResponse
+    "body" of ModulesResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "stackFrames": {
+        "modules": {
             "type": "array",
             "items": {
-                "$ref": "#/definitions/StackFrame"
+                "$ref": "#/definitions/Module"
             },
-            "description": "The frames of the stackframe. If the array has length zero, there are no stackframes available.\nThis means that there is no location information available."
+            "description": "All modules or range of modules."
         },
-        "totalFrames": {
+        "totalModules": {
             "type": "integer",
-            "description": "The total number of frames available."
+            "description": "The total number of modules available."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, stackFrames, totalFrames=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, modules, totalModules=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array stackFrames: The frames of the stackframe. If the array has length zero, there are no stackframes available.
-        This means that there is no location information available.
-        :param integer totalFrames: The total number of frames available.
+        :param array modules: All modules or range of modules.
+        :param integer totalModules: The total number of modules available.
         """
-        self.stackFrames = stackFrames
-        if update_ids_from_dap and self.stackFrames:
-            for o in self.stackFrames:
-                StackFrame.update_dict_ids_from_dap(o)
-        self.totalFrames = totalFrames
+        self.modules = modules
+        if update_ids_from_dap and self.modules:
+            for o in self.modules:
+                Module.update_dict_ids_from_dap(o)
+        self.totalModules = totalModules
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        stackFrames = self.stackFrames
-        if stackFrames and hasattr(stackFrames[0], "to_dict"):
-            stackFrames = [x.to_dict() for x in stackFrames]
-        totalFrames = self.totalFrames
+        modules = self.modules
+        if modules and hasattr(modules[0], "to_dict"):
+            modules = [x.to_dict() for x in modules]
+        totalModules = self.totalModules
         dct = {
-            'stackFrames': [StackFrame.update_dict_ids_to_dap(o) for o in stackFrames] if (update_ids_to_dap and stackFrames) else stackFrames,
+            'modules': [Module.update_dict_ids_to_dap(o) for o in modules] if (update_ids_to_dap and modules) else modules,
         }
-        if totalFrames is not None:
-            dct['totalFrames'] = totalFrames
+        if totalModules is not None:
+            dct['totalModules'] = totalModules
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class ScopesResponseBody(BaseSchema):
+class LoadedSourcesResponseBody(BaseSchema):
     """
-    "body" of ScopesResponse
+    "body" of LoadedSourcesResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "scopes": {
+        "sources": {
             "type": "array",
             "items": {
-                "$ref": "#/definitions/Scope"
+                "$ref": "#/definitions/Source"
             },
-            "description": "The scopes of the stackframe. If the array has length zero, there are no scopes available."
+            "description": "Set of loaded sources."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, scopes, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, sources, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array scopes: The scopes of the stackframe. If the array has length zero, there are no scopes available.
+        :param array sources: Set of loaded sources.
         """
-        self.scopes = scopes
-        if update_ids_from_dap and self.scopes:
-            for o in self.scopes:
-                Scope.update_dict_ids_from_dap(o)
+        self.sources = sources
+        if update_ids_from_dap and self.sources:
+            for o in self.sources:
+                Source.update_dict_ids_from_dap(o)
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        scopes = self.scopes
-        if scopes and hasattr(scopes[0], "to_dict"):
-            scopes = [x.to_dict() for x in scopes]
+        sources = self.sources
+        if sources and hasattr(sources[0], "to_dict"):
+            sources = [x.to_dict() for x in sources]
         dct = {
-            'scopes': [Scope.update_dict_ids_to_dap(o) for o in scopes] if (update_ids_to_dap and scopes) else scopes,
+            'sources': [Source.update_dict_ids_to_dap(o) for o in sources] if (update_ids_to_dap and sources) else sources,
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class VariablesResponseBody(BaseSchema):
+class EvaluateResponseBody(BaseSchema):
     """
-    "body" of VariablesResponse
+    "body" of EvaluateResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "variables": {
-            "type": "array",
-            "items": {
-                "$ref": "#/definitions/Variable"
-            },
-            "description": "All (or a range) of variables for the given variable reference."
+        "result": {
+            "type": "string",
+            "description": "The result of the evaluate request."
+        },
+        "type": {
+            "type": "string",
+            "description": "The optional type of the evaluate result."
+        },
+        "presentationHint": {
+            "description": "Properties of a evaluate result that can be used to determine how to render the result in the UI.",
+            "type": "VariablePresentationHint"
+        },
+        "variablesReference": {
+            "type": "integer",
+            "description": "If variablesReference is > 0, the evaluate result is structured and its children can be retrieved by passing variablesReference to the VariablesRequest. The value should be less than or equal to 2147483647 (2^31 - 1)."
+        },
+        "namedVariables": {
+            "type": "integer",
+            "description": "The number of named child variables.\nThe client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1)."
+        },
+        "indexedVariables": {
+            "type": "integer",
+            "description": "The number of indexed child variables.\nThe client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1)."
+        },
+        "memoryReference": {
+            "type": "string",
+            "description": "Memory reference to a location appropriate for this result. For pointer type eval results, this is generally a reference to the memory address contained in the pointer."
         }
     }
-    __refs__ = set()
+    __refs__ = set(['presentationHint'])
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, variables, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, result, variablesReference, type=None, presentationHint=None, namedVariables=None, indexedVariables=None, memoryReference=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array variables: All (or a range) of variables for the given variable reference.
+        :param string result: The result of the evaluate request.
+        :param integer variablesReference: If variablesReference is > 0, the evaluate result is structured and its children can be retrieved by passing variablesReference to the VariablesRequest. The value should be less than or equal to 2147483647 (2^31 - 1).
+        :param string type: The optional type of the evaluate result.
+        :param VariablePresentationHint presentationHint: Properties of a evaluate result that can be used to determine how to render the result in the UI.
+        :param integer namedVariables: The number of named child variables.
+        The client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1).
+        :param integer indexedVariables: The number of indexed child variables.
+        The client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1).
+        :param string memoryReference: Memory reference to a location appropriate for this result. For pointer type eval results, this is generally a reference to the memory address contained in the pointer.
         """
-        self.variables = variables
-        if update_ids_from_dap and self.variables:
-            for o in self.variables:
-                Variable.update_dict_ids_from_dap(o)
+        self.result = result
+        self.variablesReference = variablesReference
+        self.type = type
+        if presentationHint is None:
+            self.presentationHint = VariablePresentationHint()
+        else:
+            self.presentationHint = VariablePresentationHint(update_ids_from_dap=update_ids_from_dap, **presentationHint) if presentationHint.__class__ !=  VariablePresentationHint else presentationHint
+        self.namedVariables = namedVariables
+        self.indexedVariables = indexedVariables
+        self.memoryReference = memoryReference
+        if update_ids_from_dap:
+            self.variablesReference = self._translate_id_from_dap(self.variablesReference)
         self.kwargs = kwargs
-
+    
+    
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if 'variablesReference' in dct:
+            dct['variablesReference'] = cls._translate_id_from_dap(dct['variablesReference'])
+        return dct
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        variables = self.variables
-        if variables and hasattr(variables[0], "to_dict"):
-            variables = [x.to_dict() for x in variables]
+        result = self.result
+        variablesReference = self.variablesReference
+        type = self.type  # noqa (assign to builtin)
+        presentationHint = self.presentationHint
+        namedVariables = self.namedVariables
+        indexedVariables = self.indexedVariables
+        memoryReference = self.memoryReference
+        if update_ids_to_dap:
+            if variablesReference is not None:
+                variablesReference = self._translate_id_to_dap(variablesReference)
         dct = {
-            'variables': [Variable.update_dict_ids_to_dap(o) for o in variables] if (update_ids_to_dap and variables) else variables,
+            'result': result,
+            'variablesReference': variablesReference,
         }
+        if type is not None:
+            dct['type'] = type
+        if presentationHint is not None:
+            dct['presentationHint'] = presentationHint.to_dict(update_ids_to_dap=update_ids_to_dap)
+        if namedVariables is not None:
+            dct['namedVariables'] = namedVariables
+        if indexedVariables is not None:
+            dct['indexedVariables'] = indexedVariables
+        if memoryReference is not None:
+            dct['memoryReference'] = memoryReference
         dct.update(self.kwargs)
+        return dct    
+    
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if 'variablesReference' in dct:
+            dct['variablesReference'] = cls._translate_id_to_dap(dct['variablesReference'])
         return dct
 
 
 @register
-class SetVariableResponseBody(BaseSchema):
+class SetExpressionResponseBody(BaseSchema):
     """
-    "body" of SetVariableResponse
+    "body" of SetExpressionResponse
 
     Note: automatically generated code. Do not edit manually.
     """
@@ -15430,15 +17722,19 @@ class SetVariableResponseBody(BaseSchema):
     __props__ = {
         "value": {
             "type": "string",
-            "description": "The new value of the variable."
+            "description": "The new value of the expression."
         },
         "type": {
             "type": "string",
-            "description": "The type of the new value. Typically shown in the UI when hovering over the value."
+            "description": "The optional type of the value."
+        },
+        "presentationHint": {
+            "description": "Properties of a value that can be used to determine how to render the result in the UI.",
+            "type": "VariablePresentationHint"
         },
         "variablesReference": {
             "type": "integer",
-            "description": "If variablesReference is > 0, the new value is structured and its children can be retrieved by passing variablesReference to the VariablesRequest. The value should be less than or equal to 2147483647 (2^31 - 1)."
+            "description": "If variablesReference is > 0, the value is structured and its children can be retrieved by passing variablesReference to the VariablesRequest. The value should be less than or equal to 2147483647 (2^31 - 1)."
         },
         "namedVariables": {
             "type": "integer",
@@ -15449,15 +17745,16 @@ class SetVariableResponseBody(BaseSchema):
             "description": "The number of indexed child variables.\nThe client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1)."
         }
     }
-    __refs__ = set()
+    __refs__ = set(['presentationHint'])
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, value, type=None, variablesReference=None, namedVariables=None, indexedVariables=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, value, type=None, presentationHint=None, variablesReference=None, namedVariables=None, indexedVariables=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string value: The new value of the variable.
-        :param string type: The type of the new value. Typically shown in the UI when hovering over the value.
-        :param integer variablesReference: If variablesReference is > 0, the new value is structured and its children can be retrieved by passing variablesReference to the VariablesRequest. The value should be less than or equal to 2147483647 (2^31 - 1).
+        :param string value: The new value of the expression.
+        :param string type: The optional type of the value.
+        :param VariablePresentationHint presentationHint: Properties of a value that can be used to determine how to render the result in the UI.
+        :param integer variablesReference: If variablesReference is > 0, the value is structured and its children can be retrieved by passing variablesReference to the VariablesRequest. The value should be less than or equal to 2147483647 (2^31 - 1).
         :param integer namedVariables: The number of named child variables.
         The client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1).
         :param integer indexedVariables: The number of indexed child variables.
@@ -15465,6 +17762,10 @@ class SetVariableResponseBody(BaseSchema):
         """
         self.value = value
         self.type = type
+        if presentationHint is None:
+            self.presentationHint = VariablePresentationHint()
+        else:
+            self.presentationHint = VariablePresentationHint(update_ids_from_dap=update_ids_from_dap, **presentationHint) if presentationHint.__class__ !=  VariablePresentationHint else presentationHint
         self.variablesReference = variablesReference
         self.namedVariables = namedVariables
         self.indexedVariables = indexedVariables
@@ -15482,6 +17783,7 @@ class SetVariableResponseBody(BaseSchema):
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
         value = self.value
         type = self.type  # noqa (assign to builtin)
+        presentationHint = self.presentationHint
         variablesReference = self.variablesReference
         namedVariables = self.namedVariables
         indexedVariables = self.indexedVariables
@@ -15493,6 +17795,8 @@ class SetVariableResponseBody(BaseSchema):
         }
         if type is not None:
             dct['type'] = type
+        if presentationHint is not None:
+            dct['presentationHint'] = presentationHint.to_dict(update_ids_to_dap=update_ids_to_dap)
         if variablesReference is not None:
             dct['variablesReference'] = variablesReference
         if namedVariables is not None:
@@ -15510,355 +17814,358 @@ class SetVariableResponseBody(BaseSchema):
 
 
 @register
-class SourceResponseBody(BaseSchema):
+class StepInTargetsResponseBody(BaseSchema):
     """
-    "body" of SourceResponse
+    "body" of StepInTargetsResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "content": {
-            "type": "string",
-            "description": "Content of the source reference."
-        },
-        "mimeType": {
-            "type": "string",
-            "description": "Optional content type (mime type) of the source."
+        "targets": {
+            "type": "array",
+            "items": {
+                "$ref": "#/definitions/StepInTarget"
+            },
+            "description": "The possible stepIn targets of the specified source location."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, content, mimeType=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, targets, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string content: Content of the source reference.
-        :param string mimeType: Optional content type (mime type) of the source.
+        :param array targets: The possible stepIn targets of the specified source location.
         """
-        self.content = content
-        self.mimeType = mimeType
+        self.targets = targets
+        if update_ids_from_dap and self.targets:
+            for o in self.targets:
+                StepInTarget.update_dict_ids_from_dap(o)
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        content = self.content
-        mimeType = self.mimeType
+        targets = self.targets
+        if targets and hasattr(targets[0], "to_dict"):
+            targets = [x.to_dict() for x in targets]
         dct = {
-            'content': content,
+            'targets': [StepInTarget.update_dict_ids_to_dap(o) for o in targets] if (update_ids_to_dap and targets) else targets,
         }
-        if mimeType is not None:
-            dct['mimeType'] = mimeType
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class ThreadsResponseBody(BaseSchema):
+class GotoTargetsResponseBody(BaseSchema):
     """
-    "body" of ThreadsResponse
+    "body" of GotoTargetsResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "threads": {
+        "targets": {
             "type": "array",
             "items": {
-                "$ref": "#/definitions/Thread"
+                "$ref": "#/definitions/GotoTarget"
             },
-            "description": "All threads."
+            "description": "The possible goto targets of the specified location."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, threads, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, targets, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array threads: All threads.
+        :param array targets: The possible goto targets of the specified location.
         """
-        self.threads = threads
-        if update_ids_from_dap and self.threads:
-            for o in self.threads:
-                Thread.update_dict_ids_from_dap(o)
+        self.targets = targets
+        if update_ids_from_dap and self.targets:
+            for o in self.targets:
+                GotoTarget.update_dict_ids_from_dap(o)
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        threads = self.threads
-        if threads and hasattr(threads[0], "to_dict"):
-            threads = [x.to_dict() for x in threads]
+        targets = self.targets
+        if targets and hasattr(targets[0], "to_dict"):
+            targets = [x.to_dict() for x in targets]
         dct = {
-            'threads': [Thread.update_dict_ids_to_dap(o) for o in threads] if (update_ids_to_dap and threads) else threads,
+            'targets': [GotoTarget.update_dict_ids_to_dap(o) for o in targets] if (update_ids_to_dap and targets) else targets,
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class ModulesResponseBody(BaseSchema):
+class CompletionsResponseBody(BaseSchema):
     """
-    "body" of ModulesResponse
+    "body" of CompletionsResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "modules": {
+        "targets": {
             "type": "array",
             "items": {
-                "$ref": "#/definitions/Module"
+                "$ref": "#/definitions/CompletionItem"
             },
-            "description": "All modules or range of modules."
+            "description": "The possible completions for ."
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, targets, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array targets: The possible completions for .
+        """
+        self.targets = targets
+        if update_ids_from_dap and self.targets:
+            for o in self.targets:
+                CompletionItem.update_dict_ids_from_dap(o)
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        targets = self.targets
+        if targets and hasattr(targets[0], "to_dict"):
+            targets = [x.to_dict() for x in targets]
+        dct = {
+            'targets': [CompletionItem.update_dict_ids_to_dap(o) for o in targets] if (update_ids_to_dap and targets) else targets,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class ExceptionInfoResponseBody(BaseSchema):
+    """
+    "body" of ExceptionInfoResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "exceptionId": {
+            "type": "string",
+            "description": "ID of the exception that was thrown."
         },
-        "totalModules": {
+        "description": {
+            "type": "string",
+            "description": "Descriptive text for the exception provided by the debug adapter."
+        },
+        "breakMode": {
+            "description": "Mode that caused the exception notification to be raised.",
+            "type": "ExceptionBreakMode"
+        },
+        "details": {
+            "description": "Detailed information about the exception.",
+            "type": "ExceptionDetails"
+        }
+    }
+    __refs__ = set(['breakMode', 'details'])
+
+    __slots__ = list(__props__.keys()) + ['kwargs']
+
+    def __init__(self, exceptionId, breakMode, description=None, details=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string exceptionId: ID of the exception that was thrown.
+        :param ExceptionBreakMode breakMode: Mode that caused the exception notification to be raised.
+        :param string description: Descriptive text for the exception provided by the debug adapter.
+        :param ExceptionDetails details: Detailed information about the exception.
+        """
+        self.exceptionId = exceptionId
+        assert breakMode in ExceptionBreakMode.VALID_VALUES
+        self.breakMode = breakMode
+        self.description = description
+        if details is None:
+            self.details = ExceptionDetails()
+        else:
+            self.details = ExceptionDetails(update_ids_from_dap=update_ids_from_dap, **details) if details.__class__ !=  ExceptionDetails else details
+        self.kwargs = kwargs
+
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        exceptionId = self.exceptionId
+        breakMode = self.breakMode
+        description = self.description
+        details = self.details
+        dct = {
+            'exceptionId': exceptionId,
+            'breakMode': breakMode,
+        }
+        if description is not None:
+            dct['description'] = description
+        if details is not None:
+            dct['details'] = details.to_dict(update_ids_to_dap=update_ids_to_dap)
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class ReadMemoryResponseBody(BaseSchema):
+    """
+    "body" of ReadMemoryResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "address": {
+            "type": "string",
+            "description": "The address of the first byte of data returned. Treated as a hex value if prefixed with '0x', or as a decimal value otherwise."
+        },
+        "unreadableBytes": {
             "type": "integer",
-            "description": "The total number of modules available."
+            "description": "The number of unreadable bytes encountered after the last successfully read byte. This can be used to determine the number of bytes that must be skipped before a subsequent 'readMemory' request will succeed."
+        },
+        "data": {
+            "type": "string",
+            "description": "The bytes read from memory, encoded using base64."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, modules, totalModules=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, address, unreadableBytes=None, data=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array modules: All modules or range of modules.
-        :param integer totalModules: The total number of modules available.
+        :param string address: The address of the first byte of data returned. Treated as a hex value if prefixed with '0x', or as a decimal value otherwise.
+        :param integer unreadableBytes: The number of unreadable bytes encountered after the last successfully read byte. This can be used to determine the number of bytes that must be skipped before a subsequent 'readMemory' request will succeed.
+        :param string data: The bytes read from memory, encoded using base64.
         """
-        self.modules = modules
-        if update_ids_from_dap and self.modules:
-            for o in self.modules:
-                Module.update_dict_ids_from_dap(o)
-        self.totalModules = totalModules
+        self.address = address
+        self.unreadableBytes = unreadableBytes
+        self.data = data
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        modules = self.modules
-        if modules and hasattr(modules[0], "to_dict"):
-            modules = [x.to_dict() for x in modules]
-        totalModules = self.totalModules
+        address = self.address
+        unreadableBytes = self.unreadableBytes
+        data = self.data
         dct = {
-            'modules': [Module.update_dict_ids_to_dap(o) for o in modules] if (update_ids_to_dap and modules) else modules,
+            'address': address,
         }
-        if totalModules is not None:
-            dct['totalModules'] = totalModules
+        if unreadableBytes is not None:
+            dct['unreadableBytes'] = unreadableBytes
+        if data is not None:
+            dct['data'] = data
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class LoadedSourcesResponseBody(BaseSchema):
+class DisassembleResponseBody(BaseSchema):
     """
-    "body" of LoadedSourcesResponse
+    "body" of DisassembleResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "sources": {
+        "instructions": {
             "type": "array",
             "items": {
-                "$ref": "#/definitions/Source"
+                "$ref": "#/definitions/DisassembledInstruction"
             },
-            "description": "Set of loaded sources."
+            "description": "The list of disassembled instructions."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, sources, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, instructions, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array sources: Set of loaded sources.
+        :param array instructions: The list of disassembled instructions.
         """
-        self.sources = sources
-        if update_ids_from_dap and self.sources:
-            for o in self.sources:
-                Source.update_dict_ids_from_dap(o)
+        self.instructions = instructions
+        if update_ids_from_dap and self.instructions:
+            for o in self.instructions:
+                DisassembledInstruction.update_dict_ids_from_dap(o)
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        sources = self.sources
-        if sources and hasattr(sources[0], "to_dict"):
-            sources = [x.to_dict() for x in sources]
+        instructions = self.instructions
+        if instructions and hasattr(instructions[0], "to_dict"):
+            instructions = [x.to_dict() for x in instructions]
         dct = {
-            'sources': [Source.update_dict_ids_to_dap(o) for o in sources] if (update_ids_to_dap and sources) else sources,
+            'instructions': [DisassembledInstruction.update_dict_ids_to_dap(o) for o in instructions] if (update_ids_to_dap and instructions) else instructions,
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class EvaluateResponseBody(BaseSchema):
+class MessageVariables(BaseSchema):
     """
-    "body" of EvaluateResponse
+    "variables" of Message
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {
-        "result": {
-            "type": "string",
-            "description": "The result of the evaluate request."
-        },
-        "type": {
-            "type": "string",
-            "description": "The optional type of the evaluate result."
-        },
-        "presentationHint": {
-            "description": "Properties of a evaluate result that can be used to determine how to render the result in the UI.",
-            "type": "VariablePresentationHint"
-        },
-        "variablesReference": {
-            "type": "integer",
-            "description": "If variablesReference is > 0, the evaluate result is structured and its children can be retrieved by passing variablesReference to the VariablesRequest. The value should be less than or equal to 2147483647 (2^31 - 1)."
-        },
-        "namedVariables": {
-            "type": "integer",
-            "description": "The number of named child variables.\nThe client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1)."
-        },
-        "indexedVariables": {
-            "type": "integer",
-            "description": "The number of indexed child variables.\nThe client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1)."
-        },
-        "memoryReference": {
-            "type": "string",
-            "description": "Memory reference to a location appropriate for this result. For pointer type eval results, this is generally a reference to the memory address contained in the pointer."
-        }
-    }
-    __refs__ = set(['presentationHint'])
+    __props__ = {}
+    __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, result, variablesReference, type=None, presentationHint=None, namedVariables=None, indexedVariables=None, memoryReference=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
-        """
-        :param string result: The result of the evaluate request.
-        :param integer variablesReference: If variablesReference is > 0, the evaluate result is structured and its children can be retrieved by passing variablesReference to the VariablesRequest. The value should be less than or equal to 2147483647 (2^31 - 1).
-        :param string type: The optional type of the evaluate result.
-        :param VariablePresentationHint presentationHint: Properties of a evaluate result that can be used to determine how to render the result in the UI.
-        :param integer namedVariables: The number of named child variables.
-        The client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1).
-        :param integer indexedVariables: The number of indexed child variables.
-        The client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1).
-        :param string memoryReference: Memory reference to a location appropriate for this result. For pointer type eval results, this is generally a reference to the memory address contained in the pointer.
+    def __init__(self, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        self.result = result
-        self.variablesReference = variablesReference
-        self.type = type
-        if presentationHint is None:
-            self.presentationHint = VariablePresentationHint()
-        else:
-            self.presentationHint = VariablePresentationHint(update_ids_from_dap=update_ids_from_dap, **presentationHint) if presentationHint.__class__ !=  VariablePresentationHint else presentationHint
-        self.namedVariables = namedVariables
-        self.indexedVariables = indexedVariables
-        self.memoryReference = memoryReference
-        if update_ids_from_dap:
-            self.variablesReference = self._translate_id_from_dap(self.variablesReference)
-        self.kwargs = kwargs
     
+        """
     
-    @classmethod
-    def update_dict_ids_from_dap(cls, dct):
-        if 'variablesReference' in dct:
-            dct['variablesReference'] = cls._translate_id_from_dap(dct['variablesReference'])
-        return dct
+        self.kwargs = kwargs
+
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        result = self.result
-        variablesReference = self.variablesReference
-        type = self.type  # noqa (assign to builtin)
-        presentationHint = self.presentationHint
-        namedVariables = self.namedVariables
-        indexedVariables = self.indexedVariables
-        memoryReference = self.memoryReference
-        if update_ids_to_dap:
-            if variablesReference is not None:
-                variablesReference = self._translate_id_to_dap(variablesReference)
         dct = {
-            'result': result,
-            'variablesReference': variablesReference,
         }
-        if type is not None:
-            dct['type'] = type
-        if presentationHint is not None:
-            dct['presentationHint'] = presentationHint.to_dict(update_ids_to_dap=update_ids_to_dap)
-        if namedVariables is not None:
-            dct['namedVariables'] = namedVariables
-        if indexedVariables is not None:
-            dct['indexedVariables'] = indexedVariables
-        if memoryReference is not None:
-            dct['memoryReference'] = memoryReference
         dct.update(self.kwargs)
-        return dct    
-    
-    @classmethod
-    def update_dict_ids_to_dap(cls, dct):
-        if 'variablesReference' in dct:
-            dct['variablesReference'] = cls._translate_id_to_dap(dct['variablesReference'])
         return dct
 
 
 @register
-class SetExpressionResponseBody(BaseSchema):
+class PydevdVariablesUpdatedEventBody(BaseSchema):
     """
-    "body" of SetExpressionResponse
+    "body" of PydevdVariablesUpdatedEvent
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "value": {
-            "type": "string",
-            "description": "The new value of the expression."
-        },
-        "type": {
-            "type": "string",
-            "description": "The optional type of the value."
-        },
-        "presentationHint": {
-            "description": "Properties of a value that can be used to determine how to render the result in the UI.",
-            "type": "VariablePresentationHint"
-        },
         "variablesReference": {
             "type": "integer",
-            "description": "If variablesReference is > 0, the value is structured and its children can be retrieved by passing variablesReference to the VariablesRequest. The value should be less than or equal to 2147483647 (2^31 - 1)."
-        },
-        "namedVariables": {
-            "type": "integer",
-            "description": "The number of named child variables.\nThe client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1)."
+            "description": "The variablesReference used in the 'variables' request."
         },
-        "indexedVariables": {
-            "type": "integer",
-            "description": "The number of indexed child variables.\nThe client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1)."
+        "variables": {
+            "type": "array",
+            "items": {
+                "$ref": "#/definitions/Variable"
+            },
+            "description": "The variables with the computed values."
         }
     }
-    __refs__ = set(['presentationHint'])
+    __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, value, type=None, presentationHint=None, variablesReference=None, namedVariables=None, indexedVariables=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, variablesReference, variables, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string value: The new value of the expression.
-        :param string type: The optional type of the value.
-        :param VariablePresentationHint presentationHint: Properties of a value that can be used to determine how to render the result in the UI.
-        :param integer variablesReference: If variablesReference is > 0, the value is structured and its children can be retrieved by passing variablesReference to the VariablesRequest. The value should be less than or equal to 2147483647 (2^31 - 1).
-        :param integer namedVariables: The number of named child variables.
-        The client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1).
-        :param integer indexedVariables: The number of indexed child variables.
-        The client can use this optional information to present the variables in a paged UI and fetch them in chunks. The value should be less than or equal to 2147483647 (2^31 - 1).
+        :param integer variablesReference: The variablesReference used in the 'variables' request.
+        :param array variables: The variables with the computed values.
         """
-        self.value = value
-        self.type = type
-        if presentationHint is None:
-            self.presentationHint = VariablePresentationHint()
-        else:
-            self.presentationHint = VariablePresentationHint(update_ids_from_dap=update_ids_from_dap, **presentationHint) if presentationHint.__class__ !=  VariablePresentationHint else presentationHint
         self.variablesReference = variablesReference
-        self.namedVariables = namedVariables
-        self.indexedVariables = indexedVariables
+        self.variables = variables
+        if update_ids_from_dap and self.variables:
+            for o in self.variables:
+                Variable.update_dict_ids_from_dap(o)
         if update_ids_from_dap:
             self.variablesReference = self._translate_id_from_dap(self.variablesReference)
         self.kwargs = kwargs
@@ -15871,28 +18178,17 @@ class SetExpressionResponseBody(BaseSchema):
         return dct
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        value = self.value
-        type = self.type  # noqa (assign to builtin)
-        presentationHint = self.presentationHint
         variablesReference = self.variablesReference
-        namedVariables = self.namedVariables
-        indexedVariables = self.indexedVariables
+        variables = self.variables
+        if variables and hasattr(variables[0], "to_dict"):
+            variables = [x.to_dict() for x in variables]
         if update_ids_to_dap:
             if variablesReference is not None:
                 variablesReference = self._translate_id_to_dap(variablesReference)
         dct = {
-            'value': value,
+            'variablesReference': variablesReference,
+            'variables': [Variable.update_dict_ids_to_dap(o) for o in variables] if (update_ids_to_dap and variables) else variables,
         }
-        if type is not None:
-            dct['type'] = type
-        if presentationHint is not None:
-            dct['presentationHint'] = presentationHint.to_dict(update_ids_to_dap=update_ids_to_dap)
-        if variablesReference is not None:
-            dct['variablesReference'] = variablesReference
-        if namedVariables is not None:
-            dct['namedVariables'] = namedVariables
-        if indexedVariables is not None:
-            dct['indexedVariables'] = indexedVariables
         dct.update(self.kwargs)
         return dct    
     
@@ -15904,299 +18200,391 @@ class SetExpressionResponseBody(BaseSchema):
 
 
 @register
-class StepInTargetsResponseBody(BaseSchema):
+class PydevdSystemInfoResponseBody(BaseSchema):
     """
-    "body" of StepInTargetsResponse
+    "body" of PydevdSystemInfoResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "targets": {
-            "type": "array",
-            "items": {
-                "$ref": "#/definitions/StepInTarget"
-            },
-            "description": "The possible stepIn targets of the specified source location."
+        "python": {
+            "description": "Information about the python version running in the current process.",
+            "type": "PydevdPythonInfo"
+        },
+        "platform": {
+            "description": "Information about the plarforn on which the current process is running.",
+            "type": "PydevdPlatformInfo"
+        },
+        "process": {
+            "description": "Information about the current process.",
+            "type": "PydevdProcessInfo"
+        },
+        "pydevd": {
+            "description": "Information about pydevd.",
+            "type": "PydevdInfo"
+        },
+        "compactEncoding": {
+            "type": "boolean",
+            "description": "If true, the debugger accepted the compact encoding (so, the client may use it for the messages it sends after this response)."
+        },
+        "inheritedConfig": {
+            "type": "boolean",
+            "description": "If true, the debugger applied the configuration inherited from the parent process (so, it may be started with the 'pydevdRunWithInheritedConfig' request)."
         }
     }
-    __refs__ = set()
+    __refs__ = set(['python', 'platform', 'process', 'pydevd'])
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, targets, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, python, platform, process, pydevd, compactEncoding=None, inheritedConfig=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array targets: The possible stepIn targets of the specified source location.
+        :param PydevdPythonInfo python: Information about the python version running in the current process.
+        :param PydevdPlatformInfo platform: Information about the plarforn on which the current process is running.
+        :param PydevdProcessInfo process: Information about the current process.
+        :param PydevdInfo pydevd: Information about pydevd.
+        :param boolean compactEncoding: If true, the debugger accepted the compact encoding (so, the client may use it for the messages it sends after this response).
+        :param boolean inheritedConfig: If true, the debugger applied the configuration inherited from the parent process (so, it may be started with the 'pydevdRunWithInheritedConfig' request).
         """
-        self.targets = targets
-        if update_ids_from_dap and self.targets:
-            for o in self.targets:
-                StepInTarget.update_dict_ids_from_dap(o)
+        if python is None:
+            self.python = PydevdPythonInfo()
+        else:
+            self.python = PydevdPythonInfo(update_ids_from_dap=update_ids_from_dap, **python) if python.__class__ !=  PydevdPythonInfo else python
+        if platform is None:
+            self.platform = PydevdPlatformInfo()
+        else:
+            self.platform = PydevdPlatformInfo(update_ids_from_dap=update_ids_from_dap, **platform) if platform.__class__ !=  PydevdPlatformInfo else platform
+        if process is None:
+            self.process = PydevdProcessInfo()
+        else:
+            self.process = PydevdProcessInfo(update_ids_from_dap=update_ids_from_dap, **process) if process.__class__ !=  PydevdProcessInfo else process
+        if pydevd is None:
+            self.pydevd = PydevdInfo()
+        else:
+            self.pydevd = PydevdInfo(update_ids_from_dap=update_ids_from_dap, **pydevd) if pydevd.__class__ !=  PydevdInfo else pydevd
+        self.compactEncoding = compactEncoding
+        self.inheritedConfig = inheritedConfig
         self.kwargs = kwargs
 
 
-    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        targets = self.targets
-        if targets and hasattr(targets[0], "to_dict"):
-            targets = [x.to_dict() for x in targets]
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        python = self.python
+        platform = self.platform
+        process = self.process
+        pydevd = self.pydevd
+        compactEncoding = self.compactEncoding
+        inheritedConfig = self.inheritedConfig
         dct = {
-            'targets': [StepInTarget.update_dict_ids_to_dap(o) for o in targets] if (update_ids_to_dap and targets) else targets,
+            'python': python.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'platform': platform.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'process': process.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'pydevd': pydevd.to_dict(update_ids_to_dap=update_ids_to_dap),
         }
+        if compactEncoding is not None:
+            dct['compactEncoding'] = compactEncoding
+        if inheritedConfig is not None:
+            dct['inheritedConfig'] = inheritedConfig
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class GotoTargetsResponseBody(BaseSchema):
+class PydevdAuthorizeResponseBody(BaseSchema):
     """
-    "body" of GotoTargetsResponse
+    "body" of PydevdAuthorizeResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "targets": {
-            "type": "array",
-            "items": {
-                "$ref": "#/definitions/GotoTarget"
-            },
-            "description": "The possible goto targets of the specified location."
+        "clientAccessToken": {
+            "type": "string",
+            "description": "The access token to access the client (i.e.: usually the IDE)."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, targets, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, clientAccessToken, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array targets: The possible goto targets of the specified location.
+        :param string clientAccessToken: The access token to access the client (i.e.: usually the IDE).
         """
-        self.targets = targets
-        if update_ids_from_dap and self.targets:
-            for o in self.targets:
-                GotoTarget.update_dict_ids_from_dap(o)
+        self.clientAccessToken = clientAccessToken
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        targets = self.targets
-        if targets and hasattr(targets[0], "to_dict"):
-            targets = [x.to_dict() for x in targets]
+        clientAccessToken = self.clientAccessToken
         dct = {
-            'targets': [GotoTarget.update_dict_ids_to_dap(o) for o in targets] if (update_ids_to_dap and targets) else targets,
+            'clientAccessToken': clientAccessToken,
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class CompletionsResponseBody(BaseSchema):
+class PydevdRunWithInheritedConfigResponseBody(BaseSchema):
     """
-    "body" of CompletionsResponse
+    "body" of PydevdRunWithInheritedConfigResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "targets": {
-            "type": "array",
-            "items": {
-                "$ref": "#/definitions/CompletionItem"
-            },
-            "description": "The possible completions for ."
+        "running": {
+            "type": "boolean",
+            "description": "Whether the process started running (false if it has no inherited configuration, in which case it still waits for the 'configurationDone' request)."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, targets, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, running, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array targets: The possible completions for .
+        :param boolean running: Whether the process started running (false if it has no inherited configuration, in which case it still waits for the 'configurationDone' request).
         """
-        self.targets = targets
-        if update_ids_from_dap and self.targets:
-            for o in self.targets:
-                CompletionItem.update_dict_ids_from_dap(o)
+        self.running = running
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        targets = self.targets
-        if targets and hasattr(targets[0], "to_dict"):
-            targets = [x.to_dict() for x in targets]
+        running = self.running
         dct = {
-            'targets': [CompletionItem.update_dict_ids_to_dap(o) for o in targets] if (update_ids_to_dap and targets) else targets,
+            'running': running,
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class ExceptionInfoResponseBody(BaseSchema):
+class PydevdArraySliceResponseBody(BaseSchema):
     """
-    "body" of ExceptionInfoResponse
+    "body" of PydevdArraySliceResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "exceptionId": {
-            "type": "string",
-            "description": "ID of the exception that was thrown."
+        "shape": {
+            "type": "array",
+            "items": {
+                "type": "integer"
+            },
+            "description": "The shape of the whole array or DataFrame."
         },
-        "description": {
-            "type": "string",
-            "description": "Descriptive text for the exception provided by the debug adapter."
+        "rowOffset": {
+            "type": "integer",
+            "description": "The first row of the window."
         },
-        "breakMode": {
-            "description": "Mode that caused the exception notification to be raised.",
-            "type": "ExceptionBreakMode"
+        "colOffset": {
+            "type": "integer",
+            "description": "The first column of the window."
         },
-        "details": {
-            "description": "Detailed information about the exception.",
-            "type": "ExceptionDetails"
+        "rows": {
+            "type": "integer",
+            "description": "The number of rows in the window."
+        },
+        "cols": {
+            "type": "integer",
+            "description": "The number of columns in the window."
+        },
+        "rowLabels": {
+            "type": "array",
+            "items": {
+                "type": "string"
+            },
+            "description": "The labels of the rows in the window."
+        },
+        "columns": {
+            "type": "array",
+            "items": {
+                "$ref": "#/definitions/PydevdArraySliceColumn"
+            },
+            "description": "The columns in the window."
         }
     }
-    __refs__ = set(['breakMode', 'details'])
+    __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, exceptionId, breakMode, description=None, details=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
-        """
-        :param string exceptionId: ID of the exception that was thrown.
-        :param ExceptionBreakMode breakMode: Mode that caused the exception notification to be raised.
-        :param string description: Descriptive text for the exception provided by the debug adapter.
-        :param ExceptionDetails details: Detailed information about the exception.
-        """
-        self.exceptionId = exceptionId
-        assert breakMode in ExceptionBreakMode.VALID_VALUES
-        self.breakMode = breakMode
-        self.description = description
-        if details is None:
-            self.details = ExceptionDetails()
-        else:
-            self.details = ExceptionDetails(update_ids_from_dap=update_ids_from_dap, **details) if details.__class__ !=  ExceptionDetails else details
+    def __init__(self, shape, rowOffset, colOffset, rows, cols, rowLabels, columns, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array shape: The shape of the whole array or DataFrame.
+        :param integer rowOffset: The first row of the window.
+        :param integer colOffset: The first column of the window.
+        :param integer rows: The number of rows in the window.
+        :param integer cols: The number of columns in the window.
+        :param array rowLabels: The labels of the rows in the window.
+        :param array columns: The columns in the window.
+        """
+        self.shape = shape
+        self.rowOffset = rowOffset
+        self.colOffset = colOffset
+        self.rows = rows
+        self.cols = cols
+        self.rowLabels = rowLabels
+        self.columns = columns
+        if update_ids_from_dap and self.columns:
+            for o in self.columns:
+                PydevdArraySliceColumn.update_dict_ids_from_dap(o)
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        exceptionId = self.exceptionId
-        breakMode = self.breakMode
-        description = self.description
-        details = self.details
+        shape = self.shape
+        if shape and hasattr(shape[0], "to_dict"):
+            shape = [x.to_dict() for x in shape]
+        rowOffset = self.rowOffset
+        colOffset = self.colOffset
+        rows = self.rows
+        cols = self.cols
+        rowLabels = self.rowLabels
+        if rowLabels and hasattr(rowLabels[0], "to_dict"):
+            rowLabels = [x.to_dict() for x in rowLabels]
+        columns = self.columns
+        if columns and hasattr(columns[0], "to_dict"):
+            columns = [x.to_dict() for x in columns]
         dct = {
-            'exceptionId': exceptionId,
-            'breakMode': breakMode,
+            'shape': shape,
+            'rowOffset': rowOffset,
+            'colOffset': colOffset,
+            'rows': rows,
+            'cols': cols,
+            'rowLabels': rowLabels,
+            'columns': [PydevdArraySliceColumn.update_dict_ids_to_dap(o) for o in columns] if (update_ids_to_dap and columns) else columns,
         }
-        if description is not None:
-            dct['description'] = description
-        if details is not None:
-            dct['details'] = details.to_dict(update_ids_to_dap=update_ids_to_dap)
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class ReadMemoryResponseBody(BaseSchema):
+class PydevdReferrersResponseBody(BaseSchema):
     """
-    "body" of ReadMemoryResponse
+    "body" of PydevdReferrersResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "address": {
-            "type": "string",
-            "description": "The address of the first byte of data returned. Treated as a hex value if prefixed with '0x', or as a decimal value otherwise."
-        },
-        "unreadableBytes": {
-            "type": "integer",
-            "description": "The number of unreadable bytes encountered after the last successfully read byte. This can be used to determine the number of bytes that must be skipped before a subsequent 'readMemory' request will succeed."
+        "referrers": {
+            "type": "array",
+            "items": {
+                "$ref": "#/definitions/PydevdReferrer"
+            },
+            "description": "The referrers found."
         },
-        "data": {
-            "type": "string",
-            "description": "The bytes read from memory, encoded using base64."
+        "truncated": {
+            "type": "boolean",
+            "description": "Whether the referrers were truncated (because of the maxResults or because the time budget was exceeded)."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, address, unreadableBytes=None, data=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, referrers, truncated, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string address: The address of the first byte of data returned. Treated as a hex value if prefixed with '0x', or as a decimal value otherwise.
-        :param integer unreadableBytes: The number of unreadable bytes encountered after the last successfully read byte. This can be used to determine the number of bytes that must be skipped before a subsequent 'readMemory' request will succeed.
-        :param string data: The bytes read from memory, encoded using base64.
+        :param array referrers: The referrers found.
+        :param boolean truncated: Whether the referrers were truncated (because of the maxResults or because the time budget was exceeded).
         """
-        self.address = address
-        self.unreadableBytes = unreadableBytes
-        self.data = data
+        self.referrers = referrers
+        if update_ids_from_dap and self.referrers:
+            for o in self.referrers:
+                PydevdReferrer.update_dict_ids_from_dap(o)
+        self.truncated = truncated
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        address = self.address
-        unreadableBytes = self.unreadableBytes
-        data = self.data
+        referrers = self.referrers
+        if referrers and hasattr(referrers[0], "to_dict"):
+            referrers = [x.to_dict() for x in referrers]
+        truncated = self.truncated
         dct = {
-            'address': address,
+            'referrers': [PydevdReferrer.update_dict_ids_to_dap(o) for o in referrers] if (update_ids_to_dap and referrers) else referrers,
+            'truncated': truncated,
         }
-        if unreadableBytes is not None:
-            dct['unreadableBytes'] = unreadableBytes
-        if data is not None:
-            dct['data'] = data
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class DisassembleResponseBody(BaseSchema):
+class PydevdStatsResponseBody(BaseSchema):
     """
-    "body" of DisassembleResponse
+    "body" of PydevdStatsResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "instructions": {
-            "type": "array",
-            "items": {
-                "$ref": "#/definitions/DisassembledInstruction"
-            },
-            "description": "The list of disassembled instructions."
+        "traceDispatch": {
+            "description": "Counters of the tracing of the threads which are currently alive.",
+            "type": "PydevdTraceDispatchStats"
+        },
+        "caches": {
+            "type": "object",
+            "description": "Maps the name of each cache to an object with its 'size', number of 'misses' and estimated 'memory' (in bytes; -1 if not available). Caches which are bounded also have a 'maxSize' (number of entries)."
+        },
+        "queues": {
+            "type": "object",
+            "description": "The number of commands in the 'writer' queue and in each 'internalCommands' queue (which maps thread ids to the size of their queue)."
+        },
+        "suspends": {
+            "description": "Information on the time the threads were suspended.",
+            "type": "PydevdSuspendStats"
         }
     }
-    __refs__ = set()
+    __refs__ = set(['traceDispatch', 'caches', 'queues', 'suspends'])
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, instructions, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, traceDispatch, caches, queues, suspends, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array instructions: The list of disassembled instructions.
+        :param PydevdTraceDispatchStats traceDispatch: Counters of the tracing of the threads which are currently alive.
+        :param PydevdStatsResponseBodyCaches caches: Maps the name of each cache to an object with its 'size', number of 'misses' and estimated 'memory' (in bytes; -1 if not available). Caches which are bounded also have a 'maxSize' (number of entries).
+        :param PydevdStatsResponseBodyQueues queues: The number of commands in the 'writer' queue and in each 'internalCommands' queue (which maps thread ids to the size of their queue).
+        :param PydevdSuspendStats suspends: Information on the time the threads were suspended.
         """
-        self.instructions = instructions
-        if update_ids_from_dap and self.instructions:
-            for o in self.instructions:
-                DisassembledInstruction.update_dict_ids_from_dap(o)
+        if traceDispatch is None:
+            self.traceDispatch = PydevdTraceDispatchStats()
+        else:
+            self.traceDispatch = PydevdTraceDispatchStats(update_ids_from_dap=update_ids_from_dap, **traceDispatch) if traceDispatch.__class__ !=  PydevdTraceDispatchStats else traceDispatch
+        if caches is None:
+            self.caches = PydevdStatsResponseBodyCaches()
+        else:
+            self.caches = PydevdStatsResponseBodyCaches(update_ids_from_dap=update_ids_from_dap, **caches) if caches.__class__ !=  PydevdStatsResponseBodyCaches else caches
+        if queues is None:
+            self.queues = PydevdStatsResponseBodyQueues()
+        else:
+            self.queues = PydevdStatsResponseBodyQueues(update_ids_from_dap=update_ids_from_dap, **queues) if queues.__class__ !=  PydevdStatsResponseBodyQueues else queues
+        if suspends is None:
+            self.suspends = PydevdSuspendStats()
+        else:
+            self.suspends = PydevdSuspendStats(update_ids_from_dap=update_ids_from_dap, **suspends) if suspends.__class__ !=  PydevdSuspendStats else suspends
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        instructions = self.instructions
-        if instructions and hasattr(instructions[0], "to_dict"):
-            instructions = [x.to_dict() for x in instructions]
+        traceDispatch = self.traceDispatch
+        caches = self.caches
+        queues = self.queues
+        suspends = self.suspends
         dct = {
-            'instructions': [DisassembledInstruction.update_dict_ids_to_dap(o) for o in instructions] if (update_ids_to_dap and instructions) else instructions,
+            'traceDispatch': traceDispatch.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'caches': caches.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'queues': queues.to_dict(update_ids_to_dap=update_ids_to_dap),
+            'suspends': suspends.to_dict(update_ids_to_dap=update_ids_to_dap),
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class MessageVariables(BaseSchema):
+class PydevdStatsResponseBodyCaches(BaseSchema):
     """
-    "variables" of Message
+    "caches" of PydevdStatsResponseBody
 
     Note: automatically generated code. Do not edit manually.
     """
@@ -16222,106 +18610,95 @@ class MessageVariables(BaseSchema):
 
 
 @register
-class PydevdSystemInfoResponseBody(BaseSchema):
+class PydevdStatsResponseBodyQueues(BaseSchema):
     """
-    "body" of PydevdSystemInfoResponse
+    "queues" of PydevdStatsResponseBody
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {
-        "python": {
-            "description": "Information about the python version running in the current process.",
-            "type": "PydevdPythonInfo"
-        },
-        "platform": {
-            "description": "Information about the plarforn on which the current process is running.",
-            "type": "PydevdPlatformInfo"
-        },
-        "process": {
-            "description": "Information about the current process.",
-            "type": "PydevdProcessInfo"
-        },
-        "pydevd": {
-            "description": "Information about pydevd.",
-            "type": "PydevdInfo"
-        }
-    }
-    __refs__ = set(['python', 'platform', 'process', 'pydevd'])
+    __props__ = {}
+    __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, python, platform, process, pydevd, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param PydevdPythonInfo python: Information about the python version running in the current process.
-        :param PydevdPlatformInfo platform: Information about the plarforn on which the current process is running.
-        :param PydevdProcessInfo process: Information about the current process.
-        :param PydevdInfo pydevd: Information about pydevd.
+    
         """
-        if python is None:
-            self.python = PydevdPythonInfo()
-        else:
-            self.python = PydevdPythonInfo(update_ids_from_dap=update_ids_from_dap, **python) if python.__class__ !=  PydevdPythonInfo else python
-        if platform is None:
-            self.platform = PydevdPlatformInfo()
-        else:
-            self.platform = PydevdPlatformInfo(update_ids_from_dap=update_ids_from_dap, **platform) if platform.__class__ !=  PydevdPlatformInfo else platform
-        if process is None:
-            self.process = PydevdProcessInfo()
-        else:
-            self.process = PydevdProcessInfo(update_ids_from_dap=update_ids_from_dap, **process) if process.__class__ !=  PydevdProcessInfo else process
-        if pydevd is None:
-            self.pydevd = PydevdInfo()
-        else:
-            self.pydevd = PydevdInfo(update_ids_from_dap=update_ids_from_dap, **pydevd) if pydevd.__class__ !=  PydevdInfo else pydevd
+    
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        python = self.python
-        platform = self.platform
-        process = self.process
-        pydevd = self.pydevd
         dct = {
-            'python': python.to_dict(update_ids_to_dap=update_ids_to_dap),
-            'platform': platform.to_dict(update_ids_to_dap=update_ids_to_dap),
-            'process': process.to_dict(update_ids_to_dap=update_ids_to_dap),
-            'pydevd': pydevd.to_dict(update_ids_to_dap=update_ids_to_dap),
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class PydevdAuthorizeResponseBody(BaseSchema):
+class PydevdProfilerSamplesEventBody(BaseSchema):
     """
-    "body" of PydevdAuthorizeResponse
+    "body" of PydevdProfilerSamplesEvent
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "clientAccessToken": {
-            "type": "string",
-            "description": "The access token to access the client (i.e.: usually the IDE)."
+        "samples": {
+            "type": "array",
+            "items": {
+                "$ref": "#/definitions/PydevdProfilerSample"
+            },
+            "description": "The collapsed stacks sampled and the number of times each one was seen."
+        },
+        "sampleCount": {
+            "type": "integer",
+            "description": "The number of times the stacks of all the threads were sampled."
+        },
+        "interval": {
+            "type": "number",
+            "description": "The time (in seconds) between each sample."
+        },
+        "final": {
+            "type": "boolean",
+            "description": "True if this is the last event (the profiler was stopped)."
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ['kwargs']
 
-    def __init__(self, clientAccessToken, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, samples, sampleCount, interval, final, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string clientAccessToken: The access token to access the client (i.e.: usually the IDE).
+        :param array samples: The collapsed stacks sampled and the number of times each one was seen.
+        :param integer sampleCount: The number of times the stacks of all the threads were sampled.
+        :param number interval: The time (in seconds) between each sample.
+        :param boolean final: True if this is the last event (the profiler was stopped).
         """
-        self.clientAccessToken = clientAccessToken
+        self.samples = samples
+        if update_ids_from_dap and self.samples:
+            for o in self.samples:
+                PydevdProfilerSample.update_dict_ids_from_dap(o)
+        self.sampleCount = sampleCount
+        self.interval = interval
+        self.final = final
         self.kwargs = kwargs
 
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        clientAccessToken = self.clientAccessToken
+        samples = self.samples
+        if samples and hasattr(samples[0], "to_dict"):
+            samples = [x.to_dict() for x in samples]
+        sampleCount = self.sampleCount
+        interval = self.interval
+        final = self.final
         dct = {
-            'clientAccessToken': clientAccessToken,
+            'samples': [PydevdProfilerSample.update_dict_ids_to_dap(o) for o in samples] if (update_ids_to_dap and samples) else samples,
+            'sampleCount': sampleCount,
+            'interval': interval,
+            'final': final,
         }
         dct.update(self.kwargs)
         return dct
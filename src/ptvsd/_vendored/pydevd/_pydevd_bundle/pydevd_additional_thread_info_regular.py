@@ -8,7 +8,7 @@ from _pydev_bundle import pydev_log
 from _pydevd_bundle.pydevd_frame import PyDBFrame
 # ENDIF
 
-version = 11
+version = 12
 
 if USE_CUSTOM_SYS_CURRENT_FRAMES:
 
@@ -87,6 +87,8 @@ class PyDBAdditionalThreadInfo(object):
         'top_level_thread_tracer_no_back_frames',
         'top_level_thread_tracer_unhandled',
         'thread_tracer',
+        'trace_dispatch_calls',
+        'trace_dispatch_skip_cache_hits',
     ]
     # ENDIF
 
@@ -120,6 +122,10 @@ class PyDBAdditionalThreadInfo(object):
         self.top_level_thread_tracer_unhandled = None
         self.thread_tracer = None
 
+        # Counters (see: pydevd_stats).
+        self.trace_dispatch_calls = 0
+        self.trace_dispatch_skip_cache_hits = 0
+
     def get_topmost_frame(self, thread):
         '''
         Gets the topmost frame for the given thread. Note that it may be None
@@ -3,7 +3,7 @@ import bisect
 import types
 
 from _pydev_imps._pydev_saved_modules import threading
-from _pydevd_bundle import pydevd_utils, pydevd_source_mapping
+from _pydevd_bundle import pydevd_utils, pydevd_source_mapping, pydevd_stats
 from _pydevd_bundle.pydevd_additional_thread_info import set_additional_thread_info
 from _pydevd_bundle.pydevd_comm import (InternalGetThreadStack, internal_get_completions,
     pydevd_find_thread_by_id, InternalSetNextStatementThread, internal_reload_code,
@@ -11,16 +11,19 @@ from _pydevd_bundle.pydevd_comm import (InternalGetThreadStack, internal_get_com
     internal_get_description, internal_get_frame, internal_evaluate_expression, InternalConsoleExec,
     internal_get_variable_json, internal_change_variable, internal_change_variable_json,
     internal_evaluate_expression_json, internal_set_expression_json, internal_get_exception_details_json,
-    internal_step_in_thread, internal_run_thread, run_as_pydevd_daemon_thread)
+    internal_step_in_thread, internal_run_thread, run_as_pydevd_daemon_thread, internal_get_array_slice_json,
+    internal_get_referrers_json)
 from _pydevd_bundle.pydevd_comm_constants import (CMD_THREAD_SUSPEND, file_system_encoding,
     CMD_STEP_INTO_MY_CODE, CMD_STOP_ON_START)
 from _pydevd_bundle.pydevd_constants import (get_current_thread_id, set_protocol, get_protocol,
-    HTTP_JSON_PROTOCOL, JSON_PROTOCOL, IS_PY3K, DebugInfoHolder, dict_keys, dict_items, IS_WINDOWS)
+    HTTP_JSON_PROTOCOL, JSON_PROTOCOL, IS_PY3K, DebugInfoHolder, dict_keys, dict_items, IS_WINDOWS,
+    set_compact_encoding)
 from _pydevd_bundle.pydevd_net_command_factory_json import NetCommandFactoryJson
 from _pydevd_bundle.pydevd_net_command_factory_xml import NetCommandFactory
 import pydevd_file_utils
 from _pydev_bundle import pydev_log
 from _pydevd_bundle.pydevd_breakpoints import LineBreakpoint
+from _pydevd_bundle.pydevd_sampling_profiler import SamplingProfilerThread
 from pydevd_tracing import get_exception_traceback_str
 import os
 import subprocess
@@ -65,6 +68,9 @@ class PyDevdAPI(object):
     def run(self, py_db):
         py_db.ready_to_run = True
 
+    def run_with_inherited_config(self, py_db):
+        return py_db.run_with_inherited_config()
+
     def notify_initialize(self, py_db):
         py_db.on_initialize()
 
@@ -86,6 +92,19 @@ class PyDevdAPI(object):
 
         return py_db.cmd_factory.make_protocol_set_message(seq)
 
+    def set_compact_encoding(self, py_db, compact_encoding):
+        '''
+        :param bool compact_encoding:
+            Whether the client can read messages in the compact encoding.
+
+        :return bool:
+            Whether the compact encoding will be used for the messages sent from now on (it's only
+            available with the HTTP_JSON_PROTOCOL).
+        '''
+        compact_encoding = bool(compact_encoding) and get_protocol() == HTTP_JSON_PROTOCOL
+        set_compact_encoding(compact_encoding)
+        return compact_encoding
+
     def set_ide_os_and_breakpoints_by(self, py_db, seq, ide_os, breakpoints_by):
         '''
         :param ide_os: 'WINDOWS' or 'UNIX'
@@ -186,9 +205,10 @@ class PyDevdAPI(object):
 
             internal_run_thread(t, set_additional_thread_info=set_additional_thread_info)
 
-    def request_completions(self, py_db, seq, thread_id, frame_id, act_tok, line=-1, column=-1):
+    def request_completions(self, py_db, seq, thread_id, frame_id, act_tok, line=-1, column=-1, get_complete_info=True):
         py_db.post_method_as_internal_command(
-            thread_id, internal_get_completions, seq, thread_id, frame_id, act_tok, line=line, column=column)
+            thread_id, internal_get_completions, seq, thread_id, frame_id, act_tok, line=line, column=column,
+            get_complete_info=get_complete_info)
 
     def request_stack(self, py_db, seq, thread_id, fmt=None, timeout=.5, start_frame=0, levels=0):
         # If it's already suspended, get it right away.
@@ -605,6 +625,14 @@ class PyDevdAPI(object):
         py_db.post_method_as_internal_command(
             thread_id, internal_evaluate_expression_json, request, thread_id)
 
+    def request_array_slice_json(self, py_db, request, thread_id):
+        py_db.post_method_as_internal_command(
+            thread_id, internal_get_array_slice_json, request, thread_id)
+
+    def request_referrers_json(self, py_db, request, thread_id):
+        py_db.post_method_as_internal_command(
+            thread_id, internal_get_referrers_json, request, thread_id)
+
     def request_set_expression_json(self, py_db, request, thread_id):
         py_db.post_method_as_internal_command(
             thread_id, internal_set_expression_json, request, thread_id)
@@ -807,6 +835,31 @@ class PyDevdAPI(object):
         self.reapply_breakpoints(py_db)
         return ''
 
+    def start_sampling_profiler(self, py_db, interval, flush_interval, max_depth):
+        '''
+        Starts the sampling profiler (restarting it if it's already running).
+        '''
+        self.stop_sampling_profiler(py_db)
+        py_db.sampling_profiler = SamplingProfilerThread(
+            py_db, interval=interval, flush_interval=flush_interval, max_depth=max_depth)
+        py_db.sampling_profiler.start()
+
+    def stop_sampling_profiler(self, py_db):
+        '''
+        Stops the sampling profiler (the remaining samples are sent before this function returns).
+        '''
+        sampling_profiler = py_db.sampling_profiler
+        if sampling_profiler is not None:
+            py_db.sampling_profiler = None
+            sampling_profiler.stop(timeout=5)
+
+    def get_stats(self, py_db):
+        '''
+        :return dict:
+            A snapshot of the debugger counters (see: pydevd_stats).
+        '''
+        return pydevd_stats.get_stats(py_db)
+
     def get_ppid(self):
         '''
         Provides the parent pid (even for older versions of Python on Windows).
@@ -66,20 +66,21 @@ each command has a format:
 import itertools
 import linecache
 import os
+import struct
 
 from _pydev_bundle.pydev_imports import _queue
 from _pydev_imps._pydev_saved_modules import time
 from _pydev_imps._pydev_saved_modules import threading
 from socket import AF_INET, SOCK_STREAM, SHUT_WR, SOL_SOCKET, SO_REUSEADDR, IPPROTO_TCP
 from _pydevd_bundle.pydevd_constants import (DebugInfoHolder, get_thread_id, IS_WINDOWS, IS_JYTHON,
-    IS_PY2, IS_PY36_OR_GREATER, STATE_RUN, dict_keys, ASYNC_EVAL_TIMEOUT_SEC,
-    get_global_debugger, GetGlobalDebugger, set_global_debugger)  # Keep for backward compatibility @UnusedImport
+    IS_PY2, IS_PY36_OR_GREATER, STATE_RUN, STATE_SUSPEND, dict_keys, ASYNC_EVAL_TIMEOUT_SEC, VARIABLES_TIME_BUDGET,
+    get_current_thread_id, REFERRERS_TIME_BUDGET, REFERRERS_INDEX_MAX_OBJECTS,
+    get_global_debugger, GetGlobalDebugger, set_global_debugger,  # Keep for backward compatibility @UnusedImport
+    COMPACT_ENCODING_MARKER)
 from _pydev_bundle.pydev_override import overrides
 import weakref
-from _pydev_bundle._pydev_completer import extract_token_and_qualifier
-from _pydevd_bundle._debug_adapter.pydevd_schema import VariablesResponseBody, \
-    SetVariableResponseBody
-from _pydevd_bundle._debug_adapter import pydevd_base_schema, pydevd_schema
+from _pydevd_bundle._debug_adapter import pydevd_base_schema
+from _pydevd_bundle._debug_adapter.pydevd_base_schema import lazy_schema as pydevd_schema
 from _pydevd_bundle.pydevd_net_command import NetCommand
 from _pydevd_bundle.pydevd_xml import ExceptionOnEvaluate
 from _pydevd_bundle.pydevd_constants import ForkSafeLock
@@ -89,7 +90,7 @@ except:
     from urllib.parse import quote_plus, unquote_plus  # @Reimport @UnresolvedImport
 
 import pydevconsole
-from _pydevd_bundle import pydevd_vars, pydevd_utils
+from _pydevd_bundle import pydevd_vars, pydevd_utils, pydevd_referrers
 import pydevd_tracing
 from _pydevd_bundle import pydevd_xml
 from _pydevd_bundle import pydevd_vm_type
@@ -98,10 +99,8 @@ import traceback
 from _pydevd_bundle.pydevd_utils import quote_smart as quote, compare_object_attrs_key
 from _pydev_bundle import pydev_log
 from _pydev_bundle.pydev_log import exception as pydev_log_exception
-from _pydev_bundle import _pydev_completer
 
 from pydevd_tracing import get_exception_traceback_str
-from _pydevd_bundle import pydevd_console
 from _pydev_bundle.pydev_monkey import disable_trace_thread_modules, enable_trace_thread_modules
 from socket import socket
 try:
@@ -205,7 +204,8 @@ class ReaderThread(PyDBDaemonThread):
         self._buffer = b''
         self.setName("pydevd.Reader")
         self.process_net_command = process_net_command
-        self.process_net_command_json = PyDevJsonCommandProcessor(self._from_json).process_net_command_json
+        self.json_command_processor = PyDevJsonCommandProcessor(self._from_json)
+        self.process_net_command_json = self.json_command_processor.process_net_command_json
 
     def _from_json(self, json_msg, update_ids_from_dap=False):
         return pydevd_base_schema.from_json(json_msg, update_ids_from_dap, on_dict_loaded=self._on_dict_loaded)
@@ -257,6 +257,33 @@ class ReaderThread(PyDBDaemonThread):
                 return b''
             self._buffer += r
 
+    def _peek(self):
+        '''
+        :return bytes:
+            The next byte to be read (without consuming it) or an empty string if the connection
+            was closed.
+        '''
+        if not self._buffer:
+            try:
+                r = self.sock.recv(1024)
+            except OSError:
+                return b''
+            if not r:
+                return b''
+            self._buffer += r
+        return self._buffer[:1]
+
+    def _read_compact_message(self):
+        '''
+        :return bytes:
+            The payload of a message in the compact encoding (marker + length + payload) or an
+            empty string if the connection was closed.
+        '''
+        header = self._read(5)
+        if len(header) != 5:
+            return b''
+        return self._read(struct.unpack('>I', header[1:])[0])
+
     def _read_line(self):
         while True:
             i = self._buffer.find(b'\n')
@@ -284,6 +311,17 @@ class ReaderThread(PyDBDaemonThread):
                 # client itself closes the connection (although on kill received we stop actually
                 # processing anything read).
                 try:
+                    if content_len == -1 and self._peek() == COMPACT_ENCODING_MARKER:
+                        json_contents = self._read_compact_message()
+                        if len(json_contents) == 0:
+                            pydev_log.debug('ReaderThread: empty contents received (len(json_contents) == 0).')
+                            self._terminate_on_socket_close()
+                            return  # Finished communication.
+
+                        if not self._kill_received:
+                            self.process_net_command_json(self.py_db, json_contents)
+                        continue
+
                     line = self._read_line()
 
                     if len(line) == 0:
@@ -488,8 +526,72 @@ def start_server(port):
         raise
 
 
+def get_unix_socket_path(port):
+    '''
+    :return str|None:
+        The path of the unix domain socket where a debug adapter in this machine listening on
+        the given port also accepts connections (or None if there's no such socket).
+
+    Note: the socket is only used if it's in a directory which only the current user may access
+    (the same logic is in `ptvsd.common.sockets.get_unix_socket_path`).
+    '''
+    import socket as socket_module
+    if IS_WINDOWS or IS_JYTHON or not hasattr(socket_module, 'AF_UNIX'):
+        return None
+
+    import stat
+    import tempfile
+    uid = os.getuid()
+    dirname = os.path.join(tempfile.gettempdir(), 'ptvsd-%s' % (uid,))
+    try:
+        st = os.lstat(dirname)
+    except OSError:
+        return None
+
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != uid or st.st_mode & 0o077:
+        return None
+
+    path = os.path.join(dirname, '%s.sock' % (port,))
+    if not os.path.exists(path):
+        return None
+    return path
+
+
+def _start_unix_socket_client(port):
+    '''
+    Connects to the unix domain socket of a debug adapter in this machine (which avoids the
+    overhead of the loopback TCP stack).
+
+    :return socket|None:
+        The connected socket or None if it's not available (in which case TCP should be used).
+    '''
+    path = get_unix_socket_path(port)
+    if path is None:
+        return None
+
+    from socket import AF_UNIX
+    pydev_log.info("Connecting to unix domain socket: %s", path)
+    s = socket(AF_UNIX, SOCK_STREAM)
+    try:
+        timeout = int(os.environ.get('PYDEVD_CONNECT_TIMEOUT', 10))
+        s.settimeout(timeout)
+        s.connect(path)
+        s.settimeout(None)  # no timeout after connected
+        pydev_log.info("Connected.")
+        return s
+    except:
+        pydev_log.debug("Could not connect to unix domain socket: %s (falling back to TCP).", path)
+        s.close()
+        return None
+
+
 def start_client(host, port):
     ''' connects to a host/port '''
+    if host in ('127.0.0.1', 'localhost', '::1'):
+        s = _start_unix_socket_client(port)
+        if s is not None:
+            return s
+
     pydev_log.info("Connecting to %s:%s", host, port)
 
     s = socket(AF_INET, SOCK_STREAM)
@@ -714,18 +816,80 @@ def internal_get_variable_json(py_db, request):
         fmt = fmt.to_dict()
 
     variables = []
+    pending_variables = []
     try:
         variable = py_db.suspended_frames_manager.get_variable(variables_reference)
     except KeyError:
         pass
     else:
+        # Computing the value may call user code (i.e.: `__repr__`), which may be slow, so, after the
+        # time budget is exceeded the remaining values are sent with a placeholder and are computed
+        # afterwards (see: internal_update_variables_json).
+        deadline = None
+        if VARIABLES_TIME_BUDGET > 0:
+            deadline = time.time() + VARIABLES_TIME_BUDGET
+
         for child_var in variable.get_children_variables(fmt=fmt):
-            variables.append(child_var.get_var_data(fmt=fmt))
+            if deadline is not None and time.time() > deadline:
+                variables.append(_get_var_data_placeholder(child_var))
+                pending_variables.append(child_var)
+            else:
+                variables.append(child_var.get_var_data(fmt=fmt))
 
-    body = VariablesResponseBody(variables)
-    variables_response = pydevd_base_schema.build_response(request, kwargs={'body':body})
+    # Note: the response is built directly as a dict (as VariablesResponse.to_dict() would do it).
+    update_variable_ids_to_dap = pydevd_schema.Variable.update_dict_ids_to_dap
+    variables = [update_variable_ids_to_dap(var_data) for var_data in variables]
+    variables_response = pydevd_base_schema.build_response_dict(
+        request.seq, request.command, {'variables': variables})
     py_db.writer.add_command(NetCommand(CMD_RETURN, 0, variables_response, is_json=True))
 
+    if pending_variables:
+        # Note: computed in this same thread (after the commands already posted to it).
+        py_db.post_method_as_internal_command(
+            get_current_thread_id(threading.current_thread()),
+            internal_update_variables_json, variables_reference, pending_variables, fmt)
+
+
+def _get_var_data_placeholder(child_var):
+    # Note: must not call user code.
+    _type, type_name, resolver = pydevd_xml.get_type(getattr(child_var, 'value', None))
+    var_data = {
+        'name': child_var.get_name(),
+        'value': '<computing value...>',
+        'type': type_name,
+        'presentationHint': {'attributes': ['readOnly']},
+    }
+    if child_var.evaluate_name is not None:
+        var_data['evaluateName'] = child_var.evaluate_name
+
+    if resolver is not None:  # I.e.: it's a container (so, it can still be expanded).
+        var_data['variablesReference'] = child_var.get_variable_reference()
+    else:
+        var_data['variablesReference'] = 0
+    return var_data
+
+
+def internal_update_variables_json(py_db, variables_reference, children_variables, fmt):
+    '''
+    Computes the values which didn't fit in the time budget of a `variables` request and sends
+    them in a `pydevdVariablesUpdated` event (stops as soon as the thread is resumed).
+    '''
+    additional_info = getattr(threading.current_thread(), 'additional_info', None)
+
+    variables = []
+    for child_var in children_variables:
+        if additional_info is not None and additional_info.pydev_state != STATE_SUSPEND:
+            return  # The thread was resumed: the values are no longer interesting.
+
+        if py_db.suspended_frames_manager.get_thread_id_for_variable_reference(variables_reference) is None:
+            return
+
+        variables.append(child_var.get_var_data(fmt=fmt))
+
+    body = pydevd_schema.PydevdVariablesUpdatedEventBody(variables_reference, variables)
+    event = pydevd_schema.PydevdVariablesUpdatedEvent(body)
+    py_db.writer.add_command(NetCommand(CMD_VARIABLES_UPDATED_EVENT, 0, event, is_json=True))
+
 
 class InternalGetVariable(InternalThreadCommand):
     ''' gets the value of a variable '''
@@ -846,7 +1010,7 @@ def internal_change_variable_json(py_db, request):
         return
 
     var_data = child_var.get_var_data(fmt=fmt)
-    body = SetVariableResponseBody(
+    body = pydevd_schema.SetVariableResponseBody(
         value=var_data['value'],
         type=var_data['type'],
         variablesReference=var_data.get('variablesReference'),
@@ -858,7 +1022,7 @@ def internal_change_variable_json(py_db, request):
 
 
 def _write_variable_response(py_db, request, value, success, message):
-    body = SetVariableResponseBody('')
+    body = pydevd_schema.SetVariableResponseBody('')
     variables_response = pydevd_base_schema.build_response(
         request,
         kwargs={
@@ -1059,6 +1223,113 @@ def _set_expression_response(py_db, request, result, error_message):
     py_db.writer.add_command(NetCommand(CMD_RETURN, 0, variables_response, is_json=True))
 
 
+def internal_get_array_slice_json(py_db, request, thread_id):
+    '''
+    :param PydevdArraySliceRequest request:
+    '''
+    arguments = request.arguments  # : :type arguments: PydevdArraySliceArguments
+
+    def send_error(message):
+        response = pydevd_schema.Response(
+            request.seq, success=False, command=request.command, message=message, body={})
+        py_db.writer.add_command(NetCommand(CMD_RETURN, 0, response, is_json=True))
+
+    frame = py_db.find_frame(thread_id, arguments.frameId)
+    if frame is None:
+        send_error('Unable to find frame: %s.' % (arguments.frameId,))
+        return
+
+    value = pydevd_vars.evaluate_expression(py_db, frame, arguments.expression, is_exec=False)
+    if isinstance(value, ExceptionOnEvaluate):
+        send_error('%s: %s' % (value.result.__class__.__name__, value.result))
+        return
+
+    try:
+        array_slice = pydevd_vars.array_slice_to_dict(
+            value,
+            row_offset=arguments.rowOffset or 0,
+            col_offset=arguments.colOffset or 0,
+            rows=arguments.rows,
+            cols=arguments.cols,
+            format=arguments.format,
+            binary=bool(arguments.binary),
+        )
+    except Exception as e:
+        pydev_log.exception('Error getting slice of: %s', arguments.expression)
+        send_error('Unable to get slice of %s (%s: %s).' % (arguments.expression, e.__class__.__name__, e))
+        return
+
+    body = pydevd_schema.PydevdArraySliceResponseBody(**array_slice)
+    response = pydevd_base_schema.build_response(request, kwargs={'body': body})
+    py_db.writer.add_command(NetCommand(CMD_RETURN, 0, response, is_json=True))
+
+
+def internal_get_referrers_json(py_db, request, thread_id):
+    '''
+    :param PydevdReferrersRequest request:
+    '''
+    arguments = request.arguments  # : :type arguments: PydevdReferrersArguments
+
+    def send_error(message):
+        response = pydevd_schema.Response(
+            request.seq, success=False, command=request.command, message=message, body={})
+        py_db.writer.add_command(NetCommand(CMD_RETURN, 0, response, is_json=True))
+
+    frame = py_db.find_frame(thread_id, arguments.frameId)
+    if frame is None:
+        send_error('Unable to find frame: %s.' % (arguments.frameId,))
+        return
+
+    frame_tracker = py_db.suspended_frames_manager.get_frame_tracker(thread_id)
+    if frame_tracker is None:
+        # This is not really expected.
+        send_error('Thread id: %s is not current thread id.' % (thread_id,))
+        return
+
+    value = pydevd_vars.evaluate_expression(py_db, frame, arguments.expression, is_exec=False)
+    if isinstance(value, ExceptionOnEvaluate):
+        send_error('%s: %s' % (value.result.__class__.__name__, value.result))
+        return
+
+    max_results = arguments.maxResults
+    if max_results is None:
+        max_results = 100
+
+    # If enabled, the index is built in a separate thread and is kept until the program is resumed
+    # (until it's complete gc.get_referrers() is used).
+    referrers_index = py_db.referrers_index
+    if referrers_index is None and REFERRERS_INDEX_MAX_OBJECTS > 0:
+        referrers_index = py_db.referrers_index = pydevd_referrers.ReferrersIndex(
+            max_objects=REFERRERS_INDEX_MAX_OBJECTS)
+        run_as_pydevd_daemon_thread(py_db, referrers_index.build)
+
+    try:
+        referrers, truncated = pydevd_referrers.get_referrers(
+            value, max_results=max_results, time_budget=REFERRERS_TIME_BUDGET, referrers_index=referrers_index)
+    except Exception as e:
+        pydev_log.exception('Error getting referrers of: %s', arguments.expression)
+        send_error('Unable to get referrers of %s (%s: %s).' % (arguments.expression, e.__class__.__name__, e))
+        return
+    finally:
+        value = None
+
+    referrers_json = []
+    for r, found_as in referrers:
+        var_data = frame_tracker.obtain_as_variable(found_as or '', r, frame=frame).get_var_data()
+        referrer = {
+            'type': var_data.get('type', ''),
+            'value': var_data['value'],
+            'variablesReference': var_data.get('variablesReference', 0),
+        }
+        if found_as:
+            referrer['foundAs'] = found_as
+        referrers_json.append(referrer)
+
+    body = pydevd_schema.PydevdReferrersResponseBody(referrers=referrers_json, truncated=truncated)
+    response = pydevd_base_schema.build_response(request, kwargs={'body': body})
+    py_db.writer.add_command(NetCommand(CMD_RETURN, 0, response, is_json=True))
+
+
 def internal_set_expression_json(py_db, request, thread_id):
     # : :type arguments: SetExpressionArguments
 
@@ -1116,12 +1387,17 @@ def internal_set_expression_json(py_db, request, thread_id):
     py_db.writer.add_command(NetCommand(CMD_RETURN, 0, variables_response, is_json=True))
 
 
-def internal_get_completions(dbg, seq, thread_id, frame_id, act_tok, line=-1, column=-1):
+def internal_get_completions(dbg, seq, thread_id, frame_id, act_tok, line=-1, column=-1, get_complete_info=True):
     '''
     Note that if the column is >= 0, the act_tok is considered text and the actual
     activation token/qualifier is computed in this command.
+
+    :param bool get_complete_info:
+        If False, the docs and parameters of the completions aren't computed.
     '''
     try:
+        from _pydev_bundle._pydev_completer import extract_token_and_qualifier, generate_completions, \
+            CompletionsCache
         remove_path = None
         try:
             qualifier = u''
@@ -1140,7 +1416,14 @@ def internal_get_completions(dbg, seq, thread_id, frame_id, act_tok, line=-1, co
                     if not isinstance(qualifier, bytes):
                         qualifier = qualifier.encode('utf-8')
 
-                completions = _pydev_completer.generate_completions(frame, act_tok)
+                completions_cache = dbg.completions_cache
+                if completions_cache is None:
+                    completions_cache = dbg.completions_cache = CompletionsCache()
+
+                completions = completions_cache.get_completions(
+                    (thread_id, frame_id, act_tok, get_complete_info),
+                    qualifier,
+                    lambda: generate_completions(frame, act_tok, get_complete_info))
 
                 # Note that qualifier and start are only actually valid for the
                 # Debug Adapter Protocol (for the line-based protocol, the IDE
@@ -1167,6 +1450,7 @@ def internal_get_description(dbg, seq, thread_id, frame_id, expression):
     ''' Fetch the variable description stub from the debug console
     '''
     try:
+        from _pydevd_bundle import pydevd_console
         frame = dbg.find_frame(thread_id, frame_id)
         description = pydevd_console.get_description(frame, thread_id, frame_id, expression)
         description = pydevd_xml.make_valid_xml_value(quote(description, '/>_= \t'))
@@ -1370,6 +1654,7 @@ class InternalEvaluateConsoleExpression(InternalThreadCommand):
             <more>true/false</more>
         </xml>
         '''
+        from _pydevd_bundle import pydevd_console
         try:
             frame = dbg.find_frame(self.thread_id, self.frame_id)
             if frame is not None:
@@ -1378,8 +1663,7 @@ class InternalEvaluateConsoleExpression(InternalThreadCommand):
 
                 cmd = dbg.cmd_factory.make_send_console_message(self.sequence, console_message.to_xml())
             else:
-                from _pydevd_bundle.pydevd_console import ConsoleMessage
-                console_message = ConsoleMessage()
+                console_message = pydevd_console.ConsoleMessage()
                 console_message.add_console_message(
                     pydevd_console.CONSOLE_ERROR,
                     "Select the valid frame in the debug view (thread: %s, frame: %s invalid)" % (self.thread_id, self.frame_id),
@@ -1431,6 +1715,7 @@ class InternalConsoleGetCompletions(InternalThreadCommand):
     def do_it(self, dbg):
         ''' Get completions and write back to the client
         '''
+        from _pydevd_bundle import pydevd_console
         try:
             frame = dbg.find_frame(self.thread_id, self.frame_id)
             completions_xml = pydevd_console.get_completions(frame, self.act_tok)
@@ -1458,6 +1743,7 @@ class InternalConsoleExec(InternalThreadCommand):
                 # don't trace new threads created by console command
                 disable_trace_thread_modules()
 
+                dbg.completions_cache = None
                 result = pydevconsole.console_exec(self.thread_id, self.frame_id, self.expression, dbg)
                 xml = "<xml>"
                 xml += pydevd_xml.var_to_xml(result, "")
@@ -89,6 +89,10 @@ CMD_AUTHENTICATE = 205
 
 CMD_STEP_INTO_COROUTINE = 206
 
+CMD_VARIABLES_UPDATED_EVENT = 207
+
+CMD_PROFILER_SAMPLES_EVENT = 208
+
 CMD_VERSION = 501
 CMD_RETURN = 502
 CMD_SET_PROTOCOL = 503
@@ -179,6 +183,10 @@ ID_TO_MEANING = {
 
     '206': 'CMD_STEP_INTO_COROUTINE',
 
+    '207': 'CMD_VARIABLES_UPDATED_EVENT',
+
+    '208': 'CMD_PROFILER_SAMPLES_EVENT',
+
     '501': 'CMD_VERSION',
     '502': 'CMD_RETURN',
     '503': 'CMD_SET_PROTOCOL',
@@ -169,7 +169,42 @@ SHOW_COMPILE_CYTHON_COMMAND_LINE = os.getenv('PYDEVD_SHOW_COMPILE_CYTHON_COMMAND
 LOAD_VALUES_ASYNC = os.getenv('PYDEVD_LOAD_VALUES_ASYNC', 'False') == 'True'
 DEFAULT_VALUE = "__pydevd_value_async"
 ASYNC_EVAL_TIMEOUT_SEC = 60
+
+# Maximum time (in seconds) that a `variables` request spends computing values in the suspended
+# thread (the values not computed by then are sent with a placeholder and are computed afterwards in
+# that same thread -- unless it's resumed -- to be sent in a `pydevdVariablesUpdated` event).
+# Note that a single slow value can't be interrupted, so, it may still exceed it. 0 disables it.
+VARIABLES_TIME_BUDGET = float(os.getenv('PYDEVD_VARIABLES_TIME_BUDGET', '0.5'))
+
+# The `thread` (started/exited) notifications are sent in batches at most once every
+# THREAD_EVENTS_DELAY seconds (a thread which starts and exits in between isn't reported) and only
+# for threads which are alive for at least THREAD_EVENTS_MIN_LIFETIME seconds (if both are 0 the
+# notifications are sent right away).
+THREAD_EVENTS_DELAY = float(os.getenv('PYDEVD_THREAD_EVENTS_DELAY', '0.1'))
+THREAD_EVENTS_MIN_LIFETIME = float(os.getenv('PYDEVD_THREAD_EVENTS_MIN_LIFETIME', '0'))
+
+# Maximum time (in seconds) that a `pydevdReferrers` request spends collecting the referrers after
+# the initial scan of all the objects (gc.get_referrers(), which can't be interrupted) -- i.e.: it
+# bounds checking each referrer and the scan to find the objects owning dict referrers (which is
+# skipped if the time is over). It doesn't bound building the referrers index (which is done in a
+# separate thread).
+REFERRERS_TIME_BUDGET = float(os.getenv('PYDEVD_REFERRERS_TIME_BUDGET', '2'))
+
+# If > 0, the first `pydevdReferrers` request while the program is suspended starts building a
+# referrers index (which is reused by the next requests until the program is resumed) if there are
+# at most this many objects tracked by the garbage collector. The index makes the next requests much
+# faster but it uses a lot of memory (in the order of 100 bytes for each object), so, it's opt-in.
+REFERRERS_INDEX_MAX_OBJECTS = int(os.getenv('PYDEVD_REFERRERS_INDEX_MAX_OBJECTS', '0'))
 NEXT_VALUE_SEPARATOR = "__pydev_val__"
+
+# Sources bigger than this (in bytes) are not sent to the client in `source` requests (i.e.: huge
+# generated modules) and the contents of at most SOURCE_CACHE_SIZE chars are kept cached.
+MAX_SOURCE_SIZE = int(os.getenv('PYDEVD_MAX_SOURCE_SIZE', 10 * 1024 * 1024))
+SOURCE_CACHE_SIZE = int(os.getenv('PYDEVD_SOURCE_CACHE_SIZE', 20 * 1024 * 1024))
+
+# Maximum number of entries in each of the caches used to normalize/translate paths (the least
+# recently added entries are evicted first).
+PATH_CACHE_SIZE = int(os.getenv('PYDEVD_PATH_CACHE_SIZE', 10000))
 BUILTINS_MODULE_NAME = '__builtin__' if IS_PY2 else 'builtins'
 SHOW_DEBUG_INFO_ENV = os.getenv('PYCHARM_DEBUG') == 'True' or os.getenv('PYDEV_DEBUG') == 'True' or os.getenv('PYDEVD_DEBUG') == 'True'
 
@@ -605,8 +640,16 @@ HTTP_JSON_PROTOCOL = 'http_json'
 ARGUMENT_HTTP_JSON_PROTOCOL = 'json-dap-http'
 
 
+# Compact encoding which may be negotiated in the 'pydevdSystemInfo' request when the HTTP_JSON_PROTOCOL
+# is used: i.e.: COMPACT_ENCODING_MARKER + payload length (4 bytes, big endian) + payload
+# payload is json (without whitespaces)
+# Note: the marker can't start a message in the other protocols, so, the reader accepts both.
+COMPACT_ENCODING_MARKER = b'\x00'
+
+
 class _GlobalSettings:
     protocol = QUOTED_LINE_PROTOCOL
+    compact_encoding = False
 
 
 def set_protocol(protocol):
@@ -625,6 +668,14 @@ def is_json_protocol():
     return _GlobalSettings.protocol in (JSON_PROTOCOL, HTTP_JSON_PROTOCOL)
 
 
+def set_compact_encoding(compact_encoding):
+    _GlobalSettings.compact_encoding = compact_encoding
+
+
+def is_compact_encoding():
+    return _GlobalSettings.compact_encoding
+
+
 class GlobalDebuggerHolder:
     '''
         Holder for the global debugger.
@@ -19,3 +19,5 @@ cdef class PyDBAdditionalThreadInfo:
     cdef public object top_level_thread_tracer_no_back_frames;
     cdef public object top_level_thread_tracer_unhandled;
     cdef public object thread_tracer;
+    cdef public long long trace_dispatch_calls;
+    cdef public long long trace_dispatch_skip_cache_hits;
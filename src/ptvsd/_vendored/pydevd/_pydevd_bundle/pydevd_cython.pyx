@@ -14,7 +14,7 @@ pydev_log.debug("Using Cython speedups")
 # from _pydevd_bundle.pydevd_frame import PyDBFrame
 # ENDIF
 
-version = 11
+version = 12
 
 if USE_CUSTOM_SYS_CURRENT_FRAMES:
 
@@ -93,6 +93,8 @@ cdef class PyDBAdditionalThreadInfo:
 #         'top_level_thread_tracer_no_back_frames',
 #         'top_level_thread_tracer_unhandled',
 #         'thread_tracer',
+#         'trace_dispatch_calls',
+#         'trace_dispatch_skip_cache_hits',
 #     ]
     # ENDIF
 
@@ -126,6 +128,10 @@ cdef class PyDBAdditionalThreadInfo:
         self.top_level_thread_tracer_unhandled = None
         self.thread_tracer = None
 
+        # Counters (see: pydevd_stats).
+        self.trace_dispatch_calls = 0
+        self.trace_dispatch_skip_cache_hits = 0
+
     def get_topmost_frame(self, thread):
         '''
         Gets the topmost frame for the given thread. Note that it may be None
@@ -509,6 +515,38 @@ cdef class PyDBFrame:
 
         return f
 
+    # IFDEF CYTHON -- DONT EDIT THIS FILE (it is automatically generated)
+    cpdef trace_dispatch_running(self, frame, str event, arg):
+        cdef PyDBAdditionalThreadInfo info;
+        cdef int step_cmd;
+        cdef dict frame_skips_cache;
+        cdef tuple frame_cache_key;
+    # ELSE
+#     def trace_dispatch_running(self, frame, event, arg):
+    # ENDIF
+        '''
+        Specialized version of `trace_dispatch` which is used (as the frame.f_trace) for frames with
+        breakpoints while the thread is running or stepping over/returning in some other frame.
+
+        In this state a 'line' event for a line which is already known not to have a breakpoint
+        is a no-op, so, it's skipped without the checks done in `trace_dispatch` (any other event
+        or state goes through `trace_dispatch`, which selects the trace function to be used from
+        there on).
+        '''
+        main_debugger, _filename, info, _thread, frame_skips_cache, frame_cache_key = self._args
+        if event == 'line' and info.pydev_state == 1:  # 1 = 1
+            step_cmd = info.pydev_step_cmd
+            if step_cmd == -1 or (
+                    step_cmd in (108, 109, 159, 160) and
+                    info.pydev_step_stop is not frame and
+                    not (main_debugger.show_return_values and frame.f_back is info.pydev_step_stop)):
+
+                if not main_debugger.has_plugin_line_breaks and not main_debugger.has_plugin_exception_breaks:
+                    if frame_skips_cache.get((frame_cache_key, frame.f_lineno), -1) == 0:
+                        return self.trace_dispatch_running
+
+        return self.trace_dispatch(frame, event, arg)
+
     # IFDEF CYTHON -- DONT EDIT THIS FILE (it is automatically generated)
     cpdef trace_dispatch(self, frame, str event, arg):
         cdef str filename;
@@ -740,7 +778,9 @@ cdef class PyDBFrame:
                     if can_skip:
                         breakpoints_in_line_cache = frame_skips_cache.get(line_cache_key, -1)
                         if breakpoints_in_line_cache == 0:
-                            return self.trace_dispatch
+                            # Lines without breakpoints are skipped in a specialized function
+                            # until the state changes.
+                            return self.trace_dispatch_running
 
                     breakpoints_in_frame_cache = frame_skips_cache.get(frame_cache_key, -1)
                     if breakpoints_in_frame_cache != -1:
@@ -1408,6 +1448,7 @@ cdef class ThreadTracer:
             return None if event == 'call' else NO_FTRACE  # we don't wan't to trace code invoked from pydevd_frame.trace_dispatch
 
         additional_info.is_tracing += 1
+        additional_info.trace_dispatch_calls += 1
         try:
             pydev_step_cmd = additional_info.pydev_step_cmd
             is_stepping = pydev_step_cmd != -1
@@ -1425,6 +1466,7 @@ cdef class ThreadTracer:
             if frame_cache_key in cache_skips:
                 if not is_stepping:
                     # if DEBUG: print('skipped: trace_dispatch (cache hit)', frame_cache_key, frame.f_lineno, event, frame.f_code.co_name)
+                    additional_info.trace_dispatch_skip_cache_hits += 1
                     return None if event == 'call' else NO_FTRACE
                 else:
                     # When stepping we can't take into account caching based on the breakpoints (only global filtering).
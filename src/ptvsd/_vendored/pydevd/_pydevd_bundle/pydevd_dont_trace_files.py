@@ -90,6 +90,7 @@ DONT_TRACE = {
     'pydevd_frame_utils.py': PYDEV_FILE,
     'pydevd_helpers.py': PYDEV_FILE,
     'pydevd_import_class.py': PYDEV_FILE,
+    'pydevd_inherited_config.py': PYDEV_FILE,
     'pydevd_io.py': PYDEV_FILE,
     'pydevd_json_debug_options.py': PYDEV_FILE,
     'pydevd_modify_bytecode.py': PYDEV_FILE,
@@ -105,13 +106,19 @@ DONT_TRACE = {
     'pydevd_reload.py': PYDEV_FILE,
     'pydevd_resolver.py': PYDEV_FILE,
     'pydevd_safe_repr.py': PYDEV_FILE,
+    'pydevd_sampling_profiler.py': PYDEV_FILE,
     'pydevd_save_locals.py': PYDEV_FILE,
     'pydevd_schema.py': PYDEV_FILE,
     'pydevd_schema_log.py': PYDEV_FILE,
     'pydevd_signature.py': PYDEV_FILE,
+    'pydevd_source_cache.py': PYDEV_FILE,
     'pydevd_source_mapping.py': PYDEV_FILE,
     'pydevd_stackless.py': PYDEV_FILE,
+    'pydevd_stats.py': PYDEV_FILE,
     'pydevd_suspended_frames.py': PYDEV_FILE,
+    'pydevd_sys_monitoring.py': PYDEV_FILE,
+    'pydevd_template_lines.py': PYDEV_FILE,
+    'pydevd_thread_events.py': PYDEV_FILE,
     'pydevd_thread_wrappers.py': PYDEV_FILE,
     'pydevd_trace_api.py': PYDEV_FILE,
     'pydevd_trace_dispatch.py': PYDEV_FILE,
@@ -360,6 +360,38 @@ class PyDBFrame:
 
         return f
 
+    # IFDEF CYTHON
+    # cpdef trace_dispatch_running(self, frame, str event, arg):
+    #     cdef PyDBAdditionalThreadInfo info;
+    #     cdef int step_cmd;
+    #     cdef dict frame_skips_cache;
+    #     cdef tuple frame_cache_key;
+    # ELSE
+    def trace_dispatch_running(self, frame, event, arg):
+    # ENDIF
+        '''
+        Specialized version of `trace_dispatch` which is used (as the frame.f_trace) for frames with
+        breakpoints while the thread is running or stepping over/returning in some other frame.
+
+        In this state a 'line' event for a line which is already known not to have a breakpoint
+        is a no-op, so, it's skipped without the checks done in `trace_dispatch` (any other event
+        or state goes through `trace_dispatch`, which selects the trace function to be used from
+        there on).
+        '''
+        main_debugger, _filename, info, _thread, frame_skips_cache, frame_cache_key = self._args
+        if event == 'line' and info.pydev_state == 1:  # STATE_RUN = 1
+            step_cmd = info.pydev_step_cmd
+            if step_cmd == -1 or (
+                    step_cmd in (CMD_STEP_OVER, CMD_STEP_RETURN, CMD_STEP_OVER_MY_CODE, CMD_STEP_RETURN_MY_CODE) and
+                    info.pydev_step_stop is not frame and
+                    not (main_debugger.show_return_values and frame.f_back is info.pydev_step_stop)):
+
+                if not main_debugger.has_plugin_line_breaks and not main_debugger.has_plugin_exception_breaks:
+                    if frame_skips_cache.get((frame_cache_key, frame.f_lineno), -1) == 0:
+                        return self.trace_dispatch_running
+
+        return self.trace_dispatch(frame, event, arg)
+
     # IFDEF CYTHON
     # cpdef trace_dispatch(self, frame, str event, arg):
     #     cdef str filename;
@@ -591,7 +623,9 @@ class PyDBFrame:
                     if can_skip:
                         breakpoints_in_line_cache = frame_skips_cache.get(line_cache_key, -1)
                         if breakpoints_in_line_cache == 0:
-                            return self.trace_dispatch
+                            # Lines without breakpoints are skipped in a specialized function
+                            # until the state changes.
+                            return self.trace_dispatch_running
 
                     breakpoints_in_frame_cache = frame_skips_cache.get(frame_cache_key, -1)
                     if breakpoints_in_frame_cache != -1:
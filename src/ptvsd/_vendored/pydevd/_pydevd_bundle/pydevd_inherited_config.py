@@ -0,0 +1,162 @@
+'''
+Support for subprocesses to start with the configuration of the parent process.
+
+The configuration requests received from the client (the launch/attach arguments, breakpoints,
+exception breakpoints, debugger properties and source maps) are recorded and passed on to each
+subprocess in an environment variable set only for that subprocess (or directly to a forked
+process), so, a subprocess can apply them as soon as it connects and start running the user code
+without waiting for the client to attach to it and send the same configuration again (see: the
+`pydevdRunWithInheritedConfig` request).
+'''
+import json
+import os
+
+from _pydev_bundle import pydev_log
+from _pydev_imps._pydev_saved_modules import threading
+
+INHERITED_CONFIG_ENV_VAR = 'PYDEVD_INHERITED_CONFIG'
+
+# Note: the limit for an environment variable on Windows is 32767 characters (if the
+# configuration is bigger than that, subprocesses just wait for the client to configure them).
+_MAX_ENV_VAR_LEN = 32000
+
+# The order in which the requests are applied (i.e.: the launch/attach arguments have the path
+# mappings, which must be set before the breakpoints are added).
+_COMMANDS_ORDER = (
+    'launch',
+    'attach',
+    'setDebuggerProperty',
+    'setPydevdSourceMap',
+    'setExceptionBreakpoints',
+    'setBreakpoints',
+)
+
+
+def _get_request_key(request_as_dict):
+    command = request_as_dict['command']
+    arguments = request_as_dict.get('arguments') or {}
+    if command in ('launch', 'attach'):
+        return ('launch', None)  # Only the last launch/attach is kept.
+
+    if command in ('setBreakpoints', 'setPydevdSourceMap'):
+        return (command, arguments.get('source', {}).get('path'))
+
+    if command == 'setDebuggerProperty':
+        return (command, tuple(sorted(arguments)))
+
+    return (command, None)
+
+
+class InheritedConfig(object):
+    '''
+    Keeps the last configuration requests received from the client (to be passed on to
+    subprocesses) and the requests inherited from the parent process which still need to be
+    applied.
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key_to_request = {}
+        self._pending_requests = None
+
+        # Set to True after the requests inherited from the parent process are applied.
+        self.applied = False
+
+    def on_request(self, request):
+        if request.command not in _COMMANDS_ORDER:
+            return
+
+        request_as_dict = request.to_dict()
+        key = _get_request_key(request_as_dict)
+        with self._lock:
+            if request_as_dict['command'] == 'setBreakpoints' and \
+                    not request_as_dict.get('arguments', {}).get('breakpoints'):
+                self._key_to_request.pop(key, None)
+            else:
+                self._key_to_request[key] = request_as_dict
+
+    def get_requests(self):
+        '''
+        :return list(dict):
+            The requests to be applied in a subprocess (in the order they should be applied).
+        '''
+        with self._lock:
+            requests = list(self._key_to_request.values())
+        requests.sort(key=lambda request_as_dict: _COMMANDS_ORDER.index(request_as_dict['command']))
+        return requests
+
+    def set_pending_requests(self, requests):
+        self._pending_requests = requests
+
+    def pop_pending_requests(self):
+        requests = self._pending_requests
+        self._pending_requests = None
+        return requests
+
+
+def get_env_var_value(py_db, pid=None):
+    '''
+    :return str|None:
+        The value for the `PYDEVD_INHERITED_CONFIG` environment variable with the configuration of
+        the given debugger for the subprocesses created by the process with the given pid (the
+        current process if not given) or None if there's nothing to be inherited.
+
+    Note: the variable must only be set in the environment of the subprocess being created
+    (see: `pydev_monkey`), never in `os.environ` (it'd be leaked to unrelated subprocesses).
+    '''
+    requests = py_db.inherited_config.get_requests()
+    if not requests:
+        return None
+
+    if pid is None:
+        pid = os.getpid()
+    contents = json.dumps({'pid': pid, 'requests': requests})
+    if len(contents) > _MAX_ENV_VAR_LEN:
+        pydev_log.debug('Configuration too big to be inherited by subprocesses (%s chars).', len(contents))
+        return None
+    return contents
+
+
+# The requests of the parent process when the current process is a fork (set in the child
+# right after the fork and consumed when the new debugger is created).
+_forked_requests = None
+
+
+def set_forked_requests(py_db):
+    '''
+    Called in a forked process (before the debugger of the parent process is discarded) so
+    that the new debugger starts with the same configuration.
+    '''
+    global _forked_requests
+    _forked_requests = py_db.inherited_config.get_requests() or None
+
+
+def import_inherited_config(py_db, ppid):
+    '''
+    Makes the debugger apply the configuration of the parent process (with the given pid)
+    when it connects (from a fork or from the environment of the subprocess).
+    '''
+    global _forked_requests
+    requests = _forked_requests
+    _forked_requests = None
+
+    # Note: always removed so that it's not passed on to other subprocesses.
+    contents = os.environ.pop(INHERITED_CONFIG_ENV_VAR, None)
+
+    if requests is None and contents:
+        try:
+            inherited = json.loads(contents)
+        except:
+            pydev_log.exception('Error loading configuration inherited from parent process.')
+            return
+
+        # The variable could've been exported for some other process (i.e.: if the subprocess
+        # isn't a direct child, such as when it's started from a shell). Note that os.exec*
+        # replaces the program of the current process, so, in that case it's the same pid.
+        if inherited.get('pid') not in (ppid, os.getpid()):
+            pydev_log.debug('Ignoring configuration exported by process: %s (parent: %s).', inherited.get('pid'), ppid)
+            return
+        requests = inherited['requests']
+
+    if requests:
+        py_db.inherited_config.set_pending_requests(requests)
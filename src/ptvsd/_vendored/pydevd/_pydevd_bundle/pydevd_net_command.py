@@ -3,8 +3,9 @@ from _pydevd_bundle.pydevd_constants import DebugInfoHolder, IS_PY2, \
 from _pydevd_bundle.pydevd_utils import quote_smart as quote, to_string
 from _pydevd_bundle.pydevd_comm_constants import ID_TO_MEANING, CMD_EXIT
 from _pydevd_bundle.pydevd_constants import HTTP_PROTOCOL, HTTP_JSON_PROTOCOL, \
-    get_protocol, IS_JYTHON, ForkSafeLock
+    get_protocol, IS_JYTHON, ForkSafeLock, is_compact_encoding, COMPACT_ENCODING_MARKER
 import json
+import struct
 from _pydev_bundle import pydev_log
 
 
@@ -67,10 +68,15 @@ class NetCommand(_BaseNetCommand):
             else:
                 assert isinstance(text, dict)
                 as_dict = text
-            as_dict['pydevd_cmd_id'] = cmd_id
             as_dict['seq'] = seq
             self.as_dict = as_dict
-            text = json.dumps(as_dict)
+            if is_compact_encoding():
+                # The client negotiated the compact encoding (so, it doesn't need the pydevd_cmd_id
+                # which is only there to help debugging the protocol).
+                text = json.dumps(as_dict, separators=(',', ':'))
+            else:
+                as_dict['pydevd_cmd_id'] = cmd_id
+                text = json.dumps(as_dict)
 
         if IS_PY2:
             if isinstance(text, unicode):
@@ -107,6 +113,11 @@ class NetCommand(_BaseNetCommand):
     def send(self, sock):
         as_bytes = self._as_bytes
         try:
+            if is_compact_encoding():
+                # Note: a single sendall (the header is small).
+                sock.sendall(COMPACT_ENCODING_MARKER + struct.pack('>I', len(as_bytes)) + as_bytes)
+                return
+
             if get_protocol() in (HTTP_PROTOCOL, HTTP_JSON_PROTOCOL):
                 sock.sendall(('Content-Length: %s\r\n\r\n' % len(as_bytes)).encode('ascii'))
             sock.sendall(as_bytes)
@@ -1,14 +1,14 @@
 from functools import partial
 import itertools
 import os
+import weakref
 
 from _pydev_bundle._pydev_imports_tipper import TYPE_IMPORT, TYPE_CLASS, TYPE_FUNCTION, TYPE_ATTR, \
     TYPE_BUILTIN, TYPE_PARAM
 from _pydev_bundle.pydev_is_thread_alive import is_thread_alive
 from _pydev_bundle.pydev_override import overrides
-from _pydevd_bundle._debug_adapter import pydevd_schema
-from _pydevd_bundle._debug_adapter.pydevd_schema import ModuleEvent, ModuleEventBody, Module, \
-    OutputEventBody, OutputEvent, ContinuedEventBody
+from _pydevd_bundle._debug_adapter.pydevd_base_schema import lazy_schema as pydevd_schema, \
+    build_response_dict
 from _pydevd_bundle.pydevd_comm_constants import CMD_THREAD_CREATE, CMD_RETURN, CMD_MODULE_EVENT, \
     CMD_WRITE_TO_CONSOLE, CMD_STEP_INTO, CMD_STEP_INTO_MY_CODE, CMD_STEP_OVER, CMD_STEP_OVER_MY_CODE, \
     CMD_STEP_RETURN, CMD_STEP_CAUGHT_EXCEPTION, CMD_ADD_EXCEPTION_BREAK, CMD_SET_BREAK, \
@@ -44,7 +44,7 @@ class ModulesManager(object):
         with self._lock:
             # Must check again after getting the lock.
             if filename_in_utf8 in self._modules:
-                return
+                return []
 
             try:
                 version = str(frame.f_globals.get('__version__', ''))
@@ -58,7 +58,7 @@ class ModulesManager(object):
 
             module_id = self._next_id()
 
-            module = Module(module_id, module_name, filename_in_utf8)
+            module = pydevd_schema.Module(module_id, module_name, filename_in_utf8)
             if version:
                 module.version = version
 
@@ -66,7 +66,7 @@ class ModulesManager(object):
                 # Note: package doesn't appear in the docs but seems to be expected?
                 module.kwargs['package'] = package_name
 
-            module_event = ModuleEvent(ModuleEventBody('new', module))
+            module_event = pydevd_schema.ModuleEvent(pydevd_schema.ModuleEventBody('new', module))
 
             module_events.append(NetCommand(CMD_MODULE_EVENT, 0, module_event, is_json=True))
 
@@ -97,6 +97,19 @@ class NetCommandFactoryJson(NetCommandFactory):
         NetCommandFactory.__init__(self)
         self.modules_manager = ModulesManager()
 
+        # Code object -> (filename_in_utf8, module_name, source_reference).
+        # The module is tracked when a code object is first seen in a stack (so, afterwards a
+        # stack trace doesn't need to access the frame globals nor the module/source reference
+        # info for the frames with that code object).
+        # Note: weakly-keyed so that the entries go away along with the code objects (i.e.:
+        # modules which are reloaded or code compiled with exec/eval, and the code objects
+        # created for each plugin frame).
+        self._code_to_frame_info = weakref.WeakKeyDictionary()
+
+        # The pydevd_file_utils.norm_file_to_client used to compute the entries in
+        # _code_to_frame_info (it's replaced whenever the path mappings change).
+        self._frame_info_norm_file_to_client = None
+
     @overrides(NetCommandFactory.make_version_message)
     def make_version_message(self, seq):
         return NULL_NET_COMMAND  # Not a part of the debug adapter protocol
@@ -126,21 +139,27 @@ class NetCommandFactoryJson(NetCommandFactory):
 
     @overrides(NetCommandFactory.make_list_threads_message)
     def make_list_threads_message(self, py_db, seq):
+        # Note: the response is built directly as a dict (this is called frequently).
+        update_thread_ids_to_dap = pydevd_schema.Thread.update_dict_ids_to_dap
         threads = []
+
+        # The threads which were already notified as created (kept as threads start and stop).
+        running_thread_ids = dict(py_db.get_running_threads())
         for thread in get_non_pydevd_threads():
             if is_thread_alive(thread):
                 thread_id = get_thread_id(thread)
+                if thread_id not in running_thread_ids:
+                    # i.e.: a thread which wasn't traced yet (such as a thread which was already
+                    # blocked when the debugger attached) or right after the notifications are
+                    # enabled (no-op if some other thread notified it in the meanwhile).
+                    py_db.notify_thread_created(thread_id, thread)
 
-                # Notify that it's created (no-op if we already notified before).
-                py_db.notify_thread_created(thread_id, thread)
+                threads.append(update_thread_ids_to_dap({'id': thread_id, 'name': thread.getName()}))
 
-                thread_schema = pydevd_schema.Thread(id=thread_id, name=thread.getName())
-                threads.append(thread_schema.to_dict())
-
-        body = pydevd_schema.ThreadsResponseBody(threads)
-        response = pydevd_schema.ThreadsResponse(
-            request_seq=seq, success=True, command='threads', body=body)
+        # The client must know about the threads listed before the response.
+        py_db.thread_events_notifier.flush(force=True)
 
+        response = build_response_dict(seq, 'threads', {'threads': threads})
         return NetCommand(CMD_RETURN, 0, response, is_json=True)
 
     @overrides(NetCommandFactory.make_get_completions_message)
@@ -208,16 +227,36 @@ class NetCommandFactoryJson(NetCommandFactory):
                     else:
                         frames_list = pydevd_frame_utils.create_frames_list_from_frame(topmost_frame)
 
+                code_to_frame_info = self._code_to_frame_info
+                norm_file_to_client = pydevd_file_utils.norm_file_to_client
+                if norm_file_to_client is not self._frame_info_norm_file_to_client:
+                    # Path mappings changed (so, the client filenames and source references
+                    # must all be computed again).
+                    code_to_frame_info.clear()
+                    self._frame_info_norm_file_to_client = norm_file_to_client
+                update_frame_ids_to_dap = pydevd_schema.StackFrame.update_dict_ids_to_dap
                 for frame_id, frame, method_name, original_filename, filename_in_utf8, lineno in self._iter_visible_frames_info(
                         py_db, frames_list
                     ):
 
-                    try:
-                        module_name = str(frame.f_globals.get('__name__', ''))
-                    except:
-                        module_name = '<unknown>'
-
-                    module_events.extend(self.modules_manager.track_module(filename_in_utf8, module_name, frame))
+                    frame_info = code_to_frame_info.get(frame.f_code)
+                    if (
+                            frame_info is None or
+                            frame_info[0] != filename_in_utf8  # Source mappings changed.
+                        ):
+                        try:
+                            module_name = str(frame.f_globals.get('__name__', ''))
+                        except:
+                            module_name = '<unknown>'
+
+                        module_events.extend(self.modules_manager.track_module(filename_in_utf8, module_name, frame))
+                        frame_info = code_to_frame_info[frame.f_code] = (
+                            filename_in_utf8,
+                            module_name,
+                            pydevd_file_utils.get_client_filename_source_reference(filename_in_utf8),
+                        )
+                    else:
+                        module_name = frame_info[1]
 
                     presentation_hint = None
                     if not getattr(frame, 'IS_PLUGIN_FRAME', False):  # Never filter out plugin frames!
@@ -228,12 +267,20 @@ class NetCommandFactoryJson(NetCommandFactory):
                             presentation_hint = 'subtle'
 
                     formatted_name = self._format_frame_name(fmt, method_name, module_name, lineno, filename_in_utf8)
-                    frames.append(pydevd_schema.StackFrame(
-                        frame_id, formatted_name, lineno, column=1, source={
+                    # Note: built directly as a dict (as StackFrame.to_dict() would do it).
+                    frame_as_dict = {
+                        'id': frame_id,
+                        'name': formatted_name,
+                        'line': lineno,
+                        'column': 1,
+                        'source': {
                             'path': filename_in_utf8,
-                            'sourceReference': pydevd_file_utils.get_client_filename_source_reference(filename_in_utf8),
+                            'sourceReference': frame_info[2],
                         },
-                        presentationHint=presentation_hint).to_dict())
+                    }
+                    if presentation_hint is not None:
+                        frame_as_dict['presentationHint'] = presentation_hint
+                    frames.append(update_frame_ids_to_dap(frame_as_dict))
             finally:
                 topmost_frame = None
 
@@ -247,18 +294,19 @@ class NetCommandFactoryJson(NetCommandFactory):
             end = min(start + levels, total_frames)
             stack_frames = frames[start:end]
 
-        response = pydevd_schema.StackTraceResponse(
-            request_seq=seq,
-            success=True,
-            command='stackTrace',
-            body=pydevd_schema.StackTraceResponseBody(stackFrames=stack_frames, totalFrames=total_frames))
+        response = build_response_dict(
+            seq, 'stackTrace', {'stackFrames': stack_frames, 'totalFrames': total_frames})
         return NetCommand(CMD_RETURN, 0, response, is_json=True)
 
     @overrides(NetCommandFactory.make_io_message)
     def make_io_message(self, v, ctx):
         category = 'stdout' if int(ctx) == 1 else 'stderr'
-        body = OutputEventBody(v, category)
-        event = OutputEvent(body)
+        # Note: built directly as a dict (as OutputEvent.to_dict() would do it).
+        event = {
+            'type': 'event',
+            'event': 'output',
+            'body': {'output': v, 'category': category, 'source': {}},
+        }
         return NetCommand(CMD_WRITE_TO_CONSOLE, 0, event, is_json=True)
 
     _STEP_REASONS = set([
@@ -309,21 +357,33 @@ class NetCommandFactoryJson(NetCommandFactory):
             exc_name = exception_info_response.body.exceptionId
             exc_desc = exception_info_response.body.description
 
-        body = pydevd_schema.StoppedEventBody(
-            reason=stop_reason,
-            description=exc_desc,
-            threadId=thread_id,
-            text=exc_name,
-            allThreadsStopped=True,
-            preserveFocusHint=stop_reason not in ['step', 'exception', 'breakpoint', 'entry', 'goto'],
-        )
-        event = pydevd_schema.StoppedEvent(body)
+        # Note: built directly as a dict (as StoppedEvent.to_dict() would do it).
+        body = {
+            'reason': stop_reason,
+            'threadId': thread_id,
+            'preserveFocusHint': stop_reason not in ['step', 'exception', 'breakpoint', 'entry', 'goto'],
+            'allThreadsStopped': True,
+        }
+        if exc_desc is not None:
+            body['description'] = exc_desc
+        if exc_name is not None:
+            body['text'] = exc_name
+        event = {
+            'type': 'event',
+            'event': 'stopped',
+            'body': pydevd_schema.StoppedEventBody.update_dict_ids_to_dap(body),
+        }
         return NetCommand(CMD_THREAD_SUSPEND_SINGLE_NOTIFICATION, 0, event, is_json=True)
 
     @overrides(NetCommandFactory.make_thread_resume_single_notification)
     def make_thread_resume_single_notification(self, thread_id):
-        body = ContinuedEventBody(threadId=thread_id, allThreadsContinued=True)
-        event = pydevd_schema.ContinuedEvent(body)
+        # Note: built directly as a dict (as ContinuedEvent.to_dict() would do it).
+        body = {'threadId': thread_id, 'allThreadsContinued': True}
+        event = {
+            'type': 'event',
+            'event': 'continued',
+            'body': pydevd_schema.ContinuedEventBody.update_dict_ids_to_dap(body),
+        }
         return NetCommand(CMD_THREAD_RESUME_SINGLE_NOTIFICATION, 0, event, is_json=True)
 
     @overrides(NetCommandFactory.make_set_next_stmnt_status_message)
@@ -372,8 +432,8 @@ class NetCommandFactoryJson(NetCommandFactory):
             msg += ('\nNote: may have been skipped because of "justMyCode" option (default == true). '
                     'Try setting \"justMyCode\": false in the debug configuration (e.g., launch.json).\n')
 
-        body = OutputEventBody(msg, category='console')
-        event = OutputEvent(body)
+        body = pydevd_schema.OutputEventBody(msg, category='console')
+        event = pydevd_schema.OutputEvent(body)
         return NetCommand(CMD_WRITE_TO_CONSOLE, 0, event, is_json=True)
 
     @overrides(NetCommandFactory.make_exit_command)
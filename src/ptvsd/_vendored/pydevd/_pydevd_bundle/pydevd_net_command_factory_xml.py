@@ -25,7 +25,6 @@ from _pydevd_bundle.pydevd_utils import quote_smart as quote, get_non_pydevd_thr
 from pydevd_file_utils import get_abs_path_real_path_and_base_from_frame
 import pydevd_file_utils
 from pydevd_tracing import get_exception_traceback_str
-from _pydev_bundle._pydev_completer import completions_to_xml
 from _pydev_bundle import pydev_log
 from _pydevd_bundle.pydevd_frame_utils import FramesList
 
@@ -313,6 +312,7 @@ class NetCommandFactory(object):
 
     def make_get_completions_message(self, seq, completions, qualifier, start):
         try:
+            from _pydev_bundle._pydev_completer import completions_to_xml
             payload = completions_to_xml(completions)
             return NetCommand(CMD_GET_COMPLETIONS, seq, payload)
         except Exception:
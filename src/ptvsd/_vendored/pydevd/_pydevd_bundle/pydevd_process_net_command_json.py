@@ -8,14 +8,8 @@ from functools import partial
 
 import pydevd_file_utils
 from _pydev_bundle import pydev_log
-from _pydevd_bundle._debug_adapter import pydevd_base_schema, pydevd_schema
-from _pydevd_bundle._debug_adapter.pydevd_schema import (
-    CompletionsResponseBody, EvaluateResponseBody, ExceptionOptions,
-    GotoTargetsResponseBody, ModulesResponseBody, ProcessEventBody,
-    ProcessEvent, Scope, ScopesResponseBody, SetExpressionResponseBody,
-    SetVariableResponseBody, SourceBreakpoint, SourceResponseBody,
-    VariablesResponseBody, SetBreakpointsResponseBody, Response,
-    Capabilities, PydevdAuthorizeRequest)
+from _pydevd_bundle._debug_adapter import pydevd_base_schema
+from _pydevd_bundle._debug_adapter.pydevd_base_schema import lazy_schema as pydevd_schema
 from _pydevd_bundle.pydevd_api import PyDevdAPI
 from _pydevd_bundle.pydevd_breakpoints import get_exception_class
 from _pydevd_bundle.pydevd_comm_constants import (
@@ -27,7 +21,9 @@ from _pydevd_bundle.pydevd_json_debug_options import _extract_debug_options, Deb
 from _pydevd_bundle.pydevd_net_command import NetCommand
 from _pydevd_bundle.pydevd_utils import convert_dap_log_message_to_expression
 from _pydevd_bundle.pydevd_constants import (PY_IMPL_NAME, DebugInfoHolder, PY_VERSION_STR,
-    PY_IMPL_VERSION_STR, IS_64BIT_PROCESS)
+    PY_IMPL_VERSION_STR, IS_64BIT_PROCESS, MAX_SOURCE_SIZE, SOURCE_CACHE_SIZE)
+from _pydevd_bundle.pydevd_source_cache import SourceCache, SourceTooBigError
+from _pydevd_bundle import pydevd_sampling_profiler
 from _pydevd_bundle.pydevd_trace_dispatch import USING_CYTHON
 from _pydevd_frame_eval.pydevd_frame_eval_main import USING_FRAME_EVAL
 
@@ -121,6 +117,7 @@ class PyDevJsonCommandProcessor(object):
         self._next_breakpoint_id = partial(next, itertools.count(0))
         self._goto_targets_map = IDMap()
         self._launch_or_attach_request_done = False
+        self._source_cache = SourceCache(MAX_SOURCE_SIZE, SOURCE_CACHE_SIZE)
 
     def process_net_command_json(self, py_db, json_contents, send_response=True):
         '''
@@ -164,13 +161,13 @@ class PyDevJsonCommandProcessor(object):
                 print('Handled in pydevd: %s (in PyDevJsonCommandProcessor).\n' % (method_name,))
 
         with py_db._main_lock:
-            if request.__class__ == PydevdAuthorizeRequest:
+            if request.__class__ == pydevd_schema.PydevdAuthorizeRequest:
                 authorize_request = request  # : :type authorize_request: PydevdAuthorizeRequest
                 access_token = authorize_request.arguments.debugServerAccessToken
                 py_db.authentication.login(access_token)
 
             if not py_db.authentication.is_authenticated():
-                response = Response(
+                response = pydevd_schema.Response(
                     request.seq, success=False, command=request.command, message='Client not authenticated.', body={})
                 cmd = NetCommand(CMD_RETURN, 0, response, is_json=True)
                 py_db.writer.add_command(cmd)
@@ -180,6 +177,38 @@ class PyDevJsonCommandProcessor(object):
             if cmd is not None and send_response:
                 py_db.writer.add_command(cmd)
 
+            py_db.inherited_config.on_request(request)
+
+    def apply_inherited_config(self, py_db, requests):
+        '''
+        Applies the configuration requests inherited from the parent process (see:
+        `pydevd_inherited_config`).
+
+        :param list(dict) requests:
+            The requests (as dicts) to be applied.
+        '''
+        with py_db._main_lock:
+            for request_as_dict in requests:
+                try:
+                    request = pydevd_base_schema.from_dict(request_as_dict)
+                    if request.command in ('launch', 'attach'):
+                        # Just the options are applied (the client still sends its own launch
+                        # or attach request when it connects).
+                        self._launch_or_attach_request_done = True
+                        self._set_debug_options(py_db, request.arguments.kwargs, start_reason='attach')
+
+                        # Output events would be lost until the client connects.
+                        py_db.enable_output_redirection(False, False)
+                    else:
+                        on_request = getattr(self, 'on_%s_request' % (request.command.lower(),))
+                        on_request(py_db, request)
+
+                    py_db.inherited_config.on_request(request)
+                except:
+                    pydev_log.exception('Error applying inherited request: %s', request_as_dict)
+
+            py_db.inherited_config.applied = True
+
     def on_pydevdauthorize_request(self, py_db, request):
         client_access_token = py_db.authentication.client_access_token
         body = {'clientAccessToken': None}
@@ -190,7 +219,7 @@ class PyDevJsonCommandProcessor(object):
         return NetCommand(CMD_RETURN, 0, response, is_json=True)
 
     def on_initialize_request(self, py_db, request):
-        body = Capabilities(
+        body = pydevd_schema.Capabilities(
             # Supported.
             supportsConfigurationDoneRequest=True,
             supportsConditionalBreakpoints=True,
@@ -281,7 +310,7 @@ class PyDevJsonCommandProcessor(object):
             frame_id)
 
         if thread_id is None:
-            body = CompletionsResponseBody([])
+            body = pydevd_schema.CompletionsResponseBody([])
             variables_response = pydevd_base_schema.build_response(
                 request,
                 kwargs={
@@ -300,7 +329,10 @@ class PyDevJsonCommandProcessor(object):
         else:
             line = arguments.line - 1
 
-        self.api.request_completions(py_db, seq, thread_id, frame_id, text, line=line, column=column)
+        # Note: the completion items only have the label and type (so, the docs and parameters
+        # don't need to be computed).
+        self.api.request_completions(
+            py_db, seq, thread_id, frame_id, text, line=line, column=column, get_complete_info=False)
 
     def _resolve_remote_root(self, local_root, remote_root):
         if remote_root == '.':
@@ -372,13 +404,13 @@ class PyDevJsonCommandProcessor(object):
             name = name.decode(file_system_encoding, 'replace')
             name = name.encode('utf-8')
 
-        body = ProcessEventBody(
+        body = pydevd_schema.ProcessEventBody(
             name=name,
             systemProcessId=os.getpid(),
             isLocalProcess=True,
             startMethod=start_method,
         )
-        event = ProcessEvent(body)
+        event = pydevd_schema.ProcessEvent(body)
         py_db.writer.add_command(NetCommand(CMD_PROCESS_EVENT, 0, event, is_json=True))
 
     def _handle_launch_or_attach_request(self, py_db, request, start_reason):
@@ -422,7 +454,7 @@ class PyDevJsonCommandProcessor(object):
 
         def on_resumed():
             body = {'allThreadsContinued': thread_id == '*'}
-            response = pydevd_base_schema.build_response(request, kwargs={'body': body})
+            response = pydevd_base_schema.build_response_dict(request.seq, request.command, body)
             cmd = NetCommand(CMD_RETURN, 0, response, is_json=True)
             py_db.writer.add_command(cmd)
 
@@ -447,7 +479,7 @@ class PyDevJsonCommandProcessor(object):
 
         self.api.request_step(py_db, thread_id, step_cmd_id)
 
-        response = pydevd_base_schema.build_response(request)
+        response = pydevd_base_schema.build_response_dict(request.seq, request.command)
         return NetCommand(CMD_RETURN, 0, response, is_json=True)
 
     def on_stepin_request(self, py_db, request):
@@ -464,7 +496,7 @@ class PyDevJsonCommandProcessor(object):
 
         self.api.request_step(py_db, thread_id, step_cmd_id)
 
-        response = pydevd_base_schema.build_response(request)
+        response = pydevd_base_schema.build_response_dict(request.seq, request.command)
         return NetCommand(CMD_RETURN, 0, response, is_json=True)
 
     def on_stepout_request(self, py_db, request):
@@ -481,7 +513,7 @@ class PyDevJsonCommandProcessor(object):
 
         self.api.request_step(py_db, thread_id, step_cmd_id)
 
-        response = pydevd_base_schema.build_response(request)
+        response = pydevd_base_schema.build_response_dict(request.seq, request.command)
         return NetCommand(CMD_RETURN, 0, response, is_json=True)
 
     def _get_hit_condition_expression(self, hit_condition):
@@ -536,7 +568,7 @@ class PyDevJsonCommandProcessor(object):
         if not self._launch_or_attach_request_done:
             # Note that to validate the breakpoints we need the launch request to be done already
             # (otherwise the filters wouldn't be set for the breakpoint validation).
-            body = SetBreakpointsResponseBody([])
+            body = pydevd_schema.SetBreakpointsResponseBody([])
             response = pydevd_base_schema.build_response(
                 request,
                 kwargs={
@@ -565,7 +597,7 @@ class PyDevJsonCommandProcessor(object):
         breakpoints_set = []
 
         for source_breakpoint in arguments.breakpoints:
-            source_breakpoint = SourceBreakpoint(**source_breakpoint)
+            source_breakpoint = pydevd_schema.SourceBreakpoint(**source_breakpoint)
             line = source_breakpoint.line
             condition = source_breakpoint.condition
             breakpoint_id = line
@@ -632,7 +664,7 @@ class PyDevJsonCommandProcessor(object):
             break_uncaught = True
 
             for option in exception_options:
-                option = ExceptionOptions(**option)
+                option = pydevd_schema.ExceptionOptions(**option)
                 if not option.path:
                     continue
 
@@ -736,9 +768,10 @@ class PyDevJsonCommandProcessor(object):
         frame_id = request.arguments.frameId
 
         variables_reference = frame_id
-        scopes = [Scope('Locals', int(variables_reference), False).to_dict()]
-        body = ScopesResponseBody(scopes)
-        scopes_response = pydevd_base_schema.build_response(request, kwargs={'body': body})
+        # Note: built directly as a dict (as Scope.to_dict() would do it).
+        scope = {'name': 'Locals', 'variablesReference': int(variables_reference), 'expensive': False, 'source': {}}
+        scopes = [pydevd_schema.Scope.update_dict_ids_to_dap(scope)]
+        scopes_response = pydevd_base_schema.build_response_dict(request.seq, request.command, {'scopes': scopes})
         return NetCommand(CMD_RETURN, 0, scopes_response, is_json=True)
 
     def on_evaluate_request(self, py_db, request):
@@ -758,7 +791,7 @@ class PyDevJsonCommandProcessor(object):
                 self.api.request_exec_or_evaluate_json(
                     py_db, request, thread_id)
             else:
-                body = EvaluateResponseBody('', 0)
+                body = pydevd_schema.EvaluateResponseBody('', 0)
                 response = pydevd_base_schema.build_response(
                     request,
                     kwargs={
@@ -768,6 +801,38 @@ class PyDevJsonCommandProcessor(object):
                     })
                 return NetCommand(CMD_RETURN, 0, response, is_json=True)
 
+    def on_pydevdarrayslice_request(self, py_db, request):
+        '''
+        :param PydevdArraySliceRequest request:
+        '''
+        arguments = request.arguments  # : :type arguments: PydevdArraySliceArguments
+        thread_id = py_db.suspended_frames_manager.get_thread_id_for_variable_reference(
+            arguments.frameId)
+
+        if thread_id is not None:
+            self.api.request_array_slice_json(py_db, request, thread_id)
+        else:
+            response = pydevd_schema.Response(
+                request.seq, success=False, command=request.command,
+                message='Unable to find thread for evaluation.', body={})
+            return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+    def on_pydevdreferrers_request(self, py_db, request):
+        '''
+        :param PydevdReferrersRequest request:
+        '''
+        arguments = request.arguments  # : :type arguments: PydevdReferrersArguments
+        thread_id = py_db.suspended_frames_manager.get_thread_id_for_variable_reference(
+            arguments.frameId)
+
+        if thread_id is not None:
+            self.api.request_referrers_json(py_db, request, thread_id)
+        else:
+            response = pydevd_schema.Response(
+                request.seq, success=False, command=request.command,
+                message='Unable to find thread for evaluation.', body={})
+            return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
     def on_setexpression_request(self, py_db, request):
         # : :type arguments: SetExpressionArguments
         arguments = request.arguments
@@ -778,7 +843,7 @@ class PyDevJsonCommandProcessor(object):
         if thread_id is not None:
             self.api.request_set_expression_json(py_db, request, thread_id)
         else:
-            body = SetExpressionResponseBody('')
+            body = pydevd_schema.SetExpressionResponseBody('')
             response = pydevd_base_schema.build_response(
                 request,
                 kwargs={
@@ -812,7 +877,7 @@ class PyDevJsonCommandProcessor(object):
             self.api.request_get_variable_json(py_db, request, thread_id)
         else:
             variables = []
-            body = VariablesResponseBody(variables)
+            body = pydevd_schema.VariablesResponseBody(variables)
             variables_response = pydevd_base_schema.build_response(request, kwargs={
                 'body': body,
                 'success': False,
@@ -828,7 +893,7 @@ class PyDevJsonCommandProcessor(object):
             response = pydevd_base_schema.build_response(
                 request,
                 kwargs={
-                    'body': SetVariableResponseBody(''),
+                    'body': pydevd_schema.SetVariableResponseBody(''),
                     'success': False,
                     'message': 'Cannot change return value'
                 })
@@ -843,7 +908,7 @@ class PyDevJsonCommandProcessor(object):
             response = pydevd_base_schema.build_response(
                 request,
                 kwargs={
-                    'body': SetVariableResponseBody(''),
+                    'body': pydevd_schema.SetVariableResponseBody(''),
                     'success': False,
                     'message': 'Unable to find thread to evaluate variable reference.'
                 })
@@ -852,7 +917,7 @@ class PyDevJsonCommandProcessor(object):
     def on_modules_request(self, py_db, request):
         modules_manager = py_db.cmd_factory.modules_manager  # : :type modules_manager: ModulesManager
         modules_info = modules_manager.get_modules_info()
-        body = ModulesResponseBody(modules_info)
+        body = pydevd_schema.ModulesResponseBody(modules_info)
         variables_response = pydevd_base_schema.build_response(request, kwargs={'body': body})
         return NetCommand(CMD_RETURN, 0, variables_response, is_json=True)
 
@@ -863,18 +928,19 @@ class PyDevJsonCommandProcessor(object):
         source_reference = request.arguments.sourceReference
         server_filename = None
         content = None
+        message = None
 
         if source_reference != 0:
             server_filename = pydevd_file_utils.get_server_filename_from_source_reference(source_reference)
             if server_filename:
-                # Try direct file access first - it's much faster when available.
+                # Try direct file access first - it's much faster when available (and the
+                # contents are cached until the file changes).
                 try:
-                    with open(server_filename, 'r') as stream:
-                        content = stream.read()
-                except:
-                    pass
+                    content = self._source_cache.get_content(server_filename)
+                except SourceTooBigError as e:
+                    message = str(e)
 
-                if content is None:
+                if content is None and message is None:
                     # File might not exist at all, or we might not have a permission to read it,
                     # but it might also be inside a zipfile, or an IPython cell. In this case,
                     # linecache might still be able to retrieve the source.
@@ -884,17 +950,21 @@ class PyDevJsonCommandProcessor(object):
                     # If we didn't get at least one line back, reset it to None so that it's
                     # reported as error below, and not as an empty file.
                     content = ''.join(lines) or None
+                    if content is not None and len(content) > MAX_SOURCE_SIZE:
+                        content = None
+                        message = 'Source too big to be sent (maximum: %s).' % (MAX_SOURCE_SIZE,)
 
-        body = SourceResponseBody(content or '')
+        body = pydevd_schema.SourceResponseBody(content or '')
         response_args = {'body': body}
 
         if content is None:
-            if source_reference == 0:
-                message = 'Source unavailable'
-            elif server_filename:
-                message = 'Unable to retrieve source for %s' % (server_filename,)
-            else:
-                message = 'Invalid sourceReference %d' % (source_reference,)
+            if message is None:
+                if source_reference == 0:
+                    message = 'Source unavailable'
+                elif server_filename:
+                    message = 'Unable to retrieve source for %s' % (server_filename,)
+                else:
+                    message = 'Invalid sourceReference %d' % (source_reference,)
             response_args.update({'success': False, 'message': message})
 
         response = pydevd_base_schema.build_response(request, kwargs=response_args)
@@ -909,7 +979,7 @@ class PyDevJsonCommandProcessor(object):
             'label': '%s:%s' % (path, line),
             'line': line
         }
-        body = GotoTargetsResponseBody(targets=[target])
+        body = pydevd_schema.GotoTargetsResponseBody(targets=[target])
         response_args = {'body': body}
         response = pydevd_base_schema.build_response(request, kwargs=response_args)
         return NetCommand(CMD_RETURN, 0, response, is_json=True)
@@ -1004,6 +1074,61 @@ class PyDevJsonCommandProcessor(object):
             'process': process_info,
             'pydevd': pydevd_info,
         }
+        if py_db.inherited_config.applied:
+            body['inheritedConfig'] = True
+
+        arguments = request.arguments  # : :type arguments: PydevdSystemInfoArguments
+        if arguments.compactEncoding:
+            # Note: enabled before the response is created (the client must be able to read it either way).
+            body['compactEncoding'] = self.api.set_compact_encoding(py_db, True)
+
+        response = pydevd_base_schema.build_response(request, kwargs={'body': body})
+        return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+    def on_pydevdstartprofiler_request(self, py_db, request):
+        '''
+        :param PydevdStartProfilerRequest request:
+        '''
+        arguments = request.arguments  # : :type arguments: PydevdStartProfilerArguments
+        interval = flush_interval = max_depth = None
+        if arguments is not None:
+            interval = arguments.interval
+            flush_interval = arguments.flushInterval
+            max_depth = arguments.maxDepth
+
+        if not interval or interval <= 0:
+            interval = pydevd_sampling_profiler.DEFAULT_INTERVAL
+        if not flush_interval or flush_interval <= 0:
+            flush_interval = pydevd_sampling_profiler.DEFAULT_FLUSH_INTERVAL
+        if not max_depth or max_depth <= 0:
+            max_depth = pydevd_sampling_profiler.DEFAULT_MAX_DEPTH
+
+        self.api.start_sampling_profiler(py_db, interval, flush_interval, max_depth)
+        response = pydevd_base_schema.build_response(request)
+        return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+    def on_pydevdstopprofiler_request(self, py_db, request):
+        '''
+        :param PydevdStopProfilerRequest request:
+        '''
+        self.api.stop_sampling_profiler(py_db)
+        response = pydevd_base_schema.build_response(request)
+        return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+    def on_pydevdstats_request(self, py_db, request):
+        '''
+        :param PydevdStatsRequest request:
+        '''
+        body = self.api.get_stats(py_db)
+        response = pydevd_base_schema.build_response(request, kwargs={'body': body})
+        return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+    def on_pydevdrunwithinheritedconfig_request(self, py_db, request):
+        '''
+        :param PydevdRunWithInheritedConfigRequest request:
+        '''
+        running = self.api.run_with_inherited_config(py_db)
+        body = pydevd_schema.PydevdRunWithInheritedConfigResponseBody(running=running)
         response = pydevd_base_schema.build_response(request, kwargs={'body': body})
         return NetCommand(CMD_RETURN, 0, response, is_json=True)
 
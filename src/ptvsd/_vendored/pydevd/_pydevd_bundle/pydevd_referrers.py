@@ -1,4 +1,6 @@
+import gc
 import sys
+import time
 from _pydevd_bundle import pydevd_xml
 from os.path import basename
 import traceback
@@ -61,13 +63,281 @@ def print_referrers(obj, stream=None):
     return result
 
 
+#===================================================================================================
+# ReferrersIndex
+#===================================================================================================
+class _ReferrersList(list):
+    '''
+    Used for the lists in the index (so that those can be told apart from the referrers found
+    in the program).
+    '''
+
+    __slots__ = []
+
+
+class ReferrersIndex(object):
+    '''
+    Reverse-reference index (id(referent) -> referrers) of the objects tracked by the garbage
+    collector.
+
+    gc.get_referrers() scans all the tracked objects on each call, so, while the program is
+    suspended an index may be built once (usually in a separate thread, as building it is much
+    slower than a single gc.get_referrers() call) and then reused for all the queries.
+
+    Note: the index keeps all the objects alive, so, it must be cancelled when the program is
+    resumed. It also uses a lot of memory: a list with all the tracked objects plus, for each
+    object referenced, a dict entry and a list of its referrers (in the order of 100 bytes for
+    each object), so, `max_objects` may be used to avoid building it in big processes.
+    '''
+
+    def __init__(self, max_objects=None):
+        '''
+        :param int max_objects:
+            If there are more tracked objects than this, the index isn't built (see: `too_big`).
+        '''
+        self._max_objects = max_objects
+        self._objects = None
+        self._next = 0
+        self._id_to_referrers = {}
+        self._cancelled = False
+        self.complete = False
+        self.too_big = False
+
+    def build(self, timeout=None):
+        '''
+        Continues building the index.
+
+        :param float timeout:
+            The maximum time (in seconds) to spend building the index (None means no limit).
+
+        :return bool:
+            Whether the index is complete.
+        '''
+        if self.complete or self._cancelled or self.too_big:
+            return self.complete
+
+        if self._objects is None:
+            objects = gc.get_objects()
+            if self._max_objects is not None and len(objects) > self._max_objects:
+                pydev_log.info('Not building referrers index: %s objects (max: %s).', len(objects), self._max_objects)
+                self.too_big = True
+                return False
+            self._objects = objects
+            objects = None
+
+        objects = self._objects
+        id_to_referrers = self._id_to_referrers
+        get_referents = gc.get_referents
+        initial_time = time.time()
+        i = self._next
+        total = len(objects)
+        while i < total:
+            if self._cancelled:
+                break
+
+            # Check the time/cancellation only at each 1000 objects.
+            for j in range(i, min(i + 1000, total)):
+                obj = objects[j]
+                for referent in get_referents(obj):
+                    referrers = id_to_referrers.get(id(referent))
+                    if referrers is None:
+                        id_to_referrers[id(referent)] = _ReferrersList((obj,))
+                    else:
+                        referrers.append(obj)
+            i = min(i + 1000, total)
+            if timeout is not None and time.time() - initial_time > timeout:
+                break
+
+        obj = None
+        referent = None
+        objects = None
+        self._next = i
+        if self._cancelled:
+            self._clear()
+        elif i >= total:
+            self.complete = True
+        return self.complete
+
+    def cancel(self):
+        '''
+        Stops building the index and releases the objects referenced (may be called from any thread).
+        '''
+        self._cancelled = True
+        self.complete = False
+        self._clear()
+
+    def _clear(self):
+        self._id_to_referrers = {}
+        self._objects = None
+
+    def get_referrers(self, searched_obj):
+        '''
+        :return list:
+            The referrers of the given object (the index must be complete).
+        '''
+        assert self.complete
+        referrers = self._id_to_referrers.get(id(searched_obj), ())
+
+        # The object graph may have changed after the index was built.
+        return [r for r in referrers if _refers_to(r, searched_obj)]
+
+    def is_internal(self, obj):
+        return obj is self._objects or type(obj) is _ReferrersList
+
+
+def _refers_to(referrer, searched_obj):
+    for referent in gc.get_referents(referrer):
+        if referent is searched_obj:
+            return True
+    return False
+
+
+def _get_dict_owners(dicts, referrers_index):
+    '''
+    :return dict:
+        id(d) -> the object whose __dict__ is d (for each of the given dicts whose owner is found).
+    '''
+    if referrers_index is not None and referrers_index.complete:
+        candidates = []
+        for d in dicts:
+            candidates.extend(referrers_index.get_referrers(d))
+    else:
+        # Note: a single scan of all the objects for all the dicts.
+        candidates = gc.get_referrers(*dicts)
+
+    dict_ids = set(id(d) for d in dicts)
+    owners = {}
+    for x in candidates:
+        try:
+            d = getattr(x, '__dict__', None)
+        except:
+            continue  # Just ignore any error here (i.e.: ReferenceError, etc.)
+        if d is not None and id(d) in dict_ids and id(d) not in owners:
+            owners[id(d)] = x
+    return owners
+
+
+#===================================================================================================
+# get_referrers
+#===================================================================================================
+def get_referrers(searched_obj, max_results=None, time_budget=None, referrers_index=None):
+    '''
+    :param int max_results:
+        The maximum number of referrers to be returned (None means no limit).
+
+    :param float time_budget:
+        The time (in seconds) after which no more referrers are collected (None means no limit).
+
+        Note: the initial scan (gc.get_referrers()) can't be interrupted, so, it's only checked
+        after it (before each referrer and before the scan to find the owners of dict referrers,
+        which is skipped if the budget is exhausted -- in which case the dicts are returned).
+
+    :param ReferrersIndex referrers_index:
+        If given and complete, the index is used to find the referrers (otherwise
+        gc.get_referrers() is used).
+
+    :return tuple(list(tuple(object, str)), bool):
+        The (referrer, found_as) for each referrer found and whether the results were truncated
+        (because of the max_results or of the time_budget).
+
+        Note: the referrer may be the object owning a dict referrer (i.e.: the instance whose
+        __dict__ has the searched object) and found_as is an empty string when it's not known
+        how the referrer refers to the searched object.
+    '''
+    initial_time = time.time()
+
+    if referrers_index is not None and referrers_index.complete:
+        referrers = referrers_index.get_referrers(searched_obj)
+    else:
+        referrers = gc.get_referrers(searched_obj)
+
+    curr_frame = sys._getframe()
+    frame_type = type(curr_frame)
+
+    ret = []
+    dict_indexes = []
+    truncated = False
+    try:
+        for r in referrers:
+            if r is referrers or r is curr_frame.f_locals:
+                continue
+
+            if referrers_index is not None and referrers_index.is_internal(r):
+                continue
+
+            r_type = type(r)
+            if r_type == frame_type:
+                if basename(r.f_code.co_filename).startswith('pydev'):
+                    continue  # Skip the references we may add ourselves
+
+            if max_results is not None and len(ret) >= max_results:
+                truncated = True
+                break
+
+            if time_budget is not None and time.time() - initial_time > time_budget:
+                truncated = True
+                break
+
+            found_as = ''
+            if r_type == frame_type:
+                for key, val in r.f_locals.items():
+                    if val is searched_obj:
+                        found_as = key
+                        break
+
+            elif r_type == dict:
+                # Try to check if it's a value in the dict (and under which key it was found)
+                for key, val in r.items():
+                    if val is searched_obj:
+                        found_as = key
+                        break
+
+                # Ok, there's one annoying thing: many times we find it in a dict from an instance,
+                # but with this we don't directly have the class, only the dict, so, to workaround
+                # that we get the object which has the given dict (for all the dicts at once below).
+                dict_indexes.append(len(ret))
+
+            elif r_type in (tuple, list):
+                for i, x in enumerate(r):
+                    if x is searched_obj:
+                        found_as = '%s[%s]' % (r_type.__name__, i)
+                        break
+
+            if not isinstance(found_as, str):
+                found_as = str(found_as)
+
+            ret.append((r, found_as))
+
+        if dict_indexes and (time_budget is None or time.time() - initial_time <= time_budget):
+            owners = _get_dict_owners([ret[i][0] for i in dict_indexes], referrers_index)
+            for i in dict_indexes:
+                r, found_as = ret[i]
+                owner = owners.get(id(r))
+                if owner is not None:
+                    ret[i] = (owner, found_as)
+    finally:
+        # Don't keep dangling references from this frame to any of our objects.
+        referrers = None
+        searched_obj = None
+        curr_frame = None
+        r = None
+        x = None
+        key = None
+        val = None
+        owner = None
+        owners = None
+
+    return ret, truncated
+
+
 #===================================================================================================
 # get_referrer_info
 #===================================================================================================
-def get_referrer_info(searched_obj):
-    DEBUG = 0
-    if DEBUG:
-        sys.stderr.write('Getting referrers info.\n')
+def get_referrer_info(searched_obj, max_results=None, time_budget=None, referrers_index=None):
+    '''
+    :return str:
+        The referrers of the given object as xml (see: get_referrers for the parameters).
+    '''
     try:
         try:
             if searched_obj is None:
@@ -86,10 +356,8 @@ def get_referrer_info(searched_obj):
             obj_id = id(searched_obj)
 
             try:
-                if DEBUG:
-                    sys.stderr.write('Getting referrers...\n')
-                import gc
-                referrers = gc.get_referrers(searched_obj)
+                referrers, _truncated = get_referrers(
+                    searched_obj, max_results=max_results, time_budget=time_budget, referrers_index=referrers_index)
             except:
                 pydev_log.exception()
                 ret = ['<xml>\n']
@@ -104,124 +372,27 @@ def get_referrer_info(searched_obj):
                 ret = ''.join(ret)
                 return ret
 
-            if DEBUG:
-                sys.stderr.write('Found %s referrers.\n' % (len(referrers),))
-
-            curr_frame = sys._getframe()
-            frame_type = type(curr_frame)
-
-            # Ignore this frame and any caller frame of this frame
-
-            ignore_frames = {}  # Should be a set, but it's not available on all python versions.
-            while curr_frame is not None:
-                if basename(curr_frame.f_code.co_filename).startswith('pydev'):
-                    ignore_frames[curr_frame] = 1
-                curr_frame = curr_frame.f_back
-
             ret = ['<xml>\n']
 
             ret.append('<for>\n')
-            if DEBUG:
-                sys.stderr.write('Searching Referrers of obj with id="%s"\n' % (obj_id,))
-
             ret.append(pydevd_xml.var_to_xml(
                 searched_obj,
                 'Referrers of obj with id="%s"' % (obj_id,)))
             ret.append('</for>\n')
 
-            curr_frame = sys._getframe()
-            all_objects = None
-
-            for r in referrers:
-                try:
-                    if r in ignore_frames:
-                        continue  # Skip the references we may add ourselves
-                except:
-                    pass  # Ok: unhashable type checked...
-
-                if r is referrers:
-                    continue
-
-                if r is curr_frame.f_locals:
-                    continue
-
-                r_type = type(r)
-                r_id = str(id(r))
-
-                representation = str(r_type)
-
-                found_as = ''
-                if r_type == frame_type:
-                    if DEBUG:
-                        sys.stderr.write('Found frame referrer: %r\n' % (r,))
-                    for key, val in r.f_locals.items():
-                        if val is searched_obj:
-                            found_as = key
-                            break
-
-                elif r_type == dict:
-                    if DEBUG:
-                        sys.stderr.write('Found dict referrer: %r\n' % (r,))
-
-                    # Try to check if it's a value in the dict (and under which key it was found)
-                    for key, val in r.items():
-                        if val is searched_obj:
-                            found_as = key
-                            if DEBUG:
-                                sys.stderr.write('    Found as %r in dict\n' % (found_as,))
-                            break
-
-                    # Ok, there's one annoying thing: many times we find it in a dict from an instance,
-                    # but with this we don't directly have the class, only the dict, so, to workaround that
-                    # we iterate over all reachable objects ad check if one of those has the given dict.
-                    if all_objects is None:
-                        all_objects = gc.get_objects()
-
-                    for x in all_objects:
-                        try:
-                            if getattr(x, '__dict__', None) is r:
-                                r = x
-                                r_type = type(x)
-                                r_id = str(id(r))
-                                representation = str(r_type)
-                                break
-                        except:
-                            pass  # Just ignore any error here (i.e.: ReferenceError, etc.)
-
-                elif r_type in (tuple, list):
-                    if DEBUG:
-                        sys.stderr.write('Found tuple referrer: %r\n' % (r,))
-
-                    for i, x in enumerate(r):
-                        if x is searched_obj:
-                            found_as = '%s[%s]' % (r_type.__name__, i)
-                            if DEBUG:
-                                sys.stderr.write('    Found as %s in tuple: \n' % (found_as,))
-                            break
-
+            for r, found_as in referrers:
                 if found_as:
-                    if not isinstance(found_as, str):
-                        found_as = str(found_as)
                     found_as = ' found_as="%s"' % (pydevd_xml.make_valid_xml_value(found_as),)
 
                 ret.append(pydevd_xml.var_to_xml(
                     r,
-                    representation,
-                    additional_in_xml=' id="%s"%s' % (r_id, found_as)))
+                    str(type(r)),
+                    additional_in_xml=' id="%s"%s' % (id(r), found_as)))
         finally:
-            if DEBUG:
-                sys.stderr.write('Done searching for references.\n')
-
             # If we have any exceptions, don't keep dangling references from this frame to any of our objects.
-            all_objects = None
             referrers = None
             searched_obj = None
             r = None
-            x = None
-            key = None
-            val = None
-            curr_frame = None
-            ignore_frames = None
     except:
         pydev_log.exception()
         ret = ['<xml>\n']
@@ -239,4 +410,3 @@ def get_referrer_info(searched_obj):
     ret.append('</xml>')
     ret = ''.join(ret)
     return ret
-
@@ -0,0 +1,158 @@
+'''
+Sampling profiler: periodically takes a snapshot of the stacks of all the (non-pydevd) threads
+without installing any trace function and sends the collapsed stacks with the number of times
+each stack was seen in a `pydevdProfilerSamples` event (which can be used to create flame graphs).
+
+Each collapsed stack is a string with the thread name and the functions from the root to the
+leaf separated by ';' (i.e.: `MainThread;<module> (main.py:1);compute (main.py:10)`).
+'''
+import os
+import weakref
+
+from _pydev_bundle import pydev_log
+from _pydev_imps._pydev_saved_modules import threading, time
+from _pydevd_bundle._debug_adapter.pydevd_base_schema import lazy_schema as pydevd_schema
+from _pydevd_bundle.pydevd_additional_thread_info_regular import _current_frames
+from _pydevd_bundle.pydevd_comm import PyDBDaemonThread
+from _pydevd_bundle.pydevd_comm_constants import CMD_PROFILER_SAMPLES_EVENT
+from _pydevd_bundle.pydevd_constants import dict_items
+from _pydevd_bundle.pydevd_net_command import NetCommand
+
+DEFAULT_INTERVAL = 0.01
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_MAX_DEPTH = 128
+
+
+class SamplingProfilerThread(PyDBDaemonThread):
+
+    def __init__(self, py_db, interval=DEFAULT_INTERVAL, flush_interval=DEFAULT_FLUSH_INTERVAL, max_depth=DEFAULT_MAX_DEPTH):
+        '''
+        :param float interval:
+            The time (in seconds) between each sample.
+
+        :param float flush_interval:
+            The time (in seconds) between each `pydevdProfilerSamples` event.
+
+        :param int max_depth:
+            The maximum number of frames in each stack (the frames closer to the
+            root are replaced by '...').
+        '''
+        PyDBDaemonThread.__init__(self, py_db)
+        self.setName('pydevd.SamplingProfiler')
+        self._interval = interval
+        self._flush_interval = flush_interval
+        self._max_depth = max_depth
+        self._stop_event = threading.Event()
+
+        # Code object -> label (or '' if it's an internal pydevd code which shouldn't be shown).
+        # Note: weakly-keyed so that sampling a long running process (which may keep creating
+        # code objects, i.e.: with exec/eval or reloading modules) doesn't keep them alive.
+        self._code_to_label = weakref.WeakKeyDictionary()
+
+        # Collapsed stack -> number of times it was seen since the last flush.
+        self._stack_to_count = {}
+        self._sample_count = 0
+
+    def _get_label(self, py_db, frame):
+        if py_db.get_file_type(frame) == py_db.PYDEV_FILE:
+            return ''
+        f_code = frame.f_code
+        return '%s (%s:%s)' % (f_code.co_name, os.path.basename(f_code.co_filename), f_code.co_firstlineno)
+
+    def _sample(self, py_db):
+        pydevd_thread_idents = set()
+        ident_to_name = {}
+        for t in threading.enumerate():
+            if getattr(t, 'is_pydev_daemon_thread', False):
+                pydevd_thread_idents.add(t.ident)
+            else:
+                ident_to_name[t.ident] = t.name
+
+        code_to_label = self._code_to_label
+        stack_to_count = self._stack_to_count
+        max_depth = self._max_depth
+        try:
+            for ident, frame in dict_items(_current_frames()):
+                if ident in pydevd_thread_idents:
+                    continue
+
+                stack = []
+                depth = 0
+                while frame is not None and depth < max_depth:
+                    f_code = frame.f_code
+                    label = code_to_label.get(f_code)
+                    if label is None:
+                        label = code_to_label[f_code] = self._get_label(py_db, frame)
+                    if label:
+                        stack.append(label)
+                    frame = frame.f_back
+                    depth += 1
+
+                if frame is not None:
+                    stack.append('...')
+
+                if not stack:
+                    continue
+
+                stack.append(ident_to_name.get(ident, 'Thread-%s' % (ident,)))
+                stack.reverse()
+                key = ';'.join(stack)
+                stack_to_count[key] = stack_to_count.get(key, 0) + 1
+        finally:
+            frame = None
+
+        self._sample_count += 1
+
+    def _flush(self, py_db, final=False):
+        stack_to_count = self._stack_to_count
+        if not stack_to_count and not final:
+            return
+
+        self._stack_to_count = {}
+        sample_count = self._sample_count
+        self._sample_count = 0
+
+        body = pydevd_schema.PydevdProfilerSamplesEventBody(
+            samples=[{'stack': stack, 'count': count} for stack, count in dict_items(stack_to_count)],
+            sampleCount=sample_count,
+            interval=self._interval,
+            final=final,
+        )
+        event = pydevd_schema.PydevdProfilerSamplesEvent(body)
+        py_db.writer.add_command(NetCommand(CMD_PROFILER_SAMPLES_EVENT, 0, event, is_json=True))
+
+    def _on_run(self):
+        next_flush = time.time() + self._flush_interval
+        while not self._kill_received and not self._stop_event.is_set():
+            py_db = self.py_db
+            if py_db is None or py_db.writer is None:
+                return
+
+            try:
+                self._sample(py_db)
+                if time.time() >= next_flush:
+                    self._flush(py_db)
+                    next_flush = time.time() + self._flush_interval
+            except:
+                pydev_log.exception('Error in sampling profiler.')
+                return
+            finally:
+                py_db = None
+
+            self._stop_event.wait(self._interval)
+
+        py_db = self.py_db
+        if py_db is not None and py_db.writer is not None:
+            self._flush(py_db, final=True)
+
+    def stop(self, timeout=None):
+        '''
+        Stops the sampling (the remaining samples are sent in a final event).
+        '''
+        self._stop_event.set()
+        if self.is_alive() and self is not threading.current_thread():
+            self.join(timeout)
+
+    def do_kill_pydev_thread(self):
+        PyDBDaemonThread.do_kill_pydev_thread(self)
+        self._stop_event.set()
@@ -0,0 +1,66 @@
+'''
+Cache for the contents of the sources sent to the client in `source` requests.
+
+Entries are keyed by the filename and validated with the file mtime and size, so, a source is
+only read again from the disk if it changed. The cache holds at most `max_cache_size` characters
+(least recently used entries are evicted first) and sources bigger than `max_source_size` are
+not read at all.
+'''
+from collections import OrderedDict
+import os
+
+from _pydev_imps._pydev_saved_modules import threading
+
+
+class SourceTooBigError(Exception):
+    pass
+
+
+class SourceCache(object):
+
+    def __init__(self, max_source_size, max_cache_size):
+        self.max_source_size = max_source_size
+        self.max_cache_size = max_cache_size
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()  # filename -> (mtime, size, content)
+        self._cache_size = 0
+
+    def get_content(self, filename):
+        '''
+        :return str:
+            The contents of the given file or None if it could not be read.
+
+        :raise SourceTooBigError:
+            If the file is bigger than `max_source_size`.
+        '''
+        try:
+            stat = os.stat(filename)
+        except:
+            return None
+
+        if stat.st_size > self.max_source_size:
+            raise SourceTooBigError('Source too big to be sent (%s bytes, maximum: %s).' % (
+                stat.st_size, self.max_source_size))
+
+        with self._lock:
+            entry = self._cache.pop(filename, None)
+            if entry is not None:
+                if entry[:2] == (stat.st_mtime, stat.st_size):
+                    self._cache[filename] = entry  # Move to the end (most recently used).
+                    return entry[2]
+                self._cache_size -= len(entry[2])
+
+        try:
+            with open(filename, 'r') as stream:
+                content = stream.read()
+        except:
+            return None
+
+        with self._lock:
+            if len(content) <= self.max_cache_size and filename not in self._cache:
+                self._cache[filename] = (stat.st_mtime, stat.st_size, content)
+                self._cache_size += len(content)
+                while self._cache_size > self.max_cache_size:
+                    _filename, (_mtime, _size, evicted) = self._cache.popitem(last=False)
+                    self._cache_size -= len(evicted)
+        return content
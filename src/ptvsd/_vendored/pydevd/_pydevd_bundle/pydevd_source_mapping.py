@@ -88,6 +88,10 @@ class SourceMapping(object):
 
     def map_to_client(self, filename, lineno):
         # Note: the filename must be normalized to the client after this point.
+        if filename not in self._mappings_to_client:
+            # Fast path: no mapping has the given file as its runtime source.
+            return filename, lineno, False
+
         key = (filename, lineno, 'client')
         try:
             return self._cache[key]
@@ -0,0 +1,174 @@
+'''
+Counters used to check the debugger overhead (a snapshot is provided in the `pydevdStats` request).
+
+The counters updated when tracing are kept in the PyDBAdditionalThreadInfo of each thread (so,
+updating those is just an attribute increment -- which is almost free in cython) and for the
+caches only the misses are counted (counting the hits would add overhead to the fast paths). The
+remaining info (cache sizes and memory, queue sizes) is only collected when a snapshot is requested.
+'''
+import sys
+import time
+
+from _pydev_imps._pydev_saved_modules import threading
+from _pydevd_bundle.pydevd_constants import ForkSafeLock, dict_items
+
+_lock = ForkSafeLock()
+
+# Cache name -> cache (a dict or set which is only checked for its size and memory).
+_caches = {}
+
+# Cache name -> maximum number of entries (for the caches which are bounded).
+_cache_max_sizes = {}
+
+# Cache name -> number of misses.
+_cache_misses = {}
+
+_suspend_count = 0
+_suspend_total_time = 0.0
+_suspend_max_time = 0.0
+_suspend_last_time = 0.0
+
+
+def register_cache(name, cache, max_size=None):
+    _caches[name] = cache
+    if max_size is not None:
+        _cache_max_sizes[name] = max_size
+
+
+def unregister_cache(name):
+    _caches.pop(name, None)
+    _cache_max_sizes.pop(name, None)
+    _cache_misses.pop(name, None)
+
+
+def on_cache_miss(name):
+    # Note: no lock here (the counters are approximate if updated from multiple threads).
+    _cache_misses[name] = _cache_misses.get(name, 0) + 1
+
+
+def on_suspend_finished(initial_time):
+    '''
+    :param float initial_time:
+        The time.time() when the thread was suspended.
+    '''
+    global _suspend_count, _suspend_total_time, _suspend_max_time, _suspend_last_time
+
+    elapsed = time.time() - initial_time
+    with _lock:
+        _suspend_count += 1
+        _suspend_total_time += elapsed
+        _suspend_last_time = elapsed
+        if elapsed > _suspend_max_time:
+            _suspend_max_time = elapsed
+
+
+def _get_memory_size(cache):
+    '''
+    :return int:
+        An estimate of the memory used by the given cache (in bytes) or -1 if it's not available.
+        Objects referenced more than once (i.e.: interned paths) are counted only once.
+    '''
+    try:
+        if isinstance(cache, dict):
+            items = list(cache.items())
+        else:
+            items = [(key,) for key in cache]
+
+        seen = set()
+        size = sys.getsizeof(cache)
+        for item in items:
+            for obj in item:
+                if obj.__class__ in (tuple, list):
+                    contents = obj
+                    size += sys.getsizeof(obj)
+                else:
+                    contents = (obj,)
+
+                for o in contents:
+                    if id(o) not in seen:
+                        seen.add(id(o))
+                        size += sys.getsizeof(o)
+        return size
+    except:
+        return -1  # i.e.: changed while iterating or sys.getsizeof not available.
+
+
+def _get_cache_stats(name, cache):
+    stats = {
+        'size': len(cache),
+        'misses': _cache_misses.get(name, 0),
+        'memory': _get_memory_size(cache),
+    }
+    max_size = _cache_max_sizes.get(name)
+    if max_size is not None:
+        stats['maxSize'] = max_size
+    return stats
+
+
+def _get_trace_dispatch_stats():
+    calls = 0
+    skip_cache_hits = 0
+    threads = 0
+    for t in threading.enumerate():
+        additional_info = getattr(t, 'additional_info', None)
+        if additional_info is None:
+            continue
+        threads += 1
+        calls += additional_info.trace_dispatch_calls
+        skip_cache_hits += additional_info.trace_dispatch_skip_cache_hits
+
+    return {
+        'calls': calls,
+        'skipCacheHits': skip_cache_hits,
+        'threads': threads,
+    }
+
+
+def _get_queue_size(queue):
+    try:
+        return queue.qsize()
+    except:
+        return -1  # Not available in this platform.
+
+
+def get_stats(py_db):
+    '''
+    :return dict:
+        A snapshot with the current counters (which may be converted to json).
+    '''
+    caches = {}
+    for name, cache in list(dict_items(_caches)):
+        caches[name] = _get_cache_stats(name, cache)
+
+    for name, cache in (
+            ('filesFilter', py_db._apply_filter_cache),
+            ('projectScope', py_db._in_project_scope_cache),
+        ):
+        caches[name] = _get_cache_stats(name, cache)
+
+    writer = py_db.writer
+    writer_queue_size = 0
+    if writer is not None:
+        writer_queue_size = _get_queue_size(writer._cmd_queue)
+
+    internal_commands = {}
+    for thread_id, queue in dict_items(py_db._cmd_queue):
+        internal_commands[str(thread_id)] = _get_queue_size(queue)
+
+    with _lock:
+        suspends = {
+            'count': _suspend_count,
+            'totalTime': _suspend_total_time,
+            'maxTime': _suspend_max_time,
+            'lastTime': _suspend_last_time,
+        }
+
+    return {
+        'traceDispatch': _get_trace_dispatch_stats(),
+        'caches': caches,
+        'queues': {
+            'writer': writer_queue_size,
+            'internalCommands': internal_commands,
+        },
+        'suspends': suspends,
+    }
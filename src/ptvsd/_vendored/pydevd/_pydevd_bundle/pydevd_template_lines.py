@@ -0,0 +1,96 @@
+'''
+Caches used by the template plugins (Django/Jinja2) to map template positions to lines.
+
+These are checked on each render call when template breakpoints are set, so, instead of
+re-reading/re-scanning the template each time, the offsets of the lines of a template file are
+computed once (and recomputed only if the file mtime/size changes) and looked up with bisect
+and the line mappings of compiled templates are computed once per template.
+'''
+from bisect import bisect_left
+import os
+import re
+
+from _pydevd_bundle.pydevd_constants import IS_PY2
+
+_NEW_LINE_RE = re.compile(r'\r\n|\r|\n')
+
+# filename -> (mtime, size, text_len, offsets where each line break starts)
+_filename_to_line_breaks = {}
+
+# key -> dict(line -> mapped line)
+_key_to_line_mapping = {}
+
+
+def _read_file(filename):
+    # type: (str) -> str
+    if IS_PY2:
+        f = open(filename, 'r')
+    else:
+        f = open(filename, 'r', encoding='utf-8', errors='replace')
+    try:
+        return f.read()
+    finally:
+        f.close()
+
+
+def _get_line_breaks(filename):
+    stat = os.stat(filename)
+    entry = _filename_to_line_breaks.get(filename)
+    if entry is not None and entry[0] == stat.st_mtime and entry[1] == stat.st_size:
+        return entry[2], entry[3]
+
+    text = _read_file(filename)
+    line_breaks = [m.start() for m in _NEW_LINE_RE.finditer(text)]
+    _filename_to_line_breaks[filename] = (stat.st_mtime, stat.st_size, len(text), line_breaks)
+    return len(text), line_breaks
+
+
+def offset_to_line_number(filename, offset):
+    '''
+    :param str filename:
+        The template file.
+
+    :param int offset:
+        The offset (in chars) in the contents of the file.
+
+    :return int:
+        The 1-based line for the given offset or -1 if the offset is after the end of the file
+        (a '\\r\\n' counts as a single line break).
+
+    :raise EnvironmentError:
+        If the file could not be read.
+    '''
+    text_len, line_breaks = _get_line_breaks(filename)
+    if offset > text_len:
+        return -1
+    return bisect_left(line_breaks, offset) + 1
+
+
+def get_mapped_line(key, line, get_line_pairs):
+    '''
+    :param key:
+        A (hashable) key which identifies the mapping (i.e.: the debug info of a compiled template).
+
+    :param int line:
+        The line to be mapped.
+
+    :param callable get_line_pairs:
+        Called (only once for each key) to get a list of (mapped line, line) tuples (if a line
+        appears more than once, the first one is used).
+
+    :return int|None:
+        The mapped line or None if it's not available.
+    '''
+    try:
+        mapping = _key_to_line_mapping[key]
+    except KeyError:
+        mapping = {}
+        for mapped_line, pair_line in get_line_pairs():
+            mapping.setdefault(pair_line, mapped_line)
+        _key_to_line_mapping[key] = mapping
+    return mapping.get(line)
+
+
+def clear_caches():
+    _filename_to_line_breaks.clear()
+    _key_to_line_mapping.clear()
@@ -0,0 +1,182 @@
+'''
+Coalesces the thread lifecycle notifications (`thread` events with the `started`/`exited` reasons).
+
+Programs which use thread pools may start and stop lots of short-lived threads, so, instead of sending
+one event for each thread as soon as it's noticed, the notifications are kept pending and are sent in
+batches (at most once every `delay` seconds). A thread which starts and exits before its `started`
+notification is sent isn't reported at all and, optionally, threads are only reported after they're
+alive for `min_lifetime` seconds.
+
+The pending notifications are always sent before a thread is reported as suspended and before the
+response to a `threads` request (so, the client always knows about the threads it sees).
+'''
+from _pydev_bundle import pydev_log
+from _pydev_imps._pydev_saved_modules import threading, time
+from _pydevd_bundle.pydevd_comm import PyDBDaemonThread
+
+
+class ThreadEventsNotifier(object):
+
+    def __init__(self, py_db, delay, min_lifetime):
+        '''
+        :param float delay:
+            The time (in seconds) between each batch of notifications (if both `delay` and
+            `min_lifetime` are 0 the notifications are sent right away).
+
+        :param float min_lifetime:
+            The time (in seconds) a thread must be alive before its `started` notification
+            is sent.
+        '''
+        self._py_db = py_db
+        self._delay = delay
+        self._min_lifetime = min_lifetime
+        self.immediate = delay <= 0 and min_lifetime <= 0
+
+        self._lock = threading.Lock()
+
+        # thread_id -> (thread, time noticed) for the threads whose `started` notification is pending.
+        self._pending_created = {}
+
+        # The thread ids whose `exited` notification is pending (in the order they exited).
+        self._pending_killed = []
+
+        # The thread ids whose `started` notification was sent.
+        self._notified = set()
+
+        self._flusher_thread = None
+
+    def on_thread_created(self, thread_id, thread):
+        if self.immediate:
+            self._send_created(thread)
+            return
+
+        with self._lock:
+            if thread_id not in self._pending_created and thread_id not in self._notified:
+                self._pending_created[thread_id] = (thread, time.time())
+                self._ensure_flusher_thread()
+
+    def on_thread_killed(self, thread_id):
+        if self.immediate:
+            self._send_killed(thread_id)
+            return
+
+        with self._lock:
+            if self._pending_created.pop(thread_id, None) is not None:
+                # It was never reported as started: just forget about it.
+                return
+
+            if thread_id in self._notified:
+                self._notified.discard(thread_id)
+                self._pending_killed.append(thread_id)
+                self._ensure_flusher_thread()
+
+    def has_pending(self):
+        with self._lock:
+            return bool(self._pending_created or self._pending_killed)
+
+    def flush(self, force=False):
+        '''
+        Sends the pending notifications.
+
+        :param bool force:
+            If True the `started` notifications are sent even for threads which are not alive
+            for `min_lifetime` seconds yet.
+        '''
+        if self.immediate:
+            return
+
+        with self._lock:
+            killed = self._pending_killed
+            self._pending_killed = []
+
+            created = []
+            if self._pending_created:
+                if force or self._min_lifetime <= 0:
+                    created = list(self._pending_created.items())
+                    self._pending_created = {}
+                else:
+                    min_time = time.time() - self._min_lifetime
+                    for thread_id, (thread, noticed_time) in list(self._pending_created.items()):
+                        if noticed_time <= min_time:
+                            created.append((thread_id, (thread, noticed_time)))
+                            del self._pending_created[thread_id]
+
+            created.sort(key=lambda item: item[1][1])
+            for thread_id, _ in created:
+                self._notified.add(thread_id)
+
+        # Note: the exited notifications go first as a thread id may be reused by a new thread.
+        for thread_id in killed:
+            self._send_killed(thread_id)
+
+        for _thread_id, (thread, _noticed_time) in created:
+            self._send_created(thread)
+
+    def clear(self):
+        '''
+        Forgets about all the threads (i.e.: when the thread notifications are disabled
+        or the client reconnects).
+        '''
+        with self._lock:
+            self._pending_created = {}
+            self._pending_killed = []
+            self._notified = set()
+
+    def _send_created(self, thread):
+        writer = self._py_db.writer
+        if writer is not None:
+            writer.add_command(self._py_db.cmd_factory.make_thread_created_message(thread))
+
+    def _send_killed(self, thread_id):
+        writer = self._py_db.writer
+        if writer is not None:
+            writer.add_command(self._py_db.cmd_factory.make_thread_killed_message(thread_id))
+
+    def _ensure_flusher_thread(self):
+        # Note: called with the lock held.
+        flusher_thread = self._flusher_thread
+        if flusher_thread is None or not flusher_thread.is_alive():
+            interval = self._delay if self._delay > 0 else self._min_lifetime
+            self._flusher_thread = flusher_thread = _ThreadEventsFlusherThread(self._py_db, self, interval)
+            flusher_thread.start()
+        flusher_thread.wake_up()
+
+
+class _ThreadEventsFlusherThread(PyDBDaemonThread):
+
+    def __init__(self, py_db, notifier, interval):
+        PyDBDaemonThread.__init__(self, py_db)
+        self.setName('pydevd.ThreadEventsFlusher')
+        self._notifier = notifier
+        self._interval = interval
+        self._wake_up_event = threading.Event()
+        self._stop_event = threading.Event()
+
+    def wake_up(self):
+        self._wake_up_event.set()
+
+    def _on_run(self):
+        while not self._kill_received:
+            self._wake_up_event.wait()
+            if self._kill_received:
+                return
+
+            # Wait for more notifications to send them all at once.
+            self._stop_event.wait(self._interval)
+            if self._kill_received:
+                return
+
+            self._wake_up_event.clear()
+            try:
+                self._notifier.flush()
+            except:
+                pydev_log.exception('Error sending thread notifications.')
+
+            if self._notifier.has_pending():
+                # Threads which are not alive for min_lifetime yet.
+                self._wake_up_event.set()
+
+    def do_kill_pydev_thread(self):
+        PyDBDaemonThread.do_kill_pydev_thread(self)
+        self._stop_event.set()
+        self._wake_up_event.set()
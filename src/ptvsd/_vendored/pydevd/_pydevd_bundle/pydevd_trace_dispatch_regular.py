@@ -385,6 +385,7 @@ class ThreadTracer(object):
             return None if event == 'call' else NO_FTRACE  # we don't wan't to trace code invoked from pydevd_frame.trace_dispatch
 
         additional_info.is_tracing += 1
+        additional_info.trace_dispatch_calls += 1
         try:
             pydev_step_cmd = additional_info.pydev_step_cmd
             is_stepping = pydev_step_cmd != -1
@@ -402,6 +403,7 @@ class ThreadTracer(object):
             if frame_cache_key in cache_skips:
                 if not is_stepping:
                     # if DEBUG: print('skipped: trace_dispatch (cache hit)', frame_cache_key, frame.f_lineno, event, frame.f_code.co_name)
+                    additional_info.trace_dispatch_skip_cache_hits += 1
                     return None if event == 'call' else NO_FTRACE
                 else:
                     # When stepping we can't take into account caching based on the breakpoints (only global filtering).
@@ -1,6 +1,7 @@
 """ pydevd_vars deals with variables:
     resolution/conversion to XML.
 """
+import base64
 import pickle
 from _pydevd_bundle.pydevd_constants import get_frame, get_current_thread_id, xrange, IS_PY2
 
@@ -263,6 +264,9 @@ def evaluate_expression(dbg, frame, expression, is_exec):
     if frame is None:
         return
 
+    # The expression may change the state of the program.
+    dbg.completions_cache = None
+
     # Not using frame.f_globals because of https://sourceforge.net/tracker2/?func=detail&aid=2541355&group_id=85796&atid=577329
     # (Names not resolved in generator expression in method)
     # See message: http://mail.python.org/pipermail/python-list/2009-January/526522.html
@@ -310,6 +314,8 @@ def change_attr_expression(frame, attr, expression, dbg, value=SENTINEL_VALUE):
     if frame is None:
         return
 
+    dbg.completions_cache = None
+
     try:
         expression = expression.replace('@LINE@', '\n')
 
@@ -549,3 +555,99 @@ def dataframe_to_xml(df, name, roffset, coffset, rows, cols, format):
             value = col_formats[col] % value
             xml += var_to_xml(value, '')
     return xml
+
+
+def _get_label(label):
+    return str(label) if not isinstance(label, tuple) else '/'.join(map(str, label))
+
+
+def _column_to_dict(numpy, label, values, format, binary):
+    '''
+    :param numpy:
+        The numpy module.
+
+    :param values:
+        1D numpy array with the values of the column (only for the requested window).
+    '''
+    kind = values.dtype.kind
+    column = {
+        'label': label,
+        'dtype': values.dtype.str,
+        'kind': kind,
+    }
+
+    if kind in 'biuf':
+        # Note: statistics are only computed for the window.
+        stats_values = values[~numpy.isnan(values)] if kind == 'f' else values
+        if len(stats_values) > 0:
+            column['min'] = str(stats_values.min())
+            column['max'] = str(stats_values.max())
+
+    if binary and kind in 'biufc':
+        column['base64'] = base64.b64encode(
+            numpy.ascontiguousarray(values, dtype=values.dtype.newbyteorder('<')).tobytes()).decode('ascii')
+        return column
+
+    if kind == 'f':
+        fmt = format or '%.5f'
+    elif kind in 'iu':
+        fmt = '%d'
+    else:
+        fmt = '%s'
+    column['format'] = fmt
+
+    if kind in 'biufc':
+        column['values'] = numpy.char.mod(fmt, values).tolist()
+    else:
+        column['values'] = [fmt % (value,) for value in values.tolist()]
+    return column
+
+
+def array_slice_to_dict(value, row_offset=0, col_offset=0, rows=None, cols=None, format=None, binary=False):
+    '''
+    :param value:
+        A numpy array (with up to 2 dimensions) or a pandas DataFrame.
+
+    :return dict:
+        The window requested in a columnar format (see: `PydevdArraySliceResponseBody`).
+    '''
+    numpy = sys.modules['numpy']  # If we have an array/DataFrame, numpy must be already imported.
+
+    # Note: negative values would be interpreted as indexes from the end.
+    for name, arg in (('rowOffset', row_offset), ('colOffset', col_offset), ('rows', rows), ('cols', cols)):
+        if arg is not None and arg < 0:
+            raise ValueError('%s must not be negative (%s).' % (name, arg))
+
+    rows = MAX_SLICE_SIZE if rows is None else min(rows, MAX_SLICE_SIZE)
+    cols = MAX_SLICE_SIZE if cols is None else min(cols, MAX_SLICE_SIZE)
+
+    if hasattr(value, 'iloc'):  # pandas DataFrame
+        shape = list(value.shape)
+        window = value.iloc[row_offset:row_offset + rows, col_offset:col_offset + cols]
+        row_labels = [_get_label(label) for label in window.index]
+        columns = [
+            _column_to_dict(numpy, _get_label(label), numpy.asarray(window.iloc[:, i]), format, binary)
+            for i, label in enumerate(window.columns)]
+    else:
+        shape = list(value.shape)
+        if value.ndim > 2:
+            raise ValueError('Array has more than 2 dimensions (%s).' % (value.ndim,))
+        elif value.ndim == 1:
+            value = value.reshape(-1, 1)
+        elif value.ndim == 0:
+            value = value.reshape(1, 1)
+        window = value[row_offset:row_offset + rows, col_offset:col_offset + cols]
+        row_labels = [str(row) for row in xrange(row_offset, row_offset + window.shape[0])]
+        columns = [
+            _column_to_dict(numpy, str(col_offset + i), window[:, i], format, binary)
+            for i in xrange(window.shape[1])]
+
+    return {
+        'shape': shape,
+        'rowOffset': row_offset,
+        'colOffset': col_offset,
+        'rows': len(row_labels),
+        'cols': len(columns),
+        'rowLabels': row_labels,
+        'columns': columns,
+    }
@@ -5,6 +5,7 @@ from _pydev_bundle import pydev_log
 from _pydevd_bundle.pydevd_trace_dispatch import USING_CYTHON
 
 IS_PY36_OR_GREATER = sys.version_info >= (3, 6)
+IS_PY312_OR_GREATER = sys.version_info >= (3, 12)
 
 frame_eval_func = None
 stop_frame_eval = None
@@ -13,11 +14,24 @@ clear_thread_local_info = None
 
 use_cython = os.getenv('PYDEVD_USE_CYTHON', None)
 USING_FRAME_EVAL = False
+USING_SYS_MONITORING = False
 
 # "NO" means we should not use frame evaluation, 'YES' we should use it (and fail if not there) and unspecified uses if possible.
 use_frame_eval = os.environ.get('PYDEVD_USE_FRAME_EVAL', None)
 
-if use_frame_eval == 'NO' or use_cython == 'NO' or not USING_CYTHON:
+# The tracing based on sys.monitoring (Python 3.12 onwards) is opt-in: when 'YES' it's used instead
+# of the frame evaluation (and of sys.settrace) -- unspecified is the same as 'NO'.
+use_sys_monitoring = os.environ.get('PYDEVD_USE_SYS_MONITORING', None)
+
+if use_sys_monitoring not in (None, 'YES', 'NO'):
+    raise RuntimeError('Unexpected value for PYDEVD_USE_SYS_MONITORING: %s (accepted: YES, NO)' % (use_sys_monitoring,))
+
+if use_sys_monitoring == 'YES':
+    # Fail if unable to use
+    from _pydevd_frame_eval.pydevd_sys_monitoring import clear_thread_local_info
+    USING_SYS_MONITORING = True
+
+elif use_frame_eval == 'NO' or use_cython == 'NO' or not USING_CYTHON:
     pass
 
 elif use_frame_eval == 'YES':
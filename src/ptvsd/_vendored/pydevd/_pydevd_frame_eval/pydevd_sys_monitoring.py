@@ -0,0 +1,442 @@
+'''
+Tracing based on `sys.monitoring` (PEP 669 -- Python 3.12 onwards).
+
+Instead of having a trace function called for every event in every frame, callbacks are
+registered for the events the debugger needs and those are only enabled where needed:
+
+    PY_START is always enabled and is used to check whether a code object has breakpoints. If it
+    has, LINE events are enabled just for that code object, otherwise `DISABLE` is returned so
+    that it's not checked again until the breakpoints change (see: `restart_events`).
+
+    LINE events return `DISABLE` for lines without breakpoints, so, after the first hit only the
+    lines with breakpoints are still reported.
+
+    RAISE is only enabled when there are exception breakpoints.
+
+    When some thread is stepping or has to be suspended, LINE, PY_RETURN, PY_YIELD and RAISE are
+    enabled for all code objects (until no thread needs it anymore).
+
+The events which must be handled are forwarded to `PyDBFrame.trace_dispatch` as the equivalent
+'call', 'line', 'return' and 'exception' events, so, the logic which decides whether the thread
+should be suspended (conditions, hit counts, logpoints, stepping, exception breakpoints) is the
+same used in the regular tracing.
+
+Note: code executed from a callback doesn't generate events, so, the debugger doesn't trace
+itself (this is also why the code evaluated while the thread is suspended isn't traced).
+'''
+import dis
+import sys
+
+from _pydev_bundle import pydev_log
+from _pydev_imps._pydev_saved_modules import threading
+from _pydevd_bundle import pydevd_trace_dispatch_regular
+from _pydevd_bundle.pydevd_additional_thread_info import set_additional_thread_info
+from _pydevd_bundle.pydevd_comm_constants import (CMD_STEP_INTO, CMD_STEP_INTO_MY_CODE, CMD_STEP_RETURN,
+    CMD_STEP_RETURN_MY_CODE)
+from _pydevd_bundle.pydevd_constants import GlobalDebuggerHolder, ForkSafeLock, STATE_SUSPEND
+from _pydevd_bundle.pydevd_frame import PyDBFrame
+from _pydevd_bundle.pydevd_trace_dispatch import fix_top_level_trace_and_get_trace_func
+from _pydevd_bundle.pydevd_utils import get_non_pydevd_threads
+from pydevd_file_utils import get_abs_path_real_path_and_base_from_file, NORM_PATHS_AND_BASE_CONTAINER
+
+monitoring = sys.monitoring
+events = monitoring.events
+DISABLE = monitoring.DISABLE
+
+TOOL_ID = monitoring.DEBUGGER_ID
+
+_BASE_EVENTS = events.PY_START
+_TRACE_ALL_EVENTS = events.PY_START | events.LINE | events.PY_RETURN | events.PY_YIELD | events.RAISE
+
+_lock = ForkSafeLock()
+_started = False
+
+# When True some thread is stepping or must be suspended (and thus all events are enabled).
+_trace_all = False
+
+_thread_local_info = threading.local()
+
+_code_to_info = {}
+_frame_skips_cache = {}
+
+
+def clear_thread_local_info():
+    global _thread_local_info
+    _thread_local_info = threading.local()
+
+
+class _ThreadInfo(object):
+
+    __slots__ = ['additional_info', 'thread', 'is_pydevd_thread', 'is_dummy_thread', 'fully_initialized', 'top_level_initialized']
+
+    def __init__(self):
+        self.additional_info = None
+        self.thread = None
+        self.is_pydevd_thread = False
+        self.is_dummy_thread = False
+        self.fully_initialized = False
+        self.top_level_initialized = False
+
+    def initialize_if_possible(self):
+        # Don't call threading.currentThread because if we're too early in the process
+        # we may create a dummy thread.
+        t = threading._active.get(threading.get_ident())
+        if t is None:
+            return  # Cannot initialize until thread becomes active.
+
+        if getattr(t, 'is_pydev_daemon_thread', False) or getattr(t, 'pydev_do_not_trace', False):
+            self.is_pydevd_thread = True
+        else:
+            self.additional_info = set_additional_thread_info(t)
+            self.thread = t
+            # A dummy thread may be a leftover from a finished thread whose ident was reused
+            # (it's replaced once threading registers the new thread).
+            self.is_dummy_thread = isinstance(t, threading._DummyThread)
+        self.top_level_initialized = False
+        self.fully_initialized = True
+
+
+def _get_thread_info():
+    '''
+    :return _ThreadInfo:
+        The info for the current thread or None if it shouldn't be traced (i.e.: pydevd threads
+        or threads which are still not active).
+    '''
+    try:
+        thread_info = _thread_local_info.thread_info
+    except AttributeError:
+        thread_info = _thread_local_info.thread_info = _ThreadInfo()
+
+    if not thread_info.fully_initialized:
+        thread_info.initialize_if_possible()
+        if not thread_info.fully_initialized:
+            return None
+
+    elif thread_info.is_dummy_thread and threading._active.get(threading.get_ident()) is not thread_info.thread:
+        thread_info.initialize_if_possible()
+
+    if thread_info.is_pydevd_thread:
+        return None
+
+    return thread_info
+
+
+class _CodeInfo(object):
+
+    __slots__ = ['always_skip', 'filtered_out', 'filename', 'frame_cache_key', 'breakpoint_lines', 'plugin_traced']
+
+    def __init__(self):
+        self.always_skip = False
+        self.filtered_out = False
+        self.filename = ''
+        self.frame_cache_key = None
+        self.breakpoint_lines = frozenset()
+        self.plugin_traced = False
+
+
+def _get_code_info(py_db, code, frame):
+    '''
+    Provides the information on whether a code object must be traced (cached until the
+    breakpoints or filters change).
+    '''
+    try:
+        return _code_to_info[code]
+    except KeyError:
+        pass
+
+    code_info = _CodeInfo()
+    co_filename = code.co_filename
+    try:
+        try:
+            abs_path_real_path_and_base = NORM_PATHS_AND_BASE_CONTAINER[co_filename]
+        except:
+            abs_path_real_path_and_base = get_abs_path_real_path_and_base_from_file(co_filename)
+
+        filename = abs_path_real_path_and_base[1]
+        code_info.filename = filename
+        code_info.frame_cache_key = (code.co_firstlineno, code.co_name, co_filename)
+
+        file_type = py_db.get_file_type(frame, abs_path_real_path_and_base)
+        if file_type is not None:
+            if file_type == 1:  # inlining LIB_FILE = 1
+                if not py_db.in_project_scope(frame, abs_path_real_path_and_base[0]):
+                    code_info.always_skip = True
+            else:
+                code_info.always_skip = True
+
+        if not code_info.always_skip and py_db.is_files_filter_enabled:
+            if py_db.apply_files_filter(frame, filename, False):
+                code_info.always_skip = True
+                code_info.filtered_out = True
+
+        if not code_info.always_skip:
+            breakpoints = py_db.breakpoints.get(filename)
+            if breakpoints:
+                code_info.breakpoint_lines = frozenset(
+                    line for _offset, line in dis.findlinestarts(code) if line in breakpoints)
+
+            if py_db.plugin is not None and (py_db.has_plugin_line_breaks or py_db.has_plugin_exception_breaks):
+                code_info.plugin_traced = not py_db.plugin.can_skip(py_db, frame)
+    except:
+        # An exception in a callback would be raised in the user code, so, just skip it.
+        pydev_log.exception('Error checking whether %s should be traced.', code)
+        code_info.always_skip = True
+
+    _code_to_info[code] = code_info
+    return code_info
+
+
+def _needs_tracing(additional_info):
+    return additional_info.pydev_step_cmd != -1 or additional_info.pydev_state == STATE_SUSPEND
+
+
+def _enable_line_events(code, extra_events=0):
+    local_events = monitoring.get_local_events(TOOL_ID, code)
+    new_events = local_events | events.LINE | extra_events
+    if new_events != local_events:
+        monitoring.set_local_events(TOOL_ID, code, new_events)
+
+
+def _trace_dispatch(py_db, thread_info, code_info, frame, event, arg):
+    additional_info = thread_info.additional_info
+    if additional_info.is_tracing:
+        return
+    try:
+        PyDBFrame(
+            (
+                py_db, code_info.filename, additional_info, thread_info.thread, _frame_skips_cache, code_info.frame_cache_key,
+            )
+        ).trace_dispatch(frame, event, arg)
+    except SystemExit:
+        pass
+    except Exception:
+        if not py_db.pydb_disposed:
+            pydev_log.exception()
+
+
+def _on_py_start(code, instruction_offset):
+    py_db = GlobalDebuggerHolder.global_dbg
+    thread_info = _get_thread_info()
+    if py_db is None or thread_info is None or py_db.pydb_disposed:
+        return None
+
+    frame = sys._getframe(1)
+    code_info = _get_code_info(py_db, code, frame)
+    additional_info = thread_info.additional_info
+    additional_info.trace_dispatch_calls += 1
+    if code_info.always_skip:
+        additional_info.trace_dispatch_skip_cache_hits += 1
+        if code_info.filtered_out and additional_info.pydev_original_step_cmd in (CMD_STEP_INTO, CMD_STEP_INTO_MY_CODE):
+            if not pydevd_trace_dispatch_regular._global_notify_skipped_step_in:
+                pydevd_trace_dispatch_regular.notify_skipped_step_in_because_of_filters(py_db, frame)
+        return DISABLE
+
+    if code_info.plugin_traced:
+        _enable_line_events(code, events.PY_RETURN)
+        _trace_dispatch(py_db, thread_info, code_info, frame, 'call', None)
+        return None
+
+    if code_info.breakpoint_lines:
+        _enable_line_events(code)
+
+    if _needs_tracing(additional_info):
+        _trace_dispatch(py_db, thread_info, code_info, frame, 'call', None)
+
+    if _trace_all or code_info.breakpoint_lines:
+        # Note: keep on getting PY_START for code with breakpoints so that its frame objects are
+        # created upfront as in the regular tracing (frame ids sent to the client are based on them).
+        return None
+    return DISABLE
+
+
+def _on_line(code, line):
+    py_db = GlobalDebuggerHolder.global_dbg
+    thread_info = _get_thread_info()
+    if py_db is None or thread_info is None or py_db.pydb_disposed:
+        return None
+
+    frame = sys._getframe(1)
+    code_info = _get_code_info(py_db, code, frame)
+    if code_info.always_skip:
+        return DISABLE
+
+    if line in code_info.breakpoint_lines or code_info.plugin_traced or _needs_tracing(thread_info.additional_info):
+        _trace_dispatch(py_db, thread_info, code_info, frame, 'line', None)
+        return None
+
+    if _trace_all:
+        return None
+    return DISABLE
+
+
+def _on_py_return(code, instruction_offset, retval):
+    py_db = GlobalDebuggerHolder.global_dbg
+    thread_info = _get_thread_info()
+    if py_db is None or thread_info is None or py_db.pydb_disposed:
+        return None
+
+    frame = sys._getframe(1)
+    code_info = _get_code_info(py_db, code, frame)
+    additional_info = thread_info.additional_info
+    if code_info.always_skip:
+        if code_info.filtered_out and _trace_all:
+            # As in the regular tracing, when stepping in or out of a frame which is filtered out,
+            # the step may stop at its return (shown in the back frame if it's not filtered out).
+            if additional_info.pydev_step_cmd in (CMD_STEP_INTO, CMD_STEP_INTO_MY_CODE, CMD_STEP_RETURN, CMD_STEP_RETURN_MY_CODE):
+                back_frame = frame.f_back
+                if back_frame is not None and not _get_code_info(py_db, back_frame.f_code, back_frame).always_skip:
+                    _trace_dispatch(py_db, thread_info, code_info, frame, 'return', retval)
+            return None
+        return DISABLE
+
+    if code_info.plugin_traced or _needs_tracing(additional_info):
+        _trace_dispatch(py_db, thread_info, code_info, frame, 'return', retval)
+    return None
+
+
+def _on_raise(code, instruction_offset, exception):
+    # Note: RAISE can't be disabled per location (it's only enabled when needed).
+    py_db = GlobalDebuggerHolder.global_dbg
+    thread_info = _get_thread_info()
+    if py_db is None or thread_info is None or py_db.pydb_disposed:
+        return None
+
+    frame = sys._getframe(1)
+    additional_info = thread_info.additional_info
+    arg = (type(exception), exception, exception.__traceback__)
+
+    if py_db.break_on_uncaught_exceptions:
+        if not thread_info.top_level_initialized:
+            # Find out the frame where unhandled exceptions are reported for this thread
+            # (i.e.: threading._bootstrap_inner). Note that when attaching to a thread whose
+            # topmost frame has no back frame, unhandled exceptions are not reported.
+            _, thread_info.top_level_initialized = fix_top_level_trace_and_get_trace_func(py_db, frame)
+
+        # Check if the exception reached the frame where unhandled exceptions are reported.
+        top_level_thread_tracer = additional_info.top_level_thread_tracer_unhandled
+        if top_level_thread_tracer is not None:
+            f_trace = frame.f_trace
+            if f_trace is not None and f_trace == top_level_thread_tracer.get_trace_dispatch_func():
+                f_trace(frame, 'exception', arg)
+                return None
+
+    if py_db.break_on_caught_exceptions or py_db.has_plugin_exception_breaks or _needs_tracing(additional_info):
+        code_info = _get_code_info(py_db, code, frame)
+        if not code_info.always_skip:
+            _trace_dispatch(py_db, thread_info, code_info, frame, 'exception', arg)
+    return None
+
+
+def update_monitoring_events(py_db):
+    '''
+    Enables all the events if some thread is stepping or must be suspended, otherwise, only the
+    events which are needed to find out where breakpoints are (and RAISE if there are exception
+    breakpoints).
+
+    Should be called whenever the state of some thread changes (i.e.: when it's marked to be
+    suspended or when it's resumed).
+    '''
+    global _trace_all
+    if not _started or py_db is None:
+        return
+
+    trace_all = False
+    for t in get_non_pydevd_threads():
+        additional_info = getattr(t, 'additional_info', None)
+        if additional_info is not None and _needs_tracing(additional_info):
+            trace_all = True
+            break
+
+    with _lock:
+        if not _started:
+            return
+
+        if trace_all:
+            if not _trace_all:
+                # Locations disabled while running must be reported again.
+                monitoring.restart_events()
+            event_set = _TRACE_ALL_EVENTS
+        else:
+            event_set = _BASE_EVENTS
+            if py_db.break_on_uncaught_exceptions or py_db.break_on_caught_exceptions or py_db.has_plugin_exception_breaks:
+                event_set |= events.RAISE
+
+        _trace_all = trace_all
+        monitoring.set_events(TOOL_ID, event_set)
+
+
+def restart_events(py_db):
+    '''
+    Should be called when the breakpoints or filters change (the code objects must be checked
+    again and the locations previously disabled must be reported again).
+    '''
+    _code_to_info.clear()
+    _frame_skips_cache.clear()
+    if _started:
+        monitoring.restart_events()
+        update_monitoring_events(py_db)
+
+
+def set_trace_for_frame_and_parents(py_db, frame, disable=False):
+    '''
+    Enables the LINE events for the code objects with breakpoints in the given frame and parents
+    (which may already be running, so, PY_START won't be reported for those) and checks whether
+    all events must be enabled.
+
+    :param bool disable:
+        If True the local events of the (non-debugger) code objects in the given frame and parents
+        are disabled instead (note that, unlike in the regular tracing, this affects all the frames
+        running those code objects -- as in the regular tracing, new calls are still checked).
+    '''
+    if disable:
+        while frame is not None:
+            if py_db.get_file_type(frame) is None:
+                pydev_log.debug('Disable monitoring of: %s - %s', frame.f_code.co_filename, frame.f_code.co_name)
+                monitoring.set_local_events(TOOL_ID, frame.f_code, 0)
+            frame = frame.f_back
+        return
+
+    while frame is not None:
+        code_info = _get_code_info(py_db, frame.f_code, frame)
+        if not code_info.always_skip and code_info.breakpoint_lines:
+            _enable_line_events(frame.f_code)
+        frame = frame.f_back
+
+    update_monitoring_events(py_db)
+
+
+def start_monitoring(py_db):
+    global _started
+    with _lock:
+        if _started:
+            return
+
+        try:
+            monitoring.use_tool_id(TOOL_ID, 'pydevd')
+        except ValueError:
+            pydev_log.critical('Unable to use sys.monitoring for debugging (tool id already in use by: %s).',
+                monitoring.get_tool(TOOL_ID))
+            return
+
+        monitoring.register_callback(TOOL_ID, events.PY_START, _on_py_start)
+        monitoring.register_callback(TOOL_ID, events.LINE, _on_line)
+        monitoring.register_callback(TOOL_ID, events.PY_RETURN, _on_py_return)
+        monitoring.register_callback(TOOL_ID, events.PY_YIELD, _on_py_return)
+        monitoring.register_callback(TOOL_ID, events.RAISE, _on_raise)
+        _started = True
+
+    update_monitoring_events(py_db)
+
+
+def stop_monitoring():
+    global _started, _trace_all
+    with _lock:
+        if not _started:
+            return
+
+        _started = False
+        _trace_all = False
+        monitoring.set_events(TOOL_ID, 0)
+        for event in (events.PY_START, events.LINE, events.PY_RETURN, events.PY_YIELD, events.RAISE):
+            monitoring.register_callback(TOOL_ID, event, None)
+        monitoring.free_tool_id(TOOL_ID)
@@ -29,6 +29,7 @@ from _pydevd_bundle import pydevd_extension_utils, pydevd_frame_utils, pydevd_co
 from _pydevd_bundle.pydevd_filtering import FilesFiltering
 from _pydevd_bundle import pydevd_io, pydevd_vm_type
 from _pydevd_bundle import pydevd_utils
+from _pydevd_bundle import pydevd_stats
 from _pydev_bundle.pydev_console_utils import DebugConsoleStdIn
 from _pydevd_bundle.pydevd_additional_thread_info import set_additional_thread_info
 from _pydevd_bundle.pydevd_breakpoints import ExceptionBreakpoint, get_exception_breakpoint
@@ -40,7 +41,7 @@ from _pydevd_bundle.pydevd_constants import (IS_JYTH_LESS25, get_thread_id, get_
     dict_keys, dict_iter_items, DebugInfoHolder, PYTHON_SUSPEND, STATE_SUSPEND, STATE_RUN, get_frame,
     clear_cached_thread_id, INTERACTIVE_MODE_AVAILABLE, SHOW_DEBUG_INFO_ENV, IS_PY34_OR_GREATER, IS_PY2, NULL,
     NO_FTRACE, IS_IRONPYTHON, JSON_PROTOCOL, IS_CPYTHON, HTTP_JSON_PROTOCOL, USE_CUSTOM_SYS_CURRENT_FRAMES_MAP, call_only_once,
-    ForkSafeLock)
+    ForkSafeLock, set_compact_encoding, THREAD_EVENTS_DELAY, THREAD_EVENTS_MIN_LIFETIME)
 from _pydevd_bundle.pydevd_defaults import PydevdCustomization  # Note: import alias used on pydev_monkey.
 from _pydevd_bundle.pydevd_custom_frames import CustomFramesContainer, custom_frames_container_init
 from _pydevd_bundle.pydevd_dont_trace_files import DONT_TRACE, PYDEV_FILE, LIB_FILE
@@ -51,11 +52,14 @@ from _pydevd_bundle.pydevd_trace_dispatch import (
     trace_dispatch as _trace_dispatch, global_cache_skips, global_cache_frame_skips, fix_top_level_trace_and_get_trace_func)
 from _pydevd_bundle.pydevd_utils import save_main_module, is_current_thread_main_thread
 from _pydevd_frame_eval.pydevd_frame_eval_main import (
-    frame_eval_func, dummy_trace_dispatch)
+    frame_eval_func, dummy_trace_dispatch, USING_SYS_MONITORING)
+if USING_SYS_MONITORING:
+    from _pydevd_frame_eval import pydevd_sys_monitoring
+# Note: top-level packages must be imported while the pydevd folder is still in the sys.path
+# (modules inside those may be imported lazily afterwards).
 import pydev_ipython  # @UnusedImport
+import pydevd_concurrency_analyser  # @UnusedImport
 from _pydevd_bundle.pydevd_source_mapping import SourceMapping
-from pydevd_concurrency_analyser.pydevd_concurrency_logger import ThreadingLogger, AsyncioLogger, send_concurrency_message, cur_time
-from pydevd_concurrency_analyser.pydevd_thread_wrappers import wrap_threads
 from pydevd_file_utils import get_abs_path_real_path_and_base_from_frame, NORM_PATHS_AND_BASE_CONTAINER, get_abs_path_real_path_and_base_from_file
 from pydevd_file_utils import get_fullname, rPath, get_package_dir
 import pydevd_tracing
@@ -68,18 +72,27 @@ from _pydevd_bundle.pydevd_comm import(InternalConsoleExec,
     InternalSendCurrExceptionTraceProceeded, run_as_pydevd_daemon_thread)
 
 from _pydevd_bundle.pydevd_process_net_command_json import PyDevJsonCommandProcessor
-from _pydevd_bundle.pydevd_process_net_command import process_net_command
 from _pydevd_bundle.pydevd_net_command import NetCommand
 
 from _pydevd_bundle.pydevd_breakpoints import stop_on_unhandled_exception
 from _pydevd_bundle.pydevd_collect_bytecode_info import collect_try_except_info, collect_return_info
 from _pydevd_bundle.pydevd_suspended_frames import SuspendedFramesManager
+from _pydevd_bundle.pydevd_thread_events import ThreadEventsNotifier
 from socket import SHUT_RDWR
 from _pydevd_bundle.pydevd_api import PyDevdAPI
+from _pydevd_bundle import pydevd_inherited_config
 
 if USE_CUSTOM_SYS_CURRENT_FRAMES_MAP:
     from _pydevd_bundle.pydevd_additional_thread_info_regular import _tid_to_last_frame
 
+
+def process_net_command(py_db, cmd_id, seq, text):
+    # Note: the processing for the xml-based protocol is only imported when a
+    # message in that protocol is actually received.
+    from _pydevd_bundle.pydevd_process_net_command import process_net_command
+    return process_net_command(py_db, cmd_id, seq, text)
+
+
 __version_info__ = (1, 3, 3)
 __version_info_str__ = []
 for v in __version_info__:
@@ -131,9 +144,6 @@ def install_breakpointhook(pydevd_breakpointhook=None):
 install_breakpointhook()
 
 SUPPORT_PLUGINS = not IS_JYTH_LESS25
-PluginManager = None
-if SUPPORT_PLUGINS:
-    from _pydevd_bundle.pydevd_plugin_utils import PluginManager
 
 threadingEnumerate = threading.enumerate
 threadingCurrentThread = threading.currentThread
@@ -150,6 +160,10 @@ file_system_encoding = getfilesystemencoding()
 
 _CACHE_FILE_TYPE = {}
 
+pydevd_stats.register_cache('fileType', _CACHE_FILE_TYPE)
+pydevd_stats.register_cache('skips', global_cache_skips)
+pydevd_stats.register_cache('frameSkips', global_cache_frame_skips)
+
 
 #=======================================================================================================================
 # PyDBCommandThread
@@ -457,12 +471,33 @@ class PyDB(object):
         self.created_pydb_daemon_threads = {}
         self._waiting_for_connection_thread = None
         self._on_configuration_done_event = threading.Event()
+        self.inherited_config = pydevd_inherited_config.InheritedConfig()
+
+        # When the process starts running with the configuration inherited from the parent
+        # process, the client may not be attached yet (so, threads which are suspended must
+        # wait for the configuration to be done before notifying it).
+        self._wait_configuration_done_to_notify_suspend = False
+
+        # Set when the configuration is done (or the debugger is disposed) to release those threads.
+        self._notify_suspend_event = threading.Event()
         self.check_alive_thread = None
         self.py_db_command_thread = None
         self.quitting = None
         self.cmd_factory = NetCommandFactory()
         self._cmd_queue = defaultdict(_queue.Queue)  # Key is thread id or '*', value is Queue
         self.suspended_frames_manager = SuspendedFramesManager()
+
+        # Index used to find the referrers of objects while the program is suspended (created on
+        # demand and cancelled when a thread is resumed).
+        self.referrers_index = None
+
+        # The SamplingProfilerThread (while the sampling profiler is running).
+        self.sampling_profiler = None
+
+        # Cache for the completions requested while the program is suspended (created on demand
+        # and discarded when a thread is resumed or an expression is evaluated).
+        self.completions_cache = None
+
         self._files_filtering = FilesFiltering()
         self.source_mapping = SourceMapping()
 
@@ -528,6 +563,9 @@ class PyDB(object):
         # Note: also access '_enable_thread_notifications' with '_lock_running_thread_ids'
         self._enable_thread_notifications = False
 
+        # Sends the thread started/exited notifications (coalesced).
+        self.thread_events_notifier = ThreadEventsNotifier(self, THREAD_EVENTS_DELAY, THREAD_EVENTS_MIN_LIFETIME)
+
         self._set_breakpoints_with_id = False
 
         # This attribute holds the file-> lines which have an @IgnoreException.
@@ -639,8 +677,27 @@ class PyDB(object):
         Note: only called when using the DAP (Debug Adapter Protocol).
         '''
         self._on_configuration_done_event.set()
+        self._wait_configuration_done_to_notify_suspend = False
+        self._notify_suspend_event.set()
         self._py_db_command_thread_event.set()
 
+    def run_with_inherited_config(self):
+        '''
+        Note: only called when using the DAP (Debug Adapter Protocol).
+
+        :return bool:
+            Whether the configuration inherited from the parent process was applied (in which
+            case the process is set to run without waiting for the configuration to be done).
+        '''
+        if not self.inherited_config.applied:
+            return False
+
+        if not self.ready_to_run:
+            self._wait_configuration_done_to_notify_suspend = True
+            self.ready_to_run = True
+            self._py_db_command_thread_event.set()
+        return True
+
     def is_attached(self):
         return self._on_configuration_done_event.is_set()
 
@@ -795,6 +852,7 @@ class PyDB(object):
         try:
             return _cache_file_type[cache_key]
         except:
+            pydevd_stats.on_cache_miss('fileType')
             if abs_real_path_and_basename[0] == '<string>':
 
                 # Consider it an untraceable file unless there's no back frame (ignoring
@@ -857,6 +915,11 @@ class PyDB(object):
             this function is called on a multi-threaded program (either programmatically or attach
             to pid).
         '''
+        if USING_SYS_MONITORING:
+            # Note: sys.monitoring is enabled for all threads at once.
+            pydevd_sys_monitoring.start_monitoring(self)
+            return
+
         if self.frame_eval_func is not None:
             self.frame_eval_func()
             pydevd_tracing.SetTrace(self.dummy_trace_dispatch)
@@ -885,6 +948,9 @@ class PyDB(object):
         '''
         When breakpoints change, we have to re-evaluate all the assumptions we've made so far.
         '''
+        if USING_SYS_MONITORING:
+            pydevd_sys_monitoring.restart_events(self)
+
         if not self.ready_to_run:
             # No need to do anything if we're still not running.
             return
@@ -947,6 +1013,8 @@ class PyDB(object):
 
     def get_plugin_lazy_init(self):
         if self.plugin is None and SUPPORT_PLUGINS:
+            # Note: the plugins are only imported when actually needed.
+            from _pydevd_bundle.pydevd_plugin_utils import PluginManager
             self.plugin = PluginManager(self)
         return self.plugin
 
@@ -977,6 +1045,7 @@ class PyDB(object):
 
             return self._in_project_scope_cache[cache_key]
         except KeyError:
+            pydevd_stats.on_cache_miss('projectScope')
             cache = self._in_project_scope_cache
             try:
                 abs_real_path_and_basename  # If we've gotten it previously, use it again.
@@ -1060,6 +1129,7 @@ class PyDB(object):
         try:
             return self._apply_filter_cache[cache_key]
         except KeyError:
+            pydevd_stats.on_cache_miss('filesFilter')
             if self.plugin is not None and (self.has_plugin_line_breaks or self.has_plugin_exception_breaks):
                 # If it's explicitly needed by some plugin, we can't skip it.
                 if not self.plugin.can_skip(self, frame):
@@ -1161,6 +1231,8 @@ class PyDB(object):
         if curr_writer:
             curr_writer.do_kill_pydev_thread()
 
+        # The compact encoding must be negotiated again in the new connection.
+        set_compact_encoding(False)
         self.writer = WriterThread(sock, self, terminate_on_socket_close=terminate_on_socket_close)
         self.reader = ReaderThread(
             sock,
@@ -1169,6 +1241,12 @@ class PyDB(object):
             process_net_command=process_net_command,
             terminate_on_socket_close=terminate_on_socket_close
         )
+        inherited_requests = self.inherited_config.pop_pending_requests()
+        if inherited_requests:
+            # Note: applied before the reader starts so that the configuration from the client
+            # is always applied afterwards.
+            self.reader.json_command_processor.apply_inherited_config(self, inherited_requests)
+
         self.writer.start()
         self.reader.start()
 
@@ -1374,7 +1452,7 @@ class PyDB(object):
 
             self._running_thread_ids[thread_id] = thread
 
-        self.writer.add_command(self.cmd_factory.make_thread_created_message(thread))
+        self.thread_events_notifier.on_thread_created(thread_id, thread)
 
     def notify_thread_not_alive(self, thread_id, use_lock=True):
         """ if thread is not alive, cancel trace_dispatch processing """
@@ -1394,7 +1472,16 @@ class PyDB(object):
             if not was_notified:
                 additional_info.pydev_notify_kill = True
 
-        self.writer.add_command(self.cmd_factory.make_thread_killed_message(thread_id))
+        self.thread_events_notifier.on_thread_killed(thread_id)
+
+    def get_running_threads(self):
+        '''
+        :return list(tuple(str, threading.Thread)):
+            The thread ids and threads for the threads which were notified as created (and were
+            still not notified as dead).
+        '''
+        with self._lock_running_thread_ids:
+            return list(dict_iter_items(self._running_thread_ids))
 
     def set_enable_thread_notifications(self, enable):
         with self._lock_running_thread_ids:
@@ -1406,6 +1493,8 @@ class PyDB(object):
                     # (so, clear the cache related to that).
                     self._running_thread_ids = {}
 
+                self.thread_events_notifier.clear()
+
     def process_internal_commands(self):
         '''
         This function processes internal commands.
@@ -1513,6 +1602,8 @@ class PyDB(object):
     def _clear_skip_caches(self):
         global_cache_skips.clear()
         global_cache_frame_skips.clear()
+        if USING_SYS_MONITORING:
+            pydevd_sys_monitoring.restart_events(self)
 
     def add_break_on_exception(
         self,
@@ -1638,6 +1729,10 @@ class PyDB(object):
                         finally:
                             frame = None
 
+        if USING_SYS_MONITORING:
+            # Threads which are marked to be suspended must be traced until they're actually suspended.
+            pydevd_sys_monitoring.update_monitoring_events(self)
+
     def _send_breakpoint_condition_exception(self, thread, conditional_breakpoint_exception_tuple):
         """If conditional breakpoint raises an exception during evaluation
         send exception details to java
@@ -1727,6 +1822,11 @@ class PyDB(object):
         self.process_internal_commands()
 
         thread_id = get_current_thread_id(thread)
+        initial_time = time.time()
+
+        if self._wait_configuration_done_to_notify_suspend:
+            # The client may still not be attached (the notification would be lost).
+            self._notify_suspend_event.wait()
 
         # print('do_wait_suspend %s %s %s %s %s %s (%s)' % (frame.f_lineno, frame.f_code.co_name, frame.f_code.co_filename, event, arg, constant_to_str(thread.additional_info.pydev_step_cmd), constant_to_str(thread.additional_info.pydev_original_step_cmd)))
 
@@ -1747,6 +1847,9 @@ class PyDB(object):
         if frames_list is None:
             frames_list = pydevd_frame_utils.create_frames_list_from_frame(frame)
 
+        # The client must know about the suspended thread (and the other threads it may list).
+        self.thread_events_notifier.flush(force=True)
+
         with self.suspended_frames_manager.track_frames(self) as frames_tracker:
             frames_tracker.track(thread_id, frames_list)
             cmd = frames_tracker.create_thread_suspend_command(thread_id, stop_reason, message, suspend_type)
@@ -1772,12 +1875,24 @@ class PyDB(object):
                 keep_suspended = self._do_wait_suspend(thread, frame, event, arg, suspend_type, from_this_thread, frames_tracker)
 
         frames_list = None
+        pydevd_stats.on_suspend_finished(initial_time)
+
+        # The object graph may change from now on.
+        self.completions_cache = None
+        referrers_index = self.referrers_index
+        if referrers_index is not None:
+            self.referrers_index = None
+            referrers_index.cancel()
 
         if keep_suspended:
             # This means that we should pause again after a set next statement.
             self._threads_suspended_single_notification.increment_suspend_time()
             self.do_wait_suspend(thread, frame, event, arg, is_unhandled_exception)
 
+        elif USING_SYS_MONITORING:
+            # The thread was resumed (and may be stepping now).
+            pydevd_sys_monitoring.update_monitoring_events(self)
+
     def _do_wait_suspend(self, thread, frame, event, arg, suspend_type, from_this_thread, frames_tracker):
         info = thread.additional_info
         keep_suspended = False
@@ -1915,6 +2030,10 @@ class PyDB(object):
         disable = kwargs.pop('disable', False)
         assert not kwargs
 
+        if USING_SYS_MONITORING:
+            pydevd_sys_monitoring.set_trace_for_frame_and_parents(self, frame, disable=disable)
+            return
+
         while frame is not None:
             # Don't change the tracing on debugger-related files
             file_type = self.get_file_type(frame)
@@ -2015,6 +2134,9 @@ class PyDB(object):
                 disposed = self.pydb_disposed
                 self.pydb_disposed = True
 
+            # Threads waiting for the configuration to be done must not wait anymore.
+            self._notify_suspend_event.set()
+
             if disposed:
                 if wait:
                     pydev_log.debug("PyDB.dispose_and_kill_all_pydevd_threads (already disposed - wait)")
@@ -2066,11 +2188,12 @@ class PyDB(object):
         self.start_auxiliary_daemon_threads()
 
     def patch_threads(self):
-        try:
-            # not available in jython!
-            threading.settrace(self.trace_dispatch)  # for all future threads
-        except:
-            pass
+        if not USING_SYS_MONITORING:  # sys.monitoring already covers all the threads.
+            try:
+                # not available in jython!
+                threading.settrace(self.trace_dispatch)  # for all future threads
+            except:
+                pass
 
         from _pydev_bundle.pydev_monkey import patch_thread_modules
         patch_thread_modules()
@@ -2166,11 +2289,14 @@ class PyDB(object):
         thread_id = get_current_thread_id(t)
 
         if self.thread_analyser is not None:
+            from pydevd_concurrency_analyser.pydevd_concurrency_logger import send_concurrency_message, cur_time
+            from pydevd_concurrency_analyser.pydevd_thread_wrappers import wrap_threads
             wrap_threads()
             self.thread_analyser.set_start_time(cur_time())
             send_concurrency_message("threading_event", 0, t.getName(), thread_id, "thread", "start", file, 1, None, parent=thread_id)
 
         if self.asyncio_analyser is not None:
+            from pydevd_concurrency_analyser.pydevd_concurrency_logger import send_concurrency_message
             # we don't have main thread in asyncio graph, so we should add a fake event
             send_concurrency_message("asyncio_event", 0, "Task", "Task", "thread", "stop", file, 1, frame=None, parent=None)
 
@@ -2590,6 +2716,9 @@ def _locked_settrace(
         py_db = PyDB()
         pydevd_vm_type.setup_type()
 
+        if patch_multiprocessing:
+            pydevd_inherited_config.import_inherited_config(py_db, PyDevdAPI().get_ppid())
+
         if SetupHolder.setup is None:
             setup = {
                 'client': host,  # dispatch expects client to be set to the host address when server is False
@@ -2681,6 +2810,8 @@ def _locked_settrace(
             additional_info.pydev_step_cmd = CMD_STEP_OVER
             additional_info.pydev_step_stop = stop_at_frame
             additional_info.suspend_type = PYTHON_SUSPEND
+            if USING_SYS_MONITORING:
+                pydevd_sys_monitoring.update_monitoring_events(py_db)
         else:
             # Ask to break as soon as possible.
             py_db.set_suspend(t, CMD_SET_BREAK)
@@ -2690,6 +2821,8 @@ def stoptrace():
     pydev_log.debug("pydevd.stoptrace()")
     pydevd_tracing.restore_sys_set_trace_func()
     sys.settrace(None)
+    if USING_SYS_MONITORING:
+        pydevd_sys_monitoring.stop_monitoring()
     try:
         # not available in jython!
         threading.settrace(None)  # for all future threads
@@ -2800,6 +2933,9 @@ def settrace_forked(setup_tracing=True):
     py_db = GlobalDebuggerHolder.global_dbg
     if py_db is not None:
         py_db.created_pydb_daemon_threads = {}  # Just making sure we won't touch those (paused) threads.
+        if setup_tracing:
+            # The new debugger starts with the configuration of the parent process.
+            pydevd_inherited_config.set_forked_requests(py_db)
         py_db = None
 
     GlobalDebuggerHolder.global_dbg = None
@@ -2986,6 +3122,7 @@ def main():
     else:
         if setup['multiprocess']:  # PyDev
             pydev_monkey.patch_new_process_functions()
+            pydevd_inherited_config.import_inherited_config(debugger, PyDevdAPI().get_ppid())
 
         elif setup['multiproc']:  # PyCharm
             pydev_log.debug("Started in multiproc mode\n")
@@ -3104,11 +3241,14 @@ def main():
         # Run the dev_appserver
         debugger.run(setup['file'], None, None, is_module, set_trace=False)
     else:
-        if setup['save-threading']:
-            debugger.thread_analyser = ThreadingLogger()
-        if setup['save-asyncio']:
-            if IS_PY34_OR_GREATER:
-                debugger.asyncio_analyser = AsyncioLogger()
+        if setup['save-threading'] or setup['save-asyncio']:
+            # The concurrency analyser is only imported when requested.
+            from pydevd_concurrency_analyser.pydevd_concurrency_logger import ThreadingLogger, AsyncioLogger
+            if setup['save-threading']:
+                debugger.thread_analyser = ThreadingLogger()
+            if setup['save-asyncio']:
+                if IS_PY34_OR_GREATER:
+                    debugger.asyncio_analyser = AsyncioLogger()
 
         apply_debugger_options(setup)
 
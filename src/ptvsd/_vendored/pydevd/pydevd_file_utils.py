@@ -42,10 +42,12 @@ r'''
 '''
 
 from _pydev_bundle import pydev_log
-from _pydevd_bundle.pydevd_constants import IS_PY2, IS_PY3K, DebugInfoHolder, IS_WINDOWS, IS_JYTHON
+from _pydevd_bundle.pydevd_constants import IS_PY2, IS_PY3K, DebugInfoHolder, IS_WINDOWS, IS_JYTHON, \
+    PATH_CACHE_SIZE, ForkSafeLock
 from _pydev_bundle._pydev_filesystem_encoding import getfilesystemencoding
 from _pydevd_bundle.pydevd_comm_constants import file_system_encoding, filesystem_encoding_is_utf8
 from _pydev_bundle.pydev_log import error_once
+from _pydevd_bundle import pydevd_stats
 
 import json
 import os.path
@@ -53,12 +55,59 @@ import sys
 import itertools
 import ntpath
 from functools import partial
+from collections import deque
 
 _nt_os_normcase = ntpath.normcase
 basename = os.path.basename
 os_path_exists = os.path.exists
 join = os.path.join
 
+if IS_PY2:
+
+    def _intern(s):
+        if s.__class__ == str:
+            return intern(s)
+        return s  # unicode can't be interned in Python 2.
+
+else:
+    _intern = sys.intern
+
+
+class _BoundedCache(object):
+    '''
+    Keeps a cache dict with at most `max_size` entries (the oldest entries are evicted first).
+
+    The dict itself is still a regular dict which is accessed directly for lookups (so, the
+    tracing fast path isn't slowed down) and only new entries must be added through `add()`.
+    Entries aren't moved when accessed, but an evicted entry which is still used is just
+    computed again and re-added as the newest entry.
+    '''
+
+    def __init__(self, name, cache, max_size=PATH_CACHE_SIZE):
+        self.cache = cache
+        self.max_size = max_size
+        self._name = name
+        self._keys = deque()
+        self._lock = ForkSafeLock()
+        pydevd_stats.register_cache(name, cache, max_size)
+
+    def add(self, key, value):
+        cache = self.cache
+        with self._lock:
+            if key not in cache:
+                pydevd_stats.on_cache_miss(self._name)
+                keys = self._keys
+                while len(cache) >= self.max_size and keys:
+                    # Note: keys of entries removed with cache.clear() may still be in the deque.
+                    cache.pop(keys.popleft(), None)
+                keys.append(key)
+            cache[key] = value
+
+    def clear(self):
+        with self._lock:
+            self.cache.clear()
+            self._keys.clear()
+
 try:
     FileNotFoundError
 except NameError:
@@ -167,8 +216,9 @@ if sys.platform == 'win32':
         # the debugger is executing (as this seems very unlikely and the cache can save a
         # reasonable time -- especially on mapped drives -- it seems nice to have it).
         _listdir_cache = {}
+        _listdir_bounded_cache = _BoundedCache('listdir', _listdir_cache)
 
-        def _resolve_listing(resolved, iter_parts, cache=_listdir_cache):
+        def _resolve_listing(resolved, iter_parts, cache=_listdir_cache, add_to_cache=_listdir_bounded_cache.add):
             while True:  # Note: while True to make iterative and not recursive
                 try:
                     resolve_lowercase = next(iter_parts)  # must be lowercase already
@@ -181,12 +231,13 @@ if sys.platform == 'win32':
                 if resolved_joined is None:
                     dir_contents = cache.get(resolved_lower)
                     if dir_contents is None:
-                        dir_contents = cache[resolved_lower] = os.listdir(resolved)
+                        dir_contents = os.listdir(resolved)
+                        add_to_cache(resolved_lower, dir_contents)
 
                     for filename in dir_contents:
                         if filename.lower() == resolve_lowercase:
                             resolved_joined = os.path.join(resolved, filename)
-                            cache[(resolved_lower, resolve_lowercase)] = resolved_joined
+                            add_to_cache((resolved_lower, resolve_lowercase), resolved_joined)
                             break
                     else:
                         raise FileNotFoundError('Unable to find: %s in %s' % (
@@ -220,7 +271,7 @@ if sys.platform == 'win32':
             try:
                 return _resolve_listing(drive, iter(parts))
             except FileNotFoundError:
-                _listdir_cache.clear()
+                _listdir_bounded_cache.clear()
                 # Retry once after clearing the cache we have.
                 try:
                     return _resolve_listing(drive, iter(parts))
@@ -330,6 +381,8 @@ def set_ide_os(os):
 # Caches filled as requested during the debug session.
 NORM_PATHS_CONTAINER = {}
 NORM_PATHS_AND_BASE_CONTAINER = {}
+_norm_paths_bounded_cache = _BoundedCache('normPaths', NORM_PATHS_CONTAINER)
+_norm_paths_and_base_bounded_cache = _BoundedCache('normPathsAndBase', NORM_PATHS_AND_BASE_CONTAINER)
 
 
 def _NormFile(filename):
@@ -349,6 +402,13 @@ def _NormPaths(filename, NORM_PATHS_CONTAINER=NORM_PATHS_CONTAINER):
     except:
         if filename.__class__ != str:
             raise AssertionError('Paths passed to _NormPaths must be str. Found: %s (%s)' % (filename, type(filename)))
+
+        if filename.startswith('<'):
+            # Not really a file, rather a synthetic name like <string> or <ipython-...>, so,
+            # there's nothing to normalize (and it's not cached as there may be many unique
+            # names such as the ones from generated templates).
+            return filename, filename
+
         if os is None:  # Interpreter shutdown
             return filename, filename
 
@@ -367,8 +427,11 @@ def _NormPaths(filename, NORM_PATHS_CONTAINER=NORM_PATHS_CONTAINER):
         abs_path = _NormPath(filename, os_path_abspath, isabs)
         real_path = _NormPath(filename, rPath, isabs)
 
-        # cache it for fast access later
-        NORM_PATHS_CONTAINER[filename] = abs_path, real_path
+        # cache it for fast access later (interned as the same paths are usually
+        # referenced from multiple caches).
+        abs_path = _intern(abs_path)
+        real_path = _intern(real_path)
+        _norm_paths_bounded_cache.add(filename, (abs_path, real_path))
         return abs_path, real_path
 
 
@@ -485,7 +548,9 @@ try:
         code = rPath.func_code
     except AttributeError:
         code = rPath.__code__
-    if not os_path_exists(_NormFile(code.co_filename)):
+    # Note: modules frozen in the interpreter (i.e.: '<frozen posixpath>' in Python 3.11 onwards)
+    # don't have a file in the disk, so, those can't be used for the check.
+    if not code.co_filename.startswith('<frozen ') and not os_path_exists(_NormFile(code.co_filename)):
         sys.stderr.write('-------------------------------------------------------------------------------\n')
         sys.stderr.write('pydev debugger: CRITICAL WARNING: This version of python seems to be incorrectly compiled (internal generated filenames are not absolute)\n')
         sys.stderr.write('pydev debugger: The debugger may still function, but it will work slower and may miss breakpoints.\n')
@@ -546,13 +611,16 @@ def _path_to_expected_str(filename):
     return filename
 
 
-def _original_file_to_client(filename, cache={}):
+_original_file_to_client_bounded_cache = _BoundedCache('pathsToClient', {})
+
+
+def _original_file_to_client(filename, cache=_original_file_to_client_bounded_cache.cache):
     try:
         return cache[filename]
     except KeyError:
         translated = _path_to_expected_str(get_path_with_real_case(_AbsFile(filename)))
-        cache[filename] = translated
-    return cache[filename]
+        _original_file_to_client_bounded_cache.add(filename, translated)
+    return translated
 
 
 _original_file_to_server = _NormFile
@@ -572,6 +640,11 @@ def _fix_path(path, sep):
 
 _last_client_server_paths_set = []
 
+# Caches used when translating with the paths set in setup_client_server_paths (cleared whenever
+# those change).
+_norm_filename_to_server_bounded_cache = _BoundedCache('mappedPathsToServer', {})
+_norm_filename_to_client_bounded_cache = _BoundedCache('mappedPathsToClient', {})
+
 _source_reference_to_server_filename = {}
 _client_filename_in_utf8_to_source_reference = {}
 _next_source_reference = partial(next, itertools.count(1))
@@ -603,8 +676,10 @@ def setup_client_server_paths(paths):
     python_sep = '\\' if IS_WINDOWS else '/'
     eclipse_sep = '\\' if _ide_os == 'WINDOWS' else '/'
 
-    norm_filename_to_server_container = {}
-    norm_filename_to_client_container = {}
+    _norm_filename_to_server_bounded_cache.clear()
+    _norm_filename_to_client_bounded_cache.clear()
+    norm_filename_to_server_container = _norm_filename_to_server_bounded_cache.cache
+    norm_filename_to_client_container = _norm_filename_to_client_bounded_cache.cache
     initial_paths = list(paths)
     paths_from_eclipse_to_python = initial_paths[:]
 
@@ -673,7 +748,7 @@ def setup_client_server_paths(paths):
                     # it back, so, having no translation is ok too).
                     translated = _NormFile(translated)
 
-            cache[filename] = translated
+            _norm_filename_to_server_bounded_cache.add(filename, translated)
             return translated
 
     def _norm_file_to_client(filename, cache=norm_filename_to_client_container):
@@ -726,7 +801,7 @@ def setup_client_server_paths(paths):
 
             # The resulting path is not in the python process, so, we cannot do a _NormFile here,
             # only at the beginning of this method.
-            cache[filename] = translated
+            _norm_filename_to_client_bounded_cache.add(filename, translated)
 
             if translated not in _client_filename_in_utf8_to_source_reference:
                 if path_mapping_applied:
@@ -764,13 +839,13 @@ def get_abs_path_real_path_and_base_from_file(
         abs_path, real_path = _NormPaths(f)
 
         try:
-            base = basename(real_path)
+            base = _intern(basename(real_path))
         except AttributeError:
             # Error during shutdown.
             i = max(f.rfind('/'), f.rfind('\\'))
             base = f[i + 1:]
         ret = abs_path, real_path, base
-        NORM_PATHS_AND_BASE_CONTAINER[f] = ret
+        _norm_paths_and_base_bounded_cache.add(f, ret)
         return ret
 
 
@@ -789,7 +864,7 @@ def get_abs_path_real_path_and_base_from_frame(frame):
 
         ret = get_abs_path_real_path_and_base_from_file(f)
         # Also cache based on the frame.f_code.co_filename (if we had it inside build/bdist it can make a difference).
-        NORM_PATHS_AND_BASE_CONTAINER[frame.f_code.co_filename] = ret
+        _norm_paths_and_base_bounded_cache.add(frame.f_code.co_filename, ret)
         return ret
 
 
@@ -1,11 +1,13 @@
 import inspect
 import traceback
+import weakref
 
 from _pydev_bundle import pydev_log
 from _pydevd_bundle.pydevd_breakpoints import LineBreakpoint
 from _pydevd_bundle.pydevd_comm import CMD_SET_BREAK, CMD_ADD_EXCEPTION_BREAK
 from _pydevd_bundle.pydevd_constants import STATE_SUSPEND, dict_iter_items, DJANGO_SUSPEND, IS_PY2
 from _pydevd_bundle.pydevd_frame_utils import add_exception_to_frame, FCode, just_raised, ignore_exception_trace
+from _pydevd_bundle import pydevd_template_lines
 from pydevd_file_utils import get_abs_path_real_path_and_base_from_file, normcase
 
 IS_DJANGO18 = False
@@ -80,17 +82,48 @@ def get_breakpoints(plugin, pydb, type):
     return None
 
 
+# These are checked on each call while template breakpoints are active, so, the results which
+# depend only on the class are cached (weakly-keyed so that the classes aren't kept alive).
+# cls -> names -> whether the class (or one of its bases) has one of the given names.
+_cls_to_names_to_inherits = weakref.WeakKeyDictionary()
+
+# cls -> whether a call to its `render` method is a template render call.
+_cls_to_is_render_node = weakref.WeakKeyDictionary()
+
+
 def _inherits(cls, *names):
-    if cls.__name__ in names:
-        return True
+    try:
+        names_to_inherits = _cls_to_names_to_inherits[cls]
+    except KeyError:
+        names_to_inherits = _cls_to_names_to_inherits[cls] = {}
+    else:
+        try:
+            return names_to_inherits[names]
+        except KeyError:
+            pass
+
     inherits_node = False
-    for base in inspect.getmro(cls):
-        if base.__name__ in names:
-            inherits_node = True
-            break
+    if cls.__name__ in names:
+        inherits_node = True
+    else:
+        for base in inspect.getmro(cls):
+            if base.__name__ in names:
+                inherits_node = True
+                break
+    names_to_inherits[names] = inherits_node
     return inherits_node
 
 
+def _is_render_node(cls):
+    try:
+        return _cls_to_is_render_node[cls]
+    except KeyError:
+        clsname = cls.__name__
+        is_render_node = _inherits(cls, 'Node') and clsname != 'TextNode' and clsname != 'NodeList'
+        _cls_to_is_render_node[cls] = is_render_node
+        return is_render_node
+
+
 def _is_django_render_call(frame, debug=False):
     try:
         name = frame.f_code.co_name
@@ -102,20 +135,14 @@ def _is_django_render_call(frame, debug=False):
 
         cls = frame.f_locals['self'].__class__
 
-        inherits_node = _inherits(cls, 'Node')
-
-        if not inherits_node:
-            return False
-
-        clsname = cls.__name__
         if IS_DJANGO19:
             # in Django 1.9 we need to save the flag that there is included template
-            if clsname == 'IncludeNode':
+            if cls.__name__ == 'IncludeNode' and _inherits(cls, 'Node'):
                 if 'context' in frame.f_locals:
                     context = frame.f_locals['context']
                     context._has_included_template = True
 
-        return clsname != 'TextNode' and clsname != 'NodeList'
+        return _is_render_node(cls)
     except:
         pydev_log.exception()
         return False
@@ -177,36 +204,6 @@ def _find_django_render_frame(frame):
 #=======================================================================================================================
 
 
-def _read_file(filename):
-    # type: (str) -> str
-    if IS_PY2:
-        f = open(filename, 'r')
-    else:
-        f = open(filename, 'r', encoding='utf-8', errors='replace')
-    s = f.read()
-    f.close()
-    return s
-
-
-def _offset_to_line_number(text, offset):
-    curLine = 1
-    curOffset = 0
-    while curOffset < offset:
-        if curOffset == len(text):
-            return -1
-        c = text[curOffset]
-        if c == '\n':
-            curLine += 1
-        elif c == '\r':
-            curLine += 1
-            if curOffset < len(text) and text[curOffset + 1] == '\n':
-                curOffset += 1
-
-        curOffset += 1
-
-    return curLine
-
-
 def _get_source_django_18_or_lower(frame):
     # This method is usable only for the Django <= 1.8
     try:
@@ -294,7 +291,7 @@ def _get_template_line(frame):
     source = _get_source_django_18_or_lower(frame)
     file_name = _get_template_file_name(frame)
     try:
-        return _offset_to_line_number(_read_file(file_name), source[1][0])
+        return pydevd_template_lines.offset_to_line_number(file_name, source[1][0])
     except:
         return None
 
@@ -1,8 +1,11 @@
+import weakref
+
 from _pydevd_bundle.pydevd_breakpoints import LineBreakpoint
 from _pydevd_bundle.pydevd_constants import STATE_SUSPEND, dict_iter_items, dict_keys, JINJA2_SUSPEND, \
     IS_PY2
 from _pydevd_bundle.pydevd_comm import CMD_SET_BREAK, CMD_ADD_EXCEPTION_BREAK
 from pydevd_file_utils import get_abs_path_real_path_and_base_from_file
+from _pydevd_bundle import pydevd_template_lines
 from _pydevd_bundle.pydevd_frame_utils import add_exception_to_frame, FCode
 from _pydev_bundle import pydev_log
 
@@ -68,12 +71,28 @@ def get_breakpoints(plugin, pydb, type):
     return None
 
 
+# code -> whether it's a template render function (checked on each call while template
+# breakpoints are active, so, it's cached).
+# Note: weakly-keyed as templates may be compiled again (i.e.: with auto_reload), which creates
+# new code objects.
+_code_to_is_render_call = weakref.WeakKeyDictionary()
+
+
 def _is_jinja2_render_call(frame):
     try:
-        name = frame.f_code.co_name
+        f_code = frame.f_code
+        try:
+            return _code_to_is_render_call[f_code]
+        except KeyError:
+            pass
+
+        name = f_code.co_name
         if "__jinja_template__" in frame.f_globals and name in ("root", "loop", "macro") or name.startswith("block_"):
-            return True
-        return False
+            is_render_call = True
+        else:
+            is_render_call = False
+        _code_to_is_render_call[f_code] = is_render_call
+        return is_render_call
     except:
         pydev_log.exception()
         return False
@@ -217,21 +236,15 @@ def _find_render_function_frame(frame):
 
 
 def _get_jinja2_template_line(frame):
-    debug_info = None
     if '__jinja_template__' in frame.f_globals:
-        _debug_info = frame.f_globals['__jinja_template__']._debug_info
+        template = frame.f_globals['__jinja_template__']
+        _debug_info = template._debug_info
         if _debug_info != '':
             # sometimes template contains only plain text
-            debug_info = frame.f_globals['__jinja_template__'].debug_info
-
-    if debug_info is None:
-        return None
-
-    lineno = frame.f_lineno
-
-    for pair in debug_info:
-        if pair[1] == lineno:
-            return pair[0]
+            # Note: the `debug_info` is parsed from the `_debug_info` string on each access, so,
+            # the mapping is cached based on that string.
+            return pydevd_template_lines.get_mapped_line(
+                _debug_info, frame.f_lineno, lambda: template.debug_info)
 
     return None
 
@@ -123,3 +123,74 @@ class Test(unittest.TestCase):
         result = pydevd_referrers.get_referrer_info(t.frame)
         assert 'MyThread' in result
 
+
+    def test_get_referrers_index(self):
+
+        class MyClass(object):
+
+            def __init__(self):
+                pass
+
+        contained = [1, 2]
+        container = [0, contained]
+        obj = MyClass()
+        obj.contained = contained
+
+        referrers_index = pydevd_referrers.ReferrersIndex()
+        while not referrers_index.build(timeout=0.001):
+            pass
+
+        # The index may be reused for multiple queries.
+        for _i in range(2):
+            referrers, truncated = pydevd_referrers.get_referrers(
+                contained, referrers_index=referrers_index)
+            assert not truncated
+            found = dict((id(r), found_as) for (r, found_as) in referrers)
+            assert found[id(container)] == 'list[1]'
+            if sys.version_info[:2] < (3, 11):
+                # In 3.11 the instance dict may not be materialized.
+                assert found[id(obj)] == 'contained'
+
+        referrers, truncated = pydevd_referrers.get_referrers(
+            contained, max_results=1, referrers_index=referrers_index)
+        assert len(referrers) == 1
+        assert truncated
+
+        result = pydevd_referrers.get_referrer_info(contained, referrers_index=referrers_index)
+        assert 'list[1]' in result
+
+        referrers_index.cancel()
+        assert not referrers_index.complete
+        referrers, truncated = pydevd_referrers.get_referrers(
+            contained, referrers_index=referrers_index)
+        assert 'list[1]' in [found_as for (_r, found_as) in referrers]
+
+    def test_get_referrers_index_too_big(self):
+        referrers_index = pydevd_referrers.ReferrersIndex(max_objects=1)
+        assert not referrers_index.build()
+        assert referrers_index.too_big
+        assert not referrers_index.complete
+
+        contained = [1, 2]
+        container = [0, contained]
+        referrers, truncated = pydevd_referrers.get_referrers(
+            contained, referrers_index=referrers_index)
+        assert not truncated
+        assert id(container) in [id(r) for (r, _found_as) in referrers]
+
+    def test_get_referrers_dict_owners(self):
+
+        class MyClass(object):
+            pass
+
+        contained = [1, 2]
+        objs = [MyClass() for _i in range(3)]
+        for obj in objs:
+            obj.contained = contained
+            obj.__dict__  # Make sure that the dict is materialized.
+
+        referrers, truncated = pydevd_referrers.get_referrers(contained)
+        assert not truncated
+        found = dict((id(r), found_as) for (r, found_as) in referrers)
+        for obj in objs:
+            assert found[id(obj)] == 'contained'
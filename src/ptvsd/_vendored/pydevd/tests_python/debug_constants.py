@@ -23,6 +23,8 @@ if sys.version_info[0] == 3 and sys.version_info[1] == 6:
 TEST_DJANGO = False
 TEST_FLASK = False
 TEST_CHERRYPY = False
+TEST_NUMPY = False
+TEST_PANDAS = False
 
 try:
     import django
@@ -41,3 +43,15 @@ try:
     TEST_CHERRYPY = True
 except:
     pass
+
+try:
+    import numpy
+    TEST_NUMPY = True
+except:
+    pass
+
+try:
+    import pandas
+    TEST_PANDAS = True
+except:
+    pass
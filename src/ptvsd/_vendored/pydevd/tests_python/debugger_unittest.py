@@ -8,6 +8,7 @@ except ImportError:
 
 import re
 import socket
+import struct
 import subprocess
 import threading
 import time
@@ -202,6 +203,7 @@ class ReaderThread(threading.Thread):
         self._queue = Queue()
         self._kill = False
         self.accept_xml_messages = True
+        self.compact_messages_received = 0
 
     def set_messages_timeout(self, timeout):
         self.MESSAGES_TIMEOUT = timeout
@@ -279,6 +281,30 @@ class ReaderThread(threading.Thread):
             content_len = -1
 
             while not self._kill:
+                if content_len == -1:
+                    if not self._buffer:
+                        r = self.sock.recv(1024)
+                        if not r:
+                            break
+                        self._buffer += r
+
+                    if self._buffer[:1] == b'\x00':
+                        # Message in the compact encoding: marker + length (4 bytes, big endian) + payload.
+                        header = self._read(5)
+                        if len(header) != 5:
+                            break
+                        json_contents = self._read(struct.unpack('>I', header[1:])[0])
+                        if len(json_contents) == 0:
+                            break
+
+                        self.compact_messages_received += 1
+                        msg = json_contents
+                        if IS_PY3K:
+                            msg = msg.decode('utf-8')
+                        print('Test Reader Thread Received %s' % (msg,))
+                        self._queue.put(msg)
+                        continue
+
                 line = self._read_line()
 
                 if not line:
@@ -651,6 +677,9 @@ class AbstractWriterThread(threading.Thread):
         self._next_breakpoint_id = 0
         self.log = []
 
+        # Set to True to send json messages in the compact encoding (after it's negotiated).
+        self.compact_encoding = False
+
     def run(self):
         self.start_socket()
 
@@ -795,6 +824,10 @@ class AbstractWriterThread(threading.Thread):
         if not isinstance(msg, bytes):
             msg = msg.encode('utf-8')
 
+        if self.compact_encoding:
+            self.sock.sendall(b'\x00' + struct.pack('>I', len(msg)) + msg)
+            return
+
         self.sock.sendall((u'Content-Length: %s\r\n\r\n' % len(msg)).encode('ascii'))
         self.sock.sendall(msg)
 
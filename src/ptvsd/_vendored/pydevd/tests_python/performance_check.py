@@ -1,49 +1,111 @@
+'''
+Benchmarks the debugger overhead (to be run manually, i.e.: python -m tests_python.performance_check
+from the pydevd dir -- use --help to see the options).
+
+Each scenario runs one of the `resources/_performance_*.py` programs (which print `TotalTime>>...<<`)
+in the debugger with each backend (regular, cython and frame_eval -- backends which aren't available
+for the current interpreter, i.e.: because the cython extensions aren't compiled, are skipped) and
+also without the debugger (no_debugger) for reference.
+
+Each scenario is run `--warmup` times (discarded) and then `--runs` times. The median and the
+interquartile range of the runs are reported (and saved along with all the times with `--json`,
+so that the results can be compared over time).
+'''
 from tests_python import debugger_unittest
+import argparse
+import json
+import subprocess
 import sys
 import re
 import os
 
 CHECK_BASELINE, CHECK_REGULAR, CHECK_CYTHON, CHECK_FRAME_EVAL = 'baseline', 'regular', 'cython', 'frame_eval'
 
+CHECK_NO_DEBUGGER = 'no_debugger'
+
 pytest_plugins = [
     str('tests_python.debugger_fixtures'),
 ]
 
 RUNS = 5
 
+WARMUP_RUNS = 1
 
-class PerformanceWriterThread(debugger_unittest.AbstractWriterThread):
+# Directory with another checkout of pydevd to be checked against (set with --baseline).
+BASELINE_DIR = None
 
-    CHECK = None
+PYDEVD_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-    debugger_unittest.AbstractWriterThread.get_environ  # overrides
 
-    def get_environ(self):
-        env = os.environ.copy()
-        if self.CHECK == CHECK_BASELINE:
-            env['PYTHONPATH'] = r'X:\PyDev.Debugger.baseline'
+def _percentile(sorted_values, percent):
+    k = (len(sorted_values) - 1) * percent
+    f = int(k)
+    c = min(f + 1, len(sorted_values) - 1)
+    return sorted_values[f] + (sorted_values[c] - sorted_values[f]) * (k - f)
+
+
+def get_stats(times):
+    sorted_times = sorted(times)
+    return {
+        'median': _percentile(sorted_times, .5),
+        'iqr': _percentile(sorted_times, .75) - _percentile(sorted_times, .25),
+        'min': sorted_times[0],
+        'max': sorted_times[-1],
+        'times': times,
+    }
+
+
+def get_environ(check):
+    env = os.environ.copy()
+    if check == CHECK_BASELINE:
+        env['PYTHONPATH'] = BASELINE_DIR
+
+    elif check == CHECK_CYTHON:
+        env['PYDEVD_USE_CYTHON'] = 'YES'
+        env['PYDEVD_USE_FRAME_EVAL'] = 'NO'
+
+    elif check == CHECK_FRAME_EVAL:
+        env['PYDEVD_USE_CYTHON'] = 'YES'
+        env['PYDEVD_USE_FRAME_EVAL'] = 'YES'
 
-        elif self.CHECK == CHECK_CYTHON:
-            env['PYDEVD_USE_CYTHON'] = 'YES'
-            env['PYDEVD_USE_FRAME_EVAL'] = 'NO'
+    elif check in (CHECK_REGULAR, CHECK_NO_DEBUGGER):
+        env['PYDEVD_USE_CYTHON'] = 'NO'
+        env['PYDEVD_USE_FRAME_EVAL'] = 'NO'
 
-        elif self.CHECK == CHECK_FRAME_EVAL:
-            env['PYDEVD_USE_CYTHON'] = 'YES'
-            env['PYDEVD_USE_FRAME_EVAL'] = 'YES'
+    else:
+        raise AssertionError("Don't know what to check.")
+    return env
 
-        elif self.CHECK == CHECK_REGULAR:
-            env['PYDEVD_USE_CYTHON'] = 'NO'
-            env['PYDEVD_USE_FRAME_EVAL'] = 'NO'
 
-        else:
-            raise AssertionError("Don't know what to check.")
-        return env
+def is_check_available(check):
+    '''
+    :return bool:
+        Whether pydevd can be imported with the given backend (i.e.: the cython extensions may not
+        be compiled for the current interpreter).
+    '''
+    if check == CHECK_NO_DEBUGGER:
+        return True
+    cwd = BASELINE_DIR if check == CHECK_BASELINE else PYDEVD_DIR
+    with open(os.devnull, 'w') as devnull:
+        return subprocess.call(
+            [sys.executable, '-c', 'import pydevd'],
+            env=get_environ(check), cwd=cwd, stdout=devnull, stderr=devnull) == 0
+
+
+class PerformanceWriterThread(debugger_unittest.AbstractWriterThread):
+
+    CHECK = None
+
+    debugger_unittest.AbstractWriterThread.get_environ  # overrides
+
+    def get_environ(self):
+        return get_environ(self.CHECK)
 
     debugger_unittest.AbstractWriterThread.get_pydevd_file  # overrides
 
     def get_pydevd_file(self):
         if self.CHECK == CHECK_BASELINE:
-            return os.path.abspath(os.path.join(r'X:\PyDev.Debugger.baseline', 'pydevd.py'))
+            return os.path.abspath(os.path.join(BASELINE_DIR, 'pydevd.py'))
         dirname = os.path.dirname(__file__)
         dirname = os.path.dirname(dirname)
         return os.path.abspath(os.path.join(dirname, 'pydevd.py'))
@@ -51,6 +113,15 @@ class PerformanceWriterThread(debugger_unittest.AbstractWriterThread):
 
 class CheckDebuggerPerformance(debugger_unittest.DebuggerRunner):
 
+    def __init__(self, tmpdir, check, runs=RUNS, warmup_runs=WARMUP_RUNS):
+        debugger_unittest.DebuggerRunner.__init__(self, tmpdir)
+        self.check = check
+        self.runs = runs
+        self.warmup_runs = warmup_runs
+
+        # Benchmark name -> stats.
+        self.results = {}
+
     def get_command_line(self):
         return [sys.executable]
 
@@ -59,40 +130,48 @@ class CheckDebuggerPerformance(debugger_unittest.DebuggerRunner):
         time_taken = match.group(1)
         return float(time_taken)
 
+    def _run_without_debugger(self, filename):
+        args = self.get_command_line()
+        args.append(filename)
+        stdout = subprocess.check_output(args, env=get_environ(CHECK_NO_DEBUGGER))
+        return self._get_time_from_result(stdout.decode('utf-8'))
+
     def obtain_results(self, benchmark_name, filename):
 
         class PerformanceCheck(PerformanceWriterThread):
             TEST_FILE = debugger_unittest._get_debugger_test_file(filename)
             BENCHMARK_NAME = benchmark_name
+            CHECK = self.check
 
         writer_thread_class = PerformanceCheck
 
-        runs = RUNS
         all_times = []
-        for _ in range(runs):
-            stdout_ref = []
+        for i in range(self.warmup_runs + self.runs):
+            if self.check == CHECK_NO_DEBUGGER:
+                # Nothing is yielded (there's no debugger to be configured by the scenario).
+                time_taken = self._run_without_debugger(writer_thread_class.TEST_FILE)
+            else:
+                stdout_ref = []
 
-            def store_stdout(stdout, stderr):
-                stdout_ref.append(stdout)
+                def store_stdout(stdout, stderr):
+                    stdout_ref.append(stdout)
 
-            with self.check_case(writer_thread_class) as writer:
-                writer.additional_output_checks = store_stdout
-                yield writer
+                with self.check_case(writer_thread_class) as writer:
+                    writer.additional_output_checks = store_stdout
+                    yield writer
 
-            assert len(stdout_ref) == 1
-            all_times.append(self._get_time_from_result(stdout_ref[0]))
-            print('partial for: %s: %.3fs' % (writer_thread_class.BENCHMARK_NAME, all_times[-1]))
-        if len(all_times) > 3:
-            all_times.remove(min(all_times))
-            all_times.remove(max(all_times))
-        time_when_debugged = sum(all_times) / float(len(all_times))
+                assert len(stdout_ref) == 1
+                time_taken = self._get_time_from_result(stdout_ref[0])
 
-        args = self.get_command_line()
-        args.append(writer_thread_class.TEST_FILE)
-        # regular_time = self._get_time_from_result(self.run_process(args, writer_thread=None))
-        # simple_trace_time = self._get_time_from_result(self.run_process(args+['--regular-trace'], writer_thread=None))
+            if i >= self.warmup_runs:
+                all_times.append(time_taken)
+                print('partial for: %s (%s): %.3fs' % (writer_thread_class.BENCHMARK_NAME, self.check, all_times[-1]))
+
+        stats = get_stats(all_times)
+        self.results[benchmark_name] = stats
+        time_when_debugged = stats['median']
 
-        if 'SPEEDTIN_AUTHORIZATION_KEY' in os.environ:
+        if 'SPEEDTIN_AUTHORIZATION_KEY' in os.environ and self.check != CHECK_NO_DEBUGGER:
 
             SPEEDTIN_AUTHORIZATION_KEY = os.environ['SPEEDTIN_AUTHORIZATION_KEY']
 
@@ -104,7 +183,7 @@ class CheckDebuggerPerformance(debugger_unittest.DebuggerRunner):
                 project_ids = (pydevd_cython_project_id, pydevd_pure_python_project_id)
             elif writer_thread_class.CHECK == CHECK_REGULAR:
                 project_ids = (pydevd_pure_python_project_id,)
-            elif writer_thread_class.CHECK == CHECK_CYTHON:
+            elif writer_thread_class.CHECK in (CHECK_CYTHON, CHECK_FRAME_EVAL):
                 project_ids = (pydevd_cython_project_id,)
             else:
                 raise AssertionError('Wrong check: %s' % (writer_thread_class.CHECK))
@@ -132,7 +211,8 @@ class CheckDebuggerPerformance(debugger_unittest.DebuggerRunner):
                 )
                 api.commit()
 
-        self.performance_msg = '%s: %.3fs ' % (writer_thread_class.BENCHMARK_NAME, time_when_debugged)
+        self.performance_msg = '%s: %.3fs (iqr: %.3fs)' % (
+            writer_thread_class.BENCHMARK_NAME, time_when_debugged, stats['iqr'])
 
     def method_calls_with_breakpoint(self):
         for writer in self.obtain_results('method_calls_with_breakpoint', '_performance_1.py'):
@@ -172,6 +252,15 @@ class CheckDebuggerPerformance(debugger_unittest.DebuggerRunner):
 
         return self.performance_msg
 
+    def method_calls_with_conditional_breakpoint(self):
+        for writer in self.obtain_results('method_calls_with_conditional_breakpoint', '_performance_1.py'):
+            # The condition is evaluated in every iteration of the loop (and is never satisfied).
+            writer.write_add_breakpoint(14, 'method', condition='i == -1')
+            writer.write_make_initial_run()
+            writer.finished_ok = True
+
+        return self.performance_msg
+
     def global_scope_1_with_breakpoint(self):
         for writer in self.obtain_results('global_scope_1_with_breakpoint', '_performance_2.py'):
             writer.write_add_breakpoint(writer.get_line_index_with_content('Breakpoint here'), None)
@@ -188,6 +277,117 @@ class CheckDebuggerPerformance(debugger_unittest.DebuggerRunner):
 
         return self.performance_msg
 
+    def _unreachable_breakpoint(self, benchmark_name, filename):
+        for writer in self.obtain_results(benchmark_name, filename):
+            writer.write_add_breakpoint(writer.get_line_index_with_content('Unreachable breakpoint here'), None)
+            writer.write_make_initial_run()
+            writer.finished_ok = True
+
+        return self.performance_msg
+
+    def deep_recursion_with_breakpoint(self):
+        return self._unreachable_breakpoint('deep_recursion_with_breakpoint', '_performance_recursion.py')
+
+    def generators_with_breakpoint(self):
+        return self._unreachable_breakpoint('generators_with_breakpoint', '_performance_generators.py')
+
+    def coroutines_with_breakpoint(self):
+        return self._unreachable_breakpoint('coroutines_with_breakpoint', '_performance_coroutines.py')
+
+    def exceptions_with_breakpoint(self):
+        return self._unreachable_breakpoint('exceptions_with_breakpoint', '_performance_exceptions.py')
+
+    def exceptions_with_exception_breakpoint(self):
+        for writer in self.obtain_results('exceptions_with_exception_breakpoint', '_performance_exceptions.py'):
+            # Only uncaught exceptions are checked (all the exceptions in the benchmark are handled).
+            writer.write_add_exception_breakpoint('KeyError')
+            writer.write_make_initial_run()
+            writer.finished_ok = True
+
+        return self.performance_msg
+
+    def many_threads_with_breakpoint(self):
+        return self._unreachable_breakpoint('many_threads_with_breakpoint', '_performance_threads.py')
+
+
+SCENARIOS = [
+    'method_calls_with_breakpoint',
+    'method_calls_without_breakpoint',
+    'method_calls_with_step_over',
+    'method_calls_with_exception_breakpoint',
+    'method_calls_with_conditional_breakpoint',
+    'global_scope_1_with_breakpoint',
+    'global_scope_2_with_breakpoint',
+    'deep_recursion_with_breakpoint',
+    'generators_with_breakpoint',
+    'coroutines_with_breakpoint',
+    'exceptions_with_breakpoint',
+    'exceptions_with_exception_breakpoint',
+    'many_threads_with_breakpoint',
+]
+
+
+def main():
+    global BASELINE_DIR
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=RUNS)
+    parser.add_argument('--warmup', type=int, default=WARMUP_RUNS)
+    parser.add_argument(
+        '--checks', default=','.join((CHECK_NO_DEBUGGER, CHECK_REGULAR, CHECK_CYTHON, CHECK_FRAME_EVAL)),
+        help='comma-separated backends to check (%s)' % (
+            ', '.join((CHECK_NO_DEBUGGER, CHECK_REGULAR, CHECK_CYTHON, CHECK_FRAME_EVAL, CHECK_BASELINE)),))
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='comma-separated scenarios to run')
+    parser.add_argument('--baseline', help='dir with another checkout of pydevd to check against')
+    parser.add_argument('--json', help='write the results to this file')
+    args = parser.parse_args()
+
+    BASELINE_DIR = args.baseline
+    checks = args.checks.split(',')
+    if CHECK_BASELINE in checks and not BASELINE_DIR:
+        parser.error('--baseline is required to check the baseline.')
+
+    scenarios = args.scenarios.split(',')
+    if sys.version_info[:2] < (3, 5) and 'coroutines_with_breakpoint' in scenarios:
+        scenarios.remove('coroutines_with_breakpoint')
+
+    debugger_unittest.SHOW_WRITES_AND_READS = False
+    debugger_unittest.SHOW_OTHER_DEBUG_INFO = False
+    debugger_unittest.SHOW_STDOUT = False
+
+    import time
+    start_time = time.time()
+
+    tmpdir = None
+
+    msgs = []
+    results = {}
+    for check in checks:
+        if not is_check_available(check):
+            msgs.append('Skipping: %s (not available)' % (check,))
+            continue
+
+        msgs.append('Checking: %s' % (check,))
+        check_debugger_performance = CheckDebuggerPerformance(tmpdir, check, runs=args.runs, warmup_runs=args.warmup)
+        for scenario in scenarios:
+            msgs.append(getattr(check_debugger_performance, scenario)())
+        results[check] = check_debugger_performance.results
+
+    for msg in msgs:
+        print(msg)
+
+    print('TotalTime for profile: %.2fs' % (time.time() - start_time,))
+
+    if args.json:
+        with open(args.json, 'w') as stream:
+            json.dump({
+                'python': sys.version,
+                'platform': sys.platform,
+                'runs': args.runs,
+                'warmup': args.warmup,
+                'results': results,
+            }, stream, indent=4, sort_keys=True)
+
 
 if __name__ == '__main__':
     # Local times gotten (python 3.6)
@@ -212,34 +412,4 @@ if __name__ == '__main__':
     # global_scope_1_with_breakpoint: 0.281s
     # global_scope_2_with_breakpoint: 0.169s
     # TotalTime for profile: 209.01s
-
-    debugger_unittest.SHOW_WRITES_AND_READS = False
-    debugger_unittest.SHOW_OTHER_DEBUG_INFO = False
-    debugger_unittest.SHOW_STDOUT = False
-
-    import time
-    start_time = time.time()
-
-    tmpdir = None
-
-    msgs = []
-    for check in (
-            # CHECK_BASELINE, -- Checks against the version checked out at X:\PyDev.Debugger.baseline.
-            CHECK_REGULAR,
-            CHECK_CYTHON,
-            CHECK_FRAME_EVAL,
-        ):
-        PerformanceWriterThread.CHECK = check
-        msgs.append('Checking: %s' % (check,))
-        check_debugger_performance = CheckDebuggerPerformance(tmpdir)
-        msgs.append(check_debugger_performance.method_calls_with_breakpoint())
-        msgs.append(check_debugger_performance.method_calls_without_breakpoint())
-        msgs.append(check_debugger_performance.method_calls_with_step_over())
-        msgs.append(check_debugger_performance.method_calls_with_exception_breakpoint())
-        msgs.append(check_debugger_performance.global_scope_1_with_breakpoint())
-        msgs.append(check_debugger_performance.global_scope_2_with_breakpoint())
-
-    for msg in msgs:
-        print(msg)
-
-    print('TotalTime for profile: %.2fs' % (time.time() - start_time,))
+    main()
@@ -0,0 +1,176 @@
+'''
+Measures the CPU time to create the messages which are sent/received frequently when stepping
+(to be run manually, i.e.: python performance_messages_check.py).
+
+For each message, compares creating it through the generated schema classes (`to_dict()` on the
+full object graph / `from_dict()` to the full object graph) with creating it directly as a dict
+(as pydevd does now). The NetCommand creation (i.e.: json.dumps) is included for the messages
+sent and `from_json` for the messages received.
+
+Reports the median (of RUNS runs) of the CPU time per message.
+'''
+import json
+import os
+import sys
+import time
+
+RUNS = 5
+
+ITERATIONS = 2000
+
+PYDEVD_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PYDEVD_DIR)
+
+from _pydevd_bundle._debug_adapter import pydevd_base_schema  # noqa
+from _pydevd_bundle._debug_adapter import pydevd_schema  # noqa
+from _pydevd_bundle.pydevd_constants import HTTP_JSON_PROTOCOL, set_protocol  # noqa
+from _pydevd_bundle.pydevd_net_command import NetCommand  # noqa
+
+try:
+    process_time = time.process_time
+except AttributeError:
+    process_time = time.clock  # Python 2
+
+FRAMES = 20
+
+VARIABLES = 30
+
+THREADS = 10
+
+
+def _frame(i):
+    return (i + 1, 'function_%s' % (i,), 10 + i, '/home/user/project/module_%s.py' % (i,))
+
+
+def _var_data(i):
+    return {
+        'name': 'variable_%s' % (i,),
+        'value': repr(list(range(i % 5))),
+        'type': 'list',
+        'evaluateName': 'variable_%s' % (i,),
+        'variablesReference': i + 100,
+    }
+
+
+def output_schema():
+    event = pydevd_schema.OutputEvent(pydevd_schema.OutputEventBody('some output\n', 'stdout'))
+    return NetCommand(0, 0, event, is_json=True)
+
+
+def output_dict():
+    event = {'type': 'event', 'event': 'output', 'body': {'output': 'some output\n', 'category': 'stdout', 'source': {}}}
+    return NetCommand(0, 0, event, is_json=True)
+
+
+def stopped_schema():
+    body = pydevd_schema.StoppedEventBody(
+        reason='step', threadId='pid_1_id_2', allThreadsStopped=True, preserveFocusHint=False)
+    return NetCommand(0, 0, pydevd_schema.StoppedEvent(body), is_json=True)
+
+
+def stopped_dict():
+    body = {'reason': 'step', 'threadId': 'pid_1_id_2', 'preserveFocusHint': False, 'allThreadsStopped': True}
+    event = {'type': 'event', 'event': 'stopped', 'body': pydevd_schema.StoppedEventBody.update_dict_ids_to_dap(body)}
+    return NetCommand(0, 0, event, is_json=True)
+
+
+def stack_trace_schema():
+    frames = []
+    for frame_id, name, line, path in (_frame(i) for i in range(FRAMES)):
+        frames.append(pydevd_schema.StackFrame(
+            frame_id, name, line, column=1, source={'path': path, 'sourceReference': 0},
+            presentationHint=None).to_dict())
+    response = pydevd_schema.StackTraceResponse(
+        request_seq=1, success=True, command='stackTrace',
+        body=pydevd_schema.StackTraceResponseBody(stackFrames=frames, totalFrames=len(frames)))
+    return NetCommand(0, 0, response, is_json=True)
+
+
+def stack_trace_dict():
+    update_frame_ids_to_dap = pydevd_schema.StackFrame.update_dict_ids_to_dap
+    frames = []
+    for frame_id, name, line, path in (_frame(i) for i in range(FRAMES)):
+        frames.append(update_frame_ids_to_dap({
+            'id': frame_id, 'name': name, 'line': line, 'column': 1,
+            'source': {'path': path, 'sourceReference': 0}}))
+    response = pydevd_base_schema.build_response_dict(
+        1, 'stackTrace', {'stackFrames': frames, 'totalFrames': len(frames)})
+    return NetCommand(0, 0, response, is_json=True)
+
+
+def variables_schema():
+    variables = [_var_data(i) for i in range(VARIABLES)]
+    request = pydevd_schema.VariablesRequest(pydevd_schema.VariablesArguments(0), seq=1)
+    response = pydevd_base_schema.build_response(
+        request, kwargs={'body': pydevd_schema.VariablesResponseBody(variables)})
+    return NetCommand(0, 0, response, is_json=True)
+
+
+def variables_dict():
+    update_variable_ids_to_dap = pydevd_schema.Variable.update_dict_ids_to_dap
+    variables = [update_variable_ids_to_dap(_var_data(i)) for i in range(VARIABLES)]
+    response = pydevd_base_schema.build_response_dict(1, 'variables', {'variables': variables})
+    return NetCommand(0, 0, response, is_json=True)
+
+
+def threads_schema():
+    threads = [pydevd_schema.Thread(id='pid_1_id_%s' % (i,), name='Thread-%s' % (i,)).to_dict() for i in range(THREADS)]
+    response = pydevd_schema.ThreadsResponse(
+        request_seq=1, success=True, command='threads', body=pydevd_schema.ThreadsResponseBody(threads))
+    return NetCommand(0, 0, response, is_json=True)
+
+
+def threads_dict():
+    update_thread_ids_to_dap = pydevd_schema.Thread.update_dict_ids_to_dap
+    threads = [update_thread_ids_to_dap({'id': 'pid_1_id_%s' % (i,), 'name': 'Thread-%s' % (i,)}) for i in range(THREADS)]
+    response = pydevd_base_schema.build_response_dict(1, 'threads', {'threads': threads})
+    return NetCommand(0, 0, response, is_json=True)
+
+
+def next_schema(json_msg):
+    # As `from_json` used to create it (with the full object graph) + the response.
+    dct = json.loads(json_msg)
+    request = pydevd_schema.NextRequest(update_ids_from_dap=True, **dct)
+    return NetCommand(0, 0, pydevd_base_schema.build_response(request), is_json=True)
+
+
+def next_dict(json_msg):
+    request = pydevd_base_schema.from_json(json_msg, update_ids_from_dap=True)
+    response = pydevd_base_schema.build_response_dict(request.seq, request.command)
+    return NetCommand(0, 0, response, is_json=True)
+
+
+def _measure(func, *args):
+    times = []
+    for _ in range(RUNS):
+        start = process_time()
+        for _ in range(ITERATIONS):
+            func(*args)
+        times.append((process_time() - start) / ITERATIONS)
+    times.sort()
+    return times[len(times) // 2]
+
+
+def main():
+    set_protocol(HTTP_JSON_PROTOCOL)
+    pydevd_base_schema.BaseSchema.initialize_ids_translation()
+    thread_id = pydevd_base_schema.BaseSchema._translate_id_to_dap('pid_1_id_2')
+    next_json = json.dumps({'type': 'request', 'command': 'next', 'seq': 1, 'arguments': {'threadId': thread_id}})
+
+    checks = [
+        ('output', (output_schema,), (output_dict,)),
+        ('stopped', (stopped_schema,), (stopped_dict,)),
+        ('stackTrace (%s frames)' % (FRAMES,), (stack_trace_schema,), (stack_trace_dict,)),
+        ('variables (%s variables)' % (VARIABLES,), (variables_schema,), (variables_dict,)),
+        ('threads (%s threads)' % (THREADS,), (threads_schema,), (threads_dict,)),
+        ('next (request + response)', (next_schema, next_json), (next_dict, next_json)),
+    ]
+    for name, schema_args, dict_args in checks:
+        schema_time = _measure(*schema_args)
+        dict_time = _measure(*dict_args)
+        print('%-28s schema: %7.1f us  dict: %7.1f us  (%.0f%% less CPU)' % (
+            name, schema_time * 1e6, dict_time * 1e6, (1 - dict_time / schema_time) * 100))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+'''
+Measures the time to the first breakpoint in multiprocessing pool workers (to be run manually,
+i.e.: python performance_subprocess_check.py).
+
+The client (i.e.: the IDE and the debug adapter) is emulated here: each subprocess which connects
+is only configured (attach/setBreakpoints/configurationDone) after a delay which emulates the
+time it takes for the IDE to start a new debug session for it.
+
+Modes:
+
+    handshake: the subprocess waits for the client to configure it to start running.
+
+    inherited: the subprocess is asked to start running with the configuration inherited from
+        its parent process as soon as it connects (see: `pydevdRunWithInheritedConfig`).
+
+For each start method ('fork' and 'spawn') and mode, the time until the first breakpoint is
+reported to the client and the total time to run the pool are reported (median of RUNS runs).
+'''
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+RUNS = 5
+
+WORKERS = 4
+
+# Emulates the time it takes for the IDE to start a debug session for a subprocess.
+CLIENT_DELAY = .5
+
+PYDEVD_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+POOL_CODE = '''
+import multiprocessing
+import sys
+import time
+
+# The debugger created in a forked process uses the default protocol (ptvsd does the same).
+import pydevd
+pydevd.PydevdCustomization.DEFAULT_PROTOCOL = 'http_json'
+
+
+def work(i):
+    time.sleep(.2)  # Some work before the breakpoint.
+    if i == 0:
+        pass  # break here
+    return i
+
+
+if __name__ == '__main__':
+    multiprocessing.set_start_method(sys.argv[1])
+    pool = multiprocessing.Pool(%(workers)s)
+    pool.map(work, range(%(workers)s * 2))
+    pool.close()
+    pool.join()
+''' % dict(workers=WORKERS)
+
+
+class _Connection(object):
+
+    def __init__(self, sock):
+        self._sock = sock
+        self._stream = sock.makefile('rb')
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def send(self, command, **arguments):
+        with self._lock:
+            self._seq += 1
+            contents = json.dumps(
+                {'type': 'request', 'command': command, 'arguments': arguments, 'seq': self._seq}).encode('utf-8')
+            self._sock.sendall(('Content-Length: %s\r\n\r\n' % (len(contents),)).encode('ascii') + contents)
+
+    def read(self):
+        content_len = None
+        while True:
+            line = self._stream.readline()
+            if not line:
+                return None
+            if line.startswith(b'Content-Length:'):
+                content_len = int(line.split(b':')[1])
+            elif line == b'\r\n' and content_len is not None:
+                return json.loads(self._stream.read(content_len).decode('utf-8'))
+
+
+def _handle_connection(sock, is_subprocess, mode, target, line, on_stopped):
+    conn = _Connection(sock)
+    if is_subprocess:
+        if mode == 'inherited':
+            conn.send('pydevdRunWithInheritedConfig')
+        time.sleep(CLIENT_DELAY)
+        conn.send('attach')
+    else:
+        conn.send('launch')
+    conn.send('setDebuggerProperty', multiThreadsSingleNotification=True)
+    conn.send('setBreakpoints', source={'path': target}, breakpoints=[{'line': line}])
+    conn.send('configurationDone')
+
+    while True:
+        msg = conn.read()
+        if msg is None:
+            return
+        if msg.get('event') == 'stopped':
+            on_stopped()
+            conn.send('continue', threadId=msg['body']['threadId'])
+
+
+def run(start_method, mode, target, line):
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(WORKERS + 1)
+    server.settimeout(.2)
+    port = server.getsockname()[1]
+
+    stopped_times = []
+    env = os.environ.copy()
+    env['PYTHONPATH'] = PYDEVD_DIR + os.pathsep + env.get('PYTHONPATH', '')
+
+    initial_time = time.time()
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(PYDEVD_DIR, 'pydevd.py'), '--multiprocess', '--client', '127.0.0.1',
+         '--port', str(port), '--json-dap-http', '--file', target, start_method],
+        env=env,
+    )
+    try:
+        is_subprocess = False
+        while process.poll() is None:
+            try:
+                sock, _addr = server.accept()
+            except socket.timeout:
+                continue
+            t = threading.Thread(
+                target=_handle_connection,
+                args=(sock, is_subprocess, mode, target, line, lambda: stopped_times.append(time.time())))
+            t.daemon = True
+            t.start()
+            is_subprocess = True
+    finally:
+        server.close()
+    elapsed = time.time() - initial_time
+    return min(stopped_times) - initial_time, elapsed
+
+
+def main():
+    fd, target = tempfile.mkstemp(suffix='.py')
+    os.close(fd)
+    try:
+        with open(target, 'w') as stream:
+            stream.write(POOL_CODE)
+        line = POOL_CODE.splitlines().index('        pass  # break here')
+
+        for start_method in ('fork', 'spawn'):
+            for mode in ('handshake', 'inherited'):
+                results = [run(start_method, mode, target, line + 1) for _ in range(RUNS)]
+                first_breakpoint = sorted(r[0] for r in results)[RUNS // 2]
+                total = sorted(r[1] for r in results)[RUNS // 2]
+                print('%s/%s: first breakpoint: %.3fs, total: %.3fs (median of %s runs, %s workers)' % (
+                    start_method, mode, first_breakpoint, total, RUNS, WORKERS))
+    finally:
+        os.remove(target)
+
+
+if __name__ == '__main__':
+    main()
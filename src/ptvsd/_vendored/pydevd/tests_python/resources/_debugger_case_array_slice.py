@@ -0,0 +1,17 @@
+import numpy as np
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+def call():
+    arr = np.arange(100000, dtype=np.float64).reshape(1000, 100)
+    if pd is not None:
+        df = pd.DataFrame({'ints': np.arange(1000), 'strs': ['s%s' % i for i in range(1000)]})
+    print('break here')
+
+
+call()
+print('TEST SUCEEDED!')
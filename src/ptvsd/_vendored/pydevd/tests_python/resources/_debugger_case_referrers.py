@@ -0,0 +1,14 @@
+class MyClass(object):
+    pass
+
+
+def call():
+    contained = [1, 2]
+    container = [0, contained]
+    obj = MyClass()
+    obj.contained = contained
+    print('break here')
+
+
+call()
+print('TEST SUCEEDED!')
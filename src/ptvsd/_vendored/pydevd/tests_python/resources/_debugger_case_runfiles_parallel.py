@@ -0,0 +1,38 @@
+import os
+import tempfile
+import unittest
+
+
+class ParallelTest(unittest.TestCase):
+
+    def test_1(self):
+        print('in test 1')  # break 1 here
+
+    def test_2(self):
+        print('in test 2')  # break 2 here
+
+
+if __name__ == '__main__':
+    import sys
+    import pydevd
+    pydevd_dirname = os.path.dirname(os.path.abspath(pydevd.__file__))
+    if pydevd_dirname not in sys.path:
+        sys.path.append(pydevd_dirname)
+
+    # The jobs must also be able to import pydevd modules.
+    os.environ['PYTHONPATH'] = os.pathsep.join(
+        [pydevd_dirname] + [p for p in os.environ.get('PYTHONPATH', '').split(os.pathsep) if p])
+
+    from _pydev_runfiles import pydev_runfiles
+    from _pydev_runfiles import pydev_runfiles_xml_rpc
+    pydev_runfiles_xml_rpc.initialize_server(None)  # No IDE: just create a Null server.
+
+    configuration = pydev_runfiles.Configuration(
+        files_or_dirs=[os.path.abspath(__file__)],
+        verbosity=1,
+        jobs=2,
+        split_jobs='tests',
+        timings_file=os.path.join(tempfile.mkdtemp(), 'timings.json'),
+    )
+    pydev_runfiles.main(configuration)
+    print('TEST SUCEEDED!')
@@ -0,0 +1,12 @@
+import time
+
+
+def busy_function():
+    initial_time = time.time()
+    while time.time() - initial_time < 1:
+        pass
+
+
+busy_function()
+print('break here')
+print('TEST SUCEEDED!')
@@ -0,0 +1,21 @@
+import time
+
+
+class SlowRepr(object):
+
+    def __init__(self):
+        self.attr = 1
+
+    def __repr__(self):
+        time.sleep(1)
+        return 'SlowRepr finished'
+
+
+def call():
+    slow1 = SlowRepr()
+    slow2 = SlowRepr()
+    print('break here')
+
+
+call()
+print('TEST SUCEEDED!')
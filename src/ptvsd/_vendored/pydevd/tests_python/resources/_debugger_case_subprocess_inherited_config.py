@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+
+
+def call():
+    print('called')  # break 1 here
+
+
+if __name__ == '__main__':
+    if 'child' in sys.argv:
+        call()
+        if 'exec' in sys.argv:
+            # Same process (the program was replaced by os.execv).
+            assert 'PYDEVD_INHERITED_CONFIG' not in os.environ
+            print('TEST SUCEEDED!')
+
+    elif 'exec' in sys.argv:
+        os.execv(sys.executable, [sys.executable, __file__, 'child', 'exec'])
+
+    elif 'fork' in sys.argv:
+        # A forked process creates a new debugger with the default protocol.
+        import pydevd
+        pydevd.PydevdCustomization.DEFAULT_PROTOCOL = 'http_json'
+
+        import multiprocessing
+        if sys.version_info[0] >= 3:
+            multiprocessing.set_start_method('fork')
+        p = multiprocessing.Process(target=call)
+        p.start()
+        p.join()
+        print('TEST SUCEEDED!')
+
+    else:
+        subprocess.check_call([sys.executable, __file__, 'child'])
+
+        # The configuration is only passed on in the environment of the subprocess.
+        assert 'PYDEVD_INHERITED_CONFIG' not in os.environ
+        print('TEST SUCEEDED!')
@@ -0,0 +1,36 @@
+import asyncio
+import time
+
+
+async def step(i):
+    if False:
+        pass  # Unreachable breakpoint here
+    return i
+
+
+async def task(n):
+    total = 0
+    for i in range(n):
+        total += await step(i)
+        if i % 100 == 0:
+            await asyncio.sleep(0)
+    return total
+
+
+async def main():
+    await asyncio.gather(*[task(5000) for _ in range(20)])
+
+
+def caller():
+    start_time = time.time()
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
+    print('TotalTime>>%s<<' % (time.time() - start_time,))
+
+
+if __name__ == '__main__':
+    caller()
+    print('TEST SUCEEDED')
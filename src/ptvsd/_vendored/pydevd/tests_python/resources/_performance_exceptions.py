@@ -0,0 +1,33 @@
+import time
+
+try:
+    xrange  # @UndefinedVariable
+except NameError:
+    xrange = range
+
+
+def raise_error(i):
+    raise KeyError(i)
+
+
+def handle_error(i):
+    try:
+        raise_error(i)
+    except KeyError:
+        return i
+
+
+def caller():
+    start_time = time.time()
+    for i in xrange(50000):
+        handle_error(i)
+
+    if False:
+        pass  # Unreachable breakpoint here
+
+    print('TotalTime>>%s<<' % (time.time() - start_time,))
+
+
+if __name__ == '__main__':
+    caller()
+    print('TEST SUCEEDED')
@@ -0,0 +1,41 @@
+import time
+
+try:
+    xrange  # @UndefinedVariable
+except NameError:
+    xrange = range
+
+
+def numbers(n):
+    for i in xrange(n):
+        yield i
+
+
+def squares(it):
+    for i in it:
+        if False:
+            pass  # Unreachable breakpoint here
+        yield i * i
+
+
+def accumulator():
+    total = 0
+    while True:
+        value = yield total
+        total += value
+
+
+def caller():
+    start_time = time.time()
+    sum(squares(numbers(200000)))
+
+    acc = accumulator()
+    next(acc)
+    for i in xrange(200000):
+        acc.send(i)
+    print('TotalTime>>%s<<' % (time.time() - start_time,))
+
+
+if __name__ == '__main__':
+    caller()
+    print('TEST SUCEEDED')
@@ -0,0 +1,28 @@
+import time
+
+try:
+    xrange  # @UndefinedVariable
+except NameError:
+    xrange = range
+
+
+def recurse(depth):
+    if depth == 0:
+        return 0
+
+    if False:
+        pass  # Unreachable breakpoint here
+
+    return recurse(depth - 1) + 1
+
+
+def caller():
+    start_time = time.time()
+    for _ in xrange(300):
+        recurse(800)
+    print('TotalTime>>%s<<' % (time.time() - start_time,))
+
+
+if __name__ == '__main__':
+    caller()
+    print('TEST SUCEEDED')
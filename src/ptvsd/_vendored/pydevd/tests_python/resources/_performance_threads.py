@@ -0,0 +1,34 @@
+import threading
+import time
+
+try:
+    xrange  # @UndefinedVariable
+except NameError:
+    xrange = range
+
+
+def method2():
+    i = 1
+
+
+def work():
+    for i in xrange(10000):
+        method2()
+
+        if False:
+            pass  # Unreachable breakpoint here
+
+
+def caller():
+    start_time = time.time()
+    threads = [threading.Thread(target=work) for _ in xrange(50)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    print('TotalTime>>%s<<' % (time.time() - start_time,))
+
+
+if __name__ == '__main__':
+    caller()
+    print('TEST SUCEEDED')
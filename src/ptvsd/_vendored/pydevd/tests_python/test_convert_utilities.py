@@ -302,6 +302,33 @@ def test_relative_paths(tmpdir):
         sys.path.remove(str(tmpdir))
 
 
+def test_path_cache_bounded():
+    import pydevd_file_utils
+
+    from _pydevd_bundle import pydevd_stats
+
+    cache = {}
+    bounded_cache = pydevd_file_utils._BoundedCache('testPaths', cache, max_size=3)
+    try:
+        for i in range(5):
+            bounded_cache.add('file%s' % (i,), i)
+        bounded_cache.add('file4', 4)
+
+        assert sorted(cache) == ['file2', 'file3', 'file4']
+    finally:
+        pydevd_stats.unregister_cache('testPaths')
+
+    # Pseudo-filenames are not normalized nor cached.
+    pydevd_file_utils.NORM_PATHS_CONTAINER.clear()
+    assert pydevd_file_utils._NormPaths('<template-1>') == ('<template-1>', '<template-1>')
+    assert len(pydevd_file_utils.NORM_PATHS_CONTAINER) == 0
+
+    # Paths are interned.
+    abs_path, real_path, _base = pydevd_file_utils.get_abs_path_real_path_and_base_from_file(pydevd_file_utils.__file__)
+    if abs_path == real_path:
+        assert abs_path is real_path
+
+
 def test_zip_paths(tmpdir):
     import pydevd_file_utils
     import sys
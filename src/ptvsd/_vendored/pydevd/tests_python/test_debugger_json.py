@@ -19,7 +19,7 @@ from _pydevd_bundle.pydevd_constants import (int_types, IS_64BIT_PROCESS,
     PY_VERSION_STR, PY_IMPL_VERSION_STR, PY_IMPL_NAME, IS_PY36_OR_GREATER)
 from tests_python import debugger_unittest
 from tests_python.debug_constants import TEST_CHERRYPY, IS_PY2, TEST_DJANGO, TEST_FLASK, IS_PY26, \
-    IS_PY27, IS_CPYTHON
+    IS_PY27, IS_CPYTHON, TEST_NUMPY, TEST_PANDAS
 from tests_python.debugger_unittest import (IS_JYTHON, IS_APPVEYOR, overrides,
     get_free_port, wait_for_condition)
 
@@ -876,8 +876,45 @@ def test_case_json_protocol(case_setup):
         writer.finished_ok = True
 
 
-def test_case_started_exited_threads_protocol(case_setup):
-    with case_setup.test_file('_debugger_case_thread_started_exited.py') as writer:
+@pytest.mark.skipif(sys.version_info[:2] < (3, 12), reason='sys.monitoring is only available on Python 3.12 onwards.')
+def test_case_sys_monitoring_stepping(case_setup):
+
+    def get_environ(writer):
+        env = os.environ.copy()
+
+        env['PYDEVD_USE_SYS_MONITORING'] = 'YES'  # Opt-in.
+        return env
+
+    with case_setup.test_file('_debugger_case_stepping.py', get_environ=get_environ) as writer:
+        json_facade = JsonFacade(writer)
+
+        json_facade.write_launch()
+        break_line = writer.get_line_index_with_content('Break here 2')
+        json_facade.write_set_breakpoints(break_line)
+        json_facade.write_make_initial_run()
+
+        json_hit = json_facade.wait_for_thread_stopped(line=break_line)
+
+        json_facade.write_step_next(json_hit.thread_id)
+        json_hit = json_facade.wait_for_thread_stopped('step', line=break_line + 1)
+
+        json_facade.write_step_in(json_hit.thread_id)
+        json_hit = json_facade.wait_for_thread_stopped('step', name='step_into')
+
+        json_facade.write_continue()
+        writer.finished_ok = True
+
+
+@pytest.mark.parametrize('thread_events_delay', ['0', '5'])
+def test_case_started_exited_threads_protocol(case_setup, thread_events_delay):
+
+    def get_environ(writer):
+        env = os.environ.copy()
+
+        env['PYDEVD_THREAD_EVENTS_DELAY'] = thread_events_delay
+        return env
+
+    with case_setup.test_file('_debugger_case_thread_started_exited.py', get_environ=get_environ) as writer:
         json_facade = JsonFacade(writer)
 
         json_facade.write_launch()
@@ -889,8 +926,14 @@ def test_case_started_exited_threads_protocol(case_setup):
         _stopped_event = json_facade.wait_for_json_message(StoppedEvent)
         started_events = json_facade.mark_messages(ThreadEvent, lambda x: x.body.reason == 'started')
         exited_events = json_facade.mark_messages(ThreadEvent, lambda x: x.body.reason == 'exited')
-        assert len(started_events) == 4
-        assert len(exited_events) == 3  # Main is still running.
+        if thread_events_delay == '0':
+            assert len(started_events) == 4
+            assert len(exited_events) == 3  # Main is still running.
+        else:
+            # The threads which started and exited in the same batch are not reported (but the
+            # pending notifications are sent before the stop).
+            assert len(started_events) == 1
+            assert len(exited_events) == 0
         json_facade.write_continue()
 
         writer.finished_ok = True
@@ -1113,6 +1156,20 @@ def test_case_completions_json(case_setup):
                 assert response.body.targets == [
                     {'start': 5, 'length': 4, 'type': 'function', 'label': 'items'}]
 
+            if i == 0:
+                # The completions are cached while suspended, but not after an evaluation.
+                completions_arguments = pydevd_schema.CompletionsArguments(
+                    'method1.my_', 12, frameId=json_hit.frame_id)
+                response = json_facade.wait_for_response(json_facade.write_request(
+                    pydevd_schema.CompletionsRequest(completions_arguments)))
+                assert response.body.targets == []
+
+                json_facade.evaluate('method1.my_attr = 1', frameId=json_hit.frame_id, context='repl')
+
+                response = json_facade.wait_for_response(json_facade.write_request(
+                    pydevd_schema.CompletionsRequest(completions_arguments)))
+                assert [x['label'] for x in response.body.targets] == ['my_attr']
+
             if i == 1:
                 # Check with a previously existing frameId.
                 assert first_hit.frame_id != json_hit.frame_id
@@ -1155,6 +1212,15 @@ def test_modules(case_setup):
 
         json_facade.wait_for_json_message(ModuleEvent)
 
+        # The module info is kept for the code objects already seen (so, a new stack
+        # trace must still provide the same info).
+        stack_trace_response = json_facade.wait_for_response(json_facade.write_request(
+            pydevd_schema.StackTraceRequest(pydevd_schema.StackTraceArguments(
+                threadId=thread_id, format={'module': True}))))
+        stack_frame = next(iter(stack_trace_response.body.stackFrames))
+        assert stack_frame['name'] == '__main__.Call'
+        assert stack_frame['source']['path'].endswith('_debugger_case_local_variables.py')
+
         # : :type response: ModulesResponse
         # : :type modules_response_body: ModulesResponseBody
         response = json_facade.wait_for_response(json_facade.write_request(
@@ -1222,6 +1288,154 @@ def test_stack_and_variables_dict(case_setup):
         writer.finished_ok = True
 
 
+def test_variables_slow_repr(case_setup):
+    with case_setup.test_file('_debugger_case_slow_repr.py') as writer:
+        json_facade = JsonFacade(writer)
+
+        writer.write_add_breakpoint(writer.get_line_index_with_content('break here'))
+        json_facade.write_make_initial_run()
+
+        json_hit = json_facade.wait_for_thread_stopped()
+        json_hit = json_facade.get_stack_as_json_hit(json_hit.thread_id)
+
+        # The values are computed in the suspended thread: slow1 exceeds the time budget, so,
+        # slow2 is sent with a placeholder (but can still be expanded) and afterwards in an event.
+        variables_response = json_facade.get_variables_response(json_hit.frame_id)
+        name_to_var = dict((variable['name'], variable) for variable in variables_response.body.variables)
+        assert name_to_var['slow1']['value'] == 'SlowRepr finished'
+        assert name_to_var['slow2']['value'] == '<computing value...>'
+        assert name_to_var['slow2']['evaluateName'] == 'slow2'
+        assert name_to_var['slow2']['variablesReference'] != 0
+
+        event = json_facade.wait_for_json_message(pydevd_schema.PydevdVariablesUpdatedEvent)
+        assert event.body.variablesReference == json_hit.frame_id
+        assert len(event.body.variables) == 1
+        assert event.body.variables[0]['name'] == 'slow2'
+        assert event.body.variables[0]['value'] == 'SlowRepr finished'
+        assert event.body.variables[0]['variablesReference'] == name_to_var['slow2']['variablesReference']
+
+        variables_response = json_facade.get_variables_response(name_to_var['slow2']['variablesReference'])
+        assert [variable['name'] for variable in variables_response.body.variables] == ['attr']
+
+        json_facade.write_continue()
+        writer.finished_ok = True
+
+
+@pytest.mark.skipif(not TEST_NUMPY, reason='No numpy available')
+def test_array_slice(case_setup):
+    import base64
+    import numpy
+
+    with case_setup.test_file('_debugger_case_array_slice.py') as writer:
+        json_facade = JsonFacade(writer)
+
+        writer.write_add_breakpoint(writer.get_line_index_with_content('break here'))
+        json_facade.write_make_initial_run()
+
+        json_hit = json_facade.wait_for_thread_stopped()
+        json_hit = json_facade.get_stack_as_json_hit(json_hit.thread_id)
+
+        def get_array_slice(expression, success=True, **kwargs):
+            request = json_facade.write_request(pydevd_schema.PydevdArraySliceRequest(
+                pydevd_schema.PydevdArraySliceArguments(json_hit.frame_id, expression, **kwargs)))
+            response = json_facade.wait_for_response(request)
+            assert response.success == success
+            return response
+
+        body = get_array_slice('arr', rowOffset=10, colOffset=20, rows=2, cols=3, format='%.1f').body
+        assert body.shape == [1000, 100]
+        assert (body.rows, body.cols) == (2, 3)
+        assert body.rowLabels == ['10', '11']
+        column = body.columns[0]
+        assert column['label'] == '20'
+        assert column['kind'] == 'f'
+        assert column['values'] == ['1020.0', '1120.0']
+
+        # Statistics are computed only for the window.
+        assert (column['min'], column['max']) == ('1020.0', '1120.0')
+
+        body = get_array_slice('arr', rowOffset=998, rows=10, cols=1, binary=True).body
+        assert body.rows == 2
+        column = body.columns[0]
+        assert 'values' not in column
+        values = numpy.frombuffer(base64.b64decode(column['base64']), dtype=column['dtype'])
+        assert values.tolist() == [99800.0, 99900.0]
+
+        if TEST_PANDAS:
+            body = get_array_slice('df', rowOffset=5, rows=2).body
+            assert body.shape == [1000, 2]
+            assert body.rowLabels == ['5', '6']
+            assert [column['label'] for column in body.columns] == ['ints', 'strs']
+            assert body.columns[0]['values'] == ['5', '6']
+            assert body.columns[1]['values'] == ['s5', 's6']
+
+        response = get_array_slice('arr[None]', success=False)
+        assert 'more than 2 dimensions' in response.message
+
+        response = get_array_slice('arr', rowOffset=-1, rows=5, cols=5, success=False)
+        assert 'rowOffset must not be negative' in response.message
+
+        response = get_array_slice('arr', colOffset=-1, success=False)
+        assert 'colOffset must not be negative' in response.message
+
+        response = get_array_slice('not_there', success=False)
+        assert 'NameError' in response.message
+
+        json_facade.write_continue()
+        writer.finished_ok = True
+
+
+@pytest.mark.skipif(not IS_CPYTHON, reason='Test needs gc.get_referrers to really check anything.')
+@pytest.mark.parametrize('index_max_objects', ['0', '10000000'])
+def test_referrers(case_setup, index_max_objects):
+
+    def get_environ(writer):
+        env = os.environ.copy()
+
+        env['PYDEVD_REFERRERS_INDEX_MAX_OBJECTS'] = index_max_objects
+        return env
+
+    with case_setup.test_file('_debugger_case_referrers.py', get_environ=get_environ) as writer:
+        json_facade = JsonFacade(writer)
+
+        writer.write_add_breakpoint(writer.get_line_index_with_content('break here'))
+        json_facade.write_make_initial_run()
+
+        json_hit = json_facade.wait_for_thread_stopped()
+        json_hit = json_facade.get_stack_as_json_hit(json_hit.thread_id)
+
+        def get_referrers(expression, success=True, **kwargs):
+            request = json_facade.write_request(pydevd_schema.PydevdReferrersRequest(
+                pydevd_schema.PydevdReferrersArguments(json_hit.frame_id, expression, **kwargs)))
+            response = json_facade.wait_for_response(request)
+            assert response.success == success
+            return response
+
+        # Ask twice (the second time the referrers index may be reused if enabled).
+        for _i in range(2):
+            body = get_referrers('contained').body
+            assert not body.truncated
+            found_as = [referrer.get('foundAs') for referrer in body.referrers]
+            assert 'list[1]' in found_as
+            assert 'contained' in found_as
+
+        referrer = [referrer for referrer in body.referrers if referrer.get('foundAs') == 'list[1]'][0]
+        assert referrer['type'] == 'list'
+        assert referrer['variablesReference'] > 0
+        variables_response = json_facade.get_variables_response(referrer['variablesReference'])
+        assert [v['value'] for v in variables_response.body.variables if v['name'] == '0'] == ['0']
+
+        body = get_referrers('contained', maxResults=1).body
+        assert len(body.referrers) == 1
+        assert body.truncated
+
+        response = get_referrers('not_there', success=False)
+        assert 'NameError' in response.message
+
+        json_facade.write_continue()
+        writer.finished_ok = True
+
+
 @pytest.mark.skipif(IS_PY26, reason='__dir__ not customizable on Python 2.6')
 def test_exception_on_dir(case_setup):
     with case_setup.test_file('_debugger_case_dir_exception.py') as writer:
@@ -3245,6 +3459,72 @@ def test_subprocess_pydevd_customization(case_setup_remote, command_line_args):
         writer.finished_ok = True
 
 
+@pytest.mark.skipif(not IS_CPYTHON, reason='CPython only test.')
+def test_runfiles_parallel_with_debugger(case_setup_multiprocessing):
+    import threading
+    from tests_python.debugger_unittest import AbstractWriterThread
+
+    with case_setup_multiprocessing.test_file('_debugger_case_runfiles_parallel.py') as writer:
+        json_facade = JsonFacade(writer)
+        json_facade.write_launch()
+
+        break_lines = [
+            writer.get_line_index_with_content('break 1 here'),
+            writer.get_line_index_with_content('break 2 here'),
+        ]
+
+        server_socket = writer.server_socket
+        hit_names = []
+
+        class SecondaryProcessWriterThread(AbstractWriterThread):
+
+            TEST_FILE = writer.get_main_filename()
+            _sequence = -1
+
+        def handle_job_process(new_sock):
+            from tests_python.debugger_unittest import ReaderThread
+            reader_thread = ReaderThread(new_sock)
+            reader_thread.name = '  *** Multiprocess Reader Thread'
+            reader_thread.start()
+
+            writer2 = SecondaryProcessWriterThread()
+            writer2.reader_thread = reader_thread
+            writer2.sock = new_sock
+            json_facade2 = JsonFacade(writer2)
+
+            json_facade2.write_set_breakpoints(break_lines)
+            json_facade2.write_make_initial_run()
+
+            # Each job may run any of the tests (so, a job may have 0, 1 or 2 hits).
+            while len(hit_names) < 2:
+                try:
+                    json_hit = json_facade2.wait_for_thread_stopped()
+                except:
+                    return  # The job process finished.
+                hit_names.append(json_hit.stack_trace_response.body.stackFrames[0]['name'])
+                json_facade2.write_continue()
+
+        class SecondaryProcessThreadCommunication(threading.Thread):
+
+            def run(self):
+                for _ in range(2):  # One connection for each job.
+                    server_socket.listen(1)
+                    new_sock, addr = server_socket.accept()
+                    t = threading.Thread(target=handle_job_process, args=(new_sock,))
+                    t.daemon = True
+                    t.start()
+
+        secondary_process_thread_communication = SecondaryProcessThreadCommunication()
+        secondary_process_thread_communication.daemon = True
+        secondary_process_thread_communication.start()
+
+        json_facade.write_make_initial_run()
+
+        wait_for_condition(lambda: len(hit_names) == 2)
+        assert sorted(hit_names) == ['test_1', 'test_2']
+        writer.finished_ok = True
+
+
 @pytest.mark.parametrize('apply_multiprocessing_patch', [True, False])
 def test_no_subprocess_patching(case_setup_multiprocessing, apply_multiprocessing_patch):
     import threading
@@ -3317,6 +3597,86 @@ def test_no_subprocess_patching(case_setup_multiprocessing, apply_multiprocessin
         writer.finished_ok = True
 
 
+@pytest.mark.skipif(not IS_CPYTHON, reason='CPython only test.')
+@pytest.mark.parametrize('start_method', ['subprocess', 'fork', 'exec'])
+def test_subprocess_inherited_config(case_setup_multiprocessing, start_method):
+    import threading
+    from tests_python.debugger_unittest import AbstractWriterThread
+
+    if start_method == 'fork' and sys.platform == 'win32':
+        pytest.skip('Fork not available on Windows.')
+
+    def update_command_line_args(writer, args):
+        ret = debugger_unittest.AbstractWriterThread.update_command_line_args(writer, args)
+        ret.insert(ret.index('--qt-support'), '--multiprocess')
+        if start_method in ('fork', 'exec'):
+            ret.append(start_method)
+        return ret
+
+    with case_setup_multiprocessing.test_file(
+            '_debugger_case_subprocess_inherited_config.py',
+            update_command_line_args=update_command_line_args
+        ) as writer:
+        json_facade = JsonFacade(writer)
+        json_facade.write_launch()
+        json_facade.write_set_debugger_property(multi_threads_single_notification=True)
+
+        break1_line = writer.get_line_index_with_content('break 1 here')
+        json_facade.write_set_breakpoints(break1_line)
+
+        server_socket = writer.server_socket
+
+        class SecondaryProcessWriterThread(AbstractWriterThread):
+
+            TEST_FILE = writer.get_main_filename()
+            _sequence = -1
+
+        class SecondaryProcessThreadCommunication(threading.Thread):
+
+            def run(self):
+                from tests_python.debugger_unittest import ReaderThread
+                server_socket.listen(1)
+                self.server_socket = server_socket
+                new_sock, addr = server_socket.accept()
+
+                reader_thread = ReaderThread(new_sock)
+                reader_thread.name = '  *** Multiprocess Reader Thread'
+                reader_thread.start()
+
+                writer2 = SecondaryProcessWriterThread()
+                writer2.reader_thread = reader_thread
+                writer2.sock = new_sock
+                json_facade2 = JsonFacade(writer2, send_json_startup_messages=False)
+
+                info_response = json_facade2.wait_for_response(json_facade2.write_request(
+                    pydevd_schema.PydevdSystemInfoRequest(arguments=pydevd_schema.PydevdSystemInfoArguments())))
+                assert info_response.body.inheritedConfig
+
+                # The breakpoints were inherited from the parent process, so, it starts
+                # running right away...
+                response = json_facade2.wait_for_response(
+                    json_facade2.write_request(pydevd_schema.PydevdRunWithInheritedConfigRequest()))
+                assert response.body.running
+
+                # ... but the breakpoint is only reported after the configuration is done.
+                json_facade2.write_attach()
+                json_facade2.write_make_initial_run()
+
+                json_facade2.wait_for_thread_stopped(line=break1_line)
+                json_facade2.write_continue()
+
+        secondary_process_thread_communication = SecondaryProcessThreadCommunication()
+        secondary_process_thread_communication.start()
+        time.sleep(.1)
+
+        json_facade.write_make_initial_run()
+
+        secondary_process_thread_communication.join(10)
+        if secondary_process_thread_communication.is_alive():
+            raise AssertionError('The SecondaryProcessThreadCommunication did not finish')
+        writer.finished_ok = True
+
+
 def test_module_crash(case_setup):
     with case_setup.test_file('_debugger_case_module.py') as writer:
         json_facade = JsonFacade(writer)
@@ -3361,6 +3721,7 @@ def test_pydevd_systeminfo(case_setup):
         body = info_response.to_dict()['body']
 
         assert body['python']['version'] == PY_VERSION_STR
+        assert 'inheritedConfig' not in body
         assert body['python']['implementation']['name'] == PY_IMPL_NAME
         assert body['python']['implementation']['version'] == PY_IMPL_VERSION_STR
         assert 'description' in body['python']['implementation']
@@ -3386,6 +3747,108 @@ def test_pydevd_systeminfo(case_setup):
         writer.finished_ok = True
 
 
+def test_pydevd_systeminfo_compact_encoding(case_setup):
+    with case_setup.test_file('_debugger_case_print.py') as writer:
+        json_facade = JsonFacade(writer)
+
+        writer.write_add_breakpoint(writer.get_line_index_with_content('Break here'))
+
+        json_facade.write_make_initial_run()
+
+        json_hit = json_facade.wait_for_thread_stopped()
+
+        info_request = json_facade.write_request(
+            pydevd_schema.PydevdSystemInfoRequest(
+                arguments=pydevd_schema.PydevdSystemInfoArguments(compactEncoding=True)
+            )
+        )
+        info_response = json_facade.wait_for_response(info_request)
+        assert info_response.body.compactEncoding
+        assert writer.reader_thread.compact_messages_received >= 1  # The response itself is compact.
+
+        # Messages in both directions are now in the compact encoding.
+        writer.compact_encoding = True
+        json_hit = json_facade.get_stack_as_json_hit(json_hit.thread_id)
+        assert json_hit.stack_trace_response.body.stackFrames[0]['line'] == writer.get_line_index_with_content('Break here')
+
+        json_facade.write_continue()
+        assert writer.reader_thread.compact_messages_received > 2
+
+        writer.finished_ok = True
+
+
+def test_sampling_profiler(case_setup):
+    with case_setup.test_file('_debugger_case_sampling_profiler.py') as writer:
+        json_facade = JsonFacade(writer)
+
+        writer.write_add_breakpoint(writer.get_line_index_with_content('break here'))
+        json_facade.wait_for_response(json_facade.write_request(
+            pydevd_schema.PydevdStartProfilerRequest(
+                pydevd_schema.PydevdStartProfilerArguments(interval=0.005, flushInterval=0.2))))
+        json_facade.write_make_initial_run()
+
+        json_facade.wait_for_thread_stopped()
+
+        json_facade.wait_for_response(json_facade.write_request(
+            pydevd_schema.PydevdStopProfilerRequest(pydevd_schema.PydevdStopProfilerArguments())))
+
+        # The final event is sent before the response.
+        samples_events = json_facade.mark_messages(pydevd_schema.PydevdProfilerSamplesEvent)
+        assert samples_events
+        assert samples_events[-1].body.final
+        assert not any(event.body.final for event in samples_events[:-1])
+
+        stack_to_count = {}
+        for event in samples_events:
+            for sample in event.body.samples:
+                stack_to_count[sample['stack']] = stack_to_count.get(sample['stack'], 0) + sample['count']
+
+        busy_stacks = [stack for stack in stack_to_count if 'busy_function (_debugger_case_sampling_profiler.py:4)' in stack]
+        assert busy_stacks, 'Expected busy_function in: %s' % (list(stack_to_count),)
+        for stack in busy_stacks:
+            assert stack.startswith('MainThread;')
+
+        # Internal pydevd frames/threads must not be shown.
+        for stack in stack_to_count:
+            assert 'pydevd_comm' not in stack
+            assert 'SamplingProfiler' not in stack
+
+        json_facade.write_continue()
+        writer.finished_ok = True
+
+
+def test_pydevd_stats(case_setup):
+    with case_setup.test_file('_debugger_case_local_variables.py') as writer:
+        json_facade = JsonFacade(writer)
+
+        writer.write_add_breakpoint(writer.get_line_index_with_content('Break here'))
+        writer.write_add_breakpoint(writer.get_line_index_with_content('Break 2 here'))
+        json_facade.write_make_initial_run()
+
+        json_facade.wait_for_thread_stopped()
+        json_facade.write_continue()
+        json_facade.wait_for_thread_stopped()
+
+        stats_response = json_facade.wait_for_response(json_facade.write_request(
+            pydevd_schema.PydevdStatsRequest(pydevd_schema.PydevdStatsArguments())))
+        body = stats_response.to_dict()['body']
+
+        assert body['traceDispatch']['threads'] >= 1
+        assert body['traceDispatch']['calls'] >= body['traceDispatch']['skipCacheHits'] >= 0
+        assert body['caches']['fileType']['size'] > 0
+        assert body['caches']['fileType']['misses'] > 0
+        assert body['caches']['fileType']['memory'] > 0
+        assert body['caches']['normPathsAndBase']['maxSize'] >= body['caches']['normPathsAndBase']['size'] > 0
+        assert set(body['queues']) == set(['writer', 'internalCommands'])
+
+        # The first suspend already finished.
+        assert body['suspends']['count'] >= 1
+        assert body['suspends']['maxTime'] >= body['suspends']['lastTime'] > 0
+
+        json_facade.write_continue()
+        writer.finished_ok = True
+
+
 @pytest.mark.parametrize('scenario', [
     'terminate_request',
     'terminate_debugee'
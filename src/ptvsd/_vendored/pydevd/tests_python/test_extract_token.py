@@ -52,3 +52,24 @@ def test_extract_token_and_qualifier():
 
     # out of range (line)
     assert extract_token_and_qualifier('a\nt<ok', 5, 4) == TokenAndQualifier('', '')
+
+
+def test_completions_cache():
+    from _pydev_bundle._pydev_completer import CompletionsCache
+
+    computed = []
+
+    def compute_completions():
+        computed.append(1)
+        return [('items', '', '', 2), ('iter', '', '', 2), ('keys', '', '', 2)]
+
+    cache = CompletionsCache()
+    assert len(cache.get_completions(('key',), '', compute_completions)) == 3
+    assert cache.get_completions(('key',), 'I', compute_completions) == [('items', '', '', 2), ('iter', '', '', 2)]
+    assert cache.get_completions(('key',), 'ite', compute_completions) == [('items', '', '', 2), ('iter', '', '', 2)]
+    assert cache.get_completions(('key',), 'item', compute_completions) == [('items', '', '', 2)]
+    assert cache.get_completions(('key',), 'k', compute_completions) == [('keys', '', '', 2)]
+    assert len(computed) == 1
+
+    cache.get_completions(('other key',), '', compute_completions)
+    assert len(computed) == 2
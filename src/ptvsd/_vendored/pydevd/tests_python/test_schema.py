@@ -1,3 +1,5 @@
+import pytest
+
 from _pydevd_bundle._debug_adapter.pydevd_schema import InitializeRequest, \
     InitializeRequestArguments, InitializeResponse, Capabilities
 from _pydevd_bundle._debug_adapter import pydevd_schema, pydevd_base_schema
@@ -140,3 +142,76 @@ def test_schema_translation_thread():
         ]},
         'seq':-1
     }
+
+
+def test_schema_lazily_imported():
+    import subprocess
+    import sys
+    import os
+    import pydevd
+
+    # Note: run in a separate process as the schema is already imported in this one.
+    code = '''
+import sys
+import pydevd
+assert '_pydevd_bundle._debug_adapter.pydevd_schema' not in sys.modules
+
+from _pydevd_bundle._debug_adapter import pydevd_base_schema
+request = pydevd_base_schema.from_dict({'type': 'request', 'command': 'configurationDone', 'seq': 1})
+assert '_pydevd_bundle._debug_adapter.pydevd_schema' in sys.modules
+assert request.__class__.__name__ == 'ConfigurationDoneRequest'
+assert pydevd_base_schema.lazy_schema.ConfigurationDoneRequest is request.__class__
+'''
+    env = os.environ.copy()
+    env['PYTHONPATH'] = os.path.dirname(pydevd.__file__) + os.pathsep + env.get('PYTHONPATH', '')
+    subprocess.check_call([sys.executable, '-c', code], env=env)
+
+
+def test_schema_fast_requests():
+    pydevd_base_schema.BaseSchema.initialize_ids_translation()
+    thread_id = pydevd_base_schema.BaseSchema._translate_id_to_dap('pid_1_id_2')
+
+    # Frequent requests aren't converted to the schema classes (but ids are still translated).
+    dct = {'type': 'request', 'command': 'next', 'seq': 3, 'arguments': {'threadId': thread_id}}
+    request = pydevd_base_schema.from_dict(dct, update_ids_from_dap=True)
+    assert request.__class__ == pydevd_base_schema.DictView
+    assert request.command == 'next'
+    assert request.seq == 3
+    assert request.arguments.threadId == 'pid_1_id_2'
+    assert dct['arguments']['threadId'] == thread_id  # The received dict is not changed.
+
+    # Missing properties are None (as in the schema classes).
+    dct = {'type': 'request', 'command': 'stackTrace', 'seq': 4, 'arguments': {'threadId': thread_id, 'format': {'line': True}}}
+    request = pydevd_base_schema.from_dict(dct, update_ids_from_dap=True)
+    assert request.arguments.levels is None
+    assert request.arguments.format.to_dict() == {'line': True}
+
+    # An unknown id fails as with the schema classes.
+    dct = {'type': 'request', 'command': 'variables', 'seq': 5, 'arguments': {'variablesReference': 999}}
+    with pytest.raises(KeyError):
+        pydevd_base_schema.from_dict(dct, update_ids_from_dap=True)
+
+    # The response is built directly as a dict (as the response class would create it).
+    response = pydevd_base_schema.build_response_dict(3, 'next')
+    expected = pydevd_schema.NextResponse(request_seq=3, success=True, command='next').to_dict()
+    del expected['seq']  # Set when sending.
+    assert response == expected
+
+
+def test_schema_fast_responses_as_schema():
+    pydevd_base_schema.BaseSchema.initialize_ids_translation()
+    frame = {'id': 2 ** 45, 'name': 'foo', 'line': 1, 'column': 1, 'source': {'path': 'foo.py', 'sourceReference': 0}}
+    schema_frame = pydevd_schema.StackFrame(
+        id=2 ** 45, name='foo', line=1, column=1, source={'path': 'foo.py', 'sourceReference': 0}).to_dict()
+
+    expected = pydevd_schema.StackTraceResponse(
+        request_seq=1,
+        success=True,
+        command='stackTrace',
+        body=pydevd_schema.StackTraceResponseBody(stackFrames=[schema_frame], totalFrames=1)).to_dict(update_ids_to_dap=True)
+    del expected['seq']
+
+    pydevd_base_schema.BaseSchema.initialize_ids_translation()
+    frames = [pydevd_schema.StackFrame.update_dict_ids_to_dap(frame)]
+    response = pydevd_base_schema.build_response_dict(1, 'stackTrace', {'stackFrames': frames, 'totalFrames': 1})
+    assert response == expected
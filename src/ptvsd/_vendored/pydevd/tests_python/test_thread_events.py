@@ -0,0 +1,131 @@
+import threading
+import time
+
+import pytest
+
+from _pydevd_bundle.pydevd_constants import get_thread_id
+from _pydevd_bundle.pydevd_thread_events import ThreadEventsNotifier
+
+
+class _Writer(object):
+
+    def __init__(self):
+        self.commands = []
+
+    def add_command(self, cmd):
+        self.commands.append(cmd)
+
+
+class _CmdFactory(object):
+
+    def make_thread_created_message(self, thread):
+        return ('started', thread.name)
+
+    def make_thread_killed_message(self, thread_id):
+        return ('exited', thread_id)
+
+
+class _PyDB(object):
+
+    def __init__(self):
+        self.writer = _Writer()
+        self.cmd_factory = _CmdFactory()
+        self.created_pydb_daemon_threads = {}
+
+
+class _Thread(object):
+
+    def __init__(self, name):
+        self.name = name
+
+
+@pytest.fixture
+def py_db():
+    py_db = _PyDB()
+    yield py_db
+    for t in list(py_db.created_pydb_daemon_threads):
+        t.do_kill_pydev_thread()
+
+
+def test_thread_events_immediate(py_db):
+    notifier = ThreadEventsNotifier(py_db, delay=0, min_lifetime=0)
+    notifier.on_thread_created('t1', _Thread('Thread-1'))
+    notifier.on_thread_killed('t1')
+    assert py_db.writer.commands == [('started', 'Thread-1'), ('exited', 't1')]
+
+
+def test_thread_events_coalesced(py_db):
+    notifier = ThreadEventsNotifier(py_db, delay=100, min_lifetime=0)
+    notifier.on_thread_created('t1', _Thread('Thread-1'))
+    notifier.on_thread_created('t2', _Thread('Thread-2'))
+    notifier.on_thread_created('t2', _Thread('Thread-2'))
+    notifier.on_thread_killed('t1')  # Started and exited before being sent: not reported.
+    assert py_db.writer.commands == []
+
+    notifier.flush()
+    assert py_db.writer.commands == [('started', 'Thread-2')]
+    assert not notifier.has_pending()
+
+    del py_db.writer.commands[:]
+    notifier.on_thread_killed('t2')
+    notifier.on_thread_created('t2', _Thread('Thread-3'))  # The thread id is reused.
+    notifier.flush()
+    assert py_db.writer.commands == [('exited', 't2'), ('started', 'Thread-3')]
+
+
+def test_thread_events_min_lifetime(py_db):
+    notifier = ThreadEventsNotifier(py_db, delay=100, min_lifetime=100)
+    notifier.on_thread_created('t1', _Thread('Thread-1'))
+    notifier.flush()
+    assert py_db.writer.commands == []
+    assert notifier.has_pending()
+
+    notifier.flush(force=True)
+    assert py_db.writer.commands == [('started', 'Thread-1')]
+
+    notifier.clear()
+    del py_db.writer.commands[:]
+    notifier.on_thread_killed('t1')  # Not notified after the clear.
+    notifier.flush()
+    assert py_db.writer.commands == []
+
+
+def test_thread_events_flusher_thread(py_db):
+    notifier = ThreadEventsNotifier(py_db, delay=0.01, min_lifetime=0)
+    notifier.on_thread_created('t1', _Thread('Thread-1'))
+
+    initial_time = time.time()
+    while not py_db.writer.commands:
+        assert time.time() - initial_time < 5, 'Thread notification not sent.'
+        time.sleep(0.01)
+
+    assert py_db.writer.commands == [('started', 'Thread-1')]
+    assert [t.name for t in py_db.created_pydb_daemon_threads] == ['pydevd.ThreadEventsFlusher']
+    assert all(t.daemon for t in py_db.created_pydb_daemon_threads)
+
+
+def test_list_threads_reports_threads_not_notified(py_db):
+    from _pydevd_bundle.pydevd_net_command_factory_json import NetCommandFactoryJson
+
+    notified = []
+    main_thread = threading.current_thread()
+    py_db.get_running_threads = lambda: [(get_thread_id(main_thread), main_thread)]
+    py_db.notify_thread_created = lambda thread_id, thread: notified.append(thread.name)
+    py_db.thread_events_notifier = ThreadEventsNotifier(py_db, delay=0, min_lifetime=0)
+
+    # A thread which was never traced (so, it was never notified as created).
+    event = threading.Event()
+    t = threading.Thread(target=event.wait, name='NeverTraced')
+    t.daemon = True
+    t.start()
+    try:
+        cmd = NetCommandFactoryJson().make_list_threads_message(py_db, 1)
+    finally:
+        event.set()
+        t.join()
+
+    thread_names = [thread['name'] for thread in cmd.as_dict['body']['threads']]
+    assert main_thread.name in thread_names
+    assert 'NeverTraced' in thread_names
+    assert 'NeverTraced' in notified
+    assert main_thread.name not in notified
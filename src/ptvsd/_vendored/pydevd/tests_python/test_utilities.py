@@ -336,3 +336,213 @@ def test_get_ppid():
     else:
         assert api._get_windows_ppid() is not None
 
+
+
+def _check_lazily_imported_modules():
+    import pydevd  # @UnusedImport
+    for module_name in (
+            '_pydevd_bundle._debug_adapter.pydevd_schema',
+            '_pydevd_bundle.pydevd_process_net_command',
+            '_pydevd_bundle.pydevd_plugin_utils',
+            '_pydev_bundle._pydev_completer',
+            'pydevd_concurrency_analyser.pydevd_concurrency_logger',
+            'pydevd_plugins.django_debug',
+            'pydevd_plugins.jinja2_debug',
+        ):
+        assert module_name not in sys.modules, '%s should only be imported when needed.' % (module_name,)
+
+
+def test_lazily_imported_modules():
+    # Note: run in a separate process as these are probably already imported in this one.
+    _check_in_separate_process('_check_lazily_imported_modules')
+
+
+def test_source_cache(tmpdir):
+    from _pydevd_bundle.pydevd_source_cache import SourceCache, SourceTooBigError
+
+    source_cache = SourceCache(max_source_size=100, max_cache_size=14)
+    file1 = tmpdir.join('file1.py')
+    file1.write('a = 10\n')
+    file2 = tmpdir.join('file2.py')
+    file2.write('b = 20\n')
+    big = tmpdir.join('big.py')
+    big.write('c = 30\n' * 20)
+
+    assert source_cache.get_content(str(file1)) == 'a = 10\n'
+    assert source_cache.get_content(str(file2)) == 'b = 20\n'
+    assert source_cache._cache_size == 14
+
+    # Contents are read again when the file changes.
+    file1.write('a = 100\n')
+    file1.setmtime(file1.mtime() + 10)
+    assert source_cache.get_content(str(file1)) == 'a = 100\n'
+
+    # The least recently used entry (file2) is evicted to keep the cache size limit.
+    assert list(source_cache._cache) == [str(file1)]
+    assert source_cache._cache_size == 8
+
+    with pytest.raises(SourceTooBigError):
+        source_cache.get_content(str(big))
+
+    assert source_cache.get_content(str(tmpdir.join('not_there.py'))) is None
+
+
+def test_template_lines(tmpdir):
+    from _pydevd_bundle import pydevd_template_lines
+    pydevd_template_lines.clear_caches()
+
+    template = tmpdir.join('template.html')
+    template.write_binary(b'a\nbc\n\nd')
+    filename = str(template)
+
+    offset_to_line_number = pydevd_template_lines.offset_to_line_number
+    assert [offset_to_line_number(filename, offset) for offset in range(9)] == [
+        1, 1, 2, 2, 2, 3, 4, 4, -1]
+
+    # The line breaks are computed again when the file changes.
+    template.write_binary(b'\n\na')
+    template.setmtime(template.mtime() + 10)
+    assert offset_to_line_number(filename, 2) == 3
+
+    calls = []
+
+    def get_line_pairs():
+        calls.append(1)
+        return [(1, 10), (2, 11), (3, 11)]
+
+    get_mapped_line = pydevd_template_lines.get_mapped_line
+    assert get_mapped_line('key', 11, get_line_pairs) == 2
+    assert get_mapped_line('key', 10, get_line_pairs) == 1
+    assert get_mapped_line('key', 12, get_line_pairs) is None
+    assert len(calls) == 1
+
+
+def test_template_plugins_render_call_caches():
+    from pydevd_plugins import django_debug, jinja2_debug
+
+    class Node(object):
+
+        def render(self, context):
+            return sys._getframe()
+
+    class MyNode(Node):
+        pass
+
+    class TextNode(Node):
+        pass
+
+    class Other(object):
+        render = Node.render
+
+    for _ in range(2):  # The 2nd time the results come from the caches.
+        assert django_debug._is_django_render_call(MyNode().render(None))
+        assert not django_debug._is_django_render_call(TextNode().render(None))
+        assert not django_debug._is_django_render_call(Other().render(None))
+    assert django_debug._cls_to_is_render_node[MyNode]
+    assert not django_debug._cls_to_is_render_node[Other]
+
+    namespace = {'__jinja_template__': None}
+    exec('def root(): return sys._getframe()', namespace)
+    namespace['sys'] = sys
+
+    def root():
+        return sys._getframe()
+
+    for _ in range(2):
+        assert jinja2_debug._is_jinja2_render_call(namespace['root']())
+        assert not jinja2_debug._is_jinja2_render_call(root())
+
+    # The caches don't keep the classes nor the code objects alive.
+    import gc
+    import weakref
+    cls_ref = weakref.ref(MyNode)
+    code_ref = weakref.ref(namespace['root'].__code__)
+    del Node, MyNode, TextNode, Other, namespace
+    gc.collect()
+    assert cls_ref() is None
+    assert code_ref() is None
+
+
+@pytest.mark.skipif(IS_WINDOWS, reason='Unix domain sockets only.')
+def test_start_client_unix_socket(tmpdir, monkeypatch):
+    import socket
+    import tempfile
+    from _pydevd_bundle.pydevd_comm import start_client, get_unix_socket_path
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmpdir))
+
+    tcp_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    tcp_server.bind(('127.0.0.1', 0))
+    tcp_server.listen(5)  # Connections are not accepted.
+    port = tcp_server.getsockname()[1]
+
+    def check_connect(expected_family):
+        s = start_client('127.0.0.1', port)
+        try:
+            assert s.family == expected_family
+        finally:
+            s.close()
+
+    try:
+        # No adapter listening in a unix domain socket: use TCP.
+        check_connect(socket.AF_INET)
+
+        dirname = tmpdir.mkdir('ptvsd-%s' % (os.getuid(),))
+        dirname.chmod(0o700)
+        path = str(dirname.join('%s.sock' % (port,)))
+        unix_server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        unix_server.bind(path)
+        unix_server.listen(1)
+        try:
+            assert get_unix_socket_path(port) == path
+            check_connect(socket.AF_UNIX)
+
+            # Only used if just the current user can access it.
+            dirname.chmod(0o755)
+            assert get_unix_socket_path(port) is None
+            check_connect(socket.AF_INET)
+        finally:
+            unix_server.close()
+
+        # Stale socket: falls back to TCP.
+        dirname.chmod(0o700)
+        check_connect(socket.AF_INET)
+    finally:
+        tcp_server.close()
+
+
+
+def test_monkey_patch_args_inherited_config_env(monkeypatch):
+    from _pydev_bundle import pydev_monkey
+    from _pydevd_bundle.pydevd_inherited_config import INHERITED_CONFIG_ENV_VAR
+    from pydevd import SetupHolder
+
+    class InheritedConfig(object):
+
+        def get_requests(self):
+            return [{'command': 'setBreakpoints', 'arguments': {'breakpoints': [{'line': 1}]}}]
+
+    class PyDB(object):
+        inherited_config = InheritedConfig()
+
+    monkeypatch.setattr(pydev_monkey, 'get_global_debugger', lambda: PyDB())
+    original = SetupHolder.setup
+    try:
+        SetupHolder.setup = {'client': '127.0.0.1', 'port': '0'}
+
+        # Only set in the environment of the subprocess (never in the current process).
+        args, env = pydev_monkey._patch_args_and_env([sys.executable, 'target.py'], {'A': 'B'})
+        assert args[0] == sys.executable and 'target.py' in args
+        assert env['A'] == 'B'
+        assert '"setBreakpoints"' in env[INHERITED_CONFIG_ENV_VAR]
+        assert INHERITED_CONFIG_ENV_VAR not in os.environ
+
+        args, env = pydev_monkey._patch_args_and_env([sys.executable, 'target.py'], None)
+        assert INHERITED_CONFIG_ENV_VAR in env
+        assert INHERITED_CONFIG_ENV_VAR not in os.environ
+
+        # Not a Python process: nothing is inherited.
+        args, env = pydev_monkey._patch_args_and_env(['ls', '-la'], None)
+        assert args == ['ls', '-la']
+        assert env is None
+    finally:
+        SetupHolder.setup = original
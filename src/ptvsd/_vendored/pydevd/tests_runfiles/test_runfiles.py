@@ -133,6 +133,11 @@ class RunfilesTest(unittest.TestCase):
         configuration = pydev_runfiles.parse_cmdline()
         self.assertEqual(['*__todo', 'test*bar'], configuration.exclude_tests)
 
+        sys.argv = "pydev_runfiles.py --jobs=2 --timings_file=timings.json ./".split()
+        configuration = pydev_runfiles.parse_cmdline()
+        self.assertEqual('timings.json', configuration.timings_file)
+        self.assertEqual(2, configuration.jobs)
+
 
     def test___adjust_python_path_works_for_directories(self):
         orig_syspath = sys.path
@@ -315,6 +320,109 @@ class RunfilesTest(unittest.TestCase):
             set(names)
         )
 
+    def test_parallel_schedule_by_timings(self):
+        from _pydev_runfiles import pydev_runfiles_parallel
+        timings_file = os.path.join(tempfile.mkdtemp(), 'timings.json')
+        timings = pydev_runfiles_parallel.TestsTimings(timings_file)
+
+        # No timings: the discovery order is kept.
+        batches = [['a.py|A.test1'], ['b.py|B.test1'], ['c.py|C.test1']]
+        self.assertEqual(batches, pydev_runfiles_parallel.schedule_batches(batches, 2, timings))
+
+        timings.on_test_finished(0, 'a.py|A.test1', '0.10')
+        timings.on_test_finished(0, 'b.py|B.test1', '3.00')
+        timings.on_test_finished(1, 'c.py|C.test1', '')  # No time available (error).
+        timings.on_test_finished(1, 'c.py|D.test1', '0.50')
+        timings.on_test_finished(1, 'c.py|D.test2', '0.50')
+        timings.on_batch_finished(3.0)
+        timings.save()
+        self.assertEqual(['timings.json'], os.listdir(os.path.dirname(timings_file)))  # No temporary files left.
+
+        # Without a timings file nothing is loaded nor saved.
+        no_file_timings = pydev_runfiles_parallel.TestsTimings()
+        no_file_timings.on_test_finished(0, 'a.py|A.test1', '0.10')
+        no_file_timings.save()
+        self.assertEqual(0.1, no_file_timings.get_expected_time(['b.py|B.test1']))
+
+        timings = pydev_runfiles_parallel.TestsTimings(timings_file)
+        self.assertEqual(
+            [['b.py|B.test1'], ['c.py|C.test1'], ['a.py|A.test1']],
+            pydev_runfiles_parallel.schedule_batches(batches, 2, timings))
+
+        # A module which is expected to take longer than the total time / jobs is split by class
+        # (c.py|C.test1 has no timing information and is expected to take the average time: 1.025).
+        batches = [['a.py|A.test1'], ['c.py|C.test1', 'c.py|D.test1', 'c.py|D.test2', 'c.py|C.test2']]
+        self.assertEqual(
+            [['c.py|C.test1', 'c.py|D.test1', 'c.py|D.test2', 'c.py|C.test2'], ['a.py|A.test1']],
+            pydev_runfiles_parallel.schedule_batches(batches, 2, timings))
+        self.assertEqual(
+            [['c.py|C.test1', 'c.py|C.test2'], ['c.py|D.test1', 'c.py|D.test2'], ['a.py|A.test1']],
+            pydev_runfiles_parallel.schedule_batches(batches, 2, timings, split_by_class=True))
+
+    def test_discovery_index(self):
+        tempdir = tempfile.mkdtemp()
+        pyfile = os.path.join(tempdir, 'discovery_index_sample_test.py')
+        with open(pyfile, 'w') as stream:
+            stream.write('''
+import unittest
+
+class IndexedTest(unittest.TestCase):
+
+    def test_a(self):
+        pass
+
+    def test_b(self):
+        pass
+''')
+
+        def create_runner(**kwargs):
+            return pydev_runfiles.PydevTestRunner(pydev_runfiles.Configuration(
+                files_or_dirs=[tempdir],
+                verbosity=1,
+                jobs=2,
+                discovery_index_file=os.path.join(tempdir, 'index.json'),
+                **kwargs
+            ))
+
+        orig_syspath = sys.path[:]
+        try:
+            runner = create_runner()
+            files = runner.find_import_files()
+            self.assertEqual([pyfile], files)
+
+            discovery_index = runner.get_discovery_index()
+            self.assertEqual((files, []), runner.find_indexed_tests(discovery_index, files))
+
+            modules = runner.find_modules_from_files(files)
+            module_name = modules[0][2]  # i.e.: discovery_index_sample_test (depends on the sys.path).
+            runner.update_discovery_index(discovery_index, modules, runner.find_tests_from_modules(modules))
+
+            # A new run gets the tests from the index (without importing the module).
+            runner = create_runner()
+            self.assertEqual(
+                ([], [
+                    (pyfile, module_name, 'IndexedTest.test_a'),
+                    (pyfile, module_name, 'IndexedTest.test_b'),
+                ]),
+                runner.find_indexed_tests(runner.get_discovery_index(), files))
+
+            runner = create_runner(exclude_tests=['test_a'])
+            self.assertEqual(
+                ([], [(pyfile, module_name, 'IndexedTest.test_b')]),
+                runner.find_indexed_tests(runner.get_discovery_index(), files))
+
+            # The index isn't used when tests are explicitly requested.
+            self.assertIsNone(create_runner(tests=['IndexedTest.test_a']).get_discovery_index())
+
+            # Changed files must be imported again.
+            with open(pyfile, 'a') as stream:
+                stream.write('\n# changed\n')
+            runner = create_runner()
+            self.assertEqual((files, []), runner.find_indexed_tests(runner.get_discovery_index(), files))
+        finally:
+            sys.path = orig_syspath
+            sys.modules.pop('discovery_index_sample_test', None)
+
     def test_xml_rpc_communication(self):
         import sys
         sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'samples'))
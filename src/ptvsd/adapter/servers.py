@@ -4,7 +4,6 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import functools
 import os
 import subprocess
 import sys
@@ -20,6 +19,18 @@ from ptvsd.adapter import components
 access_token = None
 """Access token used to authenticate with the servers."""
 
+use_unix_socket = os.getenv("PTVSD_UNIX_SOCKET", "0") == "1"
+"""Whether local servers may connect through a Unix domain socket (they fall back to TCP
+if it's not available).
+"""
+
+use_compact_encoding = os.getenv("PTVSD_COMPACT_ENCODING", "0") == "1"
+"""Whether to negotiate the compact encoding (see JsonIOStream.COMPACT_ENCODING_MARKER)
+for the messages exchanged with the servers. Messages to and from the IDE are always
+regular DAP packets. Off by default: the messages can't be read by tools that expect
+DAP packets (such as a packet capture of the adapter-server connection).
+"""
+
 _lock = threading.RLock()
 
 _connections = []
@@ -57,7 +68,12 @@ class Connection(sockets.ClientConnection):
 
         try:
             self.authenticate()
-            info = self.channel.request("pydevdSystemInfo")
+            info = self.channel.request(
+                "pydevdSystemInfo", {"compactEncoding": use_compact_encoding}
+            )
+            if info("compactEncoding", False):
+                stream.enable_compact_encoding()
+
             process_info = info("process", json.object())
             self.pid = process_info("pid", int)
             self.ppid = process_info("ppid", int, optional=True)
@@ -102,6 +118,20 @@ if 'ptvsd' not in sys.modules:
                 # code - so don't terminate the session.
                 log.exception("Failed to inject ptvsd into {0}:", self, level="warning")
 
+            # A subprocess which inherited the configuration of its parent process can
+            # start running right away, without waiting for the IDE to attach to it and
+            # configure it again (pydevd holds the "stopped" events until then). This
+            # must also be done after ptvsd is injected.
+            if info("inheritedConfig", False):
+                try:
+                    self.channel.request("pydevdRunWithInheritedConfig", {})
+                except messaging.MessageHandlingError:
+                    log.exception(
+                        "Failed to start {0} with inherited configuration:",
+                        self,
+                        level="warning",
+                    )
+
             with _lock:
                 # The server can disconnect concurrently before we get here, e.g. if
                 # it was force-killed. If the disconnect() handler has already run,
@@ -343,7 +373,20 @@ class Server(components.Component):
         super(Server, self).disconnect()
 
 
-listen = functools.partial(Connection.listen, name="Server")
+def listen(host=None, port=0, timeout=None):
+    host, port = Connection.listen(host, port, timeout, name="Server")
+
+    # The servers only know the host and port of the adapter, so, the Unix domain socket
+    # path is derived from the port (pydevd tries it first and falls back to TCP).
+    if use_unix_socket:
+        path = sockets.get_unix_socket_path(port, create_dir=True)
+        if path is not None:
+            try:
+                Connection.listen_unix(path, name="Server")
+            except Exception:
+                pass  # Already logged - the servers will connect through TCP.
+
+    return host, port
 
 
 def stop_listening():
@@ -352,6 +395,15 @@ def stop_listening():
     except Exception:
         log.exception(level="warning")
 
+    unix_listener = Connection.unix_listener
+    if unix_listener is not None:
+        try:
+            path = unix_listener.getsockname()
+            unix_listener.close()
+            os.unlink(path)
+        except Exception:
+            log.exception(level="warning")
+
 
 def connections():
     with _lock:
@@ -366,19 +418,8 @@ def wait_for_connection(session, predicate, timeout=None):
     one.
     """
 
-    def wait_for_timeout():
-        time.sleep(timeout)
-        wait_for_timeout.timed_out = True
-        with _lock:
-            _connections_changed.set()
-
-    wait_for_timeout.timed_out = timeout == 0
-    if timeout:
-        thread = threading.Thread(
-            target=wait_for_timeout, name="servers.wait_for_connection() timeout"
-        )
-        thread.daemon = True
-        thread.start()
+    if timeout is not None:
+        deadline = time.time() + timeout
 
     if timeout != 0:
         log.info("{0} waiting for connection from debug server...", session)
@@ -387,9 +428,15 @@ def wait_for_connection(session, predicate, timeout=None):
             _connections_changed.clear()
             conns = (conn for conn in _connections if predicate(conn))
             conn = next(conns, None)
-            if conn is not None or wait_for_timeout.timed_out:
+            if conn is not None:
                 return conn
-        _connections_changed.wait()
+            if timeout is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return None
+            else:
+                remaining = None
+        _connections_changed.wait(remaining)
 
 
 def wait_until_disconnected():
@@ -113,24 +113,21 @@ class Session(util.Observable):
         False if it timed out, and True otherwise.
         """
 
-        def wait_for_timeout():
-            time.sleep(timeout)
-            wait_for_timeout.timed_out = True
-            self.notify_changed()
-
-        wait_for_timeout.timed_out = False
+        # The deadline is checked on every wakeup, rather than having a separate
+        # thread sleep for the duration of the timeout - many waits can be pending
+        # at the same time while sessions are being set up.
         if timeout is not None:
-            thread = threading.Thread(
-                target=wait_for_timeout, name="Session.wait_for() timeout"
-            )
-            thread.daemon = True
-            thread.start()
+            deadline = time.time() + timeout
 
         with self:
             while not predicate():
-                if wait_for_timeout.timed_out:
+                if timeout is None:
+                    self._changed_condition.wait()
+                    continue
+                remaining = deadline - time.time()
+                if remaining <= 0:
                     return False
-                self._changed_condition.wait()
+                self._changed_condition.wait(remaining)
             return True
 
     @contextlib.contextmanager
@@ -17,6 +17,7 @@ import functools
 import itertools
 import os
 import socket
+import struct
 import sys
 import threading
 
@@ -66,6 +67,15 @@ class JsonIOStream(object):
 
     MAX_BODY_SIZE = 0xFFFFFF
 
+    COMPACT_ENCODING_MARKER = b"\x00"
+    """Starts a message in the compact encoding, which is used between the adapter and
+    the debug server if it was negotiated (see enable_compact_encoding()).
+
+    Each message is the marker, followed by the length of the body (4 bytes, big
+    endian), followed by the body (JSON without whitespace). A DAP packet can't start
+    with it, so read_json() accepts messages in either encoding.
+    """
+
     json_decoder_factory = json.JsonDecoder
     """Used by read_json() when decoder is None."""
 
@@ -148,6 +158,14 @@ class JsonIOStream(object):
         self._writer = writer
         self._cleanup = cleanup
         self._closed = False
+        self._compact_encoder = None
+
+    def enable_compact_encoding(self):
+        """Makes write_json() use the compact encoding for all subsequent messages.
+
+        Must only be used once the other end has confirmed that it can read it.
+        """
+        self._compact_encoder = self.json_encoder_factory(separators=(",", ":"))
 
     def close(self):
         """Closes the stream, the reader, and the writer.
@@ -185,8 +203,7 @@ class JsonIOStream(object):
         )
         return logger(format_string, self.name, dir, data)
 
-    def _read_line(self, reader):
-        line = b""
+    def _read_line(self, reader, line=b""):
         while True:
             try:
                 line += reader.readline()
@@ -227,9 +244,28 @@ class JsonIOStream(object):
         raw_chunks = []
         headers = {}
 
+        try:
+            marker = reader.read(1)
+        except Exception as exc:
+            raise NoMoreMessages(str(exc), stream=self)
+        if not marker:
+            raise NoMoreMessages(stream=self)
+
+        if marker == self.COMPACT_ENCODING_MARKER:
+            length = self._read_compact_length(reader, raw_chunks)
+            if length > self.MAX_BODY_SIZE:
+                try:
+                    raise IOError("Compact message length is invalid:")
+                except Exception:
+                    raise log_message_and_exception()
+            return self._read_body(
+                reader, length, decoder, raw_chunks, log_message_and_exception
+            )
+
         while True:
             try:
-                line = read_line()
+                line = read_line(marker)
+                marker = b""
             except Exception:
                 # Only log it if we have already read some headers, and are looking
                 # for a blank line terminating them. If this is the very first read,
@@ -256,6 +292,27 @@ class JsonIOStream(object):
             except Exception:
                 raise log_message_and_exception()
 
+        return self._read_body(
+            reader, length, decoder, raw_chunks, log_message_and_exception
+        )
+
+    def _read_compact_length(self, reader, raw_chunks):
+        raw_chunks.append(self.COMPACT_ENCODING_MARKER)
+        header = b""
+        while len(header) < 4:
+            try:
+                chunk = reader.read(4 - len(header))
+            except Exception as exc:
+                raise NoMoreMessages(str(exc), stream=self)
+            if not chunk:
+                raise NoMoreMessages(stream=self)
+            header += chunk
+        raw_chunks.append(header)
+        return struct.unpack(">I", header)[0]
+
+    def _read_body(
+        self, reader, length, decoder, raw_chunks, log_message_and_exception
+    ):
         body_start = len(raw_chunks)
         body_remaining = length
         while body_remaining > 0:
@@ -300,7 +357,13 @@ class JsonIOStream(object):
             # anticipating EOFError from it in case it got closed concurrently.
             raise NoMoreMessages(stream=self)
 
-        encoder = encoder if encoder is not None else self.json_encoder_factory()
+        compact_encoder = self._compact_encoder
+        if encoder is None:
+            encoder = (
+                compact_encoder
+                if compact_encoder is not None
+                else self.json_encoder_factory()
+            )
         writer = self._writer
 
         # Format the value as a message, and try to log any failures using as much
@@ -314,8 +377,11 @@ class JsonIOStream(object):
         if not isinstance(body, bytes):
             body = body.encode("utf-8")
 
-        header = fmt("Content-Length: {0}\r\n\r\n", len(body))
-        header = header.encode("ascii")
+        if compact_encoder is not None:
+            header = self.COMPACT_ENCODING_MARKER + struct.pack(">I", len(body))
+        else:
+            header = fmt("Content-Length: {0}\r\n\r\n", len(body))
+            header = header.encode("ascii")
 
         data = header + body
         data_written = 0
@@ -4,8 +4,11 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import os
 import socket
+import stat
 import sys
+import tempfile
 import threading
 
 from ptvsd.common import log
@@ -30,6 +33,69 @@ def create_server(host, port, timeout=None):
     return server
 
 
+def get_unix_socket_dir(create=False):
+    """Returns the directory for the Unix domain sockets of the adapters of the current
+    user, or None if it's not available (not supported on this platform, or not only
+    accessible by the current user).
+    """
+    if sys.platform == "win32" or not hasattr(socket, "AF_UNIX"):
+        return None
+
+    uid = os.getuid()
+    dirname = os.path.join(tempfile.gettempdir(), "ptvsd-" + str(uid))
+    if create:
+        try:
+            os.mkdir(dirname, 0o700)
+        except OSError:
+            pass  # Already there (checked below).
+
+    try:
+        st = os.lstat(dirname)
+    except OSError:
+        return None
+
+    # Anyone who can create a socket in this directory could impersonate the adapter.
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != uid or st.st_mode & 0o077:
+        log.warning(
+            "Not using Unix domain sockets: {0!r} must be a directory only accessible by its owner.",
+            dirname,
+        )
+        return None
+    return dirname
+
+
+def get_unix_socket_path(port, create_dir=False):
+    """Returns the path of the Unix domain socket on which an adapter that is listening
+    for servers on the given TCP port also listens, or None if it's not available.
+
+    The debug server only knows the adapter host and port, so this path must match what
+    pydevd_comm.get_unix_socket_path() checks before falling back to TCP.
+    """
+    dirname = get_unix_socket_dir(create_dir)
+    if dirname is None:
+        return None
+    return os.path.join(dirname, str(port) + ".sock")
+
+
+def create_unix_server(path):
+    """Return a server socket listening on the given Unix domain socket path."""
+    try:
+        if stat.S_ISSOCK(os.lstat(path).st_mode):
+            os.unlink(path)  # Left behind by an adapter which didn't exit cleanly.
+    except OSError:
+        pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(path)
+        os.chmod(path, 0o600)
+        server.listen(1)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
 def create_client():
     """Return a client socket that may be connected to a remote address."""
     return _new_sock()
@@ -63,6 +129,11 @@ class ClientConnection(object):
     """After listen() is invoked, this is the socket listening for connections.
     """
 
+    unix_listener = None
+    """After listen_unix() is invoked, this is the Unix domain socket listening for
+    connections.
+    """
+
     @classmethod
     def listen(cls, host=None, port=0, timeout=None, name=None):
         """Accepts TCP connections on the specified host and port, and creates a new
@@ -101,10 +172,45 @@ class ClientConnection(object):
                 )
                 cls(sock)
 
+        cls._start_accept_worker(accept_worker)
+        return host, port
+
+    @classmethod
+    def listen_unix(cls, path, name=None):
+        """Accepts connections on the specified Unix domain socket path, and creates a
+        new instance of this class wrapping every accepted socket.
+        """
+
+        if name is None:
+            name = cls.__name__
+
+        assert cls.unix_listener is None
+        try:
+            cls.unix_listener = create_unix_server(path)
+        except Exception:
+            raise log.exception(
+                "Error listening for incoming {0} connections on {1!r}:", name, path
+            )
+        log.info("Listening for incoming {0} connections on {1!r}...", name, path)
+
+        def accept_worker():
+            while True:
+                try:
+                    sock, _ = cls.unix_listener.accept()
+                except OSError:
+                    # Listener socket has been closed.
+                    break
+
+                log.info("Accepted incoming {0} connection on {1!r}.", name, path)
+                cls(sock)
+
+        cls._start_accept_worker(accept_worker)
+        return path
+
+    @staticmethod
+    def _start_accept_worker(accept_worker):
         thread = threading.Thread(target=accept_worker)
         thread.daemon = True
         thread.pydev_do_not_trace = True
         thread.is_pydev_daemon_thread = True
         thread.start()
-
-        return host, port
@@ -0,0 +1,195 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root
+# for license information.
+
+"""Measures the CPU time used to send the messages of a stepping session from the debug
+server to the adapter with the regular DAP encoding and with the compact encoding.
+
+This is not a test - run it directly::
+
+    python tests/encoding_check.py [--runs N] [--steps N] [--json FILE]
+
+The server side creates and sends the messages with pydevd's NetCommand (as pydevd does
+in its writer thread). The adapter side reads them with JsonIOStream.read_json(). Each
+step is the sequence of messages pydevd sends when the IDE steps and shows the variables:
+"continued" and "stopped" events, and "stackTrace", "scopes" and "variables" responses.
+
+Reports the median over all runs of:
+
+    CPU ms/step: process CPU time (server and adapter threads) per step.
+    wall ms/step: elapsed time per step.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+PYDEVD_DIR = os.path.join(SRC_DIR, "ptvsd", "_vendored", "pydevd")
+
+# Note: replaces the directory of this script (its code.py would shadow the stdlib module).
+sys.path[0] = SRC_DIR
+sys.path.insert(0, PYDEVD_DIR)
+
+from ptvsd.common import messaging, sockets  # noqa
+from _pydevd_bundle import pydevd_constants  # noqa
+from _pydevd_bundle.pydevd_net_command import NetCommand  # noqa
+
+try:
+    process_time = time.process_time
+except AttributeError:
+    process_time = time.clock  # Python 2
+
+
+def step_messages(frames=20, variables=30):
+    stack_frames = [
+        {
+            "id": i + 1,
+            "name": "function_%s" % (i,),
+            "line": 10 + i,
+            "column": 1,
+            "source": {"path": "/home/user/project/module_%s.py" % (i,)},
+        }
+        for i in range(frames)
+    ]
+    variables = [
+        {
+            "name": "variable_%s" % (i,),
+            "value": repr(list(range(i % 5))),
+            "type": "list",
+            "evaluateName": "variable_%s" % (i,),
+            "variablesReference": i + 100,
+        }
+        for i in range(variables)
+    ]
+    return [
+        {"type": "event", "event": "continued", "body": {"threadId": 1}},
+        {
+            "type": "event",
+            "event": "stopped",
+            "body": {"reason": "step", "threadId": 1, "allThreadsStopped": True},
+        },
+        {
+            "type": "response",
+            "request_seq": 1,
+            "success": True,
+            "command": "stackTrace",
+            "body": {"stackFrames": stack_frames, "totalFrames": frames},
+        },
+        {
+            "type": "response",
+            "request_seq": 2,
+            "success": True,
+            "command": "scopes",
+            "body": {
+                "scopes": [
+                    {"name": "Locals", "variablesReference": 1, "expensive": False},
+                    {"name": "Globals", "variablesReference": 2, "expensive": False},
+                ]
+            },
+        },
+        {
+            "type": "response",
+            "request_seq": 3,
+            "success": True,
+            "command": "variables",
+            "body": {"variables": variables},
+        },
+    ]
+
+
+def run(compact_encoding, messages, steps):
+    """Returns the CPU time and the elapsed time (in seconds) to send and read all the
+    messages.
+    """
+    pydevd_constants.set_protocol(pydevd_constants.HTTP_JSON_PROTOCOL)
+    pydevd_constants.set_compact_encoding(compact_encoding)
+
+    server = sockets.create_server("127.0.0.1", 0)
+    try:
+        connected = []
+
+        def accept():
+            sock, _ = server.accept()
+            connected.append(sock)
+
+        accept_thread = threading.Thread(target=accept)
+        accept_thread.start()
+        client = sockets.create_client()
+        client.connect(server.getsockname())
+        accept_thread.join()
+
+        stream = messaging.JsonIOStream.from_socket(connected[0], "adapter")
+
+        def write():
+            for _ in range(steps):
+                for message in messages:
+                    # Like the pydevd writer thread (the message is created and sent).
+                    NetCommand(0, 0, dict(message), is_json=True).send(client)
+
+        writer = threading.Thread(target=write)
+        start_cpu = process_time()
+        start = time.time()
+        writer.start()
+        for _ in range(steps * len(messages)):
+            stream.read_json()
+        writer.join()
+        elapsed = time.time() - start
+        elapsed_cpu = process_time() - start_cpu
+
+        client.close()
+        stream.close()
+        return elapsed_cpu, elapsed
+    finally:
+        server.close()
+        pydevd_constants.set_compact_encoding(False)
+
+
+def _median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--json", help="write the results to this file as JSON")
+    args = parser.parse_args()
+
+    messages = step_messages()
+    results = {}
+    for encoding in ("dap", "compact"):
+        cpu_times = []
+        times = []
+        for _ in range(args.runs):
+            elapsed_cpu, elapsed = run(encoding == "compact", messages, args.steps)
+            cpu_times.append(elapsed_cpu)
+            times.append(elapsed)
+
+        result = {
+            "CPU ms/step": _median(cpu_times) * 1000 / args.steps,
+            "wall ms/step": _median(times) * 1000 / args.steps,
+            "cpu_times": cpu_times,
+            "times": times,
+        }
+        results[encoding] = result
+        print(
+            "%-8s %8.3f CPU ms/step %8.3f wall ms/step"
+            % (encoding, result["CPU ms/step"], result["wall ms/step"])
+        )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
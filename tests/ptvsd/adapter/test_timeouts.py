@@ -0,0 +1,82 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root
+# for license information.
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import threading
+
+from ptvsd.adapter import servers, sessions
+
+
+class FakeConnection(object):
+    def __init__(self, pid):
+        self.pid = pid
+
+
+def connect(conn):
+    with servers._lock:
+        servers._connections.append(conn)
+        servers._connections_changed.set()
+
+
+def disconnect(conn):
+    with servers._lock:
+        servers._connections.remove(conn)
+        servers._connections_changed.set()
+
+
+def test_session_wait_for_timeout():
+    session = sessions.Session()
+    assert not session.wait_for(lambda: False, timeout=0.1)
+    assert session.wait_for(lambda: True, timeout=0.1)
+
+
+def test_session_wait_for_notified():
+    session = sessions.Session()
+    done = []
+
+    def set_done():
+        with session:
+            done.append(True)
+        session.notify_changed()
+
+    timer = threading.Timer(0.1, set_done)
+    timer.start()
+    try:
+        assert session.wait_for(lambda: done, timeout=10)
+    finally:
+        timer.join()
+
+
+def test_wait_for_connection_timeout():
+    session = sessions.Session()
+    assert servers.wait_for_connection(session, lambda conn: False, timeout=0) is None
+    assert servers.wait_for_connection(session, lambda conn: False, timeout=0.1) is None
+
+
+def test_thread_count_is_flat():
+    session = sessions.Session()
+    threads_before = threading.active_count()
+
+    for pid in range(1000):
+        conn = FakeConnection(pid)
+        connect(conn)
+        try:
+            assert (
+                servers.wait_for_connection(
+                    session, lambda conn: conn.pid == pid, timeout=10
+                )
+                is conn
+            )
+            assert session.wait_for(lambda: True, timeout=10)
+        finally:
+            disconnect(conn)
+        assert (
+            servers.wait_for_connection(
+                session, lambda conn: conn.pid == pid, timeout=0.001
+            )
+            is None
+        )
+
+    assert threading.active_count() == threads_before
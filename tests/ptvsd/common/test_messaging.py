@@ -15,6 +15,7 @@ import pytest
 import random
 import re
 import socket
+import struct
 import threading
 import time
 
@@ -103,6 +104,37 @@ class TestJsonIOStream(object):
         data = data.getvalue()
         assert data == self.SERIALIZED_MESSAGES
 
+    def serialize_compact(self, message):
+        body = json.dumps(message, separators=(",", ":")).encode("utf-8")
+        return b"\x00" + struct.pack(">I", len(body)) + body
+
+    def test_read_compact(self):
+        # Messages in either encoding can be mixed in the same stream.
+        data = io.BytesIO(
+            self.serialize_compact(self.MESSAGES[0])
+            + self.SERIALIZED_MESSAGES
+            + self.serialize_compact(self.MESSAGES[2])
+        )
+        stream = messaging.JsonIOStream(data, data, "data")
+        expected_messages = self.MESSAGES[:1] + self.MESSAGES + self.MESSAGES[2:]
+        for expected_message in expected_messages:
+            message = stream.read_json()
+            assert message == expected_message
+        with pytest.raises(messaging.NoMoreMessages) as exc_info:
+            stream.read_json()
+        assert exc_info.value.stream is stream
+
+    def test_write_compact(self):
+        data = io.BytesIO()
+        stream = messaging.JsonIOStream(data, data, "data")
+        stream.enable_compact_encoding()
+        for message in self.MESSAGES:
+            stream.write_json(message)
+        data = data.getvalue()
+        assert data == b"".join(
+            self.serialize_compact(message) for message in self.MESSAGES
+        )
+
 
 class TestJsonMemoryStream(object):
     MESSAGES = [
@@ -4,8 +4,12 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import os
 import pytest
+import socket
+import stat
 import sys
+import tempfile
 
 from ptvsd.common import sockets
 
@@ -45,3 +49,41 @@ class TestSocketServerReuse(object):
                 sockets.close_socket(sock1)
             if sock2 is not None:
                 sockets.close_socket(sock2)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets only")
+class TestUnixSocket(object):
+    @pytest.fixture(autouse=True)
+    def tempdir(self, tmpdir, monkeypatch):
+        monkeypatch.setattr(tempfile, "tempdir", str(tmpdir))
+
+    def test_path_only_in_private_dir(self, tmpdir):
+        assert sockets.get_unix_socket_path(5678) is None
+
+        path = sockets.get_unix_socket_path(5678, create_dir=True)
+        dirname = os.path.dirname(path)
+        assert path == os.path.join(str(tmpdir), "ptvsd-" + str(os.getuid()), "5678.sock")
+        assert stat.S_IMODE(os.stat(dirname).st_mode) == 0o700
+
+        os.chmod(dirname, 0o755)
+        assert sockets.get_unix_socket_path(5678) is None
+
+    def test_connect(self):
+        path = sockets.get_unix_socket_path(5678, create_dir=True)
+        server = sockets.create_unix_server(path)
+        try:
+            assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                client.connect(path)
+                sock, _ = server.accept()
+                client.sendall(b"data")
+                assert sock.recv(4) == b"data"
+                sockets.close_socket(sock)
+            finally:
+                client.close()
+        finally:
+            server.close()
+
+        # A stale socket file is replaced.
+        sockets.create_unix_server(path).close()
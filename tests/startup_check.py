@@ -0,0 +1,372 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root
+# for license information.
+
+"""Measures how long it takes for ptvsd to start debugging.
+
+This is not a test - run it directly::
+
+    python tests/startup_check.py [--runs N] [--imports N] [--json FILE]
+
+Requires Python 3.7 or later (for -X importtime).
+
+Scenarios:
+
+    cli: python -m ptvsd --host ... file.py
+    cli_wait: python -m ptvsd --wait --host ... file.py (this script attaches to it as
+        the IDE as soon as the adapter accepts connections and sets a breakpoint in the
+        user code).
+    enable_attach: ptvsd.enable_attach() called from user code.
+    subprocess: pydevd started with the command line used for an auto-attached
+        subprocess (see: pydev_monkey.patch_args()).
+
+For every scenario, reports the median over all runs of:
+
+    startup: time from spawning the process until the first line of user code runs
+        (for subprocess, until it connects back to the adapter).
+    total: wall time until the process exits.
+    modules: number of modules in sys.modules when user code starts running.
+    first_stop: (cli_wait only) time from spawning the process until the IDE receives
+        the "stopped" event for the breakpoint - this includes handling the requests
+        of a real debug session.
+
+All processes run with -X importtime, so, the times include its (small) overhead. The
+sources are compiled beforehand, so, the times don't include compiling them.
+
+And for the last run, the modules with the biggest cumulative import time in the debug
+server process during the whole run (from -X importtime) and whether the DAP schema was
+imported (it's needed to handle the requests from the adapter, so, it's always imported
+in a real debug session - i.e.: cli_wait).
+
+Except for cli_wait, no IDE is connected - this measures the fixed cost of bringing the
+debug server up, which is paid by every debugged process (including every auto-attached
+subprocess).
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import argparse
+import compileall
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Note: replaces the directory of this script (its code.py would shadow the stdlib module).
+sys.path[0] = SRC_DIR
+
+from ptvsd.common import messaging  # noqa
+
+PYDEVD_FILE = os.path.join(SRC_DIR, "ptvsd", "_vendored", "pydevd", "pydevd.py")
+
+# Printed by user code as soon as it starts running.
+MARKER = "STARTUP_CHECK"
+
+REPORT_CODE = """
+import json, sys, time
+print("%s" + json.dumps({"time": time.time(), "modules": len(sys.modules)}))
+sys.stdout.flush()  # breakpoint
+""" % (
+    MARKER,
+)
+
+# The line of "# breakpoint" in REPORT_CODE.
+BREAKPOINT_LINE = 4
+
+ENABLE_ATTACH_CODE = (
+    """
+import sys
+import ptvsd
+ptvsd.enable_attach(("127.0.0.1", int(sys.argv[1])))
+"""
+    + REPORT_CODE
+)
+
+
+SCHEMA_MODULE = "_pydevd_bundle._debug_adapter.pydevd_schema"
+
+
+def parse_importtime(stderr):
+    """Returns a list of (module name, self time in us, cumulative time in us) from
+    the output of -X importtime.
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:") :].split("|")
+            imports.append((name.strip(), int(self_us), int(cumulative_us)))
+        except ValueError:
+            continue  # Header.
+    return imports
+
+
+def _free_port():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+    finally:
+        sock.close()
+
+
+def _release_adapter(port):
+    # The adapter daemonizes itself and waits for an IDE that will never come. When
+    # an IDE connects and then disconnects, the adapter exits.
+    try:
+        sock = socket.create_connection(("127.0.0.1", port), timeout=5)
+    except socket.error:
+        return  # Already gone.
+    sock.close()
+
+
+def _attach_as_ide(port, breakpoint_path, timeout=30):
+    """Connects to the adapter as the IDE (as soon as it accepts connections) and
+    attaches to the debug server, so that a process started with --wait runs the
+    user code. Waits for the breakpoint to be hit and resumes.
+
+    Returns the stream (closing it ends the debug session) and the time when the
+    "stopped" event was received.
+    """
+    deadline = time.time() + timeout
+    while True:
+        try:
+            sock = socket.create_connection(("127.0.0.1", port))
+            break
+        except socket.error:
+            if time.time() > deadline:
+                raise
+            time.sleep(0.01)
+
+    stream = messaging.JsonIOStream.from_socket(sock, "ide")
+    seq = [0]
+
+    def request(command, arguments):
+        seq[0] += 1
+        stream.write_json(
+            {"seq": seq[0], "type": "request", "command": command, "arguments": arguments}
+        )
+        return seq[0]
+
+    def wait_for(predicate):
+        while True:
+            message = stream.read_json()
+            if predicate(message):
+                return message
+
+    def wait_for_response(request_seq):
+        response = wait_for(
+            lambda msg: msg["type"] == "response" and msg["request_seq"] == request_seq
+        )
+        if not response["success"]:
+            raise RuntimeError("Request failed: %r" % (response,))
+
+    wait_for_response(
+        request("initialize", {"adapterID": "startup_check", "pathFormat": "path"})
+    )
+    # Note: like the IDE, attach must have arguments (it's propagated to pydevd, which
+    # requires them, and empty arguments are omitted).
+    request("attach", {"name": "startup_check", "type": "python", "request": "attach"})
+    wait_for(lambda msg: msg["type"] == "event" and msg["event"] == "initialized")
+    wait_for_response(
+        request(
+            "setBreakpoints",
+            {"source": {"path": breakpoint_path}, "breakpoints": [{"line": BREAKPOINT_LINE}]},
+        )
+    )
+    wait_for_response(request("configurationDone", {}))
+
+    stopped = wait_for(lambda msg: msg["type"] == "event" and msg["event"] == "stopped")
+    stop_time = time.time()
+    wait_for_response(request("continue", {"threadId": stopped["body"]["threadId"]}))
+    return stream, stop_time
+
+
+def _run(args, port, breakpoint_path=None):
+    env = os.environ.copy()
+    env["PYTHONPATH"] = SRC_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    args = [sys.executable, "-X", "importtime"] + args
+
+    # Note: the output goes to a file and not to a pipe because the adapter inherits
+    # it, so, reading from a pipe would block until the adapter is killed.
+    with tempfile.TemporaryFile() as stdout:
+        with tempfile.TemporaryFile() as stderr:
+            ide_results = []
+            ide_thread = None
+            if breakpoint_path is not None:
+                ide_thread = threading.Thread(
+                    target=lambda: ide_results.append(_attach_as_ide(port, breakpoint_path))
+                )
+                ide_thread.daemon = True
+
+            start = time.time()
+            try:
+                if ide_thread is not None:
+                    ide_thread.start()
+                subprocess.check_call(args, env=env, stdout=stdout, stderr=stderr)
+                total = time.time() - start
+            finally:
+                if ide_thread is not None:
+                    ide_thread.join(30)
+                for stream, _stop_time in ide_results:
+                    stream.close()
+                _release_adapter(port)
+            stdout.seek(0)
+            output = stdout.read()
+            stderr.seek(0)
+            imports = parse_importtime(stderr.read().decode("utf-8", "replace"))
+
+    reports = []
+    for line in output.decode("utf-8").splitlines():
+        if line.startswith(MARKER):
+            reports.append(json.loads(line[len(MARKER) :]))
+
+    first_stop = None
+    if breakpoint_path is not None:
+        ((_stream, stop_time),) = ide_results
+        first_stop = stop_time - start
+    return start, total, reports, imports, first_stop
+
+
+def run_cli(tmpdir, wait=False):
+    port = _free_port()
+    target = os.path.join(tmpdir, "child.py")
+    args = ["-m", "ptvsd"]
+    if wait:
+        args += ["--wait"]
+    args += ["--host", "127.0.0.1", "--port", str(port), target]
+    start, total, reports, imports, first_stop = _run(
+        args, port, breakpoint_path=target if wait else None
+    )
+    (report,) = reports
+    return report["time"] - start, total, report["modules"], imports, first_stop
+
+
+def run_cli_wait(tmpdir):
+    return run_cli(tmpdir, wait=True)
+
+
+def run_enable_attach(tmpdir):
+    port = _free_port()
+    args = [os.path.join(tmpdir, "enable_attach.py"), str(port)]
+    start, total, reports, imports, _first_stop = _run(args, port)
+    (report,) = reports
+    return report["time"] - start, total, report["modules"], imports, None
+
+
+def run_subprocess(tmpdir):
+    # This is the command line that pydev_monkey.patch_args() produces for a child
+    # process: it connects back to the adapter before running any user code, so,
+    # the time until it connects is measured (and this process plays the adapter).
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    listener.settimeout(30)
+    port = listener.getsockname()[1]
+
+    args = [sys.executable, "-X", "importtime", PYDEVD_FILE, "--multiprocess"]
+    args += ["--client", "127.0.0.1", "--port", str(port), "--json-dap-http"]
+    args += ["--file", os.path.join(tmpdir, "child.py")]
+
+    env = os.environ.copy()
+    env["PYTHONPATH"] = SRC_DIR + os.pathsep + env.get("PYTHONPATH", "")
+    with tempfile.TemporaryFile() as stderr:
+        start = time.time()
+        proc = subprocess.Popen(args, env=env, stderr=stderr)
+        try:
+            sock, _ = listener.accept()
+            startup = time.time() - start
+            sock.close()
+        finally:
+            listener.close()
+            proc.kill()
+            proc.wait()
+        stderr.seek(0)
+        output = stderr.read()
+
+    imports = parse_importtime(output.decode("utf-8", "replace"))
+    return startup, startup, len(imports), imports, None
+
+
+SCENARIOS = [
+    ("cli", run_cli),
+    ("cli_wait", run_cli_wait),
+    ("enable_attach", run_enable_attach),
+    ("subprocess", run_subprocess),
+]
+
+
+def _median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--imports",
+        type=int,
+        default=10,
+        help="number of modules with the biggest cumulative import time to report",
+    )
+    parser.add_argument("--json", help="write the results to this file as JSON")
+    args = parser.parse_args()
+
+    # Otherwise, the first run (or every run, if the bytecode can't be written) would
+    # include the time to compile the sources.
+    compileall.compile_dir(SRC_DIR, quiet=2)
+
+    tmpdir = tempfile.mkdtemp()
+    for filename, code in (
+        ("child.py", REPORT_CODE),
+        ("enable_attach.py", ENABLE_ATTACH_CODE),
+    ):
+        with open(os.path.join(tmpdir, filename), "w") as f:
+            f.write(code)
+
+    results = {}
+    for name, func in SCENARIOS:
+        measurements = [func(tmpdir) for _ in range(args.runs)]
+        startup, total, modules, all_imports, first_stop = zip(*measurements)
+        imports = all_imports[-1]
+        top_imports = sorted(imports, key=lambda imp: -imp[2])[: args.imports]
+        results[name] = {
+            "startup": _median(startup),
+            "total": _median(total),
+            "modules": _median(modules),
+            "first_stop": None if first_stop[0] is None else _median(first_stop),
+            "schema_imported": any(imp[0] == SCHEMA_MODULE for imp in imports),
+            "top_imports": [
+                {"module": module, "self_us": self_us, "cumulative_us": cumulative_us}
+                for module, self_us, cumulative_us in top_imports
+            ],
+        }
+        line = "{0}: startup={1:.3f}s total={2:.3f}s modules={3} schema_imported={4}".format(
+            name,
+            results[name]["startup"],
+            results[name]["total"],
+            results[name]["modules"],
+            results[name]["schema_imported"],
+        )
+        if results[name]["first_stop"] is not None:
+            line += " first_stop={0:.3f}s".format(results[name]["first_stop"])
+        print(line)
+        for module, _self_us, cumulative_us in top_imports:
+            print("    {0:8.1f}ms (cumulative) {1}".format(cumulative_us / 1000.0, module))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"python": sys.version, "runs": args.runs, "results": results}, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root
+# for license information.
+
+"""Measures the throughput of messages from the debug server to the adapter over TCP
+and over a Unix domain socket.
+
+This is not a test - run it directly::
+
+    python tests/transport_check.py [--runs N] [--messages N] [--json FILE]
+
+The server side connects with pydevd_comm.start_client() (so, the Unix domain socket is
+used only if it's negotiated as it would be for a real adapter) and writes messages
+framed as pydevd does. The adapter side reads them with JsonIOStream.read_json().
+
+For every payload, reports the median over all runs of:
+
+    msgs/s: number of messages read by the adapter per second.
+    MB/s: megabytes (of message bodies) read by the adapter per second.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import argparse
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+PYDEVD_DIR = os.path.join(SRC_DIR, "ptvsd", "_vendored", "pydevd")
+
+# Note: replaces the directory of this script (its code.py would shadow the stdlib module).
+sys.path[0] = SRC_DIR
+sys.path.insert(0, PYDEVD_DIR)
+
+from ptvsd.common import messaging, sockets  # noqa
+from _pydevd_bundle.pydevd_comm import start_client  # noqa
+
+
+def variables_payload(count=1000):
+    variables = [
+        {
+            "name": "variable_%s" % (i,),
+            "value": repr(list(range(i % 20))),
+            "type": "list",
+            "evaluateName": "variable_%s" % (i,),
+            "variablesReference": i + 1,
+        }
+        for i in range(count)
+    ]
+    return {
+        "type": "response",
+        "request_seq": 1,
+        "success": True,
+        "command": "variables",
+        "body": {"variables": variables},
+    }
+
+
+def output_payload(size=64 * 1024):
+    line = "x" * 79 + "\n"
+    return {
+        "type": "event",
+        "event": "output",
+        "body": {"category": "stdout", "output": line * (size // len(line))},
+    }
+
+
+PAYLOADS = {"variables": variables_payload, "output": output_payload}
+
+
+def _listen(transport):
+    tcp_server = sockets.create_server("127.0.0.1", 0)
+    port = tcp_server.getsockname()[1]
+    if transport == "tcp":
+        return tcp_server, tcp_server, port
+
+    path = sockets.get_unix_socket_path(port, create_dir=True)
+    if path is None:
+        raise RuntimeError("Unix domain sockets are not available.")
+    return tcp_server, sockets.create_unix_server(path), port
+
+
+def run(transport, payload, messages):
+    """Returns the time (in seconds) for the adapter to read all the messages."""
+    body = json.dumps(payload).encode("utf-8")
+    header = ("Content-Length: %s\r\n\r\n" % (len(body),)).encode("ascii")
+
+    tcp_server, server, port = _listen(transport)
+    try:
+        connected = []
+
+        def accept():
+            sock, _ = server.accept()
+            connected.append(sock)
+
+        accept_thread = threading.Thread(target=accept)
+        accept_thread.start()
+        client = start_client("127.0.0.1", port)
+        accept_thread.join()
+
+        expected_family = socket.AF_INET if transport == "tcp" else socket.AF_UNIX
+        assert client.family == expected_family, "Transport not negotiated."
+
+        stream = messaging.JsonIOStream.from_socket(connected[0], transport)
+
+        def write():
+            for _ in range(messages):
+                # Like NetCommand.send().
+                client.sendall(header)
+                client.sendall(body)
+
+        writer = threading.Thread(target=write)
+        start = time.time()
+        writer.start()
+        for _ in range(messages):
+            stream.read_json()
+        elapsed = time.time() - start
+        writer.join()
+
+        client.close()
+        stream.close()
+        return elapsed, len(body)
+    finally:
+        if server is not tcp_server:
+            path = server.getsockname()
+            server.close()
+            os.unlink(path)
+        tcp_server.close()
+
+
+def _median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--json", help="write the results to this file as JSON")
+    args = parser.parse_args()
+
+    transports = ["tcp"]
+    if sys.platform != "win32":
+        transports.append("unix")
+
+    results = {}
+    for payload_name, create_payload in sorted(PAYLOADS.items()):
+        payload = create_payload()
+        for transport in transports:
+            times = []
+            for _ in range(args.runs):
+                elapsed, body_len = run(transport, payload, args.messages)
+                times.append(elapsed)
+
+            elapsed = _median(times)
+            result = {
+                "msgs/s": args.messages / elapsed,
+                "MB/s": args.messages * body_len / elapsed / (1024 * 1024),
+                "times": times,
+            }
+            results["%s/%s" % (payload_name, transport)] = result
+            print(
+                "%-10s %-5s %10.1f msgs/s %10.1f MB/s"
+                % (payload_name, transport, result["msgs/s"], result["MB/s"])
+            )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()